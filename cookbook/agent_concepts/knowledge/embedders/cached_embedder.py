@@ -0,0 +1,24 @@
+from agno.agent import AgentKnowledge
+from agno.embedder.cached import CachedEmbedder
+from agno.embedder.openai import OpenAIEmbedder
+from agno.vectordb.pgvector import PgVector
+
+# Cache embeddings in memory and in a local SQLite file so repeated texts are never re-embedded
+embedder = CachedEmbedder(embedder=OpenAIEmbedder(), db_file="tmp/embedding_cache.db")
+
+embedder.get_embedding("The quick brown fox jumps over the lazy dog.")
+embeddings = embedder.get_embedding("The quick brown fox jumps over the lazy dog.")
+
+# Print the embeddings and the cache statistics
+print(f"Embeddings: {embeddings[:5]}")
+print(f"Cache stats: {embedder.stats}")
+
+# Example usage:
+knowledge_base = AgentKnowledge(
+    vector_db=PgVector(
+        db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        table_name="cached_openai_embeddings",
+        embedder=embedder,
+    ),
+    num_documents=2,
+)
@@ -3,9 +3,11 @@ How to search for user memories using different retrieval methods
 
 - last_n: Retrieves the last n memories
 - first_n: Retrieves the first n memories
-- semantic: Retrieves memories using semantic search
+- agentic: Asks the model which memories are related to the query
+- semantic: Retrieves the memories whose embeddings are most similar to the query
 """
 
+from agno.embedder.google import GeminiEmbedder
 from agno.memory.v2 import Memory, UserMemory
 from agno.memory.v2.db.sqlite import SqliteMemoryDb
 from agno.models.google.gemini import Gemini
@@ -15,7 +17,12 @@ memory_db = SqliteMemoryDb(table_name="memory", db_file="tmp/memory.db")
 # Reset for this example
 memory_db.clear()
 
-memory = Memory(model=Gemini(id="gemini-2.0-flash-exp"), db=memory_db)
+# Memories are embedded when they are written, for semantic search
+memory = Memory(
+    model=Gemini(id="gemini-2.0-flash-exp"),
+    db=memory_db,
+    embedder=GeminiEmbedder(),
+)
 
 john_doe_id = "john_doe@example.com"
 memory.add_user_memory(
@@ -50,3 +57,12 @@ memories = memory.search_user_memories(
 )
 print("\nJohn Doe's memories similar to the query (agentic):")
 pprint(memories)
+
+memories = memory.search_user_memories(
+    user_id=john_doe_id,
+    query="What does the user like to do on weekends?",
+    limit=1,
+    retrieval_method="semantic",
+)
+print("\nJohn Doe's memories similar to the query (semantic):")
+pprint(memories)
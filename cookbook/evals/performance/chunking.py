@@ -0,0 +1,106 @@
+"""Measure chunking 100 MB of text with FixedSizeChunking and RecursiveChunking.
+
+The strategies used to clean the text with six regular expressions, walk back one character at a time to find
+whitespace and slice the content for every separator they looked for. They now clean the text in a single pass,
+search the content in place and emit chunks as offset ranges. `LegacyFixedSizeChunking` is the previous
+implementation, kept here for comparison.
+
+Run `pip install agno` to install dependencies. Install `tiktoken` to also chunk by tokens with the o200k_base encoding.
+"""
+
+import random
+import re
+from typing import List
+
+from agno.document.base import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.eval.performance import PerformanceEval
+from agno.utils.tokens import get_tiktoken_tokenizer
+
+TEXT_SIZE = 100 * 1024 * 1024
+
+random.seed(42)
+words = [
+    "".join(
+        random.choice("abcdefghijklmnopqrstuvwxyz")
+        for _ in range(random.randint(1, 10))
+    )
+    for _ in range(10_000)
+]
+sentences = [
+    " ".join(random.choices(words, k=random.randint(5, 25))) + "." for _ in range(1000)
+]
+paragraph = "\n\n".join(" ".join(random.choices(sentences, k=5)) for _ in range(20))
+document = Document(
+    id="large", name="large", content=paragraph * (TEXT_SIZE // len(paragraph) + 1)
+)
+
+
+class LegacyFixedSizeChunking(FixedSizeChunking):
+    def clean_text(self, text: str) -> str:
+        text = re.sub(r"\n+", "\n", text)
+        text = re.sub(r"\s+", " ", text)
+        for pattern, replacement in [
+            (r"\t+", "\t"),
+            (r"\r+", "\r"),
+            (r"\f+", "\f"),
+            (r"\v+", "\v"),
+        ]:
+            text = re.sub(pattern, replacement, text)
+        return text
+
+    def chunk(self, document: Document) -> List[Document]:
+        content = self.clean_text(document.content)
+        content_length = len(content)
+        chunked_documents: List[Document] = []
+        chunk_number = 1
+        start = 0
+        while start + self.overlap < content_length:
+            end = min(start + self.chunk_size, content_length)
+            if end < content_length:
+                while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
+                    end -= 1
+            if end == start:
+                end = start + self.chunk_size
+            chunk = content[start:end]
+            meta_data = document.meta_data.copy()
+            meta_data["chunk"] = chunk_number
+            meta_data["chunk_size"] = len(chunk)
+            chunked_documents.append(
+                Document(
+                    id=f"{document.id}_{chunk_number}",
+                    name=document.name,
+                    meta_data=meta_data,
+                    content=chunk,
+                )
+            )
+            chunk_number += 1
+            start = end - self.overlap
+        return chunked_documents
+
+
+def run(strategy):
+    def chunk():
+        return strategy.chunk(document)
+
+    return chunk
+
+
+if __name__ == "__main__":
+    strategies = {
+        "LegacyFixedSizeChunking": LegacyFixedSizeChunking(chunk_size=5000),
+        "FixedSizeChunking": FixedSizeChunking(chunk_size=5000),
+        "RecursiveChunking": RecursiveChunking(chunk_size=5000),
+        "FixedSizeChunking with 1000 tokens": FixedSizeChunking(
+            chunk_size=1000, overlap=100, tokenizer=get_tiktoken_tokenizer()
+        ),
+    }
+    for name, strategy in strategies.items():
+        PerformanceEval(
+            name=f"Chunk {TEXT_SIZE // (1024 * 1024)} MB of text with {name}",
+            func=run(strategy),
+            num_iterations=3,
+            warmup_runs=0,
+            measure_memory=False,
+        ).run(print_summary=True)
@@ -0,0 +1,55 @@
+"""Measure reading a 200,000-row CSV export into documents.
+
+`CSVReader` builds the whole file as one string and then chunks it. `CSVStreamReader` reads the rows lazily and
+groups them into documents of the chunk size, so its memory use does not grow with the size of the file.
+
+Run `pip install agno aiofiles` to install dependencies.
+"""
+
+import csv
+import tempfile
+from pathlib import Path
+
+from agno.document.reader.csv_reader import CSVReader, CSVStreamReader
+from agno.eval.performance import PerformanceEval
+
+NUM_ROWS = 200_000
+
+csv_path = Path(tempfile.mkdtemp()) / "orders.csv"
+with csv_path.open("w", newline="", encoding="utf-8") as f:
+    writer = csv.writer(f)
+    writer.writerow(["order_id", "region", "customer", "product", "amount"])
+    for i in range(NUM_ROWS):
+        writer.writerow(
+            [
+                i,
+                f"region-{i // 10_000}",
+                f"customer-{i % 997}",
+                f"product-{i % 31}",
+                i % 1000,
+            ]
+        )
+
+
+def read_csv():
+    return CSVReader().read(file=csv_path)
+
+
+def stream_csv():
+    for _ in CSVStreamReader(metadata_fields=["region"]).iter_documents(csv_path):
+        pass
+
+
+if __name__ == "__main__":
+    PerformanceEval(
+        name=f"Read {NUM_ROWS} rows with CSVReader",
+        func=read_csv,
+        num_iterations=3,
+        warmup_runs=1,
+    ).run(print_summary=True)
+    PerformanceEval(
+        name=f"Stream {NUM_ROWS} rows with CSVStreamReader",
+        func=stream_csv,
+        num_iterations=3,
+        warmup_runs=1,
+    ).run(print_summary=True)
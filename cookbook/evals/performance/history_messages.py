@@ -0,0 +1,85 @@
+"""Measure the cost of adding the history of a 200-run session to the messages of the next run.
+
+Each run in the session has an image, a tool call and a large tool result. `Agent.get_run_messages` used to
+deep copy every history message to tag it with `from_history=True`; it now makes shallow copies that share
+their content, media and tool calls with the messages in memory.
+
+Run `pip install agno openai` to install dependencies. No API calls are made.
+"""
+
+from copy import deepcopy
+from typing import List
+
+from agno.agent import Agent, RunResponse
+from agno.eval.performance import PerformanceEval
+from agno.media import Image
+from agno.memory.v2.memory import Memory
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+
+NUM_RUNS = 200
+
+memory = Memory()
+for i in range(NUM_RUNS):
+    tool_call = {
+        "id": f"call-{i}",
+        "type": "function",
+        "function": {"name": "search", "arguments": '{"query": "cats"}'},
+    }
+    memory.add_run(
+        session_id="session-1",
+        run=RunResponse(
+            run_id=f"run-{i}",
+            session_id="session-1",
+            messages=[
+                Message(
+                    role="user",
+                    content=f"Question {i}: what is in this image?",
+                    images=[Image(content=b"\x89PNG" + bytes(64 * 1024))],
+                ),
+                Message(role="assistant", tool_calls=[tool_call]),
+                Message(
+                    role="tool",
+                    tool_call_id=f"call-{i}",
+                    content="Search result. " * 1000,
+                ),
+                Message(role="assistant", content="A cat sitting on a mat."),
+            ],
+        ),
+    )
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o", api_key="not-used"),
+    memory=memory,
+    add_history_to_messages=True,
+    num_history_runs=NUM_RUNS,
+    session_id="session-1",
+)
+
+
+def deepcopy_history() -> List[Message]:
+    """Build the history messages like before: deep copy each message, then tag it."""
+    history = memory.get_messages_from_last_n_runs(
+        session_id="session-1", last_n=NUM_RUNS, skip_role="system"
+    )
+    history_copy = [deepcopy(msg) for msg in history]
+    for _msg in history_copy:
+        _msg.from_history = True
+    return history_copy
+
+
+def shallow_copy_history() -> List[Message]:
+    return agent.get_run_messages(message="And now?", session_id="session-1").messages
+
+
+if __name__ == "__main__":
+    PerformanceEval(
+        name=f"Deep copy the history of {NUM_RUNS} runs",
+        func=deepcopy_history,
+        num_iterations=10,
+    ).run(print_summary=True)
+    PerformanceEval(
+        name=f"Build the run messages with the history of {NUM_RUNS} runs",
+        func=shallow_copy_history,
+        num_iterations=10,
+    ).run(print_summary=True)
@@ -0,0 +1,52 @@
+"""Compare extracting the text of a 280-page PDF in one process against a pool of worker processes.
+
+Text extraction with pypdf is CPU bound and holds the GIL, so only worker processes extract pages in parallel.
+The PDF repeats the pages of the Thai recipes cookbook 20 times.
+
+Run `pip install agno pypdf` to install dependencies.
+"""
+
+import os
+from io import BytesIO
+from pathlib import Path
+
+from agno.document.reader.pdf_reader import PDFReader
+from agno.eval.performance import PerformanceEval
+from pypdf import PdfReader, PdfWriter
+
+SOURCE_PDF = Path(__file__).parents[2] / "examples/teams/route/ThaiRecipes.pdf"
+NUM_COPIES = 20
+NUM_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def make_large_pdf() -> BytesIO:
+    writer = PdfWriter()
+    source = PdfReader(SOURCE_PDF)
+    for _ in range(NUM_COPIES):
+        for page in source.pages:
+            writer.add_page(page)
+    pdf = BytesIO()
+    writer.write(pdf)
+    pdf.name = "large_recipes.pdf"
+    return pdf
+
+
+pdf = make_large_pdf()
+one_process = PDFReader(chunk=False)
+worker_processes = PDFReader(chunk=False, max_workers=NUM_WORKERS, pages_per_task=10)
+
+if __name__ == "__main__":
+    PerformanceEval(
+        name="Extract a 280-page PDF in one process",
+        func=lambda: one_process.read(pdf),
+        num_iterations=3,
+        warmup_runs=1,
+        measure_memory=False,
+    ).run(print_summary=True)
+    PerformanceEval(
+        name=f"Extract a 280-page PDF with {NUM_WORKERS} worker processes",
+        func=lambda: worker_processes.read(pdf),
+        num_iterations=3,
+        warmup_runs=1,
+        measure_memory=False,
+    ).run(print_summary=True)
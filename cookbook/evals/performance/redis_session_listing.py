@@ -0,0 +1,57 @@
+"""Compare listing the sessions of one user in Redis by scanning the keyspace against reading the user_id index.
+
+Stores 10000 sessions across 1000 users, then lists the sessions of one user both ways.
+
+Run `pip install agno redis` to install dependencies, and start Redis with:
+docker run -d --name redis -p 6379:6379 redis
+"""
+
+from typing import List
+
+from agno.eval.performance import PerformanceEval
+from agno.storage.redis import RedisStorage
+from agno.storage.session.agent import AgentSession
+
+NUM_SESSIONS = 10000
+NUM_USERS = 1000
+
+storage = RedisStorage(prefix="benchmark_sessions")
+
+
+def scan_user_sessions(user_id: str) -> List[AgentSession]:
+    """List the sessions of a user like RedisStorage did before indexes: scan every key and GET it."""
+    sessions = []
+    for key in storage.redis_client.scan_iter(match=f"{storage.prefix}:*"):
+        data = storage.deserialize(storage.redis_client.get(key))  # type: ignore
+        if data["user_id"] == user_id:
+            sessions.append(AgentSession.from_dict(data))
+    return sessions
+
+
+if __name__ == "__main__":
+    storage.drop()
+    for i in range(NUM_SESSIONS):
+        storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="benchmark-agent",
+                user_id=f"user-{i % NUM_USERS}",
+                memory={
+                    "runs": [{"message": {"role": "user", "content": f"Question {i}"}}]
+                },
+            )
+        )
+
+    PerformanceEval(
+        name=f"Scan {NUM_SESSIONS} sessions for one user",
+        func=lambda: scan_user_sessions("user-1"),
+        num_iterations=10,
+        measure_memory=False,
+    ).run(print_summary=True)
+    PerformanceEval(
+        name=f"Read one user's sessions out of {NUM_SESSIONS} from the user_id index",
+        func=lambda: storage.get_all_sessions(user_id="user-1"),
+        num_iterations=10,
+        measure_memory=False,
+    ).run(print_summary=True)
+    storage.drop()
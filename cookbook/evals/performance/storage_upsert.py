@@ -0,0 +1,78 @@
+"""Measure the storage cost of saving a session at the end of an agent run.
+
+Upserts sessions holding 10, 100 and 1000 runs, which is what `Agent.write_to_storage` does after every run.
+With `append_runs=True` the agent only passes the latest run, so the cost stays the same as the session grows.
+
+Run `pip install agno sqlalchemy` to install dependencies.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict
+
+from agno.eval.performance import PerformanceEval
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+
+
+def make_run(i: int) -> Dict[str, Any]:
+    """A run as stored in the session memory, with a short exchange and a tool call"""
+    messages = [
+        {"role": "system", "content": "Be concise, reply with one sentence."},
+        {"role": "user", "content": f"Question {i}: what is the capital of France?"},
+        {
+            "role": "assistant",
+            "content": "The capital of France is Paris. " * 5,
+            "metrics": {"input_tokens": 120},
+        },
+    ]
+    return {
+        "message": messages[1],
+        "response": {
+            "run_id": f"run-{i}",
+            "content": messages[-1]["content"],
+            "messages": messages,
+        },
+    }
+
+
+def make_session(num_runs: int) -> AgentSession:
+    return AgentSession(
+        session_id=f"session-{num_runs}",
+        agent_id="benchmark-agent",
+        user_id="benchmark-user",
+        memory={"runs": [make_run(i) for i in range(num_runs)]},
+        session_data={"session_name": f"{num_runs} runs"},
+    )
+
+
+if __name__ == "__main__":
+    with TemporaryDirectory() as tmp_dir:
+        storage = SqliteStorage(
+            table_name="agent_sessions", db_file=str(Path(tmp_dir) / "sessions.db")
+        )
+        for num_runs in (10, 100, 1000):
+            session = make_session(num_runs)
+            PerformanceEval(
+                name=f"Upsert session with {num_runs} runs",
+                func=lambda: storage.upsert(session),
+                num_iterations=50,
+                measure_memory=False,
+            ).run(print_summary=True)
+
+        append_storage = SqliteStorage(
+            table_name="agent_sessions_append",
+            db_file=str(Path(tmp_dir) / "sessions.db"),
+            append_runs=True,
+        )
+        for num_runs in (10, 100, 1000):
+            # Store the earlier runs once, then only upsert the latest run like the agent does
+            append_storage.upsert(make_session(num_runs))
+            latest_run = make_session(num_runs)
+            latest_run.memory["runs"] = latest_run.memory["runs"][-1:]  # type: ignore
+            PerformanceEval(
+                name=f"Upsert latest run of a session with {num_runs} runs, with append_runs",
+                func=lambda: append_storage.upsert(latest_run),
+                num_iterations=50,
+                measure_memory=False,
+            ).run(print_summary=True)
@@ -0,0 +1,80 @@
+"""Compare crawling a local 200-page website with one fetcher against concurrent fetchers.
+
+The website is served from a local HTTP server that takes 50ms to answer each page, like a remote docs site.
+Before the concurrent crawler, `WebsiteReader` fetched one page at a time and slept 1 to 3 seconds between pages.
+
+Run `pip install agno beautifulsoup4` to install dependencies.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from agno.document.reader.website_reader import WebsiteReader
+from agno.eval.performance import PerformanceEval
+
+NUM_PAGES = 200
+LATENCY = 0.05
+
+
+class DocsSiteHandler(BaseHTTPRequestHandler):
+    """Every page has some content and links to the next 5 pages"""
+
+    def do_GET(self):
+        if self.path == "/robots.txt":
+            self.send_response(404)
+            self.end_headers()
+            return
+        time.sleep(LATENCY)
+        page = int(self.path.strip("/") or 0)
+        links = "".join(
+            f'<a href="/{i}">Page {i}</a>'
+            for i in range(page + 1, min(page + 6, NUM_PAGES))
+        )
+        body = (
+            f"<main>{'Documentation of page %d. ' % page * 50}</main>{links}".encode()
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), DocsSiteHandler)
+url = f"http://127.0.0.1:{server.server_port}/"
+
+one_fetcher = WebsiteReader(
+    max_depth=NUM_PAGES,
+    max_links=NUM_PAGES,
+    max_concurrency=1,
+    requests_per_second=None,
+)
+concurrent_fetchers = WebsiteReader(
+    max_depth=NUM_PAGES,
+    max_links=NUM_PAGES,
+    max_concurrency=16,
+    requests_per_second=None,
+)
+
+if __name__ == "__main__":
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    PerformanceEval(
+        name=f"Crawl {NUM_PAGES} pages with one fetcher",
+        func=lambda: one_fetcher.crawl(url),
+        num_iterations=3,
+        warmup_runs=1,
+        measure_memory=False,
+    ).run(print_summary=True)
+    PerformanceEval(
+        name=f"Crawl {NUM_PAGES} pages with 16 concurrent fetchers",
+        func=lambda: concurrent_fetchers.crawl(url),
+        num_iterations=3,
+        warmup_runs=1,
+        measure_memory=False,
+    ).run(print_summary=True)
+    server.shutdown()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import ChainMap, defaultdict, deque
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 from os import getenv
 from textwrap import dedent
 from typing import (
@@ -37,7 +37,7 @@ from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.messages import RunMessages
 from agno.run.response import RunEvent, RunResponse, RunResponseExtraData
 from agno.run.team import TeamRunResponse
-from agno.storage.base import Storage
+from agno.storage.base import Storage, get_run_id
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
@@ -56,6 +56,7 @@ from agno.utils.response import create_panel, escape_markdown_tags, format_tool_
 from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
+from agno.utils.tools import copy_tools
 
 
 @dataclass(init=False)
@@ -102,6 +103,9 @@ class Agent:
     enable_session_summaries: bool = False
     # If True, the agent adds a reference to the session summaries in the response
     add_session_summary_references: Optional[bool] = None
+    # If True, user memories and session summaries are created by a background worker after the run returns.
+    # Use `agno.memory.v2.worker.memory_worker.flush()` to wait for them.
+    create_memories_in_background: bool = False
 
     # --- Agent History ---
     # add_history_to_messages=true adds messages from the chat history to the messages list sent to the Model.
@@ -110,6 +114,10 @@ class Agent:
     num_history_responses: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Maximum number of tokens of history to include in the messages, keeping the most recent messages that fit
+    max_history_tokens: Optional[int] = None
+    # Function counting the tokens in a text, used for max_history_tokens. Defaults to tiktoken, if installed.
+    tokenizer: Optional[Callable[[str], int]] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -298,9 +306,12 @@ class Agent:
         add_memory_references: Optional[bool] = None,
         enable_session_summaries: bool = False,
         add_session_summary_references: Optional[bool] = None,
+        create_memories_in_background: bool = False,
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
+        tokenizer: Optional[Callable[[str], int]] = None,
         knowledge: Optional[AgentKnowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         enable_agentic_knowledge_filters: Optional[bool] = None,
@@ -382,10 +393,13 @@ class Agent:
         self.add_memory_references = add_memory_references
         self.enable_session_summaries = enable_session_summaries
         self.add_session_summary_references = add_session_summary_references
+        self.create_memories_in_background = create_memories_in_background
 
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
         self.num_history_runs = num_history_runs
+        self.max_history_tokens = max_history_tokens
+        self.tokenizer = tokenizer
 
         self.knowledge = knowledge
         self.knowledge_filters = knowledge_filters
@@ -483,6 +497,8 @@ class Agent:
         self._functions_for_model: Optional[Dict[str, Function]] = None
 
         self._formatter: Optional[SafeFormatter] = None
+        # Runs already in storage by run_id, as stored, only used if the storage appends runs
+        self._stored_runs: Dict[str, Dict[str, Any]] = {}
 
     def set_agent_id(self) -> str:
         if self.agent_id is None:
@@ -1073,7 +1089,7 @@ class Agent:
         self._set_session_metrics(run_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -1171,7 +1187,7 @@ class Agent:
             )
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -1270,7 +1286,7 @@ class Agent:
         log_debug(f"Session ID: {session_id}", center=True)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id, user_id=user_id)
+        await self.aread_from_storage(session_id=session_id, user_id=user_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -1893,7 +1909,7 @@ class Agent:
         log_debug(f"Session ID: {session_id}", center=True)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id, user_id=user_id)
+        await self.aread_from_storage(session_id=session_id, user_id=user_id)
 
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
@@ -2101,7 +2117,7 @@ class Agent:
         self._set_session_metrics(run_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -2201,7 +2217,7 @@ class Agent:
             )
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -3163,6 +3179,79 @@ class Agent:
         if session_id is not None:
             self.session_state["current_session_id"] = session_id
 
+    def _parse_messages_for_memories(self, messages: Sequence[Union[Dict, Message]]) -> List[Message]:
+        parsed_messages = []
+        for _im in messages:
+            # Parse the message and convert to a Message object if possible
+            if isinstance(_im, Message):
+                parsed_messages.append(_im)
+            elif isinstance(_im, dict):
+                try:
+                    parsed_messages.append(Message(**_im))
+                except Exception as e:
+                    log_warning(f"Failed to validate message during memory update: {e}")
+            else:
+                log_warning(f"Unsupported message type: {type(_im)}")
+        return parsed_messages
+
+    def _queue_memories_and_summaries(
+        self,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+    ) -> None:
+        """Queue creating user memories and the session summary on the background memory worker"""
+        from agno.memory.v2.worker import memory_worker
+
+        self.memory = cast(Memory, self.memory)
+        if self.enable_user_memories and run_messages.user_message is not None:
+            memory_messages = [Message(role="user", content=run_messages.user_message.get_content_string())]
+            if messages is not None and len(messages) > 0:
+                memory_messages.extend(self._parse_messages_for_memories(messages))
+            memory_worker.submit_user_memories(
+                memory=self.memory, messages=memory_messages, session_id=session_id, user_id=user_id
+            )
+
+        if self.enable_session_summaries:
+            # The summary is only created in memory, write it to the stored session once it is ready
+            memory_worker.submit_session_summary(
+                memory=self.memory,
+                session_id=session_id,
+                user_id=user_id,
+                on_done=lambda: self._write_summary_to_storage(session_id=session_id, user_id=user_id),
+            )
+
+    def _write_summary_to_storage(self, session_id: str, user_id: Optional[str] = None) -> None:
+        """Write the summary created in the background to the session in storage.
+        Only the summary of the stored session is updated, as the next run of the agent may be changing its state.
+        """
+        if self.storage is None or not isinstance(self.memory, Memory):
+            return
+        summary = self.memory.get_session_summary(session_id=session_id, user_id=user_id)
+        stored = cast(Optional[AgentSession], self.storage.read(session_id=session_id, user_id=user_id))
+        if summary is None or stored is None:
+            return
+        session = stored.with_summary(summary.to_dict(), user_id=user_id)
+        if self.storage.append_runs:
+            # The storage keeps the runs, only the session is written again
+            session = replace(session, memory={**session.memory, "runs": []})  # type: ignore
+        self.storage.upsert(session=session)
+
+    def _get_history_within_token_budget(self, history: List[Message]) -> List[Message]:
+        from agno.utils.tokens import get_messages_within_token_budget, get_tiktoken_tokenizer
+
+        selected = get_messages_within_token_budget(
+            messages=history,
+            max_tokens=self.max_history_tokens,  # type: ignore
+            tokenizer=self.tokenizer or get_tiktoken_tokenizer(),
+        )
+        if len(selected) < len(history):
+            log_debug(
+                f"Keeping {len(selected)} of {len(history)} history messages within {self.max_history_tokens} tokens"
+            )
+        return selected
+
     def _make_memories_and_summaries(
         self,
         run_messages: RunMessages,
@@ -3170,7 +3259,9 @@ class Agent:
         user_id: Optional[str] = None,
         messages: Optional[List[Message]] = None,
     ) -> None:
-        session_messages: List[Message] = []
+        if self.create_memories_in_background:
+            return self._queue_memories_and_summaries(run_messages, session_id, user_id, messages)
+
         self.memory = cast(Memory, self.memory)
         if self.enable_user_memories and run_messages.user_message is not None:
             log_debug("Creating user memories.")
@@ -3178,24 +3269,8 @@ class Agent:
 
             # TODO: Possibly do both of these in one step
             if messages is not None and len(messages) > 0:
-                parsed_messages = []
-                for _im in messages:
-                    # Parse the message and convert to a Message object if possible
-                    if isinstance(_im, Message):
-                        parsed_messages.append(_im)
-                    elif isinstance(_im, dict):
-                        try:
-                            parsed_messages.append(Message(**_im))
-                        except Exception as e:
-                            log_warning(f"Failed to validate message during memory update: {e}")
-                    else:
-                        log_warning(f"Unsupported message type: {type(_im)}")
-                        continue
-
+                parsed_messages = self._parse_messages_for_memories(messages)
                 if len(parsed_messages) > 0:
-                    if session_messages is None:
-                        session_messages = []
-                    session_messages.extend(parsed_messages)
                     self.memory.create_user_memories(messages=parsed_messages, user_id=user_id)
                 else:
                     log_warning("Unable to add messages to memory")
@@ -3212,42 +3287,40 @@ class Agent:
         user_id: Optional[str] = None,
         messages: Optional[List[Message]] = None,
     ) -> None:
+        from asyncio import gather
+
+        if self.create_memories_in_background:
+            return self._queue_memories_and_summaries(run_messages, session_id, user_id, messages)
+
         self.memory = cast(Memory, self.memory)
-        session_messages: List[Message] = []
-        if self.enable_user_memories and run_messages.user_message is not None:
+
+        async def _acreate_user_memories() -> None:
             log_debug("Creating user memories.")
-            await self.memory.acreate_user_memories(
-                message=run_messages.user_message.get_content_string(), user_id=user_id
+            await self.memory.acreate_user_memories(  # type: ignore
+                message=run_messages.user_message.get_content_string(),  # type: ignore
+                user_id=user_id,
             )
 
             # TODO: Possibly do both of these in one step
             if messages is not None and len(messages) > 0:
-                parsed_messages = []
-                for _im in messages:
-                    # Parse the message and convert to a Message object if possible
-                    if isinstance(_im, Message):
-                        parsed_messages.append(_im)
-                    elif isinstance(_im, dict):
-                        try:
-                            parsed_messages.append(Message(**_im))
-                        except Exception as e:
-                            log_warning(f"Failed to validate message during memory update: {e}")
-                    else:
-                        log_warning(f"Unsupported message type: {type(_im)}")
-                        continue
-
+                parsed_messages = self._parse_messages_for_memories(messages)
                 if len(parsed_messages) > 0:
-                    if session_messages is None:
-                        session_messages = []
-                    session_messages.extend(parsed_messages)
-                    await self.memory.acreate_user_memories(messages=parsed_messages, user_id=user_id)
+                    await self.memory.acreate_user_memories(messages=parsed_messages, user_id=user_id)  # type: ignore
                 else:
                     log_warning("Unable to add messages to memory")
 
+        async def _acreate_session_summary() -> None:
+            log_debug("Creating session summary.")
+            await self.memory.acreate_session_summary(session_id=session_id, user_id=user_id)  # type: ignore
+
+        # Create the user memories and the session summary concurrently
+        tasks = []
+        if self.enable_user_memories and run_messages.user_message is not None:
+            tasks.append(_acreate_user_memories())
         # Update the session summary if needed
         if self.enable_session_summaries:
-            log_debug("Creating session summary.")
-            await self.memory.acreate_session_summary(session_id=session_id, user_id=user_id)
+            tasks.append(_acreate_session_summary())
+        await gather(*tasks)
 
     def _raise_if_async_tools(self) -> None:
         """Raise an exception if any tools contain async functions"""
@@ -3551,10 +3624,10 @@ class Agent:
         if self.memory is not None:
             if isinstance(self.memory, AgentMemory):
                 self.memory = cast(AgentMemory, self.memory)
-                memory_dict = self.memory.to_dict()
+                memory_dict = self.memory.to_dict(include_runs=False)
                 # We only persist the runs for the current session ID (not all runs in memory)
                 memory_dict["runs"] = [
-                    agent_run.to_dict()
+                    self._serialize_run(agent_run.response.run_id, agent_run)
                     for agent_run in self.memory.runs
                     if agent_run.response is not None and agent_run.response.session_id == session_id
                 ]
@@ -3562,8 +3635,8 @@ class Agent:
                 self.memory = cast(Memory, self.memory)
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 run_responses = self.memory.runs.get(session_id, [])  # type: ignore
-                memory_dict = self.memory.to_dict()
-                memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                memory_dict = self.memory.to_dict(include_runs=False)
+                memory_dict["runs"] = [self._serialize_run(rr.run_id, rr) for rr in run_responses]
         else:
             memory_dict = None
 
@@ -3581,6 +3654,51 @@ class Agent:
             created_at=int(time()),
         )
 
+    def _serialize_run(
+        self, run_id: Optional[str], run: Union[AgentRun, RunResponse, TeamRunResponse]
+    ) -> Dict[str, Any]:
+        """Serialize a run of the session, reusing the stored dict of a run the storage already has.
+
+        Stored runs are not written again, so every write only serializes the new runs and the current run.
+        """
+        if self._is_run_stored(run_id):
+            return self._stored_runs[run_id]  # type: ignore
+        return run.to_dict()
+
+    def _get_session_to_store(self, session: AgentSession) -> AgentSession:
+        """Get a copy of the AgentSession without the runs the storage already has"""
+        if session.memory is None or not session.memory.get("runs") or not self.storage or not self.storage.append_runs:
+            return session
+        runs = [run for run in session.memory["runs"] if not self._is_run_stored(get_run_id(run))]
+        return replace(session, memory={**session.memory, "runs": runs})
+
+    def _set_session_stored(self, stored: Optional[AgentSession], session: AgentSession) -> Optional[AgentSession]:
+        """Get the AgentSession returned by the storage, with all the runs of the session that was written"""
+        if stored is not None and self.storage is not None and self.storage.append_runs:
+            # Storages that append runs return the session they were given, which only has the new runs
+            stored.memory = session.memory
+        self._set_runs_stored(stored)
+        return stored
+
+    def _is_run_stored(self, run_id: Optional[str]) -> bool:
+        """Check if a run can be left out of the AgentSession because the storage already has it.
+
+        Only storages that append runs keep the runs left out of a session. The current run is always included,
+        as it changes until it completes.
+        """
+        if self.storage is None or not self.storage.append_runs:
+            return False
+        return run_id is not None and run_id != self.run_id and run_id in self._stored_runs
+
+    def _set_runs_stored(self, session: Optional[AgentSession]) -> None:
+        """Record the runs of an AgentSession read from or written to storage as stored"""
+        if session is None or session.memory is None or self.storage is None or not self.storage.append_runs:
+            return
+        for run in session.memory.get("runs") or []:
+            run_id = get_run_id(run)
+            if run_id is not None:
+                self._stored_runs[run_id] = run
+
     def load_agent_session(self, session: AgentSession):
         """Load the existing Agent from an AgentSession (from the database)"""
 
@@ -3793,6 +3911,7 @@ class Agent:
             # Get a single session from storage
             self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
             if self.agent_session is not None:
+                self._set_runs_stored(self.agent_session)
                 # Load the agent session
                 self.load_agent_session(session=self.agent_session)
             else:
@@ -3807,10 +3926,43 @@ class Agent:
             Optional[AgentSession]: The saved AgentSession or None if not saved.
         """
         if self.storage is not None:
-            self.agent_session = cast(
-                AgentSession,
-                self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
-            )
+            agent_session = self.get_agent_session(session_id=session_id, user_id=user_id)
+            stored = self.storage.upsert(session=self._get_session_to_store(agent_session))
+            self.agent_session = self._set_session_stored(cast(Optional[AgentSession], stored), agent_session)
+        return self.agent_session
+
+    async def aread_from_storage(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> Optional[AgentSession]:
+        """Load the AgentSession from storage asynchronously
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None:
+            # Get a single session from storage
+            self.agent_session = cast(AgentSession, await self.storage.aread(session_id=session_id))
+            if self.agent_session is not None:
+                self._set_runs_stored(self.agent_session)
+                # Load the agent session
+                self.load_agent_session(session=self.agent_session)
+            else:
+                # New session, just reset the state
+                self.session_name = None
+        return self.agent_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """Save the AgentSession to storage asynchronously
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            agent_session = self.get_agent_session(session_id=session_id, user_id=user_id)
+            stored = await self.storage.aupsert(session=self._get_session_to_store(agent_session))
+            self.agent_session = self._set_session_stored(cast(Optional[AgentSession], stored), agent_session)
         return self.agent_session
 
     def add_introduction(self, introduction: str) -> None:
@@ -4382,8 +4534,6 @@ class Agent:
 
         # 3. Add history to run_messages
         if self.add_history_to_messages:
-            from copy import deepcopy
-
             history: List[Message] = []
             if isinstance(self.memory, AgentMemory):
                 history = self.memory.get_messages_from_last_n_runs(
@@ -4393,13 +4543,12 @@ class Agent:
                 history = self.memory.get_messages_from_last_n_runs(
                     session_id=session_id, last_n=self.num_history_runs, skip_role=self.system_message_role
                 )
+            if self.max_history_tokens is not None:
+                history = self._get_history_within_token_budget(history)
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Shallow copy the history messages and tag them as coming from history. The copies share their
+                # content, media and tool calls with the original messages, which are never modified in place.
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
@@ -4505,8 +4654,6 @@ class Agent:
 
         # 3. Add history to run_messages
         if self.add_history_to_messages:
-            from copy import deepcopy
-
             history: List[Message] = []
             if isinstance(self.memory, AgentMemory):
                 history = self.memory.get_messages_from_last_n_runs(
@@ -4516,13 +4663,12 @@ class Agent:
                 history = self.memory.get_messages_from_last_n_runs(
                     session_id=session_id, last_n=self.num_history_runs, skip_role=self.system_message_role
                 )
+            if self.max_history_tokens is not None:
+                history = self._get_history_within_token_budget(history)
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Shallow copy the history messages and tag them as coming from history. The copies share their
+                # content, media and tool calls with the original messages, which are never modified in place.
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
@@ -4608,13 +4754,14 @@ class Agent:
         """
         from dataclasses import fields
 
-        # Do not copy agent_session and session_name to the new agent
-        excluded_fields = ["agent_session", "session_name"]
+        # Do not copy agent_session, session_name and the session of the team to the new agent
+        excluded_fields = ["agent_session", "session_name", "team_session_id", "team_session_state"]
         # Extract the fields to set for the new Agent
         fields_for_new_agent: Dict[str, Any] = {}
 
         for f in fields(self):
-            if f.name in excluded_fields:
+            # Fields that are updated are not copied
+            if f.name in excluded_fields or (update and f.name in update):
                 continue
             field_value = getattr(self, f.name)
             if field_value is not None:
@@ -4623,8 +4770,11 @@ class Agent:
         # Update fields if provided
         if update:
             fields_for_new_agent.update(update)
+        # team_id is set after creating the new Agent, as it is not an argument of __init__
+        team_id = fields_for_new_agent.pop("team_id", None)
         # Create a new Agent
         new_agent = self.__class__(**fields_for_new_agent)
+        new_agent.team_id = team_id
         log_debug(f"Created new {self.__class__.__name__}")
         return new_agent
 
@@ -4636,6 +4786,14 @@ class Agent:
         if field_name in ("memory", "reasoning_agent"):
             return field_value.deep_copy()
 
+        # The knowledge base is only read during a run, share it with its vector db client
+        elif field_name == "knowledge":
+            return field_value
+
+        # Share the toolkits, but give each agent its own functions
+        elif field_name == "tools":
+            return copy_tools(field_value)
+
         # For storage, model and reasoning_model, use a deep copy
         elif field_name in ("storage", "model", "reasoning_model"):
             try:
@@ -6073,16 +6231,24 @@ class Agent:
             agent_session: AgentSession = self.agent_session or self.get_agent_session(
                 session_id=session_id, user_id=user_id
             )
+            get_agent_data = self._get_api_session_data(agent_session)
             create_agent_session(
-                session=AgentSessionCreate(
-                    session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
-                ),
+                session=lambda: AgentSessionCreate(session_id=agent_session.session_id, agent_data=get_agent_data()),
                 monitor=self.monitoring,
             )
         except Exception as e:
             log_debug(f"Could not create agent monitor: {e}")
 
+    def _get_api_session_data(self, agent_session: AgentSession) -> Callable[[], Dict[str, Any]]:
+        """Get a function returning the session data of an event, called on the exporter thread.
+
+        Monitoring posts the whole session, so only a snapshot is taken here and it is serialized on the exporter thread.
+        """
+        if self.monitoring:
+            return agent_session.snapshot().to_dict
+        telemetry_data = agent_session.telemetry_data()
+        return lambda: telemetry_data
+
     def _create_run_data(self) -> Dict[str, Any]:
         """Create and return the run data dictionary."""
         run_response_format = "text"
@@ -6130,12 +6296,14 @@ class Agent:
                 session_id=session_id, user_id=user_id
             )
 
+            run_id = self.run_id
+            get_agent_data = self._get_api_session_data(agent_session)
             create_agent_run(
-                run=AgentRunCreate(
-                    run_id=self.run_id,
+                run=lambda: AgentRunCreate(
+                    run_id=run_id,
                     run_data=run_data,
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=get_agent_data(),
                     team_session_id=agent_session.team_session_id,
                 ),
                 monitor=self.monitoring,
@@ -6157,12 +6325,14 @@ class Agent:
                 session_id=session_id, user_id=user_id
             )
 
+            run_id = self.run_id
+            get_agent_data = self._get_api_session_data(agent_session)
             await acreate_agent_run(
-                run=AgentRunCreate(
-                    run_id=self.run_id,
+                run=lambda: AgentRunCreate(
+                    run_id=run_id,
                     run_data=run_data,
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=get_agent_data(),
                     team_session_id=agent_session.team_session_id,
                 ),
                 monitor=self.monitoring,
@@ -0,0 +1,108 @@
+import atexit
+import threading
+from queue import Empty, Full, Queue
+from time import monotonic
+from typing import Callable, List, Optional, Tuple, Union
+
+from httpx import Client as HttpxClient
+from pydantic import BaseModel
+
+from agno.api.api import api
+from agno.utils.log import log_debug
+
+# A payload is the model to post, or a function building it that is called on the exporter thread
+Payload = Union[BaseModel, Callable[[], BaseModel]]
+
+
+class TelemetryExporter:
+    """Posts telemetry and monitoring events to the Agno API from a background thread.
+
+    Events are put on a bounded queue and the caller returns immediately. The exporter thread drains the queue
+    in batches and posts them over one persistent client. When the queue is full, new events are dropped.
+    Pending events are flushed when the interpreter exits.
+    """
+
+    def __init__(self, max_queue_size: int = 1000, max_batch_size: int = 100, flush_interval: float = 1.0):
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        # Number of events dropped because the queue was full
+        self.dropped: int = 0
+
+        self._queue: Queue[Tuple[str, str, Payload]] = Queue(maxsize=max_queue_size)
+        self._client: Optional[HttpxClient] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def export(self, route: str, key: str, payload: Payload) -> bool:
+        """Queue an event to post `{key: payload}` to `route`. Returns False if the event was dropped."""
+        if self._stopped.is_set():
+            return False
+        self._start()
+        try:
+            self._queue.put_nowait((route, key, payload))
+            return True
+        except Full:
+            self.dropped += 1
+            log_debug(f"Telemetry queue is full, dropping event for {route}")
+            return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued events are posted. Returns False if the timeout expired first."""
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Flush pending events, then stop the exporter thread and close the client."""
+        if self._thread is None or self._stopped.is_set():
+            return
+        self.flush(timeout=timeout)
+        self._stopped.set()
+        self._thread.join(timeout=self.flush_interval + 1)
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="agno-telemetry", daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except Empty:
+                continue
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            self._post_batch(batch)
+
+    def _post_batch(self, batch: List[Tuple[str, str, Payload]]) -> None:
+        for route, key, payload in batch:
+            try:
+                if self._client is None:
+                    self._client = api.AuthenticatedClient()
+                model = payload if isinstance(payload, BaseModel) else payload()
+                response = self._client.post(route, json={key: model.model_dump(exclude_none=True)})
+                response.raise_for_status()
+            except Exception as e:
+                log_debug(f"Could not post telemetry event to {route}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+exporter = TelemetryExporter()
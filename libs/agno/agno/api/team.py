@@ -1,55 +1,31 @@
-from agno.api.api import api
+from typing import Callable, Union
+
+from agno.api.exporter import exporter
 from agno.api.routes import ApiRoutes
 from agno.api.schemas.team import TeamRunCreate, TeamSessionCreate
 from agno.cli.settings import agno_cli_settings
 from agno.utils.log import log_debug
 
 
-def create_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
+def create_team_run(run: Union[TeamRunCreate, Callable[[], TeamRunCreate]], monitor: bool = False) -> None:
     if not agno_cli_settings.api_enabled:
         return
 
     log_debug("--**-- Logging Team Run")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            response = api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-            response.raise_for_status()
-        except Exception as e:
-            log_debug(f"Could not create Team run: {e}")
-    return
-
-
-async def acreate_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
-    if not agno_cli_settings.api_enabled:
-        return
+    exporter.export(ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE, "run", run)
 
-    log_debug("--**-- Logging Team Run")
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            response = await api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-            response.raise_for_status()
-        except Exception as e:
-            log_debug(f"Could not create Team run: {e}")
-
-
-def upsert_team_session(session: TeamSessionCreate, monitor: bool = False) -> None:
+
+async def acreate_team_run(run: Union[TeamRunCreate, Callable[[], TeamRunCreate]], monitor: bool = False) -> None:
+    """Queue the run on the exporter, which never blocks the event loop"""
+    create_team_run(run=run, monitor=monitor)
+
+
+def upsert_team_session(
+    session: Union[TeamSessionCreate, Callable[[], TeamSessionCreate]], monitor: bool = False
+) -> None:
     if not agno_cli_settings.api_enabled:
         return
 
     log_debug("--**-- Logging Team Session")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            if monitor:
-                api_client.post(
-                    ApiRoutes.TEAM_SESSION_CREATE,
-                    json={"session": session.model_dump(exclude_none=True)},
-                )
-        except Exception as e:
-            log_debug(f"Could not create Agent session: {e}")
-    return
+    if monitor:
+        exporter.export(ApiRoutes.TEAM_SESSION_CREATE, "session", session)
@@ -2,11 +2,12 @@ from io import BytesIO
 from typing import AsyncGenerator, List, Optional, cast
 from uuid import uuid4
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.pool import AgentPool
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.run.response import RunEvent
@@ -245,8 +246,12 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
 
         return base64_images, base64_audios, base64_videos, document_files
 
+    # Each request runs on its own copy of the agent or team, so concurrent requests do not share run state
+    pool = AgentPool(agent) if agent else AgentPool(team)  # type: ignore
+
     @router.post("/run")
     async def run_agent_team(
+        background_tasks: BackgroundTasks,
         message: str = Form(...),
         stream: bool = Form(False),
         monitor: bool = Form(False),
@@ -260,16 +265,16 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
             logger.debug("Creating new session")
             session_id = str(uuid4())
 
+        run_agent: Optional[Agent] = None
+        run_team: Optional[Team] = None
         if agent:
-            if monitor:
-                agent.monitoring = True
-            else:
-                agent.monitoring = False
+            run_agent = cast(Agent, pool.acquire())
+            run_agent.monitoring = monitor
         elif team:
-            if monitor:
-                team.monitoring = True
-            else:
-                team.monitoring = False
+            run_team = cast(Team, pool.acquire())
+            run_team.monitoring = monitor
+        # Replace the copy once the response is sent
+        background_tasks.add_task(pool.refill)
 
         base64_images: List[Image] = []
         base64_audios: List[Audio] = []
@@ -282,10 +287,10 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                 base64_images, base64_audios, base64_videos, document_files = await team_process_file(files)
 
         if stream:
-            if agent:
+            if run_agent:
                 return StreamingResponse(
                     agent_chat_response_streamer(
-                        agent,
+                        run_agent,
                         message,
                         session_id=session_id,
                         user_id=user_id,
@@ -295,10 +300,10 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                     ),
                     media_type="text/event-stream",
                 )
-            elif team:
+            elif run_team:
                 return StreamingResponse(
                     team_chat_response_streamer(
-                        team,
+                        run_team,
                         message,
                         session_id=session_id,
                         user_id=user_id,
@@ -310,10 +315,10 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                     media_type="text/event-stream",
                 )
         else:
-            if agent:
+            if run_agent:
                 run_response = cast(
                     RunResponse,
-                    await agent.arun(
+                    await run_agent.arun(
                         message=message,
                         session_id=session_id,
                         user_id=user_id,
@@ -324,8 +329,8 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                     ),
                 )
                 return run_response.to_dict()
-            elif team:
-                team_run_response = await team.arun(
+            elif run_team:
+                team_run_response = await run_team.arun(
                     message=message,
                     session_id=session_id,
                     user_id=user_id,
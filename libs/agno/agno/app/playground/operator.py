@@ -4,6 +4,7 @@ from agno.agent.agent import Agent, AgentRun, Function, Toolkit
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.summary import SessionSummary
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.team.team import Team
@@ -80,6 +81,12 @@ def get_session_title(session: Union[AgentSession, TeamSession]) -> str:
     return "Unnamed session"
 
 
+def get_session_summary_title(session: SessionSummary) -> str:
+    if session.session_name is not None:
+        return session.session_name
+    return session.title or "Unnamed session"
+
+
 def get_session_title_from_workflow_session(workflow_session: WorkflowSession) -> str:
     if workflow_session is None:
         return "Unnamed session"
@@ -4,16 +4,14 @@ from io import BytesIO
 from typing import Any, Dict, Generator, List, Optional, cast
 from uuid import uuid4
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
+    get_session_summary_title,
     get_team_by_id,
     get_workflow_by_id,
 )
@@ -33,6 +31,7 @@ from agno.app.playground.schemas import (
     WorkflowsGetResponse,
 )
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.pool import AgentPool, get_agent_pool
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.memory.agent import AgentMemory
@@ -123,6 +122,8 @@ def get_sync_playground_router(
     agents: Optional[List[Agent]] = None, workflows: Optional[List[Workflow]] = None, teams: Optional[List[Team]] = None
 ) -> APIRouter:
     playground_router = APIRouter(prefix="/playground", tags=["Playground"])
+    # Copies of the agents and teams that run requests, created on their first run
+    agent_pools: Dict[int, AgentPool] = {}
     if agents is None and workflows is None and teams is None:
         raise ValueError("Either agents, teams or workflows must be provided.")
 
@@ -208,6 +209,7 @@ def get_sync_playground_router(
     @playground_router.post("/agents/{agent_id}/runs")
     def create_agent_run(
         agent_id: str,
+        background_tasks: BackgroundTasks,
         message: str = Form(...),
         stream: bool = Form(True),
         monitor: bool = Form(False),
@@ -226,11 +228,6 @@ def get_sync_playground_router(
             logger.debug("Creating new session")
             session_id = str(uuid4())
 
-        if monitor:
-            agent.monitoring = True
-        else:
-            agent.monitoring = False
-
         base64_images: List[Image] = []
         base64_audios: List[Audio] = []
         base64_videos: List[Video] = []
@@ -323,6 +320,16 @@ def get_sync_playground_router(
                     else:
                         raise HTTPException(status_code=400, detail="Unsupported file type")
 
+        # Run on a copy of the agent, so concurrent runs do not share run state. The copy is replaced after the response.
+        pool = get_agent_pool(agent_pools, agent)
+        agent = cast(Agent, pool.acquire())
+        background_tasks.add_task(pool.refill)
+
+        if monitor:
+            agent.monitoring = True
+        else:
+            agent.monitoring = False
+
         if stream and agent.is_streamable:
             return StreamingResponse(
                 chat_response_streamer(
@@ -352,7 +359,13 @@ def get_sync_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    def get_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -361,15 +374,20 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
+        try:
+            page = agent.storage.list_sessions(user_id=user_id, entity_id=agent_id, limit=limit, cursor=cursor)
+        except ValueError as e:
+            return JSONResponse(status_code=400, content=str(e))
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        for session in page.sessions:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
+                    title=get_session_summary_title(session),
                     session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
+                    session_name=session.session_name,
                     created_at=session.created_at,
                 )
             )
@@ -422,11 +440,9 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
+        if agent.storage.exists(session_id, user_id=body.user_id, entity_id=agent_id):
+            agent.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -439,11 +455,9 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
+        if agent.storage.exists(session_id, user_id=user_id, entity_id=agent_id):
+            agent.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -521,7 +535,13 @@ def get_sync_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions", response_model=List[WorkflowSessionResponse])
-    def get_all_workflow_sessions(workflow_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_workflow_sessions(
+        workflow_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -531,23 +551,25 @@ def get_sync_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve a page of sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            page = workflow.storage.list_sessions(user_id=user_id, entity_id=workflow_id, limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         # Return the sessions
         return [
             WorkflowSessionResponse(
-                title=get_session_title_from_workflow_session(session),
+                title=get_session_summary_title(session),
                 session_id=session.session_id,
-                session_name=session.session_data.get("session_name") if session.session_data else None,
+                session_name=session.session_name,
                 created_at=session.created_at,
             )
-            for session in all_workflow_sessions
+            for session in page.sessions
         ]
 
     @playground_router.get("/workflows/{workflow_id}/sessions/{session_id}", response_model=WorkflowSession)
@@ -614,6 +636,7 @@ def get_sync_playground_router(
     @playground_router.post("/teams/{team_id}/runs")
     def create_team_run(
         team_id: str,
+        background_tasks: BackgroundTasks,
         message: str = Form(...),
         stream: bool = Form(True),
         monitor: bool = Form(True),
@@ -632,11 +655,6 @@ def get_sync_playground_router(
             logger.debug("Creating new session")
             session_id = str(uuid4())
 
-        if monitor:
-            team.monitoring = True
-        else:
-            team.monitoring = False
-
         base64_images: List[Image] = []
         base64_audios: List[Audio] = []
         base64_videos: List[Video] = []
@@ -690,6 +708,16 @@ def get_sync_playground_router(
                 else:
                     raise HTTPException(status_code=400, detail="Unsupported file type")
 
+        # Run on a copy of the team, so concurrent runs do not share run state. The copy is replaced after the response.
+        pool = get_agent_pool(agent_pools, team)
+        team = cast(Team, pool.acquire())
+        background_tasks.add_task(pool.refill)
+
+        if monitor:
+            team.monitoring = True
+        else:
+            team.monitoring = False
+
         if stream and team.is_streamable:
             return StreamingResponse(
                 team_chat_response_streamer(
@@ -718,7 +746,13 @@ def get_sync_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
-    def get_all_team_sessions(team_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_team_sessions(
+        team_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -727,18 +761,21 @@ def get_sync_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            page = team.storage.list_sessions(user_id=user_id, entity_id=team_id, limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for session in page.sessions:
             team_sessions.append(
                 TeamSessionResponse(
-                    title=title,
+                    title=get_session_summary_title(session),
                     session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
+                    session_name=session.session_name,
                     created_at=session.created_at,
                 )
             )
@@ -793,11 +830,9 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=body.user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
+        if team.storage.exists(session_id, user_id=body.user_id, entity_id=team_id):
+            team.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -810,11 +845,9 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
+        if team.storage.exists(session_id, user_id=user_id, entity_id=team_id):
+            team.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -0,0 +1,80 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Union
+
+from agno.agent.agent import Agent
+from agno.memory.v2.memory import Memory
+from agno.models.base import Model
+from agno.team.team import Team
+from agno.utils.log import log_debug
+
+
+class AgentPool:
+    """Copies of an agent or team made ahead of time, so that every request runs on its own copy.
+
+    Agents and teams keep the state of the current run on themselves, like the run response, messages and session,
+    so concurrent requests must not run on the same object. `acquire` hands out a copy made with `deep_copy`, which
+    shares the knowledge base and toolkits of the original, and `refill` replaces the copies handed out once the
+    response is sent. Copies are used for one request only, so no run state is carried over between requests.
+
+    A `Memory` is shared by the original and its copies: it keeps the runs and memories of each session and user
+    apart, and the app reads sessions and memories from the original. The models of the copies also use the API
+    clients of the models of the original, which own them, so requests do not open and leak connections of their own.
+    """
+
+    def __init__(self, agent: Union[Agent, Team], size: int = 4):
+        self.agent = agent
+        self.size = size
+
+        # Share one Memory between the copies, instead of each copy creating its own when it runs
+        if self.agent.memory is None:
+            self.agent.memory = Memory()
+
+        self._copies: Deque[Union[Agent, Team]] = deque()
+        self._lock = threading.Lock()
+        self.refill()
+
+    def acquire(self) -> Union[Agent, Team]:
+        """Return a copy for one request, making a new one if the pool is empty"""
+        try:
+            agent_copy = self._copies.popleft()
+        except IndexError:
+            log_debug(f"Agent pool for {self.agent.name or self.agent.__class__.__name__} is empty, making a copy")
+            agent_copy = self._make_copy()
+        # Shared when the copy is handed out, as async clients belong to the event loop of the request
+        self._share_clients(self.agent, agent_copy)
+        return agent_copy
+
+    def refill(self) -> None:
+        """Make copies until the pool is full"""
+        with self._lock:
+            while len(self._copies) < self.size:
+                self._copies.append(self._make_copy())
+
+    def _make_copy(self) -> Union[Agent, Team]:
+        update = {"memory": self.agent.memory} if isinstance(self.agent.memory, Memory) else None
+        return self.agent.deep_copy(update=update)
+
+    def _share_clients(self, agent: Union[Agent, Team], agent_copy: Union[Agent, Team]) -> None:
+        for name in ("model", "reasoning_model"):
+            model: Optional[Model] = getattr(agent, name, None)
+            model_copy: Optional[Model] = getattr(agent_copy, name, None)
+            if model is None or model_copy is None or model_copy is model:
+                continue
+            try:
+                model_copy.share_clients(model)
+            except Exception as e:
+                # E.g. a missing API key, which the copy reports when it runs
+                log_debug(f"Could not share the clients of {model.id}: {e}")
+        if isinstance(agent, Team) and isinstance(agent_copy, Team):
+            for member, member_copy in zip(agent.members, agent_copy.members):
+                self._share_clients(member, member_copy)
+
+
+def get_agent_pool(pools: Dict[int, AgentPool], agent: Union[Agent, Team]) -> AgentPool:
+    """Return the pool of copies of the agent or team, creating it on first use"""
+    pool = pools.get(id(agent))
+    if pool is None:
+        pool = AgentPool(agent)
+        pools[id(agent)] = pool
+    return pool
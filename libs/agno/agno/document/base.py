@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from hashlib import md5
 from typing import Any, Dict, List, Optional
 
 from agno.embedder import Embedder
@@ -17,6 +18,19 @@ class Document:
     usage: Optional[Dict[str, Any]] = None
     reranking_score: Optional[float] = None
 
+    @property
+    def content_hash(self) -> str:
+        """md5 hash of the document content, as used by the vector dbs to identify documents.
+
+        The hash is computed once and reused until the content changes.
+        """
+        cached = self.__dict__.get("_content_hash")
+        if cached is None or cached[0] is not self.content:
+            cleaned_content = self.content.replace("\x00", "\ufffd")
+            cached = (self.content, md5(cleaned_content.encode()).hexdigest())
+            self.__dict__["_content_hash"] = cached
+        return cached[1]
+
     def embed(self, embedder: Optional[Embedder] = None) -> None:
         """Embed the document using the provided embedder"""
 
@@ -24,7 +38,53 @@ class Document:
         if _embedder is None:
             raise ValueError("No embedder provided")
 
-        self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
+        embedding, usage = _embedder.get_embedding_and_usage(self.content)
+        self.set_embedding(embedding, _embedder, usage=usage)
+
+    def set_embedding(self, embedding: List[float], embedder: Embedder, usage: Optional[Dict[str, Any]] = None) -> None:
+        """Set the embedding of the current content, computed with `embedder`"""
+        self.embedding = embedding
+        self.usage = usage
+        self.__dict__["_embedded"] = (self.content, embedder)
+
+    def is_embedded_with(self, embedder: Embedder) -> bool:
+        """True if the embedding was computed with `embedder` and the content has not changed since"""
+        embedded = self.__dict__.get("_embedded")
+        return (
+            self.embedding is not None
+            and embedded is not None
+            and embedded[0] is self.content
+            and embedded[1] is embedder
+        )
+
+    @staticmethod
+    def embed_batch(documents: List["Document"], embedder: Embedder) -> None:
+        """Embed a list of documents using batched requests to the embedder.
+        Documents already embedded with this embedder (see `is_embedded_with`) are skipped. The usage of each document
+        is the usage of the request that embedded it.
+        """
+
+        documents = [document for document in documents if not document.is_embedded_with(embedder)]
+        if not documents:
+            return
+        embeddings, usages = embedder.get_embeddings_batch_and_usage([document.content for document in documents])
+        for document, embedding, usage in zip(documents, embeddings, usages):
+            document.set_embedding(embedding, embedder, usage=usage)
+
+    @staticmethod
+    async def async_embed_batch(documents: List["Document"], embedder: Embedder) -> None:
+        """Embed a list of documents asynchronously using batched requests to the embedder.
+        Documents already embedded with this embedder (see `is_embedded_with`) are skipped.
+        """
+
+        documents = [document for document in documents if not document.is_embedded_with(embedder)]
+        if not documents:
+            return
+        embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(
+            [document.content for document in documents]
+        )
+        for document, embedding, usage in zip(documents, embeddings, usages):
+            document.set_embedding(embedding, embedder, usage=usage)
 
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
@@ -1,57 +1,45 @@
-from typing import List
+from typing import List, Optional
 
 from agno.document.base import Document
+from agno.document.chunking.offsets import get_chunk_ranges, rfind_any
 from agno.document.chunking.strategy import ChunkingStrategy
+from agno.utils.tokens import Tokenizer
 
 
 class FixedSizeChunking(ChunkingStrategy):
-    """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
+    """Chunking strategy that splits text into fixed-size chunks with optional overlap.
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    Pass a `tokenizer`, e.g. `agno.utils.tokens.get_tiktoken_tokenizer()`, to measure `chunk_size` and `overlap` in
+    tokens instead of characters.
+    """
+
+    def __init__(self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Tokenizer] = None):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
         content = self.clean_text(document.content)
-        content_length = len(content)
-        chunked_documents: List[Document] = []
-        chunk_number = 1
+
+        def find_end(start: int, limit: int) -> int:
+            # Ensure we're not splitting a word in half, unless the entire chunk is a word
+            end = rfind_any(content, " \n\r\t", start + 1, limit + 1)
+            return end if end != -1 else limit
+
+        ranges = get_chunk_ranges(content, self.chunk_size, self.overlap, find_end, tokenizer=self.tokenizer)
+        chunk_id_prefix = document.id or document.name
         chunk_meta_data = document.meta_data
-        start = 0
-        while start + self.overlap < content_length:
-            end = min(start + self.chunk_size, content_length)
-
-            # Ensure we're not splitting a word in half
-            if end < content_length:
-                while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
-                    end -= 1
-
-            # If the entire chunk is a word, then just split it at chunk_size
-            if end == start:
-                end = start + self.chunk_size
-
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            elif document.name:
-                chunk_id = f"{document.name}_{chunk_number}"
-            meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
+        return [
+            Document(
+                id=f"{chunk_id_prefix}_{chunk_number}" if chunk_id_prefix else None,
+                name=document.name,
+                meta_data={**chunk_meta_data, "chunk": chunk_number, "chunk_size": end - start},
+                content=content[start:end],
             )
-            chunk_number += 1
-            start = end - self.overlap
-        return chunked_documents
+            for chunk_number, (start, end) in enumerate(ranges, start=1)
+        ]
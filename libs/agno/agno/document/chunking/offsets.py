@@ -0,0 +1,76 @@
+from typing import Callable, List, Optional, Tuple
+
+from agno.utils.tokens import Tokenizer
+
+# Returns where a chunk starting at `start` ends, at or before `limit`, e.g. at the last whitespace
+FindEnd = Callable[[int, int], int]
+
+
+def rfind_any(content: str, chars: str, start: int, end: int) -> int:
+    """Offset of the last of the characters in content[start:end], or -1. The content is not copied."""
+    return max(content.rfind(char, start, end) for char in chars)
+
+
+def get_chunk_ranges(
+    content: str,
+    chunk_size: int,
+    overlap: int,
+    find_end: FindEnd,
+    tokenizer: Optional[Tokenizer] = None,
+) -> List[Tuple[int, int]]:
+    """Split the content into (start, end) offsets of chunks of at most `chunk_size` characters.
+
+    With a tokenizer, `chunk_size` and `overlap` are numbers of tokens instead. Chunk ends are estimated from the
+    characters per token of the previous chunk, and the chunk is tokenized once or twice to check that it fits, so the
+    content is tokenized about once overall.
+    """
+    content_length = len(content)
+    ranges: List[Tuple[int, int]] = []
+    # Characters per token, updated after every chunk
+    chars_per_token = 4.0
+    start = 0
+    while start < content_length:
+        if tokenizer is None:
+            limit = start + chunk_size
+            end = content_length if limit >= content_length else find_end(start, limit)
+            overlap_chars = overlap
+        else:
+            end, num_tokens = _fit_tokens(content, start, chunk_size, find_end, tokenizer, chars_per_token)
+            chars_per_token = (end - start) / max(num_tokens, 1)
+            overlap_chars = int(overlap * chars_per_token)
+        ranges.append((start, end))
+        if end >= content_length:
+            break
+
+        next_start = end - overlap_chars
+        # Always move forward, even if the overlap is longer than the chunk
+        start = next_start if next_start > start else end
+    return ranges
+
+
+def _fit_tokens(
+    content: str, start: int, chunk_size: int, find_end: FindEnd, tokenizer: Tokenizer, chars_per_token: float
+) -> Tuple[int, int]:
+    """End of the longest chunk starting at `start` found with at most `chunk_size` tokens, and its number of tokens"""
+    content_length = len(content)
+    limit = start + max(1, int(chunk_size * chars_per_token))
+    fitting: Optional[Tuple[int, int]] = None
+    while True:
+        end = content_length if limit >= content_length else find_end(start, limit)
+        num_tokens = tokenizer(content[start:end])
+        if num_tokens > chunk_size and end - start > 1:
+            if fitting is not None:
+                # The larger estimate did not fit, keep the chunk that did
+                return fitting
+            # Shrink the chunk in proportion, down to single characters for a word longer than the chunk
+            limit = start + max(1, int((end - start) * chunk_size / num_tokens * 0.95))
+            continue
+
+        if end >= content_length or fitting is not None or num_tokens >= 0.9 * chunk_size:
+            return end, num_tokens
+        # The chunk fits with room to spare, try once to grow it to the estimated size
+        fitting = (end, num_tokens)
+        grown_limit = start + int((end - start) * chunk_size / max(num_tokens, 1))
+        if grown_limit <= limit:
+            return fitting
+        limit = grown_limit
@@ -1,14 +1,20 @@
 import warnings
-from typing import List
+from typing import List, Optional
 
 from agno.document.base import Document
+from agno.document.chunking.offsets import get_chunk_ranges
 from agno.document.chunking.strategy import ChunkingStrategy
+from agno.utils.tokens import Tokenizer
 
 
 class RecursiveChunking(ChunkingStrategy):
-    """Chunking strategy that recursively splits text into chunks by finding natural break points"""
+    """Chunking strategy that recursively splits text into chunks by finding natural break points.
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    Pass a `tokenizer`, e.g. `agno.utils.tokens.get_tiktoken_tokenizer()`, to measure `chunk_size` and `overlap` in
+    tokens instead of characters.
+    """
+
+    def __init__(self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Tokenizer] = None):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
@@ -21,43 +27,31 @@ class RecursiveChunking(ChunkingStrategy):
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer
 
     def chunk(self, document: Document) -> List[Document]:
         """Recursively chunk text by finding natural break points"""
+        # A text has at least as many characters as tokens
         if len(document.content) <= self.chunk_size:
             return [document]
 
-        chunks: List[Document] = []
-        start = 0
-        chunk_meta_data = document.meta_data
-        chunk_number = 1
         content = self.clean_text(document.content)
 
-        while start < len(content):
-            end = min(start + self.chunk_size, len(content))
-
-            if end < len(content):
-                for sep in ["\n", "."]:
-                    last_sep = content[start:end].rfind(sep)
-                    if last_sep != -1:
-                        end = start + last_sep + 1
-                        break
-
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            chunk_number += 1
-            meta_data["chunk_size"] = len(chunk)
-            chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
-
-            new_start = end - self.overlap
-            if new_start <= start:  # Prevent infinite loop
-                new_start = min(
-                    len(content), start + max(1, self.chunk_size // 10)
-                )  # Move forward by at least 10% of chunk size
-            start = new_start
-
-        return chunks
+        def find_end(start: int, limit: int) -> int:
+            for sep in ["\n", "."]:
+                last_sep = content.rfind(sep, start, limit)
+                if last_sep != -1:
+                    return last_sep + 1
+            return limit
+
+        ranges = get_chunk_ranges(content, self.chunk_size, self.overlap, find_end, tokenizer=self.tokenizer)
+        chunk_meta_data = document.meta_data
+        return [
+            Document(
+                id=f"{document.id}_{chunk_number}" if document.id else None,
+                name=document.name,
+                meta_data={**chunk_meta_data, "chunk": chunk_number, "chunk_size": end - start},
+                content=content[start:end],
+            )
+            for chunk_number, (start, end) in enumerate(ranges, start=1)
+        ]
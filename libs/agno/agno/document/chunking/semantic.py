@@ -1,47 +1,163 @@
-from typing import List, Optional
+import re
+from functools import partial
+from typing import List, Optional, Tuple
 
 from agno.document.base import Document
+from agno.document.chunking.offsets import get_chunk_ranges, rfind_any
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.embedder.base import Embedder
 from agno.embedder.openai import OpenAIEmbedder
+from agno.utils.tokens import Tokenizer, get_tiktoken_tokenizer
 
 try:
-    from chonkie import SemanticChunker
+    import numpy as np
 except ImportError:
-    raise ImportError("`chonkie` is required for semantic chunking, please install using `pip install chonkie`")
+    raise ImportError("`numpy` is required for semantic chunking, please install using `pip install numpy`")
+
+# A sentence ends at ".", "!" or "?" followed by whitespace, or at the end of the text
+SENTENCE_PATTERN = re.compile(r"\S.*?(?:[.!?](?=\s)|$)", re.DOTALL)
+
+
+def find_word_end(text: str, start: int, limit: int) -> int:
+    """End of a chunk of the text at the last space before `limit`, so words are not split in half"""
+    end = rfind_any(text, " ", start + 1, limit + 1)
+    return end if end != -1 else limit
 
 
 class SemanticChunking(ChunkingStrategy):
-    """Chunking strategy that splits text into semantic chunks using chonkie"""
+    """Chunking strategy that splits text into semantic chunks.
+
+    The sentences of the document are embedded in batches with the `embedder`, and a new chunk is started where the
+    similarity of two adjacent sentences drops below `similarity_threshold`, or where the chunk would grow past
+    `chunk_size` tokens. Without a threshold, the chunks are split at the 10% least similar sentence pairs.
+
+    Tokens are counted with the `tokenizer`, by default `agno.utils.tokens.get_tiktoken_tokenizer()`, and the tokens of
+    a chunk are counted as the sum of the tokens of its sentences. Pass `count_characters=True` to measure `chunk_size`
+    in characters instead, which needs no tokenizer.
+
+    With `reuse_embeddings=True`, a chunk made of a single sentence gets the embedding of that sentence, so the vector
+    db does not embed it again. The embedding is only reused if the vector db embeds with the same embedder. Most
+    chunks hold several sentences, so this usually saves few embeddings, mostly for short documents or low thresholds.
+    """
 
     def __init__(
-        self, embedder: Optional[Embedder] = None, chunk_size: int = 5000, similarity_threshold: Optional[float] = 0.5
+        self,
+        embedder: Optional[Embedder] = None,
+        chunk_size: int = 5000,
+        similarity_threshold: Optional[float] = 0.5,
+        reuse_embeddings: bool = False,
+        tokenizer: Optional[Tokenizer] = None,
+        count_characters: bool = False,
     ):
         self.embedder = embedder or OpenAIEmbedder(id="text-embedding-3-small")  # type: ignore
         self.chunk_size = chunk_size
         self.similarity_threshold = similarity_threshold
-        self.chunker = SemanticChunker(
-            embedding_model=self.embedder.id,  # type: ignore
-            chunk_size=self.chunk_size,
-            threshold=self.similarity_threshold,
-        )
+        self.reuse_embeddings = reuse_embeddings
+        # Without a tokenizer, sizes are counted in characters
+        self.tokenizer: Optional[Tokenizer] = None if count_characters else tokenizer or get_tiktoken_tokenizer()
 
     def chunk(self, document: Document) -> List[Document]:
-        """Split document into semantic chunks using chokie"""
+        """Split document into semantic chunks"""
         if not document.content:
             return [document]
 
-        # Use chonkie to split into semantic chunks
-        chunks = self.chunker.chunk(self.clean_text(document.content))
+        content = self.clean_text(document.content)
+        sentences, sizes = self._split_sentences(content)
+        if not sentences:
+            return [document]
+
+        embeddings = self.embedder.get_embeddings_batch([content[start:end] for start, end in sentences])
+        breakpoints = self._get_breakpoints(embeddings)
 
-        # Convert chunks to Documents
         chunked_documents: List[Document] = []
-        for i, chunk in enumerate(chunks, 1):
-            meta_data = document.meta_data.copy()
-            meta_data["chunk"] = i
-            chunk_id = f"{document.id}_{i}" if document.id else None
-            meta_data["chunk_size"] = len(chunk.text)
+        for start, end, sentence_index in self._group_sentences(sentences, sizes, breakpoints):
+            chunk_number = len(chunked_documents) + 1
+            chunk = content[start:end]
+            chunked_document = Document(
+                id=f"{document.id}_{chunk_number}" if document.id else None,
+                name=document.name,
+                meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": len(chunk)},
+                content=chunk,
+            )
+            if self.reuse_embeddings and sentence_index is not None:
+                chunked_document.set_embedding(embeddings[sentence_index], self.embedder)
+            chunked_documents.append(chunked_document)
+        return chunked_documents
 
-            chunked_documents.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk.text))
+    def _get_size(self, text: str) -> int:
+        return self.tokenizer(text) if self.tokenizer is not None else len(text)
 
-        return chunked_documents
+    def _split_sentences(self, content: str) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """Start and end offsets of the sentences in the content, and their sizes.
+        Sentences longer than a chunk are split at spaces.
+        """
+        sentences: List[Tuple[int, int]] = []
+        sizes: List[int] = []
+        for match in SENTENCE_PATTERN.finditer(content):
+            start, end = match.span()
+            sentence = content[start:end]
+            size = self._get_size(sentence)
+            if size <= self.chunk_size:
+                sentences.append((start, end))
+                sizes.append(size)
+                continue
+            find_end = partial(find_word_end, sentence)
+            for range_start, range_end in get_chunk_ranges(
+                sentence, self.chunk_size, 0, find_end, tokenizer=self.tokenizer
+            ):
+                sentences.append((start + range_start, start + range_end))
+                sizes.append(self._get_size(sentence[range_start:range_end]))
+        return sentences, sizes
+
+    def _get_breakpoints(self, embeddings: List[List[float]]) -> np.ndarray:
+        """Whether a chunk should end after each sentence, from the similarity of the sentence to the next"""
+        if len(embeddings) < 2:
+            return np.zeros(len(embeddings), dtype=bool)
+
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+        similarities = np.einsum("ij,ij->i", matrix[:-1], matrix[1:])
+
+        threshold = self.similarity_threshold
+        if threshold is None:
+            threshold = float(np.percentile(similarities, 10))
+            breakpoints = similarities <= threshold
+        else:
+            breakpoints = similarities < threshold
+        # The last sentence always ends a chunk
+        return np.append(breakpoints, True)
+
+    def _group_sentences(
+        self, sentences: List[Tuple[int, int]], sizes: List[int], breakpoints: np.ndarray
+    ) -> List[Tuple[int, int, Optional[int]]]:
+        """Start and end offsets of the chunks, and the index of the sentence of single sentence chunks"""
+        chunks: List[Tuple[int, int, Optional[int]]] = []
+        group_start: Optional[int] = None
+        # Tokens of the sentences in the group, with a tokenizer
+        group_tokens = 0
+
+        for index, (start, end) in enumerate(sentences):
+            if group_start is not None:
+                if self.tokenizer is not None:
+                    group_size = group_tokens + sizes[index]
+                else:
+                    # The characters between the sentences count too
+                    group_size = end - sentences[group_start][0]
+                if group_size > self.chunk_size:
+                    chunks.append(self._make_group(sentences, group_start, index - 1))
+                    group_start = None
+            if group_start is None:
+                group_start = index
+                group_tokens = 0
+            group_tokens += sizes[index]
+            if breakpoints[index]:
+                chunks.append(self._make_group(sentences, group_start, index))
+                group_start = None
+
+        if group_start is not None:
+            chunks.append(self._make_group(sentences, group_start, len(sentences) - 1))
+        return chunks
+
+    def _make_group(self, sentences: List[Tuple[int, int]], first: int, last: int) -> Tuple[int, int, Optional[int]]:
+        return sentences[first][0], sentences[last][1], first if first == last else None
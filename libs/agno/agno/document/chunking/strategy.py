@@ -12,20 +12,14 @@ class ChunkingStrategy(ABC):
         raise NotImplementedError
 
     def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
-
+        """Clean the text by replacing every run of whitespace, including newlines and tabs, with a single space"""
+        # Same as re.sub(r"\s+", " ", text), in a fraction of the time on large texts
+        words = text.split()
+        if not words:
+            return " " if text else ""
+        cleaned_text = " ".join(words)
+        if text[0].isspace():
+            cleaned_text = " " + cleaned_text
+        if text[-1].isspace():
+            cleaned_text = cleaned_text + " "
         return cleaned_text
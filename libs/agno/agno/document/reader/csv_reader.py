@@ -3,7 +3,7 @@ import csv
 import io
 import os
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -16,6 +16,7 @@ except ImportError:
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
+from agno.document.reader.stream_reader import StreamReader
 from agno.utils.log import logger
 
 
@@ -35,11 +36,9 @@ class CSVReader(Reader):
                 file_content = io.StringIO(file.read().decode("utf-8"))  # type: ignore
 
             csv_name = Path(file.name).stem if isinstance(file, Path) else file.name.split(".")[0]
-            csv_content = ""
             with file_content as csvfile:
                 csv_reader = csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
-                for row in csv_reader:
-                    csv_content += ", ".join(row) + "\n"
+                csv_content = "".join(", ".join(row) + "\n" for row in csv_reader)
 
             documents = [
                 Document(
@@ -132,6 +131,33 @@ class CSVReader(Reader):
             return []
 
 
+class CSVStreamReader(StreamReader):
+    """Reader for large CSV files, plain or gzipped, that reads the rows lazily and groups them into documents.
+
+    Every document starts with the header row. Pass column names as `metadata_fields` to add their values to the
+    metadata of the documents, e.g. to filter searches by them. Without a header row, columns are named by their
+    position, starting at "0".
+    """
+
+    def __init__(self, delimiter: str = ",", quotechar: str = '"', has_header: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.has_header = has_header
+
+    def read_header(self, stream: IO[str]) -> Optional[List[str]]:
+        if not self.has_header:
+            return None
+        return next(csv.reader(stream, delimiter=self.delimiter, quotechar=self.quotechar), None)
+
+    def iter_records(self, stream: IO[str], fields: Optional[List[str]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for row in csv.reader(stream, delimiter=self.delimiter, quotechar=self.quotechar):
+            if not row:
+                continue
+            values = dict(zip(fields, row)) if fields else {str(i): value for i, value in enumerate(row)}
+            yield ", ".join(row), values
+
+
 class CSVUrlReader(Reader):
     """Reader for CSV files"""
 
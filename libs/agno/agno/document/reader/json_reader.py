@@ -2,14 +2,66 @@ import asyncio
 import json
 from io import BytesIO
 from pathlib import Path
-from typing import IO, Any, List, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
+from agno.document.reader.stream_reader import StreamReader
 from agno.utils.log import log_info
 
 
+def iter_json_values(stream: IO[str], read_size: int = 65536) -> Iterator[Any]:
+    """Decode the JSON values in the stream one by one, reading it in blocks.
+
+    Handles JSON lines or any other whitespace separated values, and the elements of a top level array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+    in_array: Optional[bool] = None
+
+    while True:
+        # Skip the whitespace and, inside an array, the commas between values
+        while position < len(buffer) and (buffer[position].isspace() or (in_array and buffer[position] == ",")):
+            position += 1
+        if position == len(buffer):
+            if eof:
+                return
+            buffer = stream.read(read_size)
+            position = 0
+            eof = not buffer
+            continue
+
+        if in_array is None:
+            in_array = buffer[position] == "["
+            if in_array:
+                position += 1
+                continue
+        if in_array and buffer[position] == "]":
+            return
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+            # A number at the end of the block may continue in the next one
+            complete = end < len(buffer) or eof
+        except ValueError:
+            if eof:
+                raise
+            complete = False
+        if not complete:
+            # Read at least as much as is buffered, so a large value is decoded in linear time
+            more = stream.read(max(read_size, len(buffer) - position))
+            eof = not more
+            buffer = buffer[position:] + more
+            position = 0
+            continue
+
+        yield value
+        position = end
+
+
 class JSONReader(Reader):
     """Reader for JSON files"""
 
@@ -64,3 +116,16 @@ class JSONReader(Reader):
             List[Document]: List of documents from the JSON file
         """
         return await asyncio.to_thread(self.read, path)
+
+
+class JSONStreamReader(StreamReader):
+    """Reader for large JSON files, plain or gzipped, that decodes the values lazily and groups them into documents.
+
+    Reads JSON lines (NDJSON) files and files with a top level array, one element at a time. Pass keys as
+    `metadata_fields` to add the values of those keys of each object to the metadata of the documents, e.g. to filter
+    searches by them.
+    """
+
+    def iter_records(self, stream: IO[str], fields: Optional[List[str]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for value in iter_json_values(stream):
+            yield json.dumps(value), value if isinstance(value, dict) else {}
@@ -1,6 +1,12 @@
 import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from tempfile import NamedTemporaryFile
+from typing import IO, Any, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.document.base import Document
@@ -15,81 +21,157 @@ except ImportError:
     raise ImportError("`pypdf` not installed. Please install it via `pip install pypdf`.")
 
 
-def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
+@lru_cache(maxsize=None)
+def get_ocr_engine() -> Any:
+    """Return the OCR engine of this process, created on first use and reused for all pages and files"""
     try:
         import rapidocr_onnxruntime as rapidocr
     except ImportError:
         raise ImportError(
             "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
         )
-    ocr = rapidocr.RapidOCR()
+    return rapidocr.RapidOCR()
+
+
+def extract_page_text(page: Any, ocr: bool = False) -> str:
+    """Extract the text of a page, and with `ocr` the text of its images"""
+    if not ocr:
+        return page.extract_text()
+
+    ocr_engine = get_ocr_engine()
     page_text = page.extract_text() or ""
-    images_text_list = []
+    images_text_list: List[str] = []
 
     # Extract and process images
     for image_object in page.images:
-        image_data = image_object.data
-
         # Perform OCR on the image
-        ocr_result, elapse = ocr(image_data)
+        ocr_result, _ = ocr_engine(image_object.data)
 
         # Extract text from OCR result
         if ocr_result:
             images_text_list += [item[1] for item in ocr_result]
 
     images_text = "\n".join(images_text_list)
-    content = page_text + "\n" + images_text
+    return page_text + "\n" + images_text
 
-    # Append the document
-    return Document(
-        name=doc_name,
-        id=str(uuid4()),
-        meta_data={"page": page_number},
-        content=content,
-    )
 
+def extract_pages(pdf: str, start: int, end: int, ocr: bool = False) -> List[str]:
+    """Extract the text of the pages from `start` up to `end` of a PDF file.
 
-async def async_process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
-    try:
-        import rapidocr_onnxruntime as rapidocr
-    except ImportError:
-        raise ImportError(
-            "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-        )
-    ocr = rapidocr.RapidOCR()
+    Runs in the worker processes of the pool returned by `get_process_pool`.
+    """
+    doc_reader = DocumentReader(pdf)
+    return [extract_page_text(doc_reader.pages[index], ocr=ocr) for index in range(start, end)]
 
-    page_text = page.extract_text() or ""
-    images_text_list: List = []
-
-    # Process images in parallel
-    async def process_image(image_data: bytes) -> List[str]:
-        ocr_result, _ = ocr(image_data)
-        return [item[1] for item in ocr_result] if ocr_result else []
 
-    image_tasks = [process_image(image.data) for image in page.images]
-    images_results = await asyncio.gather(*image_tasks)
+@lru_cache(maxsize=None)
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the process pool with `max_workers` workers, shared by all PDF readers.
 
-    for result in images_results:
-        images_text_list.extend(result)
+    Workers live as long as the pool, so each keeps its OCR engine loaded between files.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers)
 
-    images_text = "\n".join(images_text_list)
-    content = page_text + "\n" + images_text
 
+def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
     return Document(
         name=doc_name,
         id=str(uuid4()),
         meta_data={"page": page_number},
-        content=content,
+        content=extract_page_text(page, ocr=True),
     )
 
 
+async def async_process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
+    # OCR is CPU bound, run it in a thread so the event loop is not blocked
+    return await asyncio.to_thread(process_image_page, doc_name, page_number, page)
+
+
 class BasePDFReader(Reader):
+    def __init__(self, max_workers: Optional[int] = None, pages_per_task: int = 8, **kwargs):
+        super().__init__(**kwargs)
+        # Number of processes extracting pages in parallel, pages are extracted in this process when not set
+        self.max_workers = max_workers
+        # Number of pages extracted by a worker process at a time
+        self.pages_per_task = pages_per_task
+
     def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
         chunked_documents: List[Document] = []
         for document in documents:
             chunked_documents.extend(self.chunk_document(document))
         return chunked_documents
 
+    def _use_process_pool(self, doc_reader: DocumentReader) -> bool:
+        return self.max_workers is not None and self.max_workers > 1 and len(doc_reader.pages) > self.pages_per_task
+
+    def _get_page_ranges(self, doc_reader: DocumentReader) -> List[Tuple[int, int]]:
+        num_pages = len(doc_reader.pages)
+        return [
+            (start, min(start + self.pages_per_task, num_pages)) for start in range(0, num_pages, self.pages_per_task)
+        ]
+
+    @contextmanager
+    def _get_pdf_path(self, pdf: Union[str, Path, IO[Any]], doc_reader: DocumentReader) -> Iterator[str]:
+        """Yield the path worker processes open the PDF from.
+
+        The content of file-like and downloaded PDFs is written to a temporary file once, instead of being sent to
+        the workers with every page range.
+        """
+        if isinstance(pdf, (str, Path)):
+            yield str(pdf)
+            return
+        doc_reader.stream.seek(0)
+        with NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(doc_reader.stream.read())
+        try:
+            yield temp_file.name
+        finally:
+            os.unlink(temp_file.name)
+
+    def _iter_page_texts(
+        self, pdf: Union[str, Path, IO[Any]], doc_reader: DocumentReader, ocr: bool = False
+    ) -> Iterator[Tuple[int, str]]:
+        """Yield the number and text of each page in page order, extracting page ranges in worker processes"""
+        if not self._use_process_pool(doc_reader):
+            for page_number, page in enumerate(doc_reader.pages, start=1):
+                yield page_number, extract_page_text(page, ocr=ocr)
+            return
+
+        pool = get_process_pool(self.max_workers)  # type: ignore
+        page_ranges = self._get_page_ranges(doc_reader)
+        with self._get_pdf_path(pdf, doc_reader) as path:
+            futures = [pool.submit(extract_pages, path, start, end, ocr) for start, end in page_ranges]
+            try:
+                for (start, _), future in zip(page_ranges, futures):
+                    for page_number, page_text in enumerate(future.result(), start=start + 1):
+                        yield page_number, page_text
+            finally:
+                # Wait for the workers to be done with the file before it is removed
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+
+    async def _async_get_page_texts(
+        self, pdf: Union[str, Path, IO[Any]], doc_reader: DocumentReader, ocr: bool = False
+    ) -> List[Tuple[int, str]]:
+        """Return the number and text of each page in page order, without blocking the event loop"""
+        if not self._use_process_pool(doc_reader):
+            # Text extraction holds the GIL, run it in a thread so the event loop keeps running
+            return await asyncio.to_thread(lambda: list(self._iter_page_texts(pdf, doc_reader, ocr=ocr)))
+
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool(self.max_workers)  # type: ignore
+        page_ranges = self._get_page_ranges(doc_reader)
+        with self._get_pdf_path(pdf, doc_reader) as path:
+            results = await asyncio.gather(
+                *[loop.run_in_executor(pool, extract_pages, path, start, end, ocr) for start, end in page_ranges]
+            )
+        return [
+            (page_number, page_text)
+            for (start, _), page_texts in zip(page_ranges, results)
+            for page_number, page_text in enumerate(page_texts, start=start + 1)
+        ]
+
 
 class PDFReader(BasePDFReader):
     """Reader for PDF files"""
@@ -112,13 +194,13 @@ class PDFReader(BasePDFReader):
             return []
 
         documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
+        for page_number, page_text in self._iter_page_texts(pdf, doc_reader):
             documents.append(
                 Document(
                     name=doc_name,
                     id=str(uuid4()),
                     meta_data={"page": page_number},
-                    content=page.extract_text(),
+                    content=page_text,
                 )
             )
         if self.chunk:
@@ -142,21 +224,15 @@ class PDFReader(BasePDFReader):
             logger.error(f"Error reading PDF: {e}")
             return []
 
-        async def _process_document(doc_name: str, page_number: int, page: Any) -> Document:
-            return Document(
+        documents = [
+            Document(
                 name=doc_name,
                 id=str(uuid4()),
                 meta_data={"page": page_number},
-                content=page.extract_text(),
+                content=page_text,
             )
-
-        # Process pages in parallel using asyncio.gather
-        documents = await asyncio.gather(
-            *[
-                _process_document(doc_name, page_number, page)
-                for page_number, page in enumerate(doc_reader.pages, start=1)
-            ]
-        )
+            for page_number, page_text in await self._async_get_page_texts(pdf, doc_reader)
+        ]
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -174,24 +250,23 @@ class PDFUrlReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         log_info(f"Reading: {url}")
 
         # Retry the request up to 3 times with exponential backoff
         response = fetch_with_retry(url, proxy=self.proxy)
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
+        pdf = BytesIO(response.content)
+        doc_reader = DocumentReader(pdf)
 
         documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
+        for page_number, page_text in self._iter_page_texts(pdf, doc_reader):
             documents.append(
                 Document(
                     name=doc_name,
                     id=f"{doc_name}_{page_number}",
                     meta_data={"page": page_number},
-                    content=page.extract_text(),
+                    content=page_text,
                 )
             )
         if self.chunk:
@@ -202,8 +277,6 @@ class PDFUrlReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
@@ -213,23 +286,18 @@ class PDFUrlReader(BasePDFReader):
             response = await async_fetch_with_retry(url, client=client)
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
+        pdf = BytesIO(response.content)
+        doc_reader = DocumentReader(pdf)
 
-        async def _process_document(doc_name: str, page_number: int, page: Any) -> Document:
-            return Document(
+        documents = [
+            Document(
                 name=doc_name,
                 id=f"{doc_name}_{page_number}",
                 meta_data={"page": page_number},
-                content=page.extract_text(),
+                content=page_text,
             )
-
-        # Process pages in parallel using asyncio.gather
-        documents = await asyncio.gather(
-            *[
-                _process_document(doc_name, page_number, page)
-                for page_number, page in enumerate(doc_reader.pages, start=1)
-            ]
-        )
+            for page_number, page_text in await self._async_get_page_texts(pdf, doc_reader)
+        ]
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -255,8 +323,15 @@ class PDFImageReader(BasePDFReader):
         doc_reader = DocumentReader(pdf)
 
         documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            documents.append(process_image_page(doc_name, page_number, page))
+        for page_number, page_text in self._iter_page_texts(pdf, doc_reader, ocr=True):
+            documents.append(
+                Document(
+                    name=doc_name,
+                    id=str(uuid4()),
+                    meta_data={"page": page_number},
+                    content=page_text,
+                )
+            )
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -278,12 +353,15 @@ class PDFImageReader(BasePDFReader):
         log_info(f"Reading: {doc_name}")
         doc_reader = DocumentReader(pdf)
 
-        documents = await asyncio.gather(
-            *[
-                async_process_image_page(doc_name, page_number, page)
-                for page_number, page in enumerate(doc_reader.pages, start=1)
-            ]
-        )
+        documents = [
+            Document(
+                name=doc_name,
+                id=str(uuid4()),
+                meta_data={"page": page_number},
+                content=page_text,
+            )
+            for page_number, page_text in await self._async_get_page_texts(pdf, doc_reader, ocr=True)
+        ]
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -301,8 +379,6 @@ class PDFUrlImageReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         # Read the PDF from the URL
@@ -310,11 +386,19 @@ class PDFUrlImageReader(BasePDFReader):
         response = httpx.get(url, proxy=self.proxy) if self.proxy else httpx.get(url)
 
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
+        pdf = BytesIO(response.content)
+        doc_reader = DocumentReader(pdf)
 
         documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            documents.append(process_image_page(doc_name, page_number, page))
+        for page_number, page_text in self._iter_page_texts(pdf, doc_reader, ocr=True):
+            documents.append(
+                Document(
+                    name=doc_name,
+                    id=str(uuid4()),
+                    meta_data={"page": page_number},
+                    content=page_text,
+                )
+            )
 
         # Optionally chunk documents
         if self.chunk:
@@ -326,8 +410,6 @@ class PDFUrlImageReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
@@ -338,14 +420,18 @@ class PDFUrlImageReader(BasePDFReader):
             response.raise_for_status()
 
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
+        pdf = BytesIO(response.content)
+        doc_reader = DocumentReader(pdf)
 
-        documents = await asyncio.gather(
-            *[
-                async_process_image_page(doc_name, page_number, page)
-                for page_number, page in enumerate(doc_reader.pages, start=1)
-            ]
-        )
+        documents = [
+            Document(
+                name=doc_name,
+                id=str(uuid4()),
+                meta_data={"page": page_number},
+                content=page_text,
+            )
+            for page_number, page_text in await self._async_get_page_texts(pdf, doc_reader, ocr=True)
+        ]
 
         if self.chunk:
             return self._build_chunked_documents(documents)
@@ -0,0 +1,156 @@
+import asyncio
+import gzip
+import io
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from agno.document.base import Document
+from agno.document.reader.base import Reader
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+@contextmanager
+def open_text_stream(file: Union[Path, IO[Any]], encoding: str = "utf-8") -> Iterator[IO[str]]:
+    """Open a path or a file-like object as a text stream, decompressing gzip input on the fly.
+
+    File-like objects are rewound and left open.
+    """
+    if isinstance(file, Path):
+        with file.open("rb") as binary:
+            compressed = binary.read(2) == GZIP_MAGIC
+            binary.seek(0)
+            if compressed:
+                with gzip.GzipFile(fileobj=binary, mode="rb") as decompressed:
+                    with io.TextIOWrapper(decompressed, encoding=encoding, newline="") as stream:  # type: ignore
+                        yield stream
+            else:
+                with io.TextIOWrapper(binary, encoding=encoding, newline="") as stream:  # type: ignore
+                    yield stream
+        return
+
+    file.seek(0)
+    if isinstance(file, io.TextIOBase):
+        yield file  # type: ignore
+        return
+    compressed = file.read(2) == GZIP_MAGIC
+    file.seek(0)
+    buffer: IO[bytes] = gzip.GzipFile(fileobj=file, mode="rb") if compressed else file  # type: ignore
+    stream = io.TextIOWrapper(buffer, encoding=encoding, newline="")  # type: ignore
+    try:
+        yield stream
+    finally:
+        # Detach the wrapper so that it does not close the file of the caller
+        stream.detach()
+        if compressed:
+            buffer.close()
+
+
+def get_stream_name(file: Union[Path, IO[Any]]) -> str:
+    """Name of the file without its extensions, e.g. `orders` for `orders.csv.gz`"""
+    name = file.name if isinstance(file, Path) else Path(getattr(file, "name", "data")).name
+    return name.split(".")[0]
+
+
+class StreamReader(Reader):
+    """Base class for readers that read a file record by record and group the records into documents.
+
+    Records are read lazily and grouped into documents of about `chunk_size` characters, so files of any size are read
+    with constant memory. The values of `metadata_fields` are added to the metadata of each document, and a new
+    document is started whenever they change, so every record of a document has the same values for the filters.
+    """
+
+    def __init__(
+        self,
+        metadata_fields: Optional[List[str]] = None,
+        max_records_per_document: Optional[int] = None,
+        batch_size: int = 100,
+        encoding: str = "utf-8",
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.metadata_fields = metadata_fields or []
+        self.max_records_per_document = max_records_per_document
+        # Number of documents per list yielded by `iter_document_lists`
+        self.batch_size = batch_size
+        self.encoding = encoding
+
+    def read_header(self, stream: IO[str]) -> Optional[List[str]]:
+        """Read the field names at the start of the stream, e.g. the header row of a CSV file.
+        The field names are repeated at the start of every document.
+        """
+        return None
+
+    def iter_records(self, stream: IO[str], fields: Optional[List[str]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield the text and the field values of each record in the stream"""
+        raise NotImplementedError
+
+    def iter_documents(self, file: Union[Path, IO[Any]]) -> Iterator[Document]:
+        """Yield the documents of the file one by one"""
+        if isinstance(file, Path) and not file.exists():
+            raise FileNotFoundError(f"Could not find file: {file}")
+
+        name = get_stream_name(file)
+        with open_text_stream(file, encoding=self.encoding) as stream:
+            fields = self.read_header(stream)
+            header = ", ".join(fields) if fields else None
+            for document in self._group_records(name, header, self.iter_records(stream, fields)):
+                if self.chunk and len(document.content) > self.chunk_size:
+                    # A single record larger than the target size
+                    yield from self.chunk_document(document)
+                else:
+                    yield document
+
+    def iter_document_lists(self, file: Union[Path, IO[Any]]) -> Iterator[List[Document]]:
+        """Yield the documents of the file in lists of `batch_size` documents"""
+        batch: List[Document] = []
+        for document in self.iter_documents(file):
+            batch.append(document)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def read(self, file: Union[Path, IO[Any]]) -> List[Document]:
+        return list(self.iter_documents(file))
+
+    async def async_read(self, file: Union[Path, IO[Any]]) -> List[Document]:
+        return await asyncio.to_thread(self.read, file)
+
+    def _group_records(
+        self, name: str, header: Optional[str], records: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> Iterator[Document]:
+        header_size = len(header) + 1 if header is not None else 0
+        lines: List[str] = []
+        size = header_size
+        group_values: Optional[Dict[str, Any]] = None
+        start_record = 1
+        document_number = 0
+
+        def make_document() -> Document:
+            content = "\n".join([header] + lines if header is not None else lines)
+            meta_data: Dict[str, Any] = dict(group_values or {})
+            meta_data.update({"start_row": start_record, "rows": len(lines)})
+            return Document(name=name, id=f"{name}_{document_number}", meta_data=meta_data, content=content)
+
+        for record_number, (text, values) in enumerate(records, start=1):
+            record_values = {key: values.get(key) for key in self.metadata_fields}
+            if lines and (
+                record_values != group_values
+                or size + len(text) + 1 > self.chunk_size
+                or (self.max_records_per_document is not None and len(lines) >= self.max_records_per_document)
+            ):
+                document_number += 1
+                yield make_document()
+                lines = []
+                size = header_size
+                start_record = record_number
+            group_values = record_values
+            lines.append(text)
+            size += len(text) + 1
+
+        if lines:
+            document_number += 1
+            yield make_document()
@@ -1,9 +1,14 @@
 import asyncio
 import random
+import threading
 import time
+import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 
 import httpx
 
@@ -17,35 +22,102 @@ except ImportError:
     raise ImportError("The `bs4` package is not installed. Please install it via `pip install beautifulsoup4`.")
 
 
+class HostRateLimiter:
+    """Token bucket rate limiter, with one bucket per host.
+
+    Each request takes a token from the bucket of its host, which refills at `rate` tokens per second up to
+    `capacity` tokens. `reserve` returns how long the caller must wait before sending its request.
+    """
+
+    def __init__(self, rate: Optional[float], capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        # Rate and capacity per host, set from robots.txt
+        self._limits: Dict[str, Tuple[float, int]] = {}
+        # Tokens left and time of the last update per host. Tokens go below 0 when requests are waiting.
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, host: str, rate: float, capacity: int = 1) -> None:
+        with self._lock:
+            self._limits[host] = (rate, capacity)
+            tokens, updated_at = self._buckets.get(host, (capacity, time.monotonic()))
+            self._buckets[host] = (min(tokens, capacity), updated_at)
+
+    def reserve(self, host: str) -> float:
+        """Take a token for a request to the host and return the seconds to wait before sending it"""
+        with self._lock:
+            if host in self._limits:
+                rate, capacity = self._limits[host]
+            elif self.rate is not None and self.rate > 0:
+                rate, capacity = self.rate, self.capacity
+            else:
+                return 0.0
+            now = time.monotonic()
+            tokens, updated_at = self._buckets.get(host, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate) - 1
+            self._buckets[host] = (tokens, now)
+            return 0.0 if tokens >= 0 else -tokens / rate
+
+
 @dataclass
 class WebsiteReader(Reader):
-    """Reader for Websites"""
+    """Reader for Websites
+
+    Pages are fetched by up to `max_concurrency` workers over one pooled connection, and requests to each host are
+    limited to `requests_per_second`. When `respect_robots_txt` is set, pages disallowed by the robots.txt of a host
+    are skipped and its crawl delay or request rate, if any, replaces `requests_per_second` for that host.
+
+    Pages are parsed with BeautifulSoup in the same threads, which hold the GIL while parsing, so parsing runs on one
+    core at a time. Crawls of many large pages are limited by parsing rather than fetching.
+    """
 
     max_depth: int = 3
     max_links: int = 10
+    max_concurrency: int = 5
+    requests_per_second: Optional[float] = 5.0
+    respect_robots_txt: bool = True
 
     _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
+    _urls_to_crawl: Deque[Tuple[str, int]] = field(default_factory=deque)
 
     def __init__(
-        self, max_depth: int = 3, max_links: int = 10, timeout: int = 10, proxy: Optional[str] = None, **kwargs
+        self,
+        max_depth: int = 3,
+        max_links: int = 10,
+        timeout: int = 10,
+        proxy: Optional[str] = None,
+        max_concurrency: int = 5,
+        requests_per_second: Optional[float] = 5.0,
+        respect_robots_txt: bool = True,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.max_depth = max_depth
         self.max_links = max_links
         self.proxy = proxy
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_second = requests_per_second
+        self.respect_robots_txt = respect_robots_txt
 
         self._visited = set()
-        self._urls_to_crawl = []
+        self._urls_to_crawl = deque()
 
     def delay(self, min_seconds=1, max_seconds=3):
         """
         Introduce a random delay.
 
+        Deprecated: requests are limited by `requests_per_second` and the robots.txt of each host instead.
+
         :param min_seconds: Minimum number of seconds to delay. Default is 1.
         :param max_seconds: Maximum number of seconds to delay. Default is 3.
         """
+        warnings.warn(
+            "WebsiteReader.delay is deprecated, use requests_per_second to limit requests",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         sleep_time = random.uniform(min_seconds, max_seconds)
         time.sleep(sleep_time)
 
@@ -53,9 +125,16 @@ class WebsiteReader(Reader):
         """
         Introduce a random delay asynchronously.
 
+        Deprecated: requests are limited by `requests_per_second` and the robots.txt of each host instead.
+
         :param min_seconds: Minimum number of seconds to delay. Default is 1.
         :param max_seconds: Maximum number of seconds to delay. Default is 3.
         """
+        warnings.warn(
+            "WebsiteReader.async_delay is deprecated, use requests_per_second to limit requests",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         sleep_time = random.uniform(min_seconds, max_seconds)
         await asyncio.sleep(sleep_time)
 
@@ -101,6 +180,121 @@ class WebsiteReader(Reader):
 
         return soup.get_text(strip=True, separator=" ")
 
+    def _get_client_args(self) -> Dict[str, Any]:
+        client_args: Dict[str, Any] = {"timeout": self.timeout, "follow_redirects": True}
+        if self.proxy:
+            client_args["proxy"] = self.proxy
+        return client_args
+
+    def _start_crawl(self, url: str, starting_depth: int) -> Set[str]:
+        """Reset the crawl state to start from the URL and return the set of queued URLs"""
+        self._visited = set()
+        self._urls_to_crawl = deque([(url, starting_depth)])
+        return {url}
+
+    def _should_crawl(self, url: str, depth: int, primary_domain: str) -> bool:
+        """Skip the URL if it is already visited, not on the primary domain or deeper than max depth"""
+        return url not in self._visited and urlparse(url).netloc.endswith(primary_domain) and depth <= self.max_depth
+
+    def _queue_links(self, links: List[str], depth: int, queued: Set[str]) -> None:
+        for link in links:
+            if link not in self._visited and link not in queued:
+                queued.add(link)
+                self._urls_to_crawl.append((link, depth))
+
+    def _parse_page(self, url: str, content: bytes, primary_domain: str) -> Tuple[str, List[str]]:
+        """Parse a page and return its main content and the URLs it links to on the primary domain"""
+        soup = BeautifulSoup(content, "html.parser")
+        main_content = self._extract_main_content(soup)
+
+        links: List[str] = []
+        for link in soup.find_all("a", href=True):
+            if not isinstance(link, Tag):
+                continue
+
+            full_url = urljoin(url, str(link["href"]))
+            if not isinstance(full_url, str):
+                continue
+
+            parsed_url = urlparse(full_url)
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                links.append(full_url)
+        return main_content, links
+
+    def _parse_robots_txt(self, url: str, response: Optional[httpx.Response]) -> RobotFileParser:
+        robots = RobotFileParser(urljoin(url, "/robots.txt"))
+        if response is not None and response.status_code in (401, 403):
+            # Access to robots.txt is denied, so nothing may be crawled
+            robots.parse(["User-agent: *", "Disallow: /"])
+        elif response is not None and response.is_success:
+            robots.parse(response.text.splitlines())
+        else:
+            # No robots.txt, everything may be crawled
+            robots.parse([])
+        return robots
+
+    def _apply_robots_txt(
+        self, robots: RobotFileParser, host: str, user_agent: str, rate_limiter: HostRateLimiter
+    ) -> None:
+        """Limit requests to the host to its crawl delay or request rate"""
+        crawl_delay = robots.crawl_delay(user_agent)
+        request_rate = robots.request_rate(user_agent)
+        if crawl_delay:
+            rate_limiter.set_limit(host, rate=1 / float(crawl_delay))
+            log_debug(f"Using a crawl delay of {crawl_delay}s for {host}")
+        elif request_rate and request_rate.requests > 0 and request_rate.seconds > 0:
+            rate_limiter.set_limit(host, rate=request_rate.requests / request_rate.seconds)
+            log_debug(f"Using a request rate of {request_rate.requests}/{request_rate.seconds}s for {host}")
+
+    def _get_robots_txt(
+        self, client: httpx.Client, url: str, user_agent: str, rate_limiter: HostRateLimiter
+    ) -> RobotFileParser:
+        response: Optional[httpx.Response] = None
+        try:
+            response = client.get(urljoin(url, "/robots.txt"))
+        except httpx.HTTPError as e:
+            log_debug(f"Could not fetch robots.txt for {url}: {e}")
+        robots = self._parse_robots_txt(url, response)
+        self._apply_robots_txt(robots, urlparse(url).netloc, user_agent, rate_limiter)
+        return robots
+
+    async def _async_get_robots_txt(
+        self, client: httpx.AsyncClient, url: str, user_agent: str, rate_limiter: HostRateLimiter
+    ) -> RobotFileParser:
+        response: Optional[httpx.Response] = None
+        try:
+            response = await client.get(urljoin(url, "/robots.txt"))
+        except httpx.HTTPError as e:
+            log_debug(f"Could not fetch robots.txt for {url}: {e}")
+        robots = self._parse_robots_txt(url, response)
+        self._apply_robots_txt(robots, urlparse(url).netloc, user_agent, rate_limiter)
+        return robots
+
+    def _fetch_page(
+        self, client: httpx.Client, rate_limiter: HostRateLimiter, url: str, primary_domain: str
+    ) -> Tuple[str, List[str]]:
+        wait_seconds = rate_limiter.reserve(urlparse(url).netloc)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        log_debug(f"Crawling: {url}")
+        response = client.get(url)
+        response.raise_for_status()
+        return self._parse_page(url, response.content, primary_domain)
+
+    async def _async_fetch_page(
+        self, client: httpx.AsyncClient, rate_limiter: HostRateLimiter, url: str, primary_domain: str
+    ) -> Tuple[str, List[str]]:
+        wait_seconds = rate_limiter.reserve(urlparse(url).netloc)
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        log_debug(f"Crawling asynchronously: {url}")
+        response = await client.get(url)
+        response.raise_for_status()
+        # Parse the page in a worker thread, so the event loop keeps fetching other pages
+        return await asyncio.to_thread(self._parse_page, url, response.content, primary_domain)
+
     def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
@@ -122,90 +316,79 @@ class WebsiteReader(Reader):
         like `<article>`, `<main>`, and `<div>` with class names such as "content", "main-content", etc.
         The crawler will also respect the `max_depth` attribute of the WebCrawler class, ensuring it does not
         crawl deeper than the specified depth.
+        Pages are fetched and parsed by `max_concurrency` threads sharing one connection pool. Parsing holds the GIL,
+        so only the fetching runs concurrently.
         """
-        num_links = 0
         crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
-        # Add starting URL with its depth to the global list
-        self._urls_to_crawl.append((url, starting_depth))
-        while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
-
-            # Skip if
-            # - URL is already visited
-            # - does not end with the primary domain,
-            # - exceeds max depth
-            # - exceeds max links
-            if (
-                current_url in self._visited
-                or not urlparse(current_url).netloc.endswith(primary_domain)
-                or current_depth > self.max_depth
-                or num_links >= self.max_links
-            ):
-                continue
-
-            self._visited.add(current_url)
-            self.delay()
-
-            try:
-                log_debug(f"Crawling: {current_url}")
-                response = (
-                    httpx.get(current_url, timeout=self.timeout, proxy=self.proxy)
-                    if self.proxy
-                    else httpx.get(current_url, timeout=self.timeout)
-                )
-
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Extract main content
-                main_content = self._extract_main_content(soup)
-                if main_content:
-                    crawler_result[current_url] = main_content
-                    num_links += 1
-
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
+        queued = self._start_crawl(url, starting_depth)
+        rate_limiter = HostRateLimiter(self.requests_per_second, capacity=self.max_concurrency)
+        robots_by_host: Dict[str, RobotFileParser] = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="agno-crawler")
+        with httpx.Client(**self._get_client_args()) as client, executor:
+            user_agent = client.headers.get("User-Agent", "*")
+            in_flight: Dict[Future, Tuple[str, int]] = {}
+            while self._urls_to_crawl or in_flight:
+                # Fill the free workers with the next URLs, until enough pages have content
+                while (
+                    self._urls_to_crawl
+                    and len(in_flight) < self.max_concurrency
+                    and len(crawler_result) < self.max_links
+                ):
+                    current_url, current_depth = self._urls_to_crawl.popleft()
+                    if not self._should_crawl(current_url, current_depth, primary_domain):
                         continue
+                    self._visited.add(current_url)
+
+                    if self.respect_robots_txt:
+                        host = urlparse(current_url).netloc
+                        if host not in robots_by_host:
+                            robots_by_host[host] = self._get_robots_txt(client, current_url, user_agent, rate_limiter)
+                        if not robots_by_host[host].can_fetch(user_agent, current_url):
+                            log_debug(f"Skipping {current_url}, disallowed by robots.txt")
+                            continue
 
-                    href_str = str(link["href"])
-                    full_url = urljoin(current_url, href_str)
-
-                    if not isinstance(full_url, str):
+                    future = executor.submit(self._fetch_page, client, rate_limiter, current_url, primary_domain)
+                    in_flight[future] = (current_url, current_depth)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_url, current_depth = in_flight.pop(future)
+                    try:
+                        main_content, links = future.result()
+                    except httpx.HTTPStatusError as e:
+                        # Log HTTP status errors but continue crawling other pages
+                        logger.warning(f"HTTP status error while crawling {current_url}: {e}")
+                        # For the initial URL, we should raise the error
+                        if current_url == url and not crawler_result:
+                            raise
+                        continue
+                    except httpx.RequestError as e:
+                        # Log request errors but continue crawling other pages
+                        logger.warning(f"Request error while crawling {current_url}: {e}")
+                        # For the initial URL, we should raise the error
+                        if current_url == url and not crawler_result:
+                            raise
+                        continue
+                    except Exception as e:
+                        # Log other exceptions but continue crawling other pages
+                        logger.warning(f"Failed to crawl {current_url}: {e}")
+                        # For the initial URL, we should raise the error
+                        if current_url == url and not crawler_result:
+                            # Wrap non-HTTP exceptions in a RequestError
+                            raise httpx.RequestError(
+                                f"Failed to crawl starting URL {url}: {str(e)}", request=None
+                            ) from e
                         continue
 
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        full_url_str = str(full_url)
-                        if (
-                            full_url_str not in self._visited
-                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                        ):
-                            self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-            except httpx.HTTPStatusError as e:
-                # Log HTTP status errors but continue crawling other pages
-                logger.warning(f"HTTP status error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    raise
-            except httpx.RequestError as e:
-                # Log request errors but continue crawling other pages
-                logger.warning(f"Request error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    raise
-            except Exception as e:
-                # Log other exceptions but continue crawling other pages
-                logger.warning(f"Failed to crawl {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    # Wrap non-HTTP exceptions in a RequestError
-                    raise httpx.RequestError(f"Failed to crawl starting URL {url}: {str(e)}", request=None) from e
+                    if main_content and len(crawler_result) < self.max_links:
+                        crawler_result[current_url] = main_content
+                    # Add found URLs to the queue, with incremented depth
+                    self._queue_links(links, current_depth + 1, queued)
 
         # If we couldn't crawl any pages, raise an error
         if not crawler_result:
@@ -229,86 +412,84 @@ class WebsiteReader(Reader):
         - httpx.HTTPStatusError: If there's an HTTP status error.
         - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
         """
-        num_links = 0
         crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
+        queued = self._start_crawl(url, starting_depth)
+        rate_limiter = HostRateLimiter(self.requests_per_second, capacity=self.max_concurrency)
+        robots_by_host: Dict[str, RobotFileParser] = {}
 
-        # Clear previously visited URLs and URLs to crawl
-        self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
-
-        client_args = {"proxy": self.proxy} if self.proxy else {}
-        async with httpx.AsyncClient(**client_args) as client:  # type: ignore
-            while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
-
-                if (
-                    current_url in self._visited
-                    or not urlparse(current_url).netloc.endswith(primary_domain)
-                    or current_depth > self.max_depth
-                    or num_links >= self.max_links
-                ):
-                    continue
-
-                self._visited.add(current_url)
-                await self.async_delay()
-
-                try:
-                    log_debug(f"Crawling asynchronously: {current_url}")
-                    response = await client.get(current_url, timeout=self.timeout, follow_redirects=True)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.content, "html.parser")
-
-                    # Extract main content
-                    main_content = self._extract_main_content(soup)
-                    if main_content:
-                        crawler_result[current_url] = main_content
-                        num_links += 1
-
-                    # Add found URLs to the list, with incremented depth
-                    for link in soup.find_all("a", href=True):
-                        if not isinstance(link, Tag):
+        async with httpx.AsyncClient(**self._get_client_args()) as client:
+            user_agent = client.headers.get("User-Agent", "*")
+            in_flight: Dict[asyncio.Task, Tuple[str, int]] = {}
+            try:
+                while self._urls_to_crawl or in_flight:
+                    # Start fetching the next URLs, until enough pages have content
+                    while (
+                        self._urls_to_crawl
+                        and len(in_flight) < self.max_concurrency
+                        and len(crawler_result) < self.max_links
+                    ):
+                        current_url, current_depth = self._urls_to_crawl.popleft()
+                        if not self._should_crawl(current_url, current_depth, primary_domain):
                             continue
-
-                        href_str = str(link["href"])
-                        full_url = urljoin(current_url, href_str)
-
-                        if not isinstance(full_url, str):
+                        self._visited.add(current_url)
+
+                        if self.respect_robots_txt:
+                            host = urlparse(current_url).netloc
+                            if host not in robots_by_host:
+                                robots_by_host[host] = await self._async_get_robots_txt(
+                                    client, current_url, user_agent, rate_limiter
+                                )
+                            if not robots_by_host[host].can_fetch(user_agent, current_url):
+                                log_debug(f"Skipping {current_url}, disallowed by robots.txt")
+                                continue
+
+                        task = asyncio.create_task(
+                            self._async_fetch_page(client, rate_limiter, current_url, primary_domain)
+                        )
+                        in_flight[task] = (current_url, current_depth)
+
+                    if not in_flight:
+                        break
+
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        current_url, current_depth = in_flight.pop(task)
+                        try:
+                            main_content, links = task.result()
+                        except httpx.HTTPStatusError as e:
+                            # Log HTTP status errors but continue crawling other pages
+                            logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and not crawler_result:
+                                raise
+                            continue
+                        except httpx.RequestError as e:
+                            # Log request errors but continue crawling other pages
+                            logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and not crawler_result:
+                                raise
+                            continue
+                        except Exception as e:
+                            # Log other exceptions but continue crawling other pages
+                            logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
+                            # For the initial URL, we should raise the error
+                            if current_url == url and not crawler_result:
+                                # Wrap non-HTTP exceptions in a RequestError
+                                raise httpx.RequestError(
+                                    f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
+                                ) from e
                             continue
 
-                        parsed_url = urlparse(full_url)
-                        if parsed_url.netloc.endswith(primary_domain) and not any(
-                            parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                        ):
-                            full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
-                                self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-                except httpx.HTTPStatusError as e:
-                    # Log HTTP status errors but continue crawling other pages
-                    logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except httpx.RequestError as e:
-                    # Log request errors but continue crawling other pages
-                    logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except Exception as e:
-                    # Log other exceptions but continue crawling other pages
-                    logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        # Wrap non-HTTP exceptions in a RequestError
-                        raise httpx.RequestError(
-                            f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
-                        ) from e
+                        if main_content and len(crawler_result) < self.max_links:
+                            crawler_result[current_url] = main_content
+                        # Add found URLs to the queue, with incremented depth
+                        self._queue_links(links, current_depth + 1, queued)
+            finally:
+                # Cancel the pages still being fetched when the crawl stops early
+                for task in in_flight:
+                    task.cancel()
 
         # If we couldn't crawl any pages, raise an error
         if not crawler_result:
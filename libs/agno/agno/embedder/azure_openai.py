@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, split_usage
 from agno.utils.log import logger
 
 try:
@@ -61,7 +61,7 @@ class AzureOpenAIEmbedder(Embedder):
 
         return AzureOpenAIClient(**_client_params)
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -90,3 +90,11 @@ class AzureOpenAIEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: CreateEmbeddingResponse = self._response(text=texts)
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+        usage = response.usage.model_dump() if response.usage else None
+        return embeddings, split_usage(usage, texts)
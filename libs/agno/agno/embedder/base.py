@@ -1,5 +1,44 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _split_count(count: int, weights: List[int]) -> List[int]:
+    """Split a count in proportion to the weights, so that the parts add up to the count"""
+    total = sum(weights)
+    if total == 0:
+        weights, total = [1] * len(weights), len(weights)
+    parts = [count * weight // total for weight in weights]
+    # Give the rest to the largest remainders
+    by_remainder = sorted(range(len(weights)), key=lambda i: count * weights[i] % total, reverse=True)
+    for i in by_remainder[: count - sum(parts)]:
+        parts[i] += 1
+    return parts
+
+
+def split_usage(usage: Optional[Dict[str, Any]], texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Split the usage of a batch request between its texts, in proportion to their lengths.
+
+    Counts, e.g. `prompt_tokens`, are split so that the usages of the texts add up to the usage of the request. Other
+    values are copied to every text.
+    """
+    if usage is None:
+        return [None] * len(texts)
+    weights = [len(text) for text in texts]
+    usages: List[Dict[str, Any]] = [{} for _ in texts]
+    for key, value in usage.items():
+        if isinstance(value, int) and not isinstance(value, bool):
+            parts: List[Any] = _split_count(value, weights)
+        elif isinstance(value, float):
+            total = sum(weights) or 1
+            parts = [value * weight / total for weight in weights]
+        elif isinstance(value, dict):
+            parts = split_usage(value, texts)
+        else:
+            parts = [value] * len(texts)
+        for text_usage, part in zip(usages, parts):
+            text_usage[key] = part
+    return list(usages)
 
 
 @dataclass
@@ -7,9 +46,77 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts sent to the embedding provider in a single request
+    batch_size: int = 100
+    # Maximum number of batch requests in flight when embedding asynchronously
+    max_concurrency: int = 4
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch of texts, returning the embeddings and the usage for each text.
+        Embedders with native batching should override this, and split the usage of the request with `split_usage`.
+        """
+        try:
+            results = [self.get_embedding_and_usage(text) for text in texts]
+        except NotImplementedError:
+            return [self.get_embedding(text) for text in texts], [None] * len(texts)
+        return [embedding for embedding, _ in results], [usage for _, usage in results]
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch of texts asynchronously. Runs the sync batch in a thread by default."""
+        return await asyncio.to_thread(self._get_batch_embeddings_and_usage, texts)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a list of texts, sending at most `batch_size` texts per request.
+
+        Returns the embeddings and the usage for each text, in the same order as `texts`. Errors of the provider are
+        raised, so no text is left without an embedding.
+        """
+        batch_size = max(1, self.batch_size)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for i in range(0, len(texts), batch_size):
+            batch_embeddings, batch_usages = self._get_batch_embeddings_and_usage(texts[i : i + batch_size])
+            embeddings.extend(batch_embeddings)
+            usages.extend(batch_usages)
+        return embeddings, usages
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a list of texts asynchronously, running up to `max_concurrency` batch requests at once.
+
+        Returns the embeddings and the usage for each text, in the same order as `texts`.
+        """
+        batch_size = max(1, self.batch_size)
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _embed(batch: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+            async with semaphore:
+                return await self._async_get_batch_embeddings_and_usage(batch)
+
+        results = await asyncio.gather(*[_embed(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size)])
+        embeddings = [embedding for batch_embeddings, _ in results for embedding in batch_embeddings]
+        usages = [usage for _, batch_usages in results for usage in batch_usages]
+        return embeddings, usages
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts, sending at most `batch_size` texts per request.
+
+        The returned embeddings are in the same order as `texts`.
+        """
+        return self.get_embeddings_batch_and_usage(texts)[0]
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts asynchronously, running up to `max_concurrency` batch requests at once.
+
+        The returned embeddings are in the same order as `texts`.
+        """
+        return (await self.async_get_embeddings_batch_and_usage(texts))[0]
@@ -0,0 +1,183 @@
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from agno.embedder.base import Embedder
+from agno.utils.log import log_debug, logger
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Wraps an embedder and caches its embeddings, keyed on the embedder and a hash of the text.
+
+    Embeddings are kept in an in-process LRU cache and, if `db_file` is set, in a SQLite database
+    so they survive across processes. Vectors persisted to disk are stored as float32.
+    """
+
+    embedder: Optional[Embedder] = None
+    # Maximum number of embeddings kept in the in-process LRU cache
+    max_size: int = 10000
+    # SQLite database file used to persist embeddings
+    db_file: Optional[Union[str, Path]] = None
+    table_name: str = "embedding_cache"
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("CachedEmbedder requires an embedder to wrap")
+
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.max_concurrency = self.embedder.max_concurrency
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Every key is prefixed with the embedder identity so different models never share vectors
+        model_id = getattr(self.embedder, "id", None)
+        self._namespace = f"{self.embedder.__class__.__name__}:{model_id}:{self.dimensions}:"
+
+        self._db: Optional[sqlite3.Connection] = None
+        if self.db_file is not None:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.db_file), check_same_thread=False)
+            self._db.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, embedding BLOB)")
+            self._db.commit()
+
+    @property
+    def id(self) -> Optional[str]:
+        return getattr(self.embedder, "id", None)
+
+    def get_key(self, text: str) -> str:
+        """Return the cache key for a text"""
+        return sha256((self._namespace + text).encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache hit/miss statistics"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "size": len(self._cache),
+        }
+
+    def clear(self) -> None:
+        """Clear the in-process cache, the persisted embeddings and the statistics"""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._db is not None:
+                self._db.execute(f"DELETE FROM {self.table_name}")
+                self._db.commit()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+
+            missing = [key for key in keys if key not in found]
+            if self._db is not None and missing:
+                # Stay well below SQLite's limit on the number of query parameters
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i : i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._db.execute(
+                        f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    for key, blob in rows:
+                        embedding = array("f", blob).tolist()
+                        found[key] = embedding
+                        self._remember(key, embedding)
+        return found
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def _store(self, items: Dict[str, List[float]]) -> None:
+        # Empty embeddings mean the wrapped embedder failed, so they are never cached
+        items = {key: embedding for key, embedding in items.items() if embedding}
+        if not items:
+            return
+        with self._lock:
+            for key, embedding in items.items():
+                self._remember(key, embedding)
+            if self._db is not None:
+                try:
+                    self._db.executemany(
+                        f"INSERT OR REPLACE INTO {self.table_name} (key, embedding) VALUES (?, ?)",
+                        [(key, array("f", embedding).tobytes()) for key, embedding in items.items()],
+                    )
+                    self._db.commit()
+                except Exception as e:
+                    logger.warning(f"Error persisting embeddings: {e}")
+
+    def _split(self, texts: List[str]) -> Tuple[List[str], Dict[str, List[float]], Dict[str, str]]:
+        """Look up texts in the cache, returning their keys, the cached embeddings and the uncached texts by key"""
+        keys = [self.get_key(text) for text in texts]
+        found = self._lookup(list(set(keys)))
+        uncached: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                uncached.setdefault(key, text)
+
+        self.hits += len(texts) - len(uncached)
+        self.misses += len(uncached)
+        log_debug(f"Embedding cache: {len(texts) - len(uncached)} hits, {len(uncached)} to embed")
+        return keys, found, uncached
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.get_key(text)
+        found = self._lookup([key])
+        if key in found:
+            self.hits += 1
+            return found[key], None
+
+        self.misses += 1
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        self._store({key: embedding})
+        return embedding, usage
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, found, uncached = self._split(texts)
+        usages: Dict[str, Optional[Dict]] = {}
+        if uncached:
+            embeddings, new_usages = self.embedder.get_embeddings_batch_and_usage(list(uncached.values()))  # type: ignore
+            new_items = dict(zip(uncached.keys(), embeddings))
+            usages = dict(zip(uncached.keys(), new_usages))
+            self._store(new_items)
+            found.update(new_items)
+        # Cached embeddings cost nothing, so they have no usage
+        return [found.get(key, []) for key in keys], [usages.get(key) for key in keys]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, found, uncached = self._split(texts)
+        usages: Dict[str, Optional[Dict]] = {}
+        if uncached:
+            embeddings, new_usages = await self.embedder.async_get_embeddings_batch_and_usage(  # type: ignore
+                list(uncached.values())
+            )
+            new_items = dict(zip(uncached.keys(), embeddings))
+            usages = dict(zip(uncached.keys(), new_usages))
+            self._store(new_items)
+            found.update(new_items)
+        return [found.get(key, []) for key in keys], [usages.get(key) for key in keys]
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, split_usage
 from agno.utils.log import logger
 
 try:
@@ -14,6 +14,8 @@ except ImportError:
 @dataclass
 class CohereEmbedder(Embedder):
     id: str = "embed-english-v3.0"
+    # Cohere accepts at most 96 texts per embed request
+    batch_size: int = 96
     input_type: str = "search_query"
     embedding_types: Optional[List[str]] = None
     api_key: Optional[str] = None
@@ -32,6 +34,9 @@ class CohereEmbedder(Embedder):
         return self.cohere_client
 
     def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+        return self._embed_texts(texts=[text])
+
+    def _embed_texts(self, texts: List[str]) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -42,7 +47,7 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        return self.client.embed(texts=texts, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -71,3 +76,17 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self._embed_texts(texts=texts)
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = list(response.embeddings)
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse) and response.embeddings.float_:
+            embeddings = list(response.embeddings.float_)
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+
+        billed_units = response.meta.billed_units if response.meta else None
+        usage = billed_units.model_dump() if billed_units else None
+        return embeddings, split_usage(usage, texts)
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, split_usage
 from agno.utils.log import logger
 
 try:
@@ -47,7 +47,7 @@ class MistralEmbedder(Embedder):
 
         return self.mistral_client
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.id,
@@ -80,3 +80,15 @@ class MistralEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], {}
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingResponse = self._response(text=texts)
+        embeddings: List[Optional[List[float]]] = [None for _ in texts]
+        for i, data in enumerate(response.data or []):
+            index = data.index if data.index is not None else i
+            embeddings[index] = data.embedding
+        if any(not embedding for embedding in embeddings):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {sum(1 for e in embeddings if e)}")
+
+        usage = response.usage.model_dump() if response.usage else None
+        return [embedding or [] for embedding in embeddings], split_usage(usage, texts)
@@ -88,3 +88,17 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+
+        response = self.client.embed(input=texts, model=self.id, **kwargs)
+        embeddings = response["embeddings"] if response and "embeddings" in response else []
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+        for embedding in embeddings:
+            if len(embedding) != self.dimensions:
+                raise ValueError(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
+        return [list(embedding) for embedding in embeddings], [None] * len(texts)
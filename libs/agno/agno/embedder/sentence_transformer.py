@@ -25,14 +25,23 @@ class SentenceTransformerEmbedder(Embedder):
     id: str = "sentence-transformers/all-MiniLM-L6-v2"
     sentence_transformer_client: Optional[SentenceTransformer] = None
 
+    @property
+    def client(self) -> SentenceTransformer:
+        if self.sentence_transformer_client is None:
+            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+        return self.sentence_transformer_client
+
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        model = SentenceTransformer(model_name_or_path=self.id)
-        embedding = model.encode(text)
+        embedding = self.client.encode(text)
         try:
-            return embedding  # type: ignore
+            return embedding.tolist()  # type: ignore
         except Exception as e:
             logger.warning(e)
             return []
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.client.encode(texts, batch_size=self.batch_size)
+        return embeddings.tolist(), [None] * len(texts)  # type: ignore
@@ -1,6 +1,8 @@
 import asyncio
+from collections import Counter
+from hashlib import md5
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -8,6 +10,8 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.knowledge.manifest import KnowledgeManifest, ManifestEntry, hash_file
+from agno.knowledge.pipeline import IngestionPipeline
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb import VectorDb
 
@@ -25,6 +29,10 @@ class AgentKnowledge(BaseModel):
     optimize_on: Optional[int] = 1000
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
+    # Stream documents through concurrent read, chunk, embed and write stages when loading
+    pipeline: Optional[IngestionPipeline] = None
+    # File recording what was indexed from each source file, used by load(incremental=True)
+    manifest_path: Optional[Union[str, Path]] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -91,6 +99,7 @@ class AgentKnowledge(BaseModel):
         recreate: bool = False,
         upsert: bool = False,
         skip_existing: bool = True,
+        incremental: bool = False,
     ) -> None:
         """Load the knowledge base to the vector db
 
@@ -98,6 +107,8 @@ class AgentKnowledge(BaseModel):
             recreate (bool): If True, recreates the collection in the vector db. Defaults to False.
             upsert (bool): If True, upserts documents to the vector db. Defaults to False.
             skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
+            incremental (bool): If True, only reads files that changed since the last load, using the manifest at
+                `manifest_path`, and deletes the documents of removed files. Defaults to False.
         """
         if self.vector_db is None:
             logger.warning("No vector db provided")
@@ -111,6 +122,14 @@ class AgentKnowledge(BaseModel):
             log_info("Creating collection")
             self.vector_db.create()
 
+        if incremental:
+            self.load_incremental(recreate=recreate, upsert=upsert)
+            return
+
+        if self.pipeline is not None:
+            self.pipeline.run(self, upsert=upsert, skip_existing=skip_existing)
+            return
+
         log_info("Loading knowledge base")
         num_documents = 0
         for document_list in self.document_lists:
@@ -142,6 +161,7 @@ class AgentKnowledge(BaseModel):
         recreate: bool = False,
         upsert: bool = False,
         skip_existing: bool = True,
+        incremental: bool = False,
     ) -> None:
         """Load the knowledge base to the vector db asynchronously
 
@@ -149,6 +169,8 @@ class AgentKnowledge(BaseModel):
             recreate (bool): If True, recreates the collection in the vector db. Defaults to False.
             upsert (bool): If True, upserts documents to the vector db. Defaults to False.
             skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
+            incremental (bool): If True, only reads files that changed since the last load, using the manifest at
+                `manifest_path`, and deletes the documents of removed files. Defaults to False.
         """
 
         if self.vector_db is None:
@@ -163,6 +185,14 @@ class AgentKnowledge(BaseModel):
             log_info("Creating collection")
             await self.vector_db.async_create()
 
+        if incremental:
+            await asyncio.to_thread(self.load_incremental, recreate=recreate, upsert=upsert)
+            return
+
+        if self.pipeline is not None:
+            await self.pipeline.arun(self, upsert=upsert, skip_existing=skip_existing)
+            return
+
         log_info("Loading knowledge base")
         num_documents = 0
         async for document_list in self.async_document_lists:
@@ -180,7 +210,7 @@ class AgentKnowledge(BaseModel):
                 # Filter out documents which already exist in the vector db
                 if skip_existing:
                     log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                    documents_to_load = await self.async_filter_existing_documents(document_list)
 
                 if documents_to_load:
                     await self.vector_db.async_insert(documents=documents_to_load, filters=doc.meta_data)
@@ -188,6 +218,129 @@ class AgentKnowledge(BaseModel):
             num_documents += len(documents_to_load)
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
+    def _get_file_sources(self) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Iterate over the files of the knowledge base and the metadata to add to their documents.
+        File based knowledge bases implement this and `_read_file` to support incremental loading.
+        """
+        raise NotImplementedError
+
+    def _read_file(self, path: Path) -> List[Document]:
+        """Read the documents of a single file of the knowledge base"""
+        raise NotImplementedError
+
+    def _delete_content_hashes(self, hashes: Iterable[str]) -> None:
+        hashes = list(hashes)
+        if not hashes:
+            return
+        try:
+            self.vector_db.delete_by_content_hashes(hashes)  # type: ignore
+        except NotImplementedError:
+            logger.warning(
+                f"{self.vector_db.__class__.__name__} does not support deleting documents, "
+                f"keeping {len(hashes)} documents of changed or removed files"
+            )
+
+    def _release_content_hashes(self, hash_counts: "Counter[str]", hashes: Iterable[str]) -> None:
+        """Remove one file from the count of each hash, and delete the documents that no file contains anymore"""
+        unreferenced = []
+        for content_hash in set(hashes):
+            hash_counts[content_hash] -= 1
+            if hash_counts[content_hash] <= 0:
+                del hash_counts[content_hash]
+                unreferenced.append(content_hash)
+        self._delete_content_hashes(unreferenced)
+
+    def load_incremental(self, recreate: bool = False, upsert: bool = False) -> None:
+        """Load only the files that changed since the last load into the vector db.
+
+        Files are compared with the manifest at `manifest_path` by size and modification time, then by content
+        hash. Changed files are re-read and their documents get ids derived from the file path and content, so
+        unchanged content keeps the same ids across loads. Documents of removed files are deleted.
+
+        Args:
+            recreate (bool): If True, ignores the existing manifest. Defaults to False.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+        """
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return
+        if self.manifest_path is None:
+            raise ValueError("manifest_path must be set to load incrementally")
+
+        manifest = KnowledgeManifest.read(self.manifest_path)
+        if recreate:
+            manifest.files = {}
+
+        # Files with identical chunks share the documents of the vector db, which identifies them by content hash,
+        # so a document is only deleted once no file contains it
+        hash_counts = manifest.count_chunk_hashes()
+        seen_files: Set[str] = set()
+        num_changed = 0
+        num_documents = 0
+        try:
+            for file_path, metadata in self._get_file_sources():
+                key = str(file_path.resolve())
+                seen_files.add(key)
+                stat = file_path.stat()
+                entry = manifest.files.get(key)
+                if entry is not None and entry.matches(stat):
+                    continue
+
+                content_hash = hash_file(file_path)
+                if entry is not None and entry.content_hash == content_hash:
+                    # The file was touched but its content did not change
+                    entry.size, entry.mtime_ns = stat.st_size, stat.st_mtime_ns
+                    continue
+
+                documents = self._read_file(file_path)
+                if not documents:
+                    # Keep the previous entry so the file is read again on the next load
+                    logger.warning(f"No documents were read from {file_path}")
+                    continue
+
+                for doc in documents:
+                    if metadata:
+                        doc.meta_data.update(metadata)
+                    if doc.meta_data:
+                        self._track_metadata_structure(doc.meta_data)
+                    doc.id = md5(f"{key}:{doc.content_hash}".encode()).hexdigest()
+                chunk_hashes = [doc.content_hash for doc in documents]
+
+                # Delete the documents of the previous version of the file that no file contains anymore
+                hash_counts.update(set(chunk_hashes))
+                if entry is not None:
+                    self._release_content_hashes(hash_counts, entry.chunk_hashes)
+
+                if upsert and self.vector_db.upsert_available():
+                    self.vector_db.upsert(documents=documents, filters=doc.meta_data)
+                    num_documents += len(documents)
+                else:
+                    # Documents carried over from the previous version of the file are already stored
+                    documents_to_load = self.filter_existing_documents(documents)
+                    if documents_to_load:
+                        self.vector_db.insert(documents=documents_to_load, filters=doc.meta_data)
+                    num_documents += len(documents_to_load)
+
+                manifest.files[key] = ManifestEntry(
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    content_hash=content_hash,
+                    chunk_ids=[doc.id for doc in documents],  # type: ignore
+                    chunk_hashes=chunk_hashes,
+                )
+                num_changed += 1
+
+            removed_files = [key for key in manifest.files if key not in seen_files]
+            for key in removed_files:
+                self._release_content_hashes(hash_counts, manifest.files.pop(key).chunk_hashes)
+
+            log_info(
+                f"Loaded {num_documents} documents from {num_changed} changed files, "
+                f"removed {len(removed_files)} files, {len(seen_files) - num_changed} files unchanged"
+            )
+        finally:
+            manifest.save()
+
     def load_documents(
         self,
         documents: List[Document],
@@ -218,11 +371,7 @@ class AgentKnowledge(BaseModel):
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
-            documents_to_load = (
-                [document for document in documents if not self.vector_db.doc_exists(document)]
-                if skip_existing
-                else documents
-            )
+            documents_to_load = self.filter_existing_documents(documents) if skip_existing else documents
 
             # Insert documents
             if len(documents_to_load) > 0:
@@ -269,20 +418,7 @@ class AgentKnowledge(BaseModel):
         else:
             # Filter out documents which already exist in the vector db
             if skip_existing:
-                try:
-                    # Parallelize existence checks using asyncio.gather
-                    existence_checks = await asyncio.gather(
-                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
-                    )
-
-                    documents_to_load = [
-                        doc
-                        for doc, exists in zip(documents, existence_checks)
-                        if not (isinstance(exists, bool) and exists)
-                    ]
-                except NotImplementedError:
-                    logger.warning("Vector db does not support async doc_exists")
-                    documents_to_load = [document for document in documents if not self.vector_db.doc_exists(document)]
+                documents_to_load = await self.async_filter_existing_documents(documents)
             else:
                 documents_to_load = documents
 
@@ -397,6 +533,57 @@ class AgentKnowledge(BaseModel):
 
         return self.vector_db.delete()
 
+    def _get_existing_content_hashes(self, documents: List[Document]) -> Set[str]:
+        """Return the content hashes of the documents that already exist in the vector database.
+        Uses a single bulk lookup where the vector db supports it, falling back to one check per document.
+        """
+        hashes = [doc.content_hash for doc in documents]
+        try:
+            return self.vector_db.existing_content_hashes(hashes)  # type: ignore
+        except NotImplementedError:
+            return {doc.content_hash for doc in documents if self.vector_db.doc_exists(doc)}  # type: ignore
+
+    async def _aget_existing_content_hashes(self, documents: List[Document]) -> Set[str]:
+        """Return the content hashes of the documents that already exist in the vector database asynchronously."""
+        hashes = [doc.content_hash for doc in documents]
+        try:
+            return await self.vector_db.async_existing_content_hashes(hashes)  # type: ignore
+        except NotImplementedError:
+            pass
+
+        try:
+            existence_checks = await asyncio.gather(
+                *[self.vector_db.async_doc_exists(doc) for doc in documents],  # type: ignore
+                return_exceptions=True,
+            )
+            return {
+                doc.content_hash
+                for doc, exists in zip(documents, existence_checks)
+                if isinstance(exists, bool) and exists
+            }
+        except NotImplementedError:
+            logger.warning("Vector db does not support async doc_exists")
+            return {doc.content_hash for doc in documents if self.vector_db.doc_exists(doc)}  # type: ignore
+
+    def _remove_existing_documents(self, documents: List[Document], existing_hashes: Set[str]) -> List[Document]:
+        """Remove documents whose content already exists in the vector database or earlier in the list."""
+        # Use set for O(1) lookups
+        seen_hashes = set(existing_hashes)
+        original_count = len(documents)
+        filtered_documents = []
+
+        for doc in documents:
+            if doc.content_hash not in seen_hashes:
+                seen_hashes.add(doc.content_hash)
+                filtered_documents.append(doc)
+            else:
+                log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+
+        if len(filtered_documents) < original_count:
+            log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
+
+        return filtered_documents
+
     def filter_existing_documents(self, documents: List[Document]) -> List[Document]:
         """Filter out documents that already exist in the vector database.
 
@@ -409,30 +596,26 @@ class AgentKnowledge(BaseModel):
         Returns:
             List[Document]: Filtered list of documents that don't exist in the database
         """
-        from agno.utils.log import log_debug, log_info
-
         if not self.vector_db:
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
-        # Use set for O(1) lookups
-        seen_content = set()
-        original_count = len(documents)
-        filtered_documents = []
+        return self._remove_existing_documents(documents, self._get_existing_content_hashes(documents))
 
-        for doc in documents:
-            # Check hash and existence in DB
-            content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not self.vector_db.doc_exists(doc):
-                seen_content.add(content_hash)
-                filtered_documents.append(doc)
-            else:
-                log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+    async def async_filter_existing_documents(self, documents: List[Document]) -> List[Document]:
+        """Filter out documents that already exist in the vector database asynchronously.
 
-        if len(filtered_documents) < original_count:
-            log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
+        Args:
+            documents (List[Document]): List of documents to filter
 
-        return filtered_documents
+        Returns:
+            List[Document]: Filtered list of documents that don't exist in the database
+        """
+        if not self.vector_db:
+            log_debug("No vector database configured, skipping document filtering")
+            return documents
+
+        return self._remove_existing_documents(documents, await self._aget_existing_content_hashes(documents))
 
     def _track_metadata_structure(self, metadata: Optional[Dict[str, Any]]) -> None:
         """Track metadata structure to enable filter extraction from queries
@@ -650,7 +833,7 @@ class AgentKnowledge(BaseModel):
             documents_to_insert = documents
             if skip_existing:
                 log_debug("Filtering out existing documents before insertion.")
-                documents_to_insert = self.filter_existing_documents(documents)
+                documents_to_insert = await self.async_filter_existing_documents(documents)
 
             if documents_to_insert:  # type: ignore
                 log_debug(f"Inserting {len(documents_to_insert)} new documents.")
@@ -1,17 +1,19 @@
+import asyncio
 from pathlib import Path
 from typing import AsyncIterator, Iterator, List, Union
 
 from pydantic import Field
 
 from agno.document import Document
-from agno.document.reader.csv_reader import CSVReader
+from agno.document.reader.csv_reader import CSVReader, CSVStreamReader
 from agno.knowledge.agent import AgentKnowledge
 
 
 class CSVKnowledgeBase(AgentKnowledge):
     path: Union[str, Path]
     exclude_files: List[str] = Field(default_factory=list)
-    reader: CSVReader = CSVReader()
+    # Use a CSVStreamReader to read large and gzipped (.csv.gz) files in batches of documents
+    reader: Union[CSVReader, CSVStreamReader] = CSVReader()
 
     @property
     def document_lists(self) -> Iterator[List[Document]]:
@@ -22,28 +24,38 @@ class CSVKnowledgeBase(AgentKnowledge):
             Iterator[List[Document]]: Iterator yielding list of documents
         """
 
-        _csv_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
-
-        if _csv_path.exists() and _csv_path.is_dir():
-            for _csv in _csv_path.glob("**/*.csv"):
-                if _csv.name in self.exclude_files:
-                    continue
+        for _csv in self._get_csv_files():
+            if isinstance(self.reader, CSVStreamReader):
+                yield from self.reader.iter_document_lists(file=_csv)
+            else:
                 yield self.reader.read(file=_csv)
-        elif _csv_path.exists() and _csv_path.is_file() and _csv_path.suffix == ".csv":
-            if _csv_path.name in self.exclude_files:
-                return
-            yield self.reader.read(file=_csv_path)
 
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
+        for _csv in self._get_csv_files():
+            if isinstance(self.reader, CSVStreamReader):
+                document_lists = self.reader.iter_document_lists(file=_csv)
+                while True:
+                    documents = await asyncio.to_thread(next, document_lists, None)
+                    if documents is None:
+                        break
+                    yield documents
+            else:
+                yield await self.reader.async_read(file=_csv)
+
+    def _get_csv_files(self) -> List[Path]:
         _csv_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
+        suffixes = (".csv", ".csv.gz") if isinstance(self.reader, CSVStreamReader) else (".csv",)
 
         if _csv_path.exists() and _csv_path.is_dir():
-            for _csv in _csv_path.glob("**/*.csv"):
-                if _csv.name in self.exclude_files:
-                    continue
-                yield await self.reader.async_read(file=_csv)
-        elif _csv_path.exists() and _csv_path.is_file() and _csv_path.suffix == ".csv":
+            return [
+                _csv
+                for suffix in suffixes
+                for _csv in _csv_path.glob(f"**/*{suffix}")
+                if _csv.name not in self.exclude_files
+            ]
+        elif _csv_path.exists() and _csv_path.is_file() and _csv_path.name.endswith(suffixes):
             if _csv_path.name in self.exclude_files:
-                return
-            yield await self.reader.async_read(file=_csv_path)
+                return []
+            return [_csv_path]
+        return []
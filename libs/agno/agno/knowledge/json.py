@@ -1,15 +1,18 @@
+import asyncio
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from agno.document import Document
-from agno.document.reader.json_reader import JSONReader
+from agno.document.reader.json_reader import JSONReader, JSONStreamReader
 from agno.knowledge.agent import AgentKnowledge
 from agno.utils.log import log_info, logger
 
 
 class JSONKnowledgeBase(AgentKnowledge):
     path: Optional[Union[str, Path, List[Dict[str, Union[str, Dict[str, Any]]]]]] = None
-    reader: JSONReader = JSONReader()
+    # Use a JSONStreamReader to read large, JSON lines (add ".jsonl" to formats) and gzipped files in batches.
+    # A JSONStreamReader also reads the gzipped files of the formats, e.g. ".json.gz" and ".jsonl.gz".
+    reader: Union[JSONReader, JSONStreamReader] = JSONReader()
     formats: List[str] = [".json"]
 
     @property
@@ -26,25 +29,49 @@ class JSONKnowledgeBase(AgentKnowledge):
                     config = item.get("metadata", {})
                     _file_path = Path(file_path)  # type: ignore
                     if self._is_valid_json(_file_path):
-                        documents = self.reader.read(path=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        for documents in self._read_document_lists(_file_path):
+                            if config:
+                                for doc in documents:
+                                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                                    doc.meta_data.update(config)  # type: ignore
+                            yield documents
         else:
             # Handle single path
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
                     if self._is_valid_json(_file):
-                        yield self.reader.read(path=_file)
+                        yield from self._read_document_lists(_file)
             elif self._is_valid_json(_file_path):
-                yield self.reader.read(path=_file_path)
+                yield from self._read_document_lists(_file_path)
+
+    def _read_document_lists(self, path: Path) -> Iterator[List[Document]]:
+        """Read the file in one list of documents, or in batches with a JSONStreamReader"""
+        if isinstance(self.reader, JSONStreamReader):
+            yield from self.reader.iter_document_lists(file=path)
+        else:
+            yield self.reader.read(path=path)
+
+    async def _async_read_document_lists(self, path: Path) -> AsyncIterator[List[Document]]:
+        if isinstance(self.reader, JSONStreamReader):
+            document_lists = self.reader.iter_document_lists(file=path)
+            while True:
+                documents = await asyncio.to_thread(next, document_lists, None)
+                if documents is None:
+                    break
+                yield documents
+        else:
+            yield await self.reader.async_read(path=path)
 
     def _is_valid_json(self, path: Path) -> bool:
         """Helper to check if path is a valid JSON file."""
-        return path.exists() and path.is_file() and path.suffix in self.formats
+        return path.exists() and path.is_file() and path.name.endswith(tuple(self._get_formats()))
+
+    def _get_formats(self) -> List[str]:
+        """Get the file formats read, with their gzipped formats when the reader is a JSONStreamReader"""
+        if isinstance(self.reader, JSONStreamReader):
+            return self.formats + [f"{file_format}.gz" for file_format in self.formats if file_format != ".gz"]
+        return self.formats
 
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
@@ -60,21 +87,23 @@ class JSONKnowledgeBase(AgentKnowledge):
                     config = item.get("metadata", {})
                     _file_path = Path(file_path)  # type: ignore
                     if self._is_valid_json(_file_path):
-                        documents = await self.reader.async_read(path=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        async for documents in self._async_read_document_lists(_file_path):
+                            if config:
+                                for doc in documents:
+                                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                                    doc.meta_data.update(config)  # type: ignore
+                            yield documents
         else:
             # Handle single path
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
                     if self._is_valid_json(_file):
-                        yield await self.reader.async_read(path=_file)
+                        async for documents in self._async_read_document_lists(_file):
+                            yield documents
             elif self._is_valid_json(_file_path):
-                yield await self.reader.async_read(path=_file_path)
+                async for documents in self._async_read_document_lists(_file_path):
+                    yield documents
 
     def load_document(
         self,
@@ -87,12 +116,14 @@ class JSONKnowledgeBase(AgentKnowledge):
         _file_path = Path(path) if isinstance(path, str) else path
 
         # Validate file and prepare collection in one step
-        if not self.prepare_load(_file_path, self.formats, metadata, recreate):
+        # Only the last suffix of the file is checked, e.g. ".gz" of a gzipped JSON file
+        formats = [_file_path.suffix] if self._is_valid_json(_file_path) else self.formats
+        if not self.prepare_load(_file_path, formats, metadata, recreate):
             return
 
         # Read documents
         try:
-            documents = self.reader.read(path=_file_path)
+            documents = self.reader.read(_file_path)
         except Exception as e:
             logger.exception(f"Failed to read documents from file {_file_path}: {e}")
             return
@@ -117,12 +148,14 @@ class JSONKnowledgeBase(AgentKnowledge):
         _file_path = Path(path) if isinstance(path, str) else path
 
         # Validate file and prepare collection in one step
-        if not await self.aprepare_load(_file_path, self.formats, metadata, recreate):
+        # Only the last suffix of the file is checked, e.g. ".gz" of a gzipped JSON file
+        formats = [_file_path.suffix] if self._is_valid_json(_file_path) else self.formats
+        if not await self.aprepare_load(_file_path, formats, metadata, recreate):
             return
 
         # Read documents
         try:
-            documents = await self.reader.async_read(path=_file_path)
+            documents = await self.reader.async_read(_file_path)
         except Exception as e:
             logger.exception(f"Failed to read documents from file {_file_path}: {e}")
             return
@@ -0,0 +1,74 @@
+import json
+import os
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from hashlib import md5
+from pathlib import Path
+from typing import Dict, List, Union
+
+from agno.utils.log import log_debug, logger
+
+
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the md5 hash of a file's contents, read in chunks"""
+    file_hash = md5()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """What was indexed for one source file"""
+
+    size: int
+    mtime_ns: int
+    # Hash of the file contents
+    content_hash: str
+    # Ids of the chunks read from the file, and the content hashes the vector db uses to identify them
+    chunk_ids: List[str] = field(default_factory=list)
+    chunk_hashes: List[str] = field(default_factory=list)
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """True if the file size and modification time are unchanged"""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+@dataclass
+class KnowledgeManifest:
+    """Record of the files indexed into a knowledge base, persisted as a json file.
+
+    Used by `AgentKnowledge.load(incremental=True)` to only re-read files that changed since the last load.
+    """
+
+    path: Path
+    files: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def read(cls, path: Union[str, Path]) -> "KnowledgeManifest":
+        """Read the manifest at `path`, returning an empty manifest if it does not exist or cannot be parsed"""
+        path = Path(path)
+        manifest = cls(path=path)
+        if not path.exists():
+            return manifest
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            manifest.files = {key: ManifestEntry(**entry) for key, entry in data.get("files", {}).items()}
+            log_debug(f"Read knowledge manifest with {len(manifest.files)} files from {path}")
+        except Exception as e:
+            logger.warning(f"Could not read knowledge manifest {path}, starting a new one: {e}")
+        return manifest
+
+    def count_chunk_hashes(self) -> "Counter[str]":
+        """Return the number of files containing each chunk content hash"""
+        return Counter(content_hash for entry in self.files.values() for content_hash in set(entry.chunk_hashes))
+
+    def save(self) -> None:
+        """Write the manifest, replacing the previous version atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        data = {"files": {key: asdict(entry) for key, entry in self.files.items()}}
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.path)
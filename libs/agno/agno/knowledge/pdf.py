@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from pydantic import Field
 
@@ -15,9 +15,8 @@ class PDFKnowledgeBase(AgentKnowledge):
     exclude_files: List[str] = Field(default_factory=list)
     reader: Union[PDFReader, PDFImageReader] = PDFReader()
 
-    @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over PDFs and yield lists of documents."""
+    def _get_file_sources(self) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Iterate over the PDFs to load and the metadata to add to their documents."""
         if self.path is None:
             raise ValueError("Path is not set")
 
@@ -25,25 +24,32 @@ class PDFKnowledgeBase(AgentKnowledge):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
                     # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _pdf_path = Path(file_path)  # type: ignore
+                    _pdf_path = Path(item["path"])  # type: ignore
                     if self._is_valid_pdf(_pdf_path):
-                        documents = self.reader.read(pdf=_pdf_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        yield _pdf_path, item.get("metadata", {})  # type: ignore
         else:
             # Handle single path
             _pdf_path = Path(self.path)
             if _pdf_path.is_dir():
                 for _pdf in _pdf_path.glob("**/*.pdf"):
                     if _pdf.name not in self.exclude_files:
-                        yield self.reader.read(pdf=_pdf)
+                        yield _pdf, {}
             elif self._is_valid_pdf(_pdf_path):
-                yield self.reader.read(pdf=_pdf_path)
+                yield _pdf_path, {}
+
+    def _read_file(self, path: Path) -> List[Document]:
+        return self.reader.read(pdf=path)
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over PDFs and yield lists of documents."""
+        for _pdf_path, config in self._get_file_sources():
+            documents = self._read_file(_pdf_path)
+            if config:
+                for doc in documents:
+                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                    doc.meta_data.update(config)  # type: ignore
+            yield documents
 
     def _is_valid_pdf(self, path: Path) -> bool:
         """Helper to check if path is a valid PDF file."""
@@ -52,32 +58,13 @@ class PDFKnowledgeBase(AgentKnowledge):
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over PDFs and yield lists of documents asynchronously."""
-        if self.path is None:
-            raise ValueError("Path is not set")
-
-        if isinstance(self.path, list):
-            for item in self.path:
-                if isinstance(item, dict) and "path" in item:
-                    # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _pdf_path = Path(file_path)  # type: ignore
-                    if self._is_valid_pdf(_pdf_path):
-                        documents = await self.reader.async_read(pdf=_pdf_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
-        else:
-            # Handle single path
-            _pdf_path = Path(self.path)
-            if _pdf_path.is_dir():
-                for _pdf in _pdf_path.glob("**/*.pdf"):
-                    if _pdf.name not in self.exclude_files:
-                        yield await self.reader.async_read(pdf=_pdf)
-            elif self._is_valid_pdf(_pdf_path):
-                yield await self.reader.async_read(pdf=_pdf_path)
+        for _pdf_path, config in self._get_file_sources():
+            documents = await self.reader.async_read(pdf=_pdf_path)
+            if config:
+                for doc in documents:
+                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                    doc.meta_data.update(config)  # type: ignore
+            yield documents
 
     def load_document(
         self,
@@ -0,0 +1,347 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.strategy import ChunkingStrategy
+from agno.utils.log import log_debug, log_info
+
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
+
+# A unit of work flowing through the pipeline: the documents read from one source and the filters to store them with
+Batch = Tuple[List[Document], Optional[Dict[str, Any]]]
+
+_DONE = object()
+
+
+def _chunk_documents(chunking_strategy: ChunkingStrategy, documents: List[Document]) -> List[Document]:
+    """Chunk a list of documents. Defined at module level so it can run in a process pool."""
+    return [chunk for document in documents for chunk in chunking_strategy.chunk(document)]
+
+
+@dataclass
+class StageStats:
+    """Throughput statistics for one pipeline stage"""
+
+    # Number of items (documents, chunks, embeddings) the stage produced
+    count: int = 0
+    # Total time the stage's workers spent processing, in seconds
+    busy_time: float = 0.0
+    # Wall-clock time of the pipeline run, in seconds
+    elapsed_time: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Items per second over the pipeline run"""
+        return self.count / self.elapsed_time if self.elapsed_time > 0 else 0.0
+
+
+@dataclass
+class IngestionPipeline:
+    """Loads a knowledge base by streaming documents through read, chunk, embed and write stages.
+
+    The stages run concurrently and are connected by bounded queues, so reading the next source overlaps with
+    chunking, embedding and writing the previous ones, and at most `queue_size` batches wait between two stages.
+    A batch is the list of documents read from one source (a file, url, query, ...).
+
+    If the knowledge base reader chunks its documents, chunking is moved out of the reader into its own stage,
+    which can run in a process pool with `chunk_in_processes=True` (the chunking strategy must be picklable).
+    """
+
+    # Maximum number of batches buffered between two stages
+    queue_size: int = 4
+    # Number of workers per stage. Sources are read in order by a single reader.
+    num_chunkers: int = 1
+    num_embedders: int = 2
+    num_writers: int = 1
+    # Chunk documents in a process pool instead of threads
+    chunk_in_processes: bool = False
+
+    stats: Dict[str, StageStats] = field(default_factory=dict)
+
+    def _reset_stats(self) -> None:
+        self.stats = {stage: StageStats() for stage in ("read", "chunk", "embed", "write")}
+        self._lock = threading.Lock()
+
+    def _record(self, stage: str, count: int, started_at: float) -> None:
+        with self._lock:
+            self.stats[stage].count += count
+            self.stats[stage].busy_time += perf_counter() - started_at
+
+    def _log_stats(self, elapsed_time: float) -> None:
+        for stage_stats in self.stats.values():
+            stage_stats.elapsed_time = elapsed_time
+        log_info(
+            f"Ingestion pipeline finished in {elapsed_time:.2f}s: "
+            f"{self.stats['read'].rate:.2f} docs/s, {self.stats['chunk'].rate:.2f} chunks/s, "
+            f"{self.stats['embed'].rate:.2f} embeddings/s, {self.stats['write'].rate:.2f} writes/s"
+        )
+        for stage, stage_stats in self.stats.items():
+            log_debug(f"Stage {stage}: {stage_stats.count} items, busy for {stage_stats.busy_time:.2f}s")
+
+    def _get_chunking_strategy(self, knowledge: "AgentKnowledge") -> Optional[ChunkingStrategy]:
+        """Return the chunking strategy of the knowledge base reader, if the reader chunks its documents"""
+        reader = knowledge.reader
+        if reader is None or not reader.chunk:
+            return None
+        if reader.chunking_strategy is None:
+            reader.chunking_strategy = FixedSizeChunking(chunk_size=reader.chunk_size)
+        return reader.chunking_strategy
+
+    def _read_batch(self, knowledge: "AgentKnowledge", document_list: List[Document], started_at: float) -> Batch:
+        for doc in document_list:
+            if doc.meta_data:
+                knowledge._track_metadata_structure(doc.meta_data)
+        # Documents from one source are stored with the metadata of that source, as in AgentKnowledge.load
+        filters = document_list[-1].meta_data if document_list else None
+        self._record("read", len(document_list), started_at)
+        return document_list, filters
+
+    def run(self, knowledge: "AgentKnowledge", upsert: bool = False, skip_existing: bool = True) -> None:
+        """Stream the documents of a knowledge base into its vector db.
+
+        Args:
+            knowledge (AgentKnowledge): The knowledge base to load.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting.
+        """
+        vector_db = knowledge.vector_db
+        if vector_db is None:
+            return
+
+        self._reset_stats()
+        embedder = getattr(vector_db, "embedder", None)
+        chunking_strategy = self._get_chunking_strategy(knowledge)
+        chunk_executor: Optional[Executor] = None
+        if chunking_strategy is not None and self.chunk_in_processes:
+            chunk_executor = ProcessPoolExecutor(max_workers=max(1, self.num_chunkers))
+
+        chunk_queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, self.queue_size))
+        embed_queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, self.queue_size))
+        write_queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, self.queue_size))
+        errors: List[BaseException] = []
+        failed = threading.Event()
+
+        def read() -> None:
+            try:
+                started_at = perf_counter()
+                for document_list in knowledge.document_lists:
+                    if failed.is_set():
+                        break
+                    chunk_queue.put(self._read_batch(knowledge, document_list, started_at))
+                    started_at = perf_counter()
+            except BaseException as e:
+                errors.append(e)
+                failed.set()
+            finally:
+                for _ in range(max(1, self.num_chunkers)):
+                    chunk_queue.put(_DONE)
+
+        def chunk(batch: Batch) -> Batch:
+            started_at = perf_counter()
+            documents, filters = batch
+            if chunking_strategy is not None:
+                if chunk_executor is not None:
+                    documents = chunk_executor.submit(_chunk_documents, chunking_strategy, documents).result()
+                else:
+                    documents = _chunk_documents(chunking_strategy, documents)
+            self._record("chunk", len(documents), started_at)
+            return documents, filters
+
+        def embed(batch: Batch) -> Batch:
+            documents, filters = batch
+            if not (upsert and vector_db.upsert_available()) and skip_existing:
+                documents = knowledge.filter_existing_documents(documents)
+            started_at = perf_counter()
+            if embedder is not None and documents:
+                Document.embed_batch(documents, embedder=embedder)
+            self._record("embed", len(documents), started_at)
+            return documents, filters
+
+        def write(batch: Batch) -> None:
+            documents, filters = batch
+            if not documents:
+                return
+            started_at = perf_counter()
+            if upsert and vector_db.upsert_available():
+                vector_db.upsert(documents=documents, filters=filters)
+            else:
+                vector_db.insert(documents=documents, filters=filters)
+            self._record("write", len(documents), started_at)
+            log_info(f"Added {len(documents)} documents to knowledge base")
+
+        def work(fn: Callable[[Batch], Any], in_queue: "queue.Queue[Any]", out_queue: Optional["queue.Queue[Any]"]):
+            while True:
+                batch = in_queue.get()
+                if batch is _DONE:
+                    return
+                # After a failure, keep draining the input so upstream stages never block on a full queue
+                if failed.is_set():
+                    continue
+                try:
+                    result = fn(batch)
+                    if out_queue is not None:
+                        out_queue.put(result)
+                except BaseException as e:
+                    errors.append(e)
+                    failed.set()
+
+        def start(target: Callable, num_workers: int, *args) -> List[threading.Thread]:
+            threads = [threading.Thread(target=target, args=args, daemon=True) for _ in range(max(1, num_workers))]
+            for thread in threads:
+                thread.start()
+            return threads
+
+        reader = knowledge.reader
+        reader_chunk = reader.chunk if reader is not None else False
+
+        log_info("Loading knowledge base using the ingestion pipeline")
+        pipeline_start = perf_counter()
+        try:
+            # Chunking is moved out of the reader while the pipeline runs, and restored even if it fails
+            if chunking_strategy is not None:
+                reader.chunk = False  # type: ignore
+            stages = [
+                (start(read, 1), chunk_queue),
+                (start(work, self.num_chunkers, chunk, chunk_queue, embed_queue), embed_queue),
+                (start(work, self.num_embedders, embed, embed_queue, write_queue), write_queue),
+                (start(work, self.num_writers, write, write_queue, None), None),
+            ]
+            # Once every worker of a stage is done, tell each worker of the next stage to stop
+            for i, (threads, _) in enumerate(stages):
+                for thread in threads:
+                    thread.join()
+                if 0 < i < len(stages) - 1:
+                    next_queue = stages[i][1]
+                    for _ in stages[i + 1][0]:
+                        next_queue.put(_DONE)  # type: ignore
+        finally:
+            if reader is not None:
+                reader.chunk = reader_chunk
+            if chunk_executor is not None:
+                chunk_executor.shutdown()
+
+        self._log_stats(perf_counter() - pipeline_start)
+        if errors:
+            raise errors[0]
+
+    async def arun(self, knowledge: "AgentKnowledge", upsert: bool = False, skip_existing: bool = True) -> None:
+        """Stream the documents of a knowledge base into its vector db asynchronously.
+
+        Args:
+            knowledge (AgentKnowledge): The knowledge base to load.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting.
+        """
+        vector_db = knowledge.vector_db
+        if vector_db is None:
+            return
+
+        self._reset_stats()
+        embedder = getattr(vector_db, "embedder", None)
+        chunking_strategy = self._get_chunking_strategy(knowledge)
+        chunk_executor: Optional[Executor] = None
+        if chunking_strategy is not None and self.chunk_in_processes:
+            chunk_executor = ProcessPoolExecutor(max_workers=max(1, self.num_chunkers))
+
+        chunk_queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, self.queue_size))
+        embed_queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, self.queue_size))
+        write_queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, self.queue_size))
+
+        async def read() -> None:
+            started_at = perf_counter()
+            async for document_list in knowledge.async_document_lists:
+                await chunk_queue.put(self._read_batch(knowledge, document_list, started_at))
+                started_at = perf_counter()
+
+        async def chunk(batch: Batch) -> Batch:
+            started_at = perf_counter()
+            documents, filters = batch
+            if chunking_strategy is not None:
+                loop = asyncio.get_running_loop()
+                documents = await loop.run_in_executor(chunk_executor, _chunk_documents, chunking_strategy, documents)
+            self._record("chunk", len(documents), started_at)
+            return documents, filters
+
+        async def embed(batch: Batch) -> Batch:
+            documents, filters = batch
+            if not (upsert and vector_db.upsert_available()) and skip_existing:
+                documents = await knowledge.async_filter_existing_documents(documents)
+            started_at = perf_counter()
+            if embedder is not None and documents:
+                await Document.async_embed_batch(documents, embedder=embedder)
+            self._record("embed", len(documents), started_at)
+            return documents, filters
+
+        async def write(batch: Batch) -> None:
+            documents, filters = batch
+            if not documents:
+                return
+            started_at = perf_counter()
+            if upsert and vector_db.upsert_available():
+                await vector_db.async_upsert(documents=documents, filters=filters)
+            else:
+                await vector_db.async_insert(documents=documents, filters=filters)
+            self._record("write", len(documents), started_at)
+            log_info(f"Added {len(documents)} documents to knowledge base")
+
+        async def work(fn: Callable, in_queue: "asyncio.Queue[Any]", out_queue: Optional["asyncio.Queue[Any]"]):
+            while True:
+                batch = await in_queue.get()
+                if batch is _DONE:
+                    return
+                result = await fn(batch)
+                if out_queue is not None:
+                    await out_queue.put(result)
+
+        async def run_stage(workers: List[Any], next_queue: Optional["asyncio.Queue[Any]"], num_next: int) -> None:
+            await asyncio.gather(*workers)
+            # Once every worker of a stage is done, tell each worker of the next stage to stop
+            if next_queue is not None:
+                for _ in range(num_next):
+                    await next_queue.put(_DONE)
+
+        num_chunkers = max(1, self.num_chunkers)
+        num_embedders = max(1, self.num_embedders)
+        num_writers = max(1, self.num_writers)
+
+        reader = knowledge.reader
+        reader_chunk = reader.chunk if reader is not None else False
+
+        log_info("Loading knowledge base using the ingestion pipeline")
+        pipeline_start = perf_counter()
+        tasks: List["asyncio.Task[None]"] = []
+        try:
+            # Chunking is moved out of the reader while the pipeline runs, and restored even if it fails
+            if chunking_strategy is not None:
+                reader.chunk = False  # type: ignore
+            tasks = [
+                asyncio.create_task(run_stage([read()], chunk_queue, num_chunkers)),
+                asyncio.create_task(
+                    run_stage(
+                        [work(chunk, chunk_queue, embed_queue) for _ in range(num_chunkers)], embed_queue, num_embedders
+                    )
+                ),
+                asyncio.create_task(
+                    run_stage(
+                        [work(embed, embed_queue, write_queue) for _ in range(num_embedders)], write_queue, num_writers
+                    )
+                ),
+                asyncio.create_task(run_stage([work(write, write_queue, None) for _ in range(num_writers)], None, 0)),
+            ]
+            await asyncio.gather(*tasks)
+        finally:
+            # If a stage failed, the other stages may be waiting on a queue that will never be filled
+            for task in tasks:
+                task.cancel()
+            if reader is not None:
+                reader.chunk = reader_chunk
+            if chunk_executor is not None:
+                chunk_executor.shutdown()
+            self._log_stats(perf_counter() - pipeline_start)
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from agno.document import Document
 from agno.document.reader.text_reader import TextReader
@@ -12,9 +12,8 @@ class TextKnowledgeBase(AgentKnowledge):
     formats: List[str] = [".txt"]
     reader: TextReader = TextReader()
 
-    @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over text files and yield lists of documents."""
+    def _get_file_sources(self) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Iterate over the text files to load and the metadata to add to their documents."""
         if self.path is None:
             raise ValueError("Path is not set")
 
@@ -22,25 +21,32 @@ class TextKnowledgeBase(AgentKnowledge):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
                     # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _file_path = Path(file_path)  # type: ignore
+                    _file_path = Path(item["path"])  # type: ignore
                     if self._is_valid_text(_file_path):
-                        documents = self.reader.read(file=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        yield _file_path, item.get("metadata", {})  # type: ignore
         else:
             # Handle single path
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
                     if self._is_valid_text(_file):
-                        yield self.reader.read(file=_file)
+                        yield _file, {}
             elif self._is_valid_text(_file_path):
-                yield self.reader.read(file=_file_path)
+                yield _file_path, {}
+
+    def _read_file(self, path: Path) -> List[Document]:
+        return self.reader.read(file=path)
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over text files and yield lists of documents."""
+        for _file_path, config in self._get_file_sources():
+            documents = self._read_file(_file_path)
+            if config:
+                for doc in documents:
+                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                    doc.meta_data.update(config)  # type: ignore
+            yield documents
 
     def _is_valid_text(self, path: Path) -> bool:
         """Helper to check if path is a valid text file."""
@@ -49,32 +55,13 @@ class TextKnowledgeBase(AgentKnowledge):
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over text files and yield lists of documents asynchronously."""
-        if self.path is None:
-            raise ValueError("Path is not set")
-
-        if isinstance(self.path, list):
-            for item in self.path:
-                if isinstance(item, dict) and "path" in item:
-                    # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _file_path = Path(file_path)  # type: ignore
-                    if self._is_valid_text(_file_path):
-                        documents = await self.reader.async_read(file=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
-        else:
-            # Handle single path
-            _file_path = Path(self.path)
-            if _file_path.is_dir():
-                for _file in _file_path.glob("**/*"):
-                    if self._is_valid_text(_file):
-                        yield await self.reader.async_read(file=_file)
-            elif self._is_valid_text(_file_path):
-                yield await self.reader.async_read(file=_file_path)
+        for _file_path, config in self._get_file_sources():
+            documents = await self.reader.async_read(file=_file_path)
+            if config:
+                for doc in documents:
+                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                    doc.meta_data.update(config)  # type: ignore
+            yield documents
 
     def load_document(
         self,
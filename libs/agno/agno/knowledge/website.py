@@ -16,12 +16,18 @@ class WebsiteKnowledgeBase(AgentKnowledge):
     # WebsiteReader parameters
     max_depth: int = 3
     max_links: int = 10
+    max_concurrency: int = 5
+    requests_per_second: Optional[float] = 5.0
 
     @model_validator(mode="after")
     def set_reader(self) -> "WebsiteKnowledgeBase":
         if self.reader is None:
             self.reader = WebsiteReader(
-                max_depth=self.max_depth, max_links=self.max_links, chunking_strategy=self.chunking_strategy
+                max_depth=self.max_depth,
+                max_links=self.max_links,
+                max_concurrency=self.max_concurrency,
+                requests_per_second=self.requests_per_second,
+                chunking_strategy=self.chunking_strategy,
             )
         return self
 
@@ -90,7 +96,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
             if document_list := self.reader.read(url=url):
                 # Filter out documents which already exist in the vector db
                 if not recreate:
-                    document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
+                    document_list = self.filter_existing_documents(document_list)
                     if not document_list:
                         continue
                 if upsert and self.vector_db.upsert_available():
@@ -148,11 +154,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                 document_list = await reader.async_read(url=url)
 
                 if not recreate:
-                    filtered_documents = []
-                    for document in document_list:
-                        if not await vector_db.async_doc_exists(document):
-                            filtered_documents.append(document)
-                    document_list = filtered_documents
+                    document_list = await self.async_filter_existing_documents(document_list)
 
                 return document_list
             except Exception as e:
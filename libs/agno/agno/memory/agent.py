@@ -69,7 +69,7 @@ class AgentMemory(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
         _memory_dict = self.model_dump(
             exclude_none=True,
             include={
@@ -92,7 +92,7 @@ class AgentMemory(BaseModel):
         if self.messages is not None:
             _memory_dict["messages"] = [message.to_dict() for message in self.messages]
         # Add runs if they exist
-        if self.runs is not None:
+        if self.runs is not None and include_runs:
             _memory_dict["runs"] = [run.to_dict() for run in self.runs]
         return _memory_dict
 
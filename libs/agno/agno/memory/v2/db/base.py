@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from agno.memory.v2.db.schema import MemoryRow
 
@@ -21,6 +21,14 @@ class MemoryDb(ABC):
     ) -> List[MemoryRow]:
         raise NotImplementedError
 
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Any]:
+        """Return a cheap marker that changes when the memories of a user are added, updated or deleted.
+
+        Memory compares it to the marker of its cached memories to skip reading them again.
+        Returns None if the db cannot provide one, so the memories are always read.
+        """
+        return None
+
     @abstractmethod
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         raise NotImplementedError
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from pymongo import MongoClient
@@ -42,6 +42,9 @@ class MongoMemoryDb(MemoryDb):
         self.db_name: str = db_name
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
+        # Revision of the memories of each user, incremented on every write. It is kept when the memories are cleared,
+        # so a revision is never repeated.
+        self.revisions: Collection = self.db[f"{self.collection_name}_revisions"]
 
     def __dict__(self) -> Dict[str, Any]:
         return {
@@ -57,6 +60,7 @@ class MongoMemoryDb(MemoryDb):
             self.collection.create_index("id", unique=True)
             self.collection.create_index("user_id")
             self.collection.create_index("created_at")
+            self.revisions.create_index("user_id", unique=True)
         except PyMongoError as e:
             logger.error(f"Error creating indexes for collection '{self.collection_name}': {e}")
             raise
@@ -108,6 +112,24 @@ class MongoMemoryDb(MemoryDb):
             logger.error(f"Error reading memories: {e}")
         return memories
 
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """Return the revision of the memories of the user, incremented on every write, and their number.
+
+        The number of memories changes when they are cleared, which does not increment the revision.
+        """
+        try:
+            query = {"user_id": user_id} if user_id is not None else {}
+            revision = self.revisions.find_one({"user_id": user_id}, {"revision": 1})
+            return revision.get("revision", 0) if revision else 0, self.collection.count_documents(query)
+        except PyMongoError as e:
+            logger.error(f"Error reading memories version: {e}")
+            return None
+
+    def _increment_revision(self, user_id: Optional[str]) -> None:
+        """Increment the revision of all memories and the revision of the user"""
+        for revision_user_id in {None, user_id}:
+            self.revisions.update_one({"user_id": revision_user_id}, {"$inc": {"revision": 1}}, upsert=True)
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Upsert a memory into the collection
         Args:
@@ -144,6 +166,7 @@ class MongoMemoryDb(MemoryDb):
 
             if not result.acknowledged:
                 logger.error("Memory upsert not acknowledged")
+            self._increment_revision(memory.user_id)
 
         except PyMongoError as e:
             logger.error(f"Error upserting memory: {e}")
@@ -157,10 +180,11 @@ class MongoMemoryDb(MemoryDb):
             None
         """
         try:
-            result = self.collection.delete_one({"id": memory_id})
-            if result.deleted_count == 0:
+            deleted = self.collection.find_one_and_delete({"id": memory_id}, {"user_id": 1})
+            if deleted is None:
                 log_debug(f"No memory found with id: {memory_id}")
             else:
+                self._increment_revision(deleted.get("user_id"))
                 log_debug(f"Successfully deleted memory with id: {memory_id}")
         except PyMongoError as e:
             logger.error(f"Error deleting memory: {e}")
@@ -1,6 +1,6 @@
 import json
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from redis import ConnectionError, Redis
@@ -39,6 +39,8 @@ class RedisMemoryDb(MemoryDb):
             password=password,
             decode_responses=True,  # Automatically decode responses to str
         )
+        # Set once the indexes are known to include memories stored before they were maintained
+        self._index_built = False
         log_debug(f"Created RedisMemoryDb with prefix: '{self.prefix}'")
 
     def __dict__(self) -> Dict[str, Any]:
@@ -51,6 +53,60 @@ class RedisMemoryDb(MemoryDb):
         """Generate Redis key for a memory."""
         return f"{self.prefix}:{memory_id}"
 
+    def _get_index_key(self, user_id: Optional[str] = None) -> str:
+        """Generate Redis key for the sorted set indexing memory IDs by created_at, for all memories or a user."""
+        if user_id is None:
+            return f"{self.prefix}-index:all"
+        return f"{self.prefix}-index:user_id:{user_id}"
+
+    def _get_revision_key(self, user_id: Optional[str] = None) -> str:
+        """Generate Redis key for the counter incremented on every write, for all memories or a user.
+
+        The counters are not removed by `clear`, so a revision is never repeated.
+        """
+        if user_id is None:
+            return f"{self.prefix}-revision:all"
+        return f"{self.prefix}-revision:user_id:{user_id}"
+
+    def _increment_revision(self, pipeline: Any, user_id: Optional[str]) -> None:
+        """Queue incrementing the revision of all memories and the revision of the user."""
+        pipeline.incr(self._get_revision_key())
+        if user_id:
+            pipeline.incr(self._get_revision_key(user_id))
+
+    def _get_index_built_key(self) -> str:
+        """Generate Redis key marking that the indexes include the memories stored before they were maintained."""
+        return f"{self.prefix}-index:built"
+
+    def _add_to_index(self, pipeline: Any, memory_data: Dict[str, Any]) -> None:
+        """Queue adding a memory to the index of all memories and the index of its user."""
+        if not memory_data.get("id"):
+            return
+        score = memory_data.get("created_at", 0)
+        pipeline.zadd(self._get_index_key(), {memory_data["id"]: score})
+        if memory_data.get("user_id"):
+            pipeline.zadd(self._get_index_key(memory_data["user_id"]), {memory_data["id"]: score})
+
+    def _ensure_index(self) -> None:
+        """Build the indexes the first time they are read, if memories were stored before they were maintained."""
+        if self._index_built:
+            return
+        if not self.redis_client.exists(self._get_index_built_key()):
+            self.rebuild_index()
+        self._index_built = True
+
+    def rebuild_index(self) -> None:
+        """Add all stored memories to the indexes."""
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        pipeline = self.redis_client.pipeline()
+        for i in range(0, len(keys), 1000):
+            for data_str in self.redis_client.mget(keys[i : i + 1000]):  # type: ignore
+                if data_str:
+                    self._add_to_index(pipeline, json.loads(data_str))
+        pipeline.set(self._get_index_built_key(), int(time.time()))
+        pipeline.execute()
+        log_debug(f"Indexed {len(keys)} memories with prefix: {self.prefix}")
+
     def create(self) -> None:
         """
         Test connection to Redis.
@@ -78,39 +134,40 @@ class RedisMemoryDb(MemoryDb):
         """Read memories from Redis"""
         memories: List[MemoryRow] = []
         try:
-            # Get all keys matching the prefix pattern
-            pattern = f"{self.prefix}:*"
-            memory_data = []
-
-            # Collect all matching memories
-            for key in self.redis_client.scan_iter(match=pattern):
-                data_str = self.redis_client.get(key)
-                if data_str:
-                    data = json.loads(data_str)  # type: ignore
+            self._ensure_index()
 
-                    # Filter by user_id if specified
-                    if user_id is None or data.get("user_id") == user_id:
-                        memory_data.append(data)
+            # Read the IDs sorted by created_at timestamp from the index, applying the limit if specified
+            end = limit - 1 if limit is not None and limit > 0 else -1
+            memory_ids = self.redis_client.zrange(self._get_index_key(user_id), 0, end, desc=sort != "asc")
 
-            # Sort by created_at timestamp
-            if sort == "asc":
-                memory_data.sort(key=lambda x: x.get("created_at", 0))
-            else:
-                memory_data.sort(key=lambda x: x.get("created_at", 0), reverse=True)
-
-            # Apply limit if specified
-            if limit is not None and limit > 0:
-                memory_data = memory_data[:limit]
-
-            # Convert to MemoryRow objects
-            for data in memory_data:
-                memories.append(MemoryRow.model_validate(data))
+            # Fetch the memories in batches and convert to MemoryRow objects
+            keys = [self._get_key(memory_id) for memory_id in memory_ids]  # type: ignore
+            for i in range(0, len(keys), 1000):
+                for data_str in self.redis_client.mget(keys[i : i + 1000]):  # type: ignore
+                    if data_str:
+                        memories.append(MemoryRow.model_validate(json.loads(data_str)))
 
         except Exception as e:
             logger.error(f"Error reading memories: {e}")
 
         return memories
 
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """Return the revision of the memories of the user, incremented on every write, and their number.
+
+        The number of memories changes when they are cleared, which does not increment the revision.
+        """
+        try:
+            self._ensure_index()
+            pipeline = self.redis_client.pipeline()
+            pipeline.get(self._get_revision_key(user_id))
+            pipeline.zcard(self._get_index_key(user_id))
+            revision, count = pipeline.execute()
+            return int(revision or 0), count
+        except Exception as e:
+            logger.error(f"Error reading memories version: {e}")
+            return None
+
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         """Upsert a memory in Redis"""
         try:
@@ -126,9 +183,13 @@ class RedisMemoryDb(MemoryDb):
 
             memory_data["updated_at"] = timestamp
 
-            # Save to Redis
+            # Save to Redis and index it in the same transaction
             key = self._get_key(memory.id)  # type: ignore
-            self.redis_client.set(key, json.dumps(memory_data))
+            pipeline = self.redis_client.pipeline()
+            pipeline.set(key, json.dumps(memory_data))
+            self._add_to_index(pipeline, memory_data)
+            self._increment_revision(pipeline, memory.user_id)
+            pipeline.execute()
             return memory
 
         except Exception as e:
@@ -139,7 +200,15 @@ class RedisMemoryDb(MemoryDb):
         """Delete a memory from Redis"""
         try:
             key = self._get_key(memory_id)
-            self.redis_client.delete(key)
+            data_str = self.redis_client.get(key)
+            user_id = json.loads(data_str).get("user_id") if data_str else None  # type: ignore
+            pipeline = self.redis_client.pipeline()
+            pipeline.delete(key)
+            pipeline.zrem(self._get_index_key(), memory_id)
+            if user_id:
+                pipeline.zrem(self._get_index_key(user_id), memory_id)
+            self._increment_revision(pipeline, user_id)
+            pipeline.execute()
             log_debug(f"Deleted memory: {memory_id}")
         except Exception as e:
             logger.error(f"Error deleting memory: {e}")
@@ -164,11 +233,13 @@ class RedisMemoryDb(MemoryDb):
         """Clear all memories with our prefix"""
         try:
             pattern = f"{self.prefix}:*"
-            keys_to_delete = list(self.redis_client.scan_iter(match=pattern))
+            memory_keys = list(self.redis_client.scan_iter(match=pattern))
+            keys_to_delete = memory_keys + list(self.redis_client.scan_iter(match=f"{self.prefix}-index:*"))
+            self._index_built = False
 
             if keys_to_delete:
                 self.redis_client.delete(*keys_to_delete)
-                log_info(f"Cleared {len(keys_to_delete)} memories with prefix: {self.prefix}")
+                log_info(f"Cleared {len(memory_keys)} memories with prefix: {self.prefix}")
 
             return True
         except Exception as e:
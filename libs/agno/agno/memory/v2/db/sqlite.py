@@ -1,5 +1,6 @@
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy import (
@@ -11,6 +12,7 @@ try:
         Table,
         create_engine,
         delete,
+        func,
         inspect,
         select,
         text,
@@ -147,22 +149,42 @@ class SqliteMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, Any]]:
+        """Return the number of memories of the user and when the last one was updated"""
+        try:
+            with self.Session() as session:
+                stmt = select(
+                    func.count(), func.max(func.coalesce(self.table.c.updated_at, self.table.c.created_at))
+                ).select_from(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                count, last_updated = session.execute(stmt).one()
+                return count, last_updated
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading memories version: {e}")
+            return None
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         try:
             with self.Session() as session:
                 # Check if the memory already exists
                 existing = session.execute(select(self.table).where(self.table.c.id == memory.id)).first()
+                # CURRENT_TIMESTAMP only has seconds, so two writes in the same second would not change the memories
+                # version. Store the UTC time with microseconds instead.
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
 
                 if existing:
                     # Update existing memory
                     stmt = (
                         self.table.update()
                         .where(self.table.c.id == memory.id)
-                        .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=text("CURRENT_TIMESTAMP"))
+                        .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=now)
                     )
                 else:
                     # Insert new memory
-                    stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
+                    stmt = self.table.insert().values(  # type: ignore
+                        id=memory.id, user_id=memory.user_id, memory=str(memory.memory), created_at=now, updated_at=now
+                    )
 
                 session.execute(stmt)
                 session.commit()
@@ -0,0 +1,170 @@
+from threading import RLock
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.memory.v2.schema import UserMemory
+from agno.utils.log import log_debug
+from agno.vectordb.base import VectorDb
+
+
+class MemoryIndex:
+    """Embeddings of user memories, used to find the memories most similar to a query.
+
+    By default the embeddings are kept in process and searched by brute force with NumPy. Pass a `vector_db` to store
+    and search them in a vector database instead, for users with a large number of memories. Memories are stored with
+    their memory ID as document ID and deleted by ID, so use a vector db that identifies documents by ID, e.g. PgVector.
+    Vector dbs identifying documents by their content hash keep one document for identical memories of different users.
+
+    The index is shared by the memory and its background worker, so it is guarded by a lock.
+    """
+
+    def __init__(self, embedder: Optional[Embedder] = None, vector_db: Optional[VectorDb] = None):
+        if embedder is None and vector_db is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+        self.embedder = embedder
+        self.vector_db = vector_db
+
+        # Text of the indexed memories, per memory ID per user
+        self._texts: Dict[str, Dict[str, str]] = {}
+        # Embeddings of the indexed memories, per memory ID per user, when they are kept in process
+        self._embeddings: Dict[str, Dict[str, List[float]]] = {}
+        # Memory IDs and matrix of normalized embeddings per user, rebuilt after the memories of the user change
+        self._matrices: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        self._lock = RLock()
+
+    def sync(self, user_id: str, memories: Dict[str, UserMemory]) -> None:
+        """Embed the memories of the user that are new or changed since they were indexed, and forget deleted ones"""
+        with self._lock:
+            self._sync(user_id=user_id, memories=memories)
+
+    def _sync(self, user_id: str, memories: Dict[str, UserMemory]) -> None:
+        texts = self._texts.setdefault(user_id, {})
+        changed = {
+            memory_id: memory.memory for memory_id, memory in memories.items() if texts.get(memory_id) != memory.memory
+        }
+        removed = [memory_id for memory_id in texts if memory_id not in memories]
+        if not changed and not removed:
+            return
+
+        if self.vector_db is not None:
+            self._delete_vector_db(memory_ids=removed)
+            # Memories not indexed by this process yet may have been stored by an earlier one
+            unseen = {memory_id: text for memory_id, text in changed.items() if memory_id not in texts}
+            stored = self._stored_in_vector_db(texts=unseen)
+            self._upsert_vector_db(
+                user_id=user_id,
+                texts={memory_id: text for memory_id, text in changed.items() if memory_id not in stored},
+            )
+        else:
+            embeddings = self._embeddings.setdefault(user_id, {})
+            for memory_id in removed:
+                embeddings.pop(memory_id, None)
+            if changed:
+                memory_ids = list(changed)
+                vectors = self.embedder.get_embeddings_batch([changed[memory_id] for memory_id in memory_ids])  # type: ignore
+                embeddings.update(zip(memory_ids, vectors))
+            self._matrices.pop(user_id, None)
+
+        for memory_id in removed:
+            texts.pop(memory_id, None)
+        texts.update(changed)
+        log_debug(f"Indexed {len(changed)} memories and removed {len(removed)} for user {user_id}")
+
+    def search(self, user_id: str, query: str, limit: Optional[int] = None) -> List[str]:
+        """Return the IDs of the memories of the user most similar to the query, most similar first"""
+        with self._lock:
+            texts = dict(self._texts.get(user_id, {}))
+            if not texts:
+                return []
+            if self.vector_db is None:
+                memory_ids, matrix = self._get_matrix(user_id)
+        limit = len(texts) if limit is None or limit <= 0 else min(limit, len(texts))
+
+        if self.vector_db is not None:
+            # Skip the memories changed or deleted by another process, or left by a vector db that cannot delete by ID
+            documents = self.vector_db.search(query=query, limit=limit, filters={"user_id": user_id})
+            memory_ids = []
+            for document in documents:
+                memory_id = document.meta_data.get("memory_id")
+                if memory_id in texts and texts[memory_id] == document.content and memory_id not in memory_ids:
+                    memory_ids.append(memory_id)
+            return memory_ids
+
+        query_vector = np.asarray(self.embedder.get_embedding(query), dtype=np.float32)  # type: ignore
+        norm = np.linalg.norm(query_vector)
+        if norm == 0:
+            return []
+        scores = matrix @ (query_vector / norm)
+        if limit < len(scores):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [memory_ids[i] for i in top]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._texts = {}
+            self._embeddings = {}
+            self._matrices = {}
+
+    def _get_matrix(self, user_id: str) -> Tuple[List[str], np.ndarray]:
+        with self._lock:
+            if user_id not in self._matrices:
+                embeddings = self._embeddings.get(user_id, {})
+                memory_ids = list(embeddings)
+                matrix = np.asarray([embeddings[memory_id] for memory_id in memory_ids], dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                self._matrices[user_id] = (memory_ids, matrix / np.where(norms == 0, 1, norms))
+            return self._matrices[user_id]
+
+    def _stored_in_vector_db(self, texts: Dict[str, str]) -> List[str]:
+        """Return the IDs of the memories stored in the vector db with their current text, without embedding them.
+
+        A memory is taken as stored when a document with its ID and a document with the content hash of its text exist.
+        A memory stored with an older text but matching another memory is skipped when searching, as its content differs.
+        """
+        if not texts:
+            return []
+        documents = {memory_id: Document(content=text, id=memory_id) for memory_id, text in texts.items()}
+        try:
+            existing_hashes = self.vector_db.existing_content_hashes(  # type: ignore
+                [document.content_hash for document in documents.values()]
+            )
+            return [
+                memory_id
+                for memory_id, document in documents.items()
+                if document.content_hash in existing_hashes and self.vector_db.id_exists(memory_id)  # type: ignore
+            ]
+        except NotImplementedError:
+            log_debug("The vector db cannot look up documents by content hash and ID, memories are embedded again")
+            return []
+
+    def _upsert_vector_db(self, user_id: str, texts: Dict[str, str]) -> None:
+        # Memories are keyed by their ID, not their content hash, so identical memories of different users are kept
+        documents = [
+            Document(content=text, id=memory_id, name=memory_id, meta_data={"user_id": user_id, "memory_id": memory_id})
+            for memory_id, text in texts.items()
+        ]
+        if not documents:
+            return
+        if self.vector_db.upsert_available():  # type: ignore
+            self.vector_db.upsert(documents=documents, filters={"user_id": user_id})  # type: ignore
+        else:
+            self.vector_db.insert(documents=documents, filters={"user_id": user_id})  # type: ignore
+
+    def _delete_vector_db(self, memory_ids: List[str]) -> None:
+        if not memory_ids:
+            return
+        try:
+            self.vector_db.delete_by_ids(memory_ids)  # type: ignore
+        except NotImplementedError:
+            log_debug("The vector db cannot delete documents by ID, deleted memories are skipped when searching")
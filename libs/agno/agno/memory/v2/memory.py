@@ -1,12 +1,15 @@
 import json
+import threading
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
+from agno.embedder import Embedder
 from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
@@ -20,6 +23,10 @@ from agno.run.team import TeamRunResponse
 from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
+from agno.vectordb.base import VectorDb
+
+if TYPE_CHECKING:
+    from agno.memory.v2.index import MemoryIndex
 
 
 class MemorySearchResponse(BaseModel):
@@ -86,6 +93,16 @@ class Memory:
     summary_manager: Optional[SessionSummarizer] = None
 
     db: Optional[MemoryDb] = None
+    # Seconds to use cached user memories without checking the db for changes.
+    # If None, every read checks the memories version in the db, and only reads the memories again if it changed.
+    cache_ttl: Optional[float] = None
+
+    # Embedder used to embed memories when they are written, for semantic search
+    embedder: Optional[Embedder] = None
+    # Vector db to store and search the memory embeddings in, instead of in process
+    vector_db: Optional[VectorDb] = None
+    # If set, agentic search only puts this many memories most similar to the query in the prompt
+    agentic_search_candidates: Optional[int] = None
 
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
@@ -113,10 +130,16 @@ class Memory:
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
+        cache_ttl: Optional[float] = None,
+        embedder: Optional[Embedder] = None,
+        vector_db: Optional[VectorDb] = None,
+        agentic_search_candidates: Optional[int] = None,
     ):
         self.memories = memories or {}
         self.summaries = summaries or {}
         self.runs = runs or {}
+        # Serializes writes to the memories and summaries, which may come from the background memory worker
+        self._write_lock = threading.Lock()
 
         self.debug_mode = debug_mode
 
@@ -134,6 +157,18 @@ class Memory:
 
         self.db = db
 
+        self.cache_ttl = cache_ttl
+        # Version of the memories in the db when the cached memories of a user were read
+        self._memory_versions: Dict[str, Any] = {}
+        # When the cached memories of a user were last checked against the db
+        self._memory_checked_at: Dict[str, float] = {}
+
+        self.embedder = embedder
+        self.vector_db = vector_db
+        self.agentic_search_candidates = agentic_search_candidates
+        # Index of the memory embeddings, created when an embedder or vector db is set or on the first semantic search
+        self.memory_index: Optional["MemoryIndex"] = None
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
@@ -175,18 +210,108 @@ class Memory:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
+    def get_memory_index(self) -> "MemoryIndex":
+        if self.memory_index is None:
+            from agno.memory.v2.index import MemoryIndex
+
+            self.memory_index = MemoryIndex(embedder=self.embedder, vector_db=self.vector_db)
+        return self.memory_index
+
+    def _index_user_memories(self, user_id: str) -> None:
+        """Embed the new and changed memories of the user, if memories are embedded when they are written"""
+        if self.memory_index is None and self.embedder is None and self.vector_db is None:
+            return
+        try:
+            self.get_memory_index().sync(user_id=user_id, memories=self.memories.get(user_id, {}))  # type: ignore
+        except Exception as e:
+            log_warning(f"Error indexing memories for user {user_id}: {e}")
+
     def refresh_from_db(self, user_id: Optional[str] = None):
         if self.db:
             # If no user_id is provided, read all memories
             if user_id is None:
                 all_memories = self.db.read_memories()
             else:
+                # Read the version first, so a change made while reading the memories is picked up by the next check
+                version = self.db.get_memories_version(user_id=user_id)
                 all_memories = self.db.read_memories(user_id=user_id)
-            # Reset the memories
-            self.memories = {}
+            # Build the memories before replacing them, so memories created in the background are swapped in at once
+            memories: Dict[str, Dict[str, UserMemory]] = {} if user_id is None else {user_id: {}}
             for memory in all_memories:
                 if memory.user_id is not None and memory.id is not None:
-                    self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                    memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+            if user_id is None:
+                # Reset the memories
+                self.memories = memories
+                self._memory_versions = {}
+            else:
+                # Reset the memories of the user
+                with self._write_lock:
+                    self.memories = {**(self.memories or {}), user_id: memories[user_id]}
+                self._set_memory_version(user_id=user_id, version=version)
+                self._index_user_memories(user_id=user_id)
+
+    def refresh_user_memories(self, user_id: str) -> None:
+        """Read the memories of the user from the db, unless the cached memories are still current.
+
+        The cache is current within `cache_ttl` seconds of the last check, or while the memories version in the db is
+        unchanged.
+        """
+        if not self.db:
+            return
+        if user_id in self._memory_versions:
+            checked_at = self._memory_checked_at.get(user_id, 0)
+            if self.cache_ttl is not None and time() - checked_at < self.cache_ttl:
+                return
+            if self.db.get_memories_version(user_id=user_id) == self._memory_versions[user_id]:
+                self._memory_checked_at[user_id] = time()
+                return
+        self.refresh_from_db(user_id=user_id)
+
+    def _set_user_memory(self, user_id: str, memory_id: str, memory: Optional[UserMemory]) -> None:
+        """Add or replace a cached memory of the user, or remove it if memory is None.
+
+        The dicts are copied instead of changed in place, so threads reading them while the memory worker writes
+        never iterate a dict that changes size.
+        """
+        with self._write_lock:
+            user_memories = dict((self.memories or {}).get(user_id, {}))
+            if memory is None:
+                user_memories.pop(memory_id, None)
+            else:
+                user_memories[memory_id] = memory
+            self.memories = {**(self.memories or {}), user_id: user_memories}
+
+    def _set_session_summary(self, user_id: str, session_id: str, summary: Optional[SessionSummary]) -> None:
+        """Add or replace the summary of the session, or remove it if summary is None. Copied like the memories."""
+        with self._write_lock:
+            session_summaries = dict((self.summaries or {}).get(user_id, {}))
+            if summary is None:
+                session_summaries.pop(session_id, None)
+            else:
+                session_summaries[session_id] = summary
+            self.summaries = {**(self.summaries or {}), user_id: session_summaries}
+
+    def _set_memory_version(self, user_id: str, version: Optional[Any]) -> None:
+        """Record the memories version the cached memories of the user match, or forget it if the db has none"""
+        if version is None:
+            self._memory_versions.pop(user_id, None)
+            self._memory_checked_at.pop(user_id, None)
+        else:
+            self._memory_versions[user_id] = version
+            self._memory_checked_at[user_id] = time()
+
+    def _update_memory_version(self, user_id: str) -> None:
+        """After writing a memory through the cache, record the new memories version in the db.
+
+        If the version did not change, the write may not have reached the db, so the memories are read on the next check.
+        """
+        if not self.db or user_id not in self._memory_versions:
+            return
+        version = self.db.get_memories_version(user_id=user_id)
+        self._set_memory_version(
+            user_id=user_id, version=None if version == self._memory_versions[user_id] else version
+        )
 
     def set_log_level(self):
         if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
@@ -199,7 +324,8 @@ class Memory:
         self.set_log_level()
         self.refresh_from_db(user_id=user_id)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
+        """Serialize the memory. Agents and teams leave out the runs, and only serialize those of the current session."""
         _memory_dict = {}
         # Add summary if it exists
         if self.summaries is not None:
@@ -214,7 +340,7 @@ class Memory:
                 for user_id, user_memories in self.memories.items()
             }
         # Add runs if they exist
-        if self.runs is not None:
+        if self.runs is not None and include_runs:
             _memory_dict["runs"] = {}
             for session_id, runs in self.runs.items():
                 if session_id is not None:
@@ -234,9 +360,9 @@ class Memory:
         """Get the user memories for a given user id"""
         if user_id is None:
             user_id = "default"
-        # Refresh from the DB
+        # Refresh from the DB, if the cached memories changed
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
 
         if self.memories is None:
             return []
@@ -256,9 +382,9 @@ class Memory:
         """Get the user memory for a given user id"""
         if user_id is None:
             user_id = "default"
-        # Refresh from the DB
+        # Refresh from the DB, if the cached memories changed
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
         if self.memories is None:
             return None
         return self.memories.get(user_id, {}).get(memory_id, None)
@@ -293,14 +419,14 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        # Refresh from the DB
+        # Refresh from the DB, if the cached memories changed
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
 
         if not memory.last_updated:
             memory.last_updated = datetime.now()
 
-        self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        self._set_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -310,6 +436,8 @@ class Memory:
                     last_updated=memory.last_updated or datetime.now(),
                 )
             )
+            self._update_memory_version(user_id=user_id)
+        self._index_user_memories(user_id=user_id)
 
         return memory_id
 
@@ -332,9 +460,9 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        # Refresh from the DB
+        # Refresh from the DB, if the cached memories changed
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
 
         if not memory.last_updated:
             memory.last_updated = datetime.now()
@@ -343,7 +471,7 @@ class Memory:
             log_warning(f"Memory {memory_id} not found for user {user_id}")
             return None
 
-        self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        self._set_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -353,6 +481,8 @@ class Memory:
                     last_updated=memory.last_updated or datetime.now(),
                 )
             )
+            self._update_memory_version(user_id=user_id)
+        self._index_user_memories(user_id=user_id)
 
         return memory_id
 
@@ -370,17 +500,19 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        # Refresh from the DB
+        # Refresh from the DB, if the cached memories changed
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
 
         if memory_id not in self.memories[user_id]:  # type: ignore
             log_warning(f"Memory {memory_id} not found for user {user_id}")
             return None
 
-        del self.memories[user_id][memory_id]  # type: ignore
+        self._set_user_memory(user_id=user_id, memory_id=memory_id, memory=None)
         if self.db:
             self._delete_db_memory(memory_id=memory_id)
+            self._update_memory_version(user_id=user_id)
+        self._index_user_memories(user_id=user_id)
 
     def delete_session_summary(self, user_id: str, session_id: str) -> None:
         """Delete a session summary for a given user id
@@ -388,7 +520,7 @@ class Memory:
             user_id (str): The user id to delete the memory from
             session_id (str): The id of the session to delete
         """
-        del self.summaries[user_id][session_id]  # type: ignore
+        self._set_session_summary(user_id=user_id, session_id=session_id, summary=None)
 
     def get_runs(self, session_id: str) -> List[Union[RunResponse, TeamRunResponse]]:
         """Get all runs for a given session id"""
@@ -414,7 +546,7 @@ class Memory:
         session_summary = SessionSummary(
             summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
         )
-        self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
+        self._set_session_summary(user_id=user_id, session_id=session_id, summary=session_summary)
 
         return session_summary
 
@@ -436,7 +568,7 @@ class Memory:
         session_summary = SessionSummary(
             summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
         )
-        self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
+        self._set_session_summary(user_id=user_id, session_id=session_id, summary=session_summary)
 
         return session_summary
 
@@ -469,7 +601,7 @@ class Memory:
             user_id = "default"
 
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
 
         existing_memories = self.memories.get(user_id, {})  # type: ignore
         existing_memories = [
@@ -517,7 +649,7 @@ class Memory:
             user_id = "default"
 
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
 
         existing_memories = self.memories.get(user_id, {})  # type: ignore
         existing_memories = [
@@ -534,7 +666,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db()
+        self.refresh_from_db(user_id=user_id)
 
         return response
 
@@ -755,19 +887,20 @@ class Memory:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
         refresh_from_db: bool = True,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query, by similarity of their embeddings
             user_id: The user to search for. Optional.
 
         Returns:
@@ -780,7 +913,7 @@ class Memory:
         self.set_log_level()
 
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            self.refresh_user_memories(user_id=user_id)
 
         if not self.memories:
             return []
@@ -797,6 +930,12 @@ class Memory:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit)
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -831,7 +970,13 @@ class Memory:
         log_debug("Searching for memories", center=True)
 
         # Get all memories as a list
-        user_memories: Dict[str, UserMemory] = self.memories[user_id]
+        user_memories: Dict[str, UserMemory] = self.memories.get(user_id, {})
+        if self.agentic_search_candidates is not None:
+            # Only put the memories most similar to the query in the prompt
+            candidates = self._search_user_memories_semantic(
+                user_id=user_id, query=query, limit=self.agentic_search_candidates
+            )
+            user_memories = {memory.memory_id: memory for memory in candidates}  # type: ignore
         system_message_str = "Your task is to search through user memories and return the IDs of the memories that are related to the query.\n"
         system_message_str += "\n<user_memories>\n"
         for memory in user_memories.values():
@@ -887,6 +1032,18 @@ class Memory:
                 memories_to_return.append(user_memories[memory_id])
         return memories_to_return[:limit]
 
+    def _search_user_memories_semantic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+        """Search through user memories by similarity of their embeddings to the query."""
+        user_memories = self.memories.get(user_id, {})  # type: ignore
+        if not user_memories:
+            return []
+
+        memory_index = self.get_memory_index()
+        # Embed the memories written since they were indexed, e.g. directly to the db by the memory manager
+        memory_index.sync(user_id=user_id, memories=user_memories)
+        memory_ids = memory_index.search(user_id=user_id, query=query, limit=limit)
+        return [user_memories[memory_id] for memory_id in memory_ids if memory_id in user_memories]
+
     def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
         """Get the most recent user memories.
 
@@ -959,6 +1116,10 @@ class Memory:
             self.db.clear()
         self.memories = {}
         self.summaries = {}
+        self._memory_versions = {}
+        self._memory_checked_at = {}
+        if self.memory_index is not None:
+            self.memory_index.clear()
 
     def deep_copy(self) -> "Memory":
         from copy import deepcopy
@@ -968,7 +1129,15 @@ class Memory:
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "memory_manager", "summary_manager"]:
+            if field_name not in [
+                "db",
+                "memory_manager",
+                "summary_manager",
+                "embedder",
+                "vector_db",
+                "memory_index",
+                "_write_lock",
+            ]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -978,6 +1147,9 @@ class Memory:
         copied_obj.db = self.db
         copied_obj.memory_manager = self.memory_manager
         copied_obj.summary_manager = self.summary_manager
+        copied_obj.embedder = self.embedder
+        copied_obj.vector_db = self.vector_db
+        copied_obj.memory_index = self.memory_index
 
         return copied_obj
 
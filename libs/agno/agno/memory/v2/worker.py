@@ -0,0 +1,129 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.memory.v2.memory import Memory
+
+
+@dataclass
+class MemoryJob:
+    """User memories or a session summary to create for a session"""
+
+    memory: "Memory"
+    session_id: str
+    user_id: Optional[str] = None
+    # Messages to create user memories from, None for a session summary
+    messages: Optional[List[Message]] = field(default=None)
+    # Called after the job succeeded, e.g. to write the session with its new summary to storage
+    on_done: Optional[Callable[[], None]] = None
+
+
+class MemoryWorker:
+    """Creates user memories and session summaries in background threads, off the response path.
+
+    Jobs are coalesced per session: while a job is waiting, new messages for the same session are added to it instead
+    of queuing another job, and a new summary request replaces the waiting one. Jobs of the same kind for a session run
+    one after the other, while memories and summaries run concurrently, up to `max_workers` jobs at a time.
+    At most `max_queue_size` sessions have jobs queued or running, jobs of further sessions are dropped.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 1000):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        # Number of jobs dropped because the queue was full
+        self.dropped = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Waiting job per kind, memory, session and user, and the keys with a job running or scheduled
+        self._pending: Dict[Tuple[Any, ...], MemoryJob] = {}
+        self._running: Set[Tuple[Any, ...]] = set()
+        self._condition = threading.Condition()
+
+    def submit_user_memories(
+        self, memory: "Memory", messages: List[Message], session_id: str, user_id: Optional[str] = None
+    ) -> bool:
+        """Queue creating user memories from the messages. Returns False if the job was dropped."""
+        key = ("memories", id(memory), session_id, user_id)
+        with self._condition:
+            job = self._pending.get(key)
+            if job is not None:
+                job.messages.extend(messages)  # type: ignore
+                return True
+            return self._submit(
+                key, MemoryJob(memory=memory, session_id=session_id, user_id=user_id, messages=list(messages))
+            )
+
+    def submit_session_summary(
+        self,
+        memory: "Memory",
+        session_id: str,
+        user_id: Optional[str] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """Queue creating the summary of the session, from the runs in memory when the job starts.
+        `on_done` is called in the worker thread after the summary was created. Returns False if the job was dropped.
+        """
+        key = ("summary", id(memory), session_id, user_id)
+        with self._condition:
+            return self._submit(key, MemoryJob(memory=memory, session_id=session_id, user_id=user_id, on_done=on_done))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued jobs are done. Returns False if the timeout expired first."""
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while self._running:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _submit(self, key: Tuple[Any, ...], job: MemoryJob) -> bool:
+        # Called with the condition held
+        if key in self._running:
+            # The running job of this session picks up the new one when it is done
+            self._pending[key] = job
+            return True
+        if len(self._running) >= self.max_queue_size:
+            self.dropped += 1
+            log_warning(f"Memory worker queue is full, dropping {key[0]} for session {job.session_id}")
+            return False
+        self._pending[key] = job
+        self._running.add(key)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-memory")
+        self._executor.submit(self._run, key)
+        return True
+
+    def _run(self, key: Tuple[Any, ...]) -> None:
+        while True:
+            with self._condition:
+                job = self._pending.pop(key, None)
+                if job is None:
+                    self._running.discard(key)
+                    self._condition.notify_all()
+                    return
+            try:
+                if job.messages is not None:
+                    log_debug(f"Creating user memories for session {job.session_id} in the background")
+                    job.memory.create_user_memories(messages=job.messages, user_id=job.user_id)
+                else:
+                    log_debug(f"Creating session summary for session {job.session_id} in the background")
+                    job.memory.create_session_summary(session_id=job.session_id, user_id=job.user_id)
+                if job.on_done is not None:
+                    job.on_done()
+            except Exception as e:
+                log_warning(f"Error creating {key[0]} for session {job.session_id}: {e}")
+
+
+memory_worker = MemoryWorker()
@@ -2,9 +2,8 @@ from dataclasses import dataclass
 from os import getenv
 from typing import Any, Dict, Optional
 
-import httpx
-
 from agno.models.openai.like import OpenAILike
+from agno.utils.common import get_running_event_loop
 
 try:
     from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
@@ -97,6 +96,7 @@ class AzureOpenAI(OpenAILike):
 
         # -*- Create client
         self.client = AzureOpenAIClient(**_client_params)
+        self._owns_client = True
         return self.client
 
     def get_async_client(self) -> AsyncAzureOpenAIClient:
@@ -106,18 +106,17 @@ class AzureOpenAI(OpenAILike):
         Returns:
             AsyncAzureOpenAIClient: An instance of the asynchronous OpenAI client.
         """
-        if self.async_client:
-            return self.async_client
+        if self._can_reuse_async_client():
+            return self.async_client  # type: ignore
+        self._close_stale_async_client()
 
         _client_params: Dict[str, Any] = self._get_client_params()
 
         if self.http_client:
             _client_params["http_client"] = self.http_client
         else:
-            # Create a new async HTTP client with custom limits
-            _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+            _client_params["http_client"] = self._get_async_http_client()
 
         self.async_client = AsyncAzureOpenAIClient(**_client_params)
+        self._async_client_loop = get_running_event_loop()
         return self.async_client
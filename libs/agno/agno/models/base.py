@@ -233,6 +233,12 @@ class Model(ABC):
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    # Run the tool calls from a single model response concurrently in a thread pool.
+    # The async methods already run tool calls concurrently, so this only affects the sync methods.
+    parallel_tool_execution: bool = False
+    # Maximum number of threads used to run tool calls. Defaults to one per tool call.
+    max_tool_workers: Optional[int] = None
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -1121,6 +1127,21 @@ class Model(ABC):
         # Stop function call timer
         function_call_timer.stop()
 
+        yield from self._process_function_call_result(
+            function_call=function_call,
+            success=function_call_success,
+            timer=function_call_timer,
+            function_call_results=function_call_results,
+        )
+
+    def _process_function_call_result(
+        self,
+        function_call: FunctionCall,
+        success: bool,
+        timer: Timer,
+        function_call_results: List[Message],
+    ) -> Iterator[ModelResponse]:
+        """Process the output of an executed function call and yield the tool_call_completed event."""
         # Process function call output
         function_call_output: str = ""
 
@@ -1136,10 +1157,10 @@ class Model(ABC):
 
         # Create and yield function call result
         function_call_result = self.create_function_call_result(
-            function_call, success=function_call_success, output=function_call_output, timer=function_call_timer
+            function_call, success=success, output=function_call_output, timer=timer
         )
         yield ModelResponse(
-            content=f"{function_call.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
+            content=f"{function_call.get_call_str()} completed in {timer.elapsed:.4f}s.",
             tool_executions=[
                 ToolExecution(
                     tool_call_id=function_call_result.tool_call_id,
@@ -1157,6 +1178,71 @@ class Model(ABC):
         # Add function call to function call results
         function_call_results.append(function_call_result)
 
+    def _execute_function_call(
+        self, function_call: FunctionCall
+    ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+        """Execute a single function call in a worker thread and return its success status, timer and FunctionCall."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+        success: Union[bool, AgentRunException] = False
+        try:
+            success = function_call.execute().status == "success"
+        except AgentRunException as e:
+            success = e
+        except Exception as e:
+            log_error(f"Error executing function {function_call.function.name}: {e}")
+            raise e
+        function_call_timer.stop()
+        return success, function_call_timer, function_call
+
+    def run_function_calls_in_parallel(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: List[Message],
+    ) -> Iterator[ModelResponse]:
+        """Run function calls concurrently in a thread pool, yielding their events in the original order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self._function_call_stack is None:
+            self._function_call_stack = []
+
+        for fc in function_calls:
+            yield ModelResponse(
+                content=fc.get_call_str(),
+                tool_executions=[
+                    ToolExecution(
+                        tool_call_id=fc.call_id,
+                        tool_name=fc.function.name,
+                        tool_args=fc.arguments,
+                    )
+                ],
+                event=ModelResponseEvent.tool_call_started.value,
+            )
+
+        max_workers = self.max_tool_workers or len(function_calls)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._execute_function_call, fc) for fc in function_calls]
+
+            # Results are processed in the order the model requested the tool calls
+            for future in futures:
+                function_call_success, function_call_timer, fc = future.result()
+
+                # Handle AgentRunException
+                if isinstance(function_call_success, AgentRunException):
+                    # Update additional messages from function call
+                    _handle_agent_exception(function_call_success, additional_messages)
+                    # Set function call success to False if an exception occurred
+                    function_call_success = False
+
+                yield from self._process_function_call_result(
+                    function_call=fc,
+                    success=function_call_success,
+                    timer=function_call_timer,
+                    function_call_results=function_call_results,
+                )
+                self._function_call_stack.append(fc)
+
     def run_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -1171,6 +1257,9 @@ class Model(ABC):
         if additional_messages is None:
             additional_messages = []
 
+        # Function calls to run concurrently when parallel tool execution is enabled
+        function_calls_to_run: List[FunctionCall] = []
+
         for fc in function_calls:
             paused_tool_executions = []
 
@@ -1247,6 +1336,15 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
+            if self.parallel_tool_execution:
+                function_calls_to_run.append(fc)
+
+                # Check function call limit
+                if tool_call_limit and len(self._function_call_stack) + len(function_calls_to_run) >= tool_call_limit:
+                    self._tool_choice = "none"
+                    break
+                continue
+
             yield from self.run_function_call(
                 function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
             )
@@ -1259,6 +1357,20 @@ class Model(ABC):
                 self._tool_choice = "none"
                 break
 
+        if len(function_calls_to_run) == 1:
+            yield from self.run_function_call(
+                function_call=function_calls_to_run[0],
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+            )
+            self._function_call_stack.append(function_calls_to_run[0])
+        elif len(function_calls_to_run) > 1:
+            yield from self.run_function_calls_in_parallel(
+                function_calls=function_calls_to_run,
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+            )
+
         # Add any additional messages at the end
         if additional_messages:
             function_call_results.extend(additional_messages)
@@ -1537,6 +1649,14 @@ class Model(ABC):
 
         self._function_call_stack = None
 
+    def share_clients(self, model: "Model") -> None:
+        """Use the API clients of the given model, which keeps owning and closing them.
+
+        Lets copies of a model made for single requests reuse the connections of the original. Models that do not
+        cache their clients make new ones as before.
+        """
+        pass
+
     def __deepcopy__(self, memo):
         """Create a deep copy of the Model instance.
 
@@ -1557,6 +1677,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions", "_function_call_stack"}:
                 continue
+            # Clients are bound to the model that closes them and to an event loop, so copies create their own
+            if k in {"client", "async_client", "_async_client_loop"}:
+                setattr(new_model, k, None)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
@@ -1,9 +1,9 @@
 import json
 from dataclasses import asdict, dataclass
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -219,6 +219,9 @@ class Message(BaseModel):
 
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
+    # The tokenizer and the number of tokens it counted in this message, see `count_tokens`
+    _token_count: Optional[Tuple[Callable[[str], int], int]] = PrivateAttr(default=None)
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
@@ -230,6 +233,20 @@ class Message(BaseModel):
                 return json.dumps(self.content)
         return ""
 
+    def count_tokens(self, tokenizer: Callable[[str], int]) -> int:
+        """Returns the number of tokens in the content and tool calls of the message.
+
+        The count is cached on the message, so history messages are only tokenized once per tokenizer.
+        """
+        if self._token_count is not None and self._token_count[0] is tokenizer:
+            return self._token_count[1]
+        # Every message carries a few tokens for the role and separators
+        num_tokens = 4 + tokenizer(self.get_content_string())
+        if self.tool_calls:
+            num_tokens += tokenizer(json.dumps(self.tool_calls, default=str))
+        self._token_count = (tokenizer, num_tokens)
+        return num_tokens
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns the message as a dictionary."""
         message_dict = {
@@ -5,7 +5,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 try:
-    from openai import AsyncOpenAI as AsyncOpenAIClient
+    import openai  # noqa: F401
 except ImportError:
     raise ImportError("`openai` not installed. Please install using `pip install openai`")
 
@@ -60,15 +60,11 @@ class LlamaOpenAI(OpenAILike):
         """
         return format_message(message, openai_like=True)
 
-    def get_async_client(self):
+    def _get_async_http_client(self) -> httpx.AsyncClient:
         """Override to provide custom httpx client that properly handles redirects"""
-        client_params = self._get_client_params()
-
         # Llama gives a 307 redirect error, so we need to set up a custom client to allow redirects
-        client_params["http_client"] = httpx.AsyncClient(
+        return httpx.AsyncClient(
             limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
             follow_redirects=True,
             timeout=httpx.Timeout(30.0),
         )
-
-        return AsyncOpenAIClient(**client_params)
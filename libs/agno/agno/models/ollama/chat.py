@@ -1,3 +1,4 @@
+import asyncio
 import json
 from dataclasses import dataclass
 from typing import Any, Dict, Iterator, List, Mapping, Optional, Type, Union
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.common import close_in_background, get_running_event_loop
 from agno.utils.log import log_debug, log_warning
 
 try:
@@ -46,6 +48,8 @@ class Ollama(Model):
     # Ollama clients
     client: Optional[OllamaClient] = None
     async_client: Optional[AsyncOllamaClient] = None
+    # Event loop the async client was created on, None if the async client was provided by the user
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _get_client_params(self) -> Dict[str, Any]:
         base_params = {
@@ -79,10 +83,31 @@ class Ollama(Model):
         Returns:
             AsyncOllamaClient: An instance of the Ollama client.
         """
+        loop = get_running_event_loop()
         if self.async_client is not None:
-            return self.async_client
+            # Pooled connections are bound to the event loop they were opened on
+            if self._async_client_loop is None or self._async_client_loop is loop:
+                return self.async_client
+            # A client on a loop that is still running may be in use there, so it is left open
+            if not self._async_client_loop.is_running():
+                close_in_background(self.async_client.close)
+
+        self.async_client = AsyncOllamaClient(**self._get_client_params())
+        self._async_client_loop = loop
+        return self.async_client
+
+    def close(self) -> None:
+        """Closes the cached Ollama client and its connection pool."""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
 
-        return AsyncOllamaClient(**self._get_client_params())
+    async def aclose(self) -> None:
+        """Closes the cached asynchronous Ollama client and its connection pool."""
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+            self._async_client_loop = None
 
     def get_request_kwargs(
         self,
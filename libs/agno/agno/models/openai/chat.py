@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from os import getenv
@@ -11,6 +12,7 @@ from agno.media import AudioResponse
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.common import close_in_background, get_running_event_loop
 from agno.utils.log import log_error, log_warning
 from agno.utils.openai import _format_file_for_message, audio_to_message, images_to_message
 
@@ -78,6 +80,14 @@ class OpenAIChat(Model):
     http_client: Optional[httpx.Client] = None
     client_params: Optional[Dict[str, Any]] = None
 
+    # OpenAI clients, created lazily and reused across requests
+    client: Optional[OpenAIClient] = None
+    async_client: Optional[AsyncOpenAIClient] = None
+    # Event loop the async client was created on, None if the async client was provided by the user
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+    # Whether the sync client was created by the model, False if it was provided by the user
+    _owns_client: bool = False
+
     # The role to map the message role to.
     role_map = {
         "system": "developer",
@@ -120,10 +130,54 @@ class OpenAIChat(Model):
         Returns:
             OpenAIClient: An instance of the OpenAI client.
         """
+        if self.client is not None and not self.client.is_closed():
+            return self.client
+
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
-        return OpenAIClient(**client_params)
+
+        self.client = OpenAIClient(**client_params)
+        self._owns_client = True
+        return self.client
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """
+        Returns the HTTP client used by the asynchronous OpenAI client.
+
+        Returns:
+            httpx.AsyncClient: A new async HTTP client with custom limits.
+        """
+        return httpx.AsyncClient(limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100))
+
+    def _can_reuse_async_client(self) -> bool:
+        """
+        Checks if the cached asynchronous client can be reused.
+
+        Pooled connections are bound to the event loop they were opened on, so a client created
+        by this model is only reused on that same loop.
+        """
+        if self.async_client is None or self.async_client.is_closed():
+            return False
+        if self._async_client_loop is None:
+            # The async client was provided by the user
+            return True
+        return self._async_client_loop is get_running_event_loop()
+
+    def _close_stale_async_client(self) -> None:
+        """
+        Closes the async client created on another event loop before it is replaced.
+
+        A client on a loop that is still running may be in use there, so it is left open.
+        """
+        loop = self._async_client_loop
+        if self.async_client is None or loop is None or loop.is_running():
+            return
+        # A user provided HTTP client is shared by every async client, so it stays open
+        if self.http_client is None:
+            close_in_background(self.async_client.close)
+        self.async_client = None
+        self._async_client_loop = None
 
     def get_async_client(self) -> AsyncOpenAIClient:
         """
@@ -132,15 +186,58 @@ class OpenAIChat(Model):
         Returns:
             AsyncOpenAIClient: An instance of the asynchronous OpenAI client.
         """
+        if self._can_reuse_async_client():
+            return self.async_client  # type: ignore
+        self._close_stale_async_client()
+
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
         else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncOpenAIClient(**client_params)
+            client_params["http_client"] = self._get_async_http_client()
+
+        self.async_client = AsyncOpenAIClient(**client_params)
+        self._async_client_loop = get_running_event_loop()
+        return self.async_client
+
+    def close(self) -> None:
+        """Closes the OpenAI client created by the model and its connection pool.
+
+        Clients and HTTP clients provided by the user are left open, as the model does not own them.
+        """
+        if self.client is None or not self._owns_client:
+            return
+        # Closing the OpenAI client closes its HTTP client
+        if self.http_client is None:
+            self.client.close()
+        self.client = None
+        self._owns_client = False
+
+    async def aclose(self) -> None:
+        """Closes the asynchronous OpenAI client created by the model and its connection pool.
+
+        Clients and HTTP clients provided by the user are left open, as the model does not own them.
+        """
+        if self.async_client is None or self._async_client_loop is None:
+            return
+        if self.http_client is None:
+            await self.async_client.close()
+        self.async_client = None
+        self._async_client_loop = None
+
+    def share_clients(self, model: Model) -> None:
+        """Use the clients of the given model, which keeps owning and closing them.
+
+        The async client is only shared inside an event loop, as the model creates it for its loop.
+        """
+        if not isinstance(model, OpenAIChat):
+            return
+        self.client = model.get_client()
+        self._owns_client = False
+        if get_running_event_loop() is not None:
+            self.async_client = model.get_async_client()
+            # Not bound to a loop, so that the copy neither replaces nor closes it
+            self._async_client_loop = None
 
     def get_request_kwargs(
         self,
@@ -1,10 +1,30 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from hashlib import md5
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple
 
-from agno.storage.session import Session
+from agno.models.message import Message
+from agno.storage.session import Session, SessionPage, SessionSummary
+
+
+def get_run_id(run: Dict[str, Any]) -> Optional[str]:
+    """Get the run_id of a run as stored in the session memory.
+
+    Runs of the v2 `Memory` store it at the top level, runs of an `AgentMemory` store it in their response.
+    """
+    run_id = run.get("run_id")
+    if run_id is None and isinstance(run.get("response"), dict):
+        run_id = run["response"].get("run_id")
+    return run_id
 
 
 class Storage(ABC):
+    # If True, the runs in the session memory are stored separately from the session and only the runs
+    # passed to `upsert` are written, so callers only need to pass the runs that are new or changed.
+    append_runs: bool = False
+
     def __init__(self, mode: Optional[Literal["agent", "team", "workflow"]] = "agent"):
         self._mode: Literal["agent", "team", "workflow"] = "agent" if mode is None else mode
 
@@ -38,10 +58,221 @@ class Storage(ABC):
     def upsert(self, session: Session) -> Optional[Session]:
         raise NotImplementedError
 
+    def exists(self, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """Check if a session exists, optionally for the given user_id and/or entity_id.
+
+        Reads the session by default, storages override it to check for the session without loading it.
+        """
+        session = self.read(session_id, user_id)
+        if session is None:
+            return False
+        return entity_id is None or getattr(session, self._get_entity_id_field()) == entity_id
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List summaries of the sessions, newest first, one page at a time.
+
+        Reads all sessions by default, storages override it to only read the fields in the summary.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): The maximum number of sessions in the page. Defaults to all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page. Defaults to the first page.
+            fields (Optional[Sequence[str]]): The summary fields to read besides session_id and created_at,
+                out of user_id, session_name, title and updated_at. Defaults to all of them.
+
+        Returns:
+            SessionPage: The session summaries and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        after = self._decode_cursor(cursor) if cursor else None
+        sessions = sorted(
+            self.get_all_sessions(user_id=user_id, entity_id=entity_id),
+            key=lambda s: (s.created_at or 0, s.session_id),
+            reverse=True,
+        )
+        if after is not None:
+            sessions = [s for s in sessions if (s.created_at or 0, s.session_id) < after]
+        if limit is not None:
+            sessions = sessions[: limit + 1]
+
+        summaries = []
+        for session in sessions:
+            runs = session.memory.get("runs") if session.memory else None
+            summaries.append(
+                self._get_summary(
+                    {
+                        "session_id": session.session_id,
+                        "user_id": session.user_id,
+                        "session_name": session.session_data.get("session_name") if session.session_data else None,
+                        "first_run": runs[0] if runs else None,
+                        "created_at": session.created_at,
+                        "updated_at": session.updated_at,
+                    },
+                    fields,
+                )
+            )
+        return self._get_page(summaries, limit)
+
+    def _get_entity_id_field(self) -> str:
+        """Get the name of the field holding the ID of the agent / team / workflow of a session"""
+        if self.mode == "team":
+            return "team_id"
+        elif self.mode == "workflow":
+            return "workflow_id"
+        return "agent_id"
+
+    def _get_run_title(self, run: Any) -> Optional[str]:
+        """Get the title of a session from its first run: the first user message, or the first line of a workflow response"""
+        if not isinstance(run, dict):
+            return None
+        if self.mode == "workflow":
+            content = (run.get("response") or {}).get("content")
+            return content.split("\n")[0] if isinstance(content, str) and content else None
+
+        # Runs of an `AgentMemory` store the user message with the response, runs of the v2 `Memory` store all messages
+        messages = [run.get("message")] if "response" in run else run.get("messages") or []
+        for message in messages:
+            if isinstance(message, dict) and message.get("role") == "user":
+                content = Message(role="user", content=message.get("content")).get_content_string()
+                if content:
+                    return content
+        return None
+
+    def _get_summary(self, data: Mapping[str, Any], fields: Optional[Sequence[str]] = None) -> SessionSummary:
+        """Build a session summary from the session_id, user_id, session_name, first_run, created_at and updated_at.
+        A title already found from the first run can be given instead of the first run.
+        """
+
+        def include(name: str) -> bool:
+            return fields is None or name in fields
+
+        return SessionSummary(
+            session_id=data["session_id"],
+            user_id=data.get("user_id") if include("user_id") else None,
+            session_name=data.get("session_name") if include("session_name") else None,
+            title=(data["title"] if "title" in data else self._get_run_title(data.get("first_run")))
+            if include("title")
+            else None,
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at") if include("updated_at") else None,
+        )
+
+    def _get_page(self, summaries: List[SessionSummary], limit: Optional[int] = None) -> SessionPage:
+        """Build a page from the summaries read, which include one more summary than the limit if there is a next page"""
+        if limit is None or len(summaries) <= limit:
+            return SessionPage(sessions=summaries)
+        summaries = summaries[:limit]
+        last = summaries[-1]
+        return SessionPage(sessions=summaries, next_cursor=self._encode_cursor([last.created_at or 0, last.session_id]))
+
+    def _encode_cursor(self, value: Any) -> str:
+        """Encode the position of a page as an opaque cursor"""
+        return urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+    def _decode_cursor_value(self, cursor: str) -> Any:
+        """Decode the value of a cursor created by `_encode_cursor`"""
+        try:
+            return json.loads(urlsafe_b64decode(cursor.encode()))
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def _decode_cursor(self, cursor: str) -> Tuple[int, str]:
+        """Decode the (created_at, session_id) of the last session of a page, from its cursor"""
+        value = self._decode_cursor_value(cursor)
+        if not isinstance(value, list) or len(value) != 2:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        created_at, session_id = value
+        if created_at is None:
+            created_at = 0
+        if isinstance(created_at, bool) or not isinstance(created_at, int) or not isinstance(session_id, str):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        return created_at, session_id
+
+    def _get_run_key(self, run: Dict[str, Any]) -> str:
+        """Get the key a run is stored under: its run_id, or a hash of the run if it has none."""
+        return get_run_id(run) or md5(json.dumps(run, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _get_session_memory(self, session: Session) -> Optional[Dict[str, Any]]:
+        """Get the memory stored with the session, which excludes the runs if they are stored separately."""
+        if not self.append_runs or session.memory is None:
+            return session.memory
+        return {k: v for k, v in session.memory.items() if k != "runs"}
+
+    def _attach_runs(self, sessions: List[Session], rows: Iterable[Any]) -> List[Session]:
+        """Set the runs read from the runs storage, as (session_id, run) rows in order, on the sessions.
+
+        Sessions written before `append_runs` was enabled have no runs in the runs storage yet, and keep the runs
+        stored with them. These sessions are returned, so their runs can be moved to the runs storage.
+        """
+        runs: Dict[str, List[Dict[str, Any]]] = {}
+        for session_id, run in rows:
+            runs.setdefault(session_id, []).append(run)
+        legacy_sessions: List[Session] = []
+        for session in sessions:
+            session_runs = runs.get(session.session_id)
+            if session_runs is None:
+                if session.memory is not None and session.memory.get("runs"):
+                    legacy_sessions.append(session)
+                continue
+            if session.memory is None:
+                session.memory = {}
+            session.memory["runs"] = session_runs
+        return legacy_sessions
+
+    def _with_timestamps(self, session: Session, row: Any) -> Session:
+        """Set the created_at and updated_at timestamps returned by the database on an upserted session.
+
+        Lets `upsert` return the session it was given instead of reading the whole session back.
+        """
+        session.created_at = row.created_at
+        session.updated_at = row.updated_at
+        return session
+
     @abstractmethod
     def delete_session(self, session_id: Optional[str] = None):
         raise NotImplementedError
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a session asynchronously, running `read` in a thread by default."""
+        return await asyncio.to_thread(self.read, session_id, user_id)
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Get all sessions asynchronously, running `get_all_sessions` in a thread by default."""
+        return await asyncio.to_thread(self.get_all_sessions, user_id, entity_id)
+
+    async def aexists(self, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """Check if a session exists asynchronously, running `exists` in a thread by default."""
+        return await asyncio.to_thread(self.exists, session_id, user_id, entity_id)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List summaries of the sessions asynchronously, running `list_sessions` in a thread by default."""
+        return await asyncio.to_thread(self.list_sessions, user_id, entity_id, limit, cursor, fields)
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a session asynchronously, running `upsert` in a thread by default."""
+        return await asyncio.to_thread(self.upsert, session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Delete a session asynchronously, running `delete_session` in a thread by default."""
+        return await asyncio.to_thread(self.delete_session, session_id)
+
     @abstractmethod
     def drop(self) -> None:
         raise NotImplementedError
@@ -1,10 +1,10 @@
 import time
 from dataclasses import asdict
 from decimal import Decimal
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, SessionPage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -12,7 +12,7 @@ from agno.utils.log import log_debug, log_info, logger
 
 try:
     import boto3
-    from boto3.dynamodb.conditions import Key
+    from boto3.dynamodb.conditions import Attr, Key
     from botocore.exceptions import ClientError
 except ImportError:
     raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
@@ -394,6 +394,116 @@ class DynamoDbStorage(Storage):
             logger.error(f"Error retrieving sessions: {e}")
         return sessions
 
+    def exists(self, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """
+        Check if a session exists, only reading its IDs.
+
+        Args:
+            session_id (str): ID of the session to check.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by. Defaults to None.
+
+        Returns:
+            bool: True if the session exists, False otherwise.
+        """
+        entity_id_field = self._get_entity_id_field()
+        try:
+            response = self.table.get_item(
+                Key={"session_id": session_id},
+                ProjectionExpression=f"session_id, user_id, {entity_id_field}",
+            )
+            item = response.get("Item", None)
+            if item is None:
+                return False
+            if user_id is not None and item.get("user_id") != user_id:
+                return False
+            return entity_id is None or item.get(entity_id_field) == entity_id
+        except Exception as e:
+            logger.error(f"Error checking session_id '{session_id}': {e}")
+        return False
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List summaries of the sessions, only reading the first run of each session.
+
+        Sessions filtered by user_id or entity_id are queried from their index, newest first.
+        Without filters the table is scanned and the sessions are not sorted.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): The maximum number of sessions in the page. Defaults to all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page. Defaults to the first page.
+            fields (Optional[Sequence[str]]): The summary fields to read besides session_id and created_at.
+
+        Returns:
+            SessionPage: The session summaries and the cursor of the next page.
+        """
+        projection = ["session_id", "created_at"]
+        if fields is None or "user_id" in fields:
+            projection.append("user_id")
+        if fields is None or "session_name" in fields:
+            projection.append("session_data.session_name")
+        if fields is None or "title" in fields:
+            projection.append("memory.runs[0]")
+        if fields is None or "updated_at" in fields:
+            projection.append("updated_at")
+
+        kwargs: Dict[str, Any] = {"ProjectionExpression": ", ".join(projection)}
+        entity_id_field = self._get_entity_id_field()
+        if user_id is not None:
+            kwargs["IndexName"] = "user_id-index"
+            kwargs["KeyConditionExpression"] = Key("user_id").eq(user_id)
+            if entity_id is not None:
+                kwargs["FilterExpression"] = Attr(entity_id_field).eq(entity_id)
+        elif entity_id is not None:
+            kwargs["IndexName"] = f"{entity_id_field}-index"
+            kwargs["KeyConditionExpression"] = Key(entity_id_field).eq(entity_id)
+        if "IndexName" in kwargs:
+            kwargs["ScanIndexForward"] = False
+        if limit is not None:
+            kwargs["Limit"] = limit
+        if cursor is not None:
+            start_key = self._decode_cursor_value(cursor)
+            if not isinstance(start_key, dict):
+                raise ValueError(f"Invalid cursor: {cursor}")
+            kwargs["ExclusiveStartKey"] = start_key
+
+        summaries = []
+        try:
+            while True:
+                if "IndexName" in kwargs:
+                    response = self.table.query(**kwargs)
+                else:
+                    response = self.table.scan(**kwargs)
+                for item in response.get("Items", []):
+                    item = self._deserialize_item(item)
+                    runs = (item.get("memory") or {}).get("runs")
+                    item["session_name"] = (item.get("session_data") or {}).get("session_name")
+                    item["first_run"] = runs[0] if runs else None
+                    summaries.append(self._get_summary(item, fields))
+
+                # DynamoDB returns the key to continue from when there are more items to read
+                last_evaluated_key = response.get("LastEvaluatedKey")
+                if last_evaluated_key is None:
+                    return SessionPage(sessions=summaries)
+                if limit is not None:
+                    return SessionPage(
+                        sessions=summaries,
+                        next_cursor=self._encode_cursor(self._deserialize_item(last_evaluated_key)),
+                    )
+                kwargs["ExclusiveStartKey"] = last_evaluated_key
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+        return SessionPage()
+
     def upsert(self, session: Session) -> Optional[Session]:
         """
         Create or update a Session in the database.
@@ -0,0 +1,285 @@
+import json
+import os
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Union
+from uuid import uuid4
+
+from agno.storage.base import SessionPage, Storage
+from agno.storage.session import Session
+from agno.storage.session.agent import AgentSession
+from agno.storage.session.team import TeamSession
+from agno.storage.session.workflow import WorkflowSession
+from agno.utils.log import logger
+
+# Maps each session_id to its user_id, entity_id, name, title and timestamps
+SessionIndex = Dict[str, Dict[str, Any]]
+
+
+class FileStorage(Storage):
+    """Base class for storages keeping each session in its own file, e.g. `JsonStorage` and `YamlStorage`.
+
+    An index file maps each session to its user_id, entity_id, name, title and timestamps, so filtered listings only
+    read the matching sessions and `list_sessions` only reads the index. The index is built from the stored sessions
+    when it does not exist or was written by an older version. Sessions stored or deleted without the storage are
+    picked up by `rebuild_index()`.
+    """
+
+    # Extension of the session files, e.g. "json"
+    extension: str = ""
+
+    def __init__(self, dir_path: Union[str, Path], mode: Optional[Literal["agent", "team", "workflow"]] = "agent"):
+        super().__init__(mode)
+        self.dir_path = Path(dir_path)
+        self.dir_path.mkdir(parents=True, exist_ok=True)
+        self._index_lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        """Path of the index mapping each session_id to its user_id, entity_id, name, title and timestamps."""
+        return self.dir_path / ".index.json"
+
+    def _get_file_path(self, session_id: str) -> Path:
+        return self.dir_path / f"{session_id}.{self.extension}"
+
+    def serialize(self, data: dict) -> str:
+        raise NotImplementedError
+
+    def deserialize(self, data: str) -> dict:
+        raise NotImplementedError
+
+    def create(self) -> None:
+        """Create the storage if it doesn't exist."""
+        if not self.dir_path.exists():
+            self.dir_path.mkdir(parents=True, exist_ok=True)
+
+    def _to_session(self, data: dict) -> Optional[Session]:
+        """Convert stored session data to a Session for the storage mode."""
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
+    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from storage."""
+        data = self._read_data(session_id)
+        if data is None or (user_id and data["user_id"] != user_id):
+            return None
+        return self._to_session(data)
+
+    def _get_stored_session_ids(self) -> List[str]:
+        """Get the IDs of all stored sessions from the file names, without reading the files."""
+        return [file.stem for file in self.dir_path.glob(f"*.{self.extension}") if file.name != self.index_path.name]
+
+    def _read_data(self, session_id: str) -> Optional[dict]:
+        """Read the stored data of a session, None if it does not exist."""
+        try:
+            with open(self._get_file_path(session_id), "r", encoding="utf-8") as f:
+                return self.deserialize(f.read())
+        except FileNotFoundError:
+            return None
+
+    def _read_all_data(self, session_ids: List[str]) -> List[Optional[dict]]:
+        """Read the stored data of the sessions, in order."""
+        return [self._read_data(session_id) for session_id in session_ids]
+
+    def _get_index_entry(self, data: dict) -> Dict[str, Any]:
+        """Get the index entry of a session: its user_id, entity_id, name, title and timestamps."""
+        entity_id_field = self._get_entity_id_field()
+        runs = (data.get("memory") or {}).get("runs")
+        return {
+            "user_id": data.get("user_id"),
+            entity_id_field: data.get(entity_id_field),
+            "session_name": (data.get("session_data") or {}).get("session_name"),
+            "title": self._get_run_title(runs[0]) if runs else None,
+            "created_at": data.get("created_at"),
+            "updated_at": data.get("updated_at"),
+        }
+
+    def _is_index_current(self, index: SessionIndex) -> bool:
+        """Check that the entries of a loaded index have every field, as indexes written by older versions lack some"""
+        return all("title" in entry for entry in index.values())
+
+    def _build_index(self) -> SessionIndex:
+        """Build the index from the stored sessions, reading all of them."""
+        session_ids = self._get_stored_session_ids()
+        return {
+            session_id: self._get_index_entry(data)
+            for session_id, data in zip(session_ids, self._read_all_data(session_ids))
+            if data is not None
+        }
+
+    def _load_index(self) -> Optional[SessionIndex]:
+        """Load the index, None if it does not exist yet or is invalid."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.loads(f.read())
+            return index if self._is_index_current(index) else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Rebuilding invalid session index {self.index_path}: {e}")
+            return None
+
+    def _save_index(self, index: SessionIndex) -> None:
+        """Save the index. Write to a temporary file and move it in place, so the index is never read half written."""
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{uuid4().hex}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+        os.replace(tmp_path, self.index_path)
+
+    def _update_index(self, update: Callable[[SessionIndex], bool], rebuild: bool = False) -> SessionIndex:
+        """Apply an update returning whether it changed the index, and save the index if it did.
+
+        The index is built from the stored sessions first if it does not exist or `rebuild` is set. Updates are
+        serialized within the process only: concurrent processes may overwrite each other's updates, which
+        `rebuild_index()` repairs.
+        """
+        with self._index_lock:
+            index = None if rebuild else self._load_index()
+            changed = index is None
+            if index is None:
+                index = self._build_index()
+            if update(index) or changed:
+                self._save_index(index)
+            return index
+
+    def _set_index_entry(self, session_id: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Add or update the index entry of a session, or remove it if entry is None."""
+
+        def update(index: SessionIndex) -> bool:
+            if entry is None:
+                return index.pop(session_id, None) is not None
+            index[session_id] = entry
+            return True
+
+        self._update_index(update)
+
+    def _remove_index_entries(self, session_ids: List[str]) -> None:
+        """Remove the index entries of sessions that no longer exist."""
+
+        def update(index: SessionIndex) -> bool:
+            return any([index.pop(session_id, None) is not None for session_id in session_ids])
+
+        self._update_index(update)
+
+    def _get_index(self) -> SessionIndex:
+        """Get the index, building it if it does not exist yet."""
+        return self._update_index(lambda index: False)
+
+    def rebuild_index(self) -> None:
+        """Rebuild the index from the stored sessions, after sessions were stored or deleted without the storage."""
+        self._update_index(lambda index: False, rebuild=True)
+
+    def _matches(self, data: dict, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """Check if a session or its index entry matches the user_id and entity_id filters."""
+        if user_id and data.get("user_id") != user_id:
+            return False
+        return not entity_id or data.get(self._get_entity_id_field()) == entity_id
+
+    def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Get all session IDs, optionally filtered by user_id and/or entity_id."""
+        if not user_id and not entity_id:
+            # No filters applied, the file names are enough
+            return self._get_stored_session_ids()
+        return [
+            session_id
+            for session_id, entry in self._get_index().items()
+            if self._matches(entry, user_id=user_id, entity_id=entity_id)
+        ]
+
+    def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Get all sessions, optionally filtered by user_id and/or entity_id.
+
+        Only the files of the sessions matching the filters in the index are read.
+        """
+        sessions: List[Session] = []
+        session_ids = self.get_all_session_ids(user_id=user_id, entity_id=entity_id)
+        missing_session_ids: List[str] = []
+        for session_id, data in zip(session_ids, self._read_all_data(session_ids)):
+            if data is None:
+                missing_session_ids.append(session_id)
+                continue
+            if not self._matches(data, user_id=user_id, entity_id=entity_id):
+                continue
+            _session = self._to_session(data)
+            if _session:
+                sessions.append(_session)
+        if missing_session_ids and (user_id or entity_id):
+            # Sessions deleted without the storage are still in the index
+            self._remove_index_entries(missing_session_ids)
+        return sessions
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List summaries of the sessions, newest first, one page at a time.
+
+        The summaries are built from the index, so no session is read.
+        """
+        after = self._decode_cursor(cursor) if cursor else None
+        entries = sorted(
+            (
+                (entry.get("created_at") or 0, session_id, entry)
+                for session_id, entry in self._get_index().items()
+                if self._matches(entry, user_id=user_id, entity_id=entity_id)
+            ),
+            key=lambda item: (item[0], item[1]),
+            reverse=True,
+        )
+        if after is not None:
+            entries = [item for item in entries if (item[0], item[1]) < after]
+        if limit is not None:
+            entries = entries[: limit + 1]
+        summaries = [self._get_summary({**entry, "session_id": session_id}, fields) for _, session_id, entry in entries]
+        return self._get_page(summaries, limit)
+
+    def _get_upsert_data(self, session: Session) -> dict:
+        """Convert a Session to the data stored in its file."""
+        data = asdict(session)
+        data["updated_at"] = int(time.time())
+        if "created_at" not in data:
+            data["created_at"] = data["updated_at"]
+        return data
+
+    def upsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in storage."""
+        try:
+            data = self._get_upsert_data(session)
+            with open(self._get_file_path(session.session_id), "w", encoding="utf-8") as f:
+                f.write(self.serialize(data))
+            self._set_index_entry(session.session_id, self._get_index_entry(data))
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    def delete_session(self, session_id: Optional[str] = None):
+        """Delete a session from storage."""
+        if session_id is None:
+            return
+        try:
+            self._get_file_path(session_id).unlink(missing_ok=True)
+            self._set_index_entry(session_id, None)
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    def drop(self) -> None:
+        """Drop all sessions from storage."""
+        for file in self.dir_path.glob(f"*.{self.extension}"):
+            file.unlink()
+        self.index_path.unlink(missing_ok=True)
+
+    def upgrade_schema(self) -> None:
+        """Upgrade the schema of the storage."""
+        pass
@@ -1,8 +1,12 @@
 import json
+import threading
 import time
-from typing import Any, List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Literal, Optional, Tuple
 
-from agno.storage.json import JsonStorage, Storage
+from agno.storage.base import Storage
+from agno.storage.file import SessionIndex
+from agno.storage.json import JsonStorage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -10,6 +14,7 @@ from agno.storage.session.workflow import WorkflowSession
 from agno.utils.log import logger
 
 try:
+    from google.api_core.exceptions import PreconditionFailed
     from google.cloud import storage as gcs
 except ImportError:
     raise ImportError("`google-cloud-storage` not installed. Please install it with `pip install google-cloud-storage`")
@@ -29,6 +34,8 @@ class GCSJsonStorage(JsonStorage):
       - project: Optional; the GCP project ID. Defaults to current Google Cloud's project (set with `gcloud init`).
       - location: Optional; the GCP location for the bucket. Default's to current project's location.
       - credentials: Optional credentials object; if not provided, defaults will be used.
+      - download_workers: Optional; the number of sessions downloaded concurrently when reading many sessions.
+        Defaults to 1.
     """
 
     def __init__(
@@ -39,6 +46,7 @@ class GCSJsonStorage(JsonStorage):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[Any] = None,
+        download_workers: int = 1,
     ):
         # Call Storage's __init__ directly to bypass the folder creation logic in JsonStorage.
         Storage.__init__(self, mode=mode)
@@ -48,6 +56,8 @@ class GCSJsonStorage(JsonStorage):
         self.prefix = prefix
         self.project = project
         self.location = location
+        self.download_workers = download_workers
+        self._index_lock = threading.Lock()
 
         # Initialize the GCS client once; if STORAGE_EMULATOR_HOST is set, it will be used automatically.
         self.client = gcs.Client(project=self.project, credentials=credentials)
@@ -57,6 +67,11 @@ class GCSJsonStorage(JsonStorage):
         """Returns the blob path for a given session."""
         return f"{self.prefix}{session_id}.json"
 
+    def _get_index_blob_path(self) -> str:
+        """Returns the blob path of the index mapping each session_id to its user_id, entity_id, name, title and
+        timestamps."""
+        return f"{self.prefix}.index.json"
+
     def create(self) -> None:
         """
         Creates the bucket if it doesn't exist
@@ -106,42 +121,91 @@ class GCSJsonStorage(JsonStorage):
             return WorkflowSession.from_dict(data)
         return None
 
-    def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+    def _get_stored_session_ids(self) -> List[str]:
         """
-        Lists all session IDs stored in the bucket.
+        Lists the IDs of all sessions stored in the bucket, without downloading them.
         """
         session_ids = []
         for blob in self.client.list_blobs(self.bucket, prefix=self.prefix):
-            if blob.name.endswith(".json"):
-                session_ids.append(blob.name.replace(".json", ""))
+            if blob.name.endswith(".json") and blob.name != self._get_index_blob_path():
+                name = blob.name[len(self.prefix) :] if self.prefix and blob.name.startswith(self.prefix) else blob.name
+                session_ids.append(name.replace(".json", ""))
         return session_ids
 
-    def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+    def _read_data(self, session_id: str) -> Optional[dict]:
         """
-        Retrieves all sessions stored in the bucket.
+        Downloads the stored data of a session, None if it does not exist or can't be read.
         """
-        sessions: List[Session] = []
-        for blob in self.client.list_blobs(self.bucket, prefix=self.prefix):
-            if blob.name.endswith(".json"):
-                try:
-                    data_str = blob.download_as_bytes().decode("utf-8")
-                    data = self.deserialize(data_str)
-
-                    if user_id and data.get("user_id") != user_id:
-                        continue
-                    session: Optional[Session] = None
-                    if self.mode == "agent":
-                        session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        session = WorkflowSession.from_dict(data)
-                    if session is not None:
-                        sessions.append(session)
-                except Exception as e:
-                    logger.error(f"Error reading session from blob {blob.name}: {e}")
-                    continue
-        return sessions
+        blob = self.bucket.blob(self._get_blob_path(session_id))
+        try:
+            return self.deserialize(blob.download_as_bytes().decode("utf-8"))
+        except Exception as e:
+            if "404" not in str(e):
+                logger.error(f"Error reading session {session_id} from GCS: {e}")
+            return None
+
+    def _read_all_data(self, session_ids: List[str]) -> List[Optional[dict]]:
+        """
+        Downloads the stored data of the sessions in order, using `download_workers` concurrent downloads.
+        """
+        if self.download_workers <= 1 or len(session_ids) <= 1:
+            return [self._read_data(session_id) for session_id in session_ids]
+        with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+            return list(executor.map(self._read_data, session_ids))
+
+    def _download_index(self) -> Tuple[Optional[SessionIndex], int]:
+        """
+        Downloads the index with its generation.
+        The index is None if it is invalid, outdated or does not exist yet, in which case the generation is 0 if it
+        does not exist.
+        """
+        blob = self.bucket.get_blob(self._get_index_blob_path())
+        if blob is None:
+            return None, 0
+        try:
+            index = self.deserialize(blob.download_as_bytes().decode("utf-8"))
+            return (index if self._is_index_current(index) else None), blob.generation
+        except Exception as e:
+            logger.warning(f"Rebuilding invalid session index {blob.name}: {e}")
+            return None, blob.generation
+
+    def _upload_index(self, index: SessionIndex, generation: Optional[int]) -> bool:
+        """
+        Uploads the index if it is still at the generation it was downloaded at, returning False otherwise.
+        Without a generation, the index is overwritten.
+        """
+        blob = self.bucket.blob(self._get_index_blob_path())
+        try:
+            blob.upload_from_string(
+                json.dumps(index, ensure_ascii=False, separators=(",", ":")),
+                content_type="application/json",
+                if_generation_match=generation,
+            )
+            return True
+        except PreconditionFailed:
+            return False
+
+    def _load_index(self) -> Optional[SessionIndex]:
+        return self._download_index()[0]
+
+    def _save_index(self, index: SessionIndex) -> None:
+        self._upload_index(index, None)
+
+    def _update_index(self, update: Callable[[SessionIndex], bool], rebuild: bool = False) -> SessionIndex:
+        """
+        Applies an update to the index and uploads it if it changed. The upload only succeeds if the index was not
+        changed concurrently since it was downloaded, otherwise the update is retried on the new index.
+        """
+        index: SessionIndex = {}
+        with self._index_lock:
+            for _ in range(5):
+                loaded, generation = self._download_index()
+                changed = rebuild or loaded is None
+                index = self._build_index() if changed or loaded is None else loaded
+                if not (update(index) or changed) or self._upload_index(index, generation):
+                    return index
+        logger.warning("Session index was changed concurrently, run rebuild_index() if sessions are missing")
+        return index
 
     def upsert(self, session: Session) -> Optional[Session]:
         """
@@ -155,6 +219,7 @@ class GCSJsonStorage(JsonStorage):
                 data["created_at"] = data["updated_at"]
             json_data = self.serialize(data)
             blob.upload_from_string(json_data, content_type="application/json")
+            self._set_index_entry(session.session_id, self._get_index_entry(data))
             return session
         except Exception as e:
             logger.error(f"Error upserting session {session.session_id}: {e}")
@@ -169,6 +234,7 @@ class GCSJsonStorage(JsonStorage):
         blob = self.bucket.blob(self._get_blob_path(session_id))
         try:
             blob.delete()
+            self._set_index_entry(session_id, None)
         except Exception as e:
             logger.error(f"Error deleting session {session_id}: {e}")
 
@@ -1,12 +1,13 @@
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 from uuid import UUID
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, SessionPage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.utils.common import get_running_event_loop
 from agno.utils.log import log_debug, logger
 
 try:
@@ -26,6 +27,7 @@ class MongoDbStorage(Storage):
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_client: Optional[Any] = None,
     ):
         """
         This class provides agent storage using MongoDB.
@@ -35,8 +37,14 @@ class MongoDbStorage(Storage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing `pymongo.AsyncMongoClient` used by the async methods
         """
         super().__init__(mode)
+        self.db_url: Optional[str] = db_url
+        # Only create an async client ourselves if we know how to connect, i.e. no sync client was provided
+        self._create_async_client: bool = client is None
+        self._async_client: Optional[Any] = async_client
+        self._async_client_loop: Optional[Any] = None
         self._client: Optional[MongoClient] = client
         if self._client is None and db_url is not None:
             self._client = MongoClient(db_url)
@@ -68,6 +76,60 @@ class MongoDbStorage(Storage):
             logger.error(f"Error creating indexes: {e}")
             raise
 
+    def _get_read_query(self, session_id: str, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """Build the query used to read a single session"""
+        query = {"session_id": session_id}
+        if user_id:
+            query["user_id"] = user_id
+        return query
+
+    def _get_sessions_query(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Dict[str, Any]:
+        """Build the query used to list sessions, optionally filtered by user_id and/or entity_id"""
+        query = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if entity_id is not None:
+            if self.mode == "agent":
+                query["agent_id"] = entity_id
+            elif self.mode == "team":
+                query["team_id"] = entity_id
+            elif self.mode == "workflow":
+                query["workflow_id"] = entity_id
+        return query
+
+    def _doc_to_session(self, doc: Optional[Dict[str, Any]]) -> Optional[Session]:
+        """Convert a MongoDB document to a Session"""
+        if not doc:
+            return None
+        # Remove MongoDB _id before converting to a Session
+        doc.pop("_id", None)
+        if self.mode == "agent":
+            return AgentSession.from_dict(doc)
+        elif self.mode == "team":
+            return TeamSession.from_dict(doc)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(doc)
+        return None
+
+    def _get_update_data(self, session: Session) -> Dict[str, Any]:
+        """Convert a Session to the fields set on upsert"""
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        return {**session_dict, "updated_at": timestamp}
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read a Session from MongoDB
         Args:
@@ -77,21 +139,9 @@ class MongoDbStorage(Storage):
             Optional[Session]: The session if found, otherwise None
         """
         try:
-            query = {"session_id": session_id}
-            if user_id:
-                query["user_id"] = user_id
-
+            query = self._get_read_query(session_id, user_id)
             doc = self.collection.find_one(query)
-            if doc:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    return AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(doc)
-            return None
+            return self._doc_to_session(doc)
         except PyMongoError as e:
             logger.error(f"Error reading session: {e}")
             return None
@@ -105,17 +155,7 @@ class MongoDbStorage(Storage):
             List[str]: List of session IDs
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-
+            query = self._get_sessions_query(user_id, entity_id)
             cursor = self.collection.find(query, {"session_id": 1}).sort("created_at", -1)
 
             return [str(doc["session_id"]) for doc in cursor]
@@ -132,39 +172,86 @@ class MongoDbStorage(Storage):
             List[Session]: List of sessions
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-
+            query = self._get_sessions_query(user_id, entity_id)
             cursor = self.collection.find(query).sort("created_at", -1)
             sessions: List[Session] = []
             for doc in cursor:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    _agent_session = AgentSession.from_dict(doc)
-                    if _agent_session is not None:
-                        sessions.append(_agent_session)
-                elif self.mode == "team":
-                    _team_session = TeamSession.from_dict(doc)
-                    if _team_session is not None:
-                        sessions.append(_team_session)
-                elif self.mode == "workflow":
-                    _workflow_session = WorkflowSession.from_dict(doc)
-                    if _workflow_session is not None:
-                        sessions.append(_workflow_session)
+                _session = self._doc_to_session(doc)
+                if _session is not None:
+                    sessions.append(_session)
             return sessions
         except PyMongoError as e:
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def exists(self, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """Check if a session exists without reading it
+        Args:
+            session_id: ID of the session to check
+            user_id: ID of the user to filter by
+            entity_id: ID of the agent / team / workflow to filter by
+        Returns:
+            bool: True if the session exists, otherwise False
+        """
+        try:
+            query = {**self._get_sessions_query(user_id, entity_id), "session_id": session_id}
+            return self.collection.find_one(query, {"_id": 1}) is not None
+        except PyMongoError as e:
+            logger.error(f"Error checking session: {e}")
+            return False
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List summaries of the sessions, newest first, only reading the first run of each session
+        Args:
+            user_id: ID of the user to filter by
+            entity_id: ID of the agent / team / workflow to filter by
+            limit: Maximum number of sessions in the page, defaults to all sessions
+            cursor: The `next_cursor` of the previous page, defaults to the first page
+            fields: The summary fields to read besides session_id and created_at
+        Returns:
+            SessionPage: The session summaries and the cursor of the next page
+        """
+        query = self._get_sessions_query(user_id, entity_id)
+        if cursor is not None:
+            created_at, session_id = self._decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "session_id": {"$lt": session_id}},
+            ]
+
+        projection: Dict[str, Any] = {"_id": 0, "session_id": 1, "created_at": 1}
+        if fields is None or "user_id" in fields:
+            projection["user_id"] = 1
+        if fields is None or "session_name" in fields:
+            projection["session_data.session_name"] = 1
+        if fields is None or "title" in fields:
+            projection["memory.runs"] = {"$slice": 1}
+        if fields is None or "updated_at" in fields:
+            projection["updated_at"] = 1
+
+        try:
+            docs = self.collection.find(query, projection).sort([("created_at", -1), ("session_id", -1)])
+            # Read one more session than the limit to know if there is a next page
+            if limit is not None:
+                docs = docs.limit(limit + 1)
+            summaries = []
+            for doc in docs:
+                runs = (doc.get("memory") or {}).get("runs")
+                doc["session_name"] = (doc.get("session_data") or {}).get("session_name")
+                doc["first_run"] = runs[0] if runs else None
+                summaries.append(self._get_summary(doc, fields))
+            return self._get_page(summaries, limit)
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionPage()
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """Upsert a session
         Args:
@@ -174,34 +261,19 @@ class MongoDbStorage(Storage):
             Optional[Session]: The upserted session, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
-
-            update_data = {**session_dict, "updated_at": timestamp}
+            update_data = self._get_update_data(session)
 
             # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
+            query = {"session_id": update_data["session_id"]}
 
             doc = self.collection.find_one(query)
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return self.read(session_id=update_data["session_id"])
             return None
 
         except PyMongoError as e:
@@ -228,6 +300,105 @@ class MongoDbStorage(Storage):
         except PyMongoError as e:
             logger.error(f"Error deleting session: {e}")
 
+    def _get_async_collection(self) -> Optional[Any]:
+        """Return the collection of an `AsyncMongoClient`, or None if the async methods should run in a thread.
+
+        Clients created here are bound to the event loop they were created on, so a new one is created for each loop.
+        """
+        # A client provided by the user is always used as is
+        if self._async_client is not None and self._async_client_loop is None:
+            return self._async_client[self.db_name][self.collection_name]
+        if not self._create_async_client:
+            return None
+
+        loop = get_running_event_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            try:
+                from pymongo import AsyncMongoClient
+            except ImportError:
+                log_debug("`pymongo.AsyncMongoClient` not available, async methods will run in a thread")
+                self._create_async_client = False
+                return None
+            self._async_client = AsyncMongoClient(self.db_url) if self.db_url else AsyncMongoClient()
+            self._async_client_loop = loop
+        return self._async_client[self.db_name][self.collection_name]
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from MongoDB asynchronously"""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        try:
+            doc = await collection.find_one(self._get_read_query(session_id, user_id))
+            return self._doc_to_session(doc)
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Get all sessions matching the criteria asynchronously"""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aget_all_sessions(user_id=user_id, entity_id=entity_id)
+
+        try:
+            cursor = collection.find(self._get_sessions_query(user_id, entity_id)).sort("created_at", -1)
+            sessions: List[Session] = []
+            async for doc in cursor:
+                _session = self._doc_to_session(doc)
+                if _session is not None:
+                    sessions.append(_session)
+            return sessions
+        except PyMongoError as e:
+            logger.error(f"Error getting sessions: {e}")
+            return []
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Upsert a session asynchronously"""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aupsert(session)
+
+        try:
+            update_data = self._get_update_data(session)
+
+            # For new documents, set created_at
+            query = {"session_id": update_data["session_id"]}
+
+            doc = await collection.find_one(query)
+            if not doc:
+                update_data["created_at"] = update_data["updated_at"]
+
+            result = await collection.update_one(query, {"$set": update_data}, upsert=True)
+
+            if result.acknowledged:
+                return await self.aread(session_id=update_data["session_id"])
+            return None
+
+        except PyMongoError as e:
+            logger.warning(f"Error upserting session: {e}")
+            return None
+
+    async def adelete_session(self, session_id: Optional[str] = None) -> None:
+        """Delete a session asynchronously"""
+        if session_id is None:
+            logger.warning("No session_id provided for deletion")
+            return
+
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().adelete_session(session_id=session_id)
+
+        try:
+            result = await collection.delete_one({"session_id": session_id})
+            if result.deleted_count == 0:
+                log_debug(f"No session found with session_id: {session_id}")
+            else:
+                log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except PyMongoError as e:
+            logger.error(f"Error deleting session: {e}")
+
     def drop(self) -> None:
         """Drop the collection
         Returns:
@@ -253,7 +424,7 @@ class MongoDbStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "db", "collection", "_async_client", "_async_client_loop"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
@@ -1,24 +1,29 @@
+import asyncio
 import time
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, List, Literal, Optional, Sequence
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, SessionPage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.utils.common import close_in_background, get_running_event_loop
 from agno.utils.log import log_debug, log_info, log_warning, logger
 
 try:
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import URL, Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.schema import Column, MetaData, Table, UniqueConstraint
+    from sqlalchemy.sql.expression import ColumnElement, and_, func, or_, select, text
     from sqlalchemy.types import BigInteger, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
 
 class PostgresStorage(Storage):
     def __init__(
@@ -30,6 +35,9 @@ class PostgresStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
+        append_runs: bool = False,
     ):
         """
         This class provides agent storage using a PostgreSQL table.
@@ -47,6 +55,11 @@ class PostgresStorage(Storage):
             schema_version (int): Version of the schema. Defaults to 1.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
             mode (Optional[Literal["agent", "team", "workflow"]]): The mode of the storage.
+            async_db_url (Optional[str]): The database URL used by the async methods, using an async driver like
+                `postgresql+psycopg` or `postgresql+asyncpg`. Defaults to the db_engine URL if its driver supports async.
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async engine used by the async methods.
+            append_runs (bool): Store the runs of each session in a separate `<table_name>_runs` table, keyed by
+                session_id and run_id, and only write the runs passed to `upsert` instead of rewriting all of them.
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
         """
@@ -74,8 +87,16 @@ class PostgresStorage(Storage):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async engine, created on first use if not provided
+        self.async_db_url: Optional[str] = async_db_url
+        self.async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        # Event loop the async engine was created on, None if the async engine was provided by the user
+        self._async_engine_loop: Optional[asyncio.AbstractEventLoop] = None
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database table for the session runs, if they are stored separately
+        self.append_runs: bool = append_runs
+        self.runs_table: Optional[Table] = self.get_runs_table() if append_runs else None
         log_debug(f"Created PostgresStorage: '{self.schema}.{self.table_name}'")
 
     @property
@@ -155,6 +176,42 @@ class PostgresStorage(Storage):
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_runs_table(self) -> Table:
+        """
+        Define the table storing the runs of each session when `append_runs` is enabled.
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs table.
+        """
+        return Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            # Orders the runs of a session in the order they were first stored
+            Column("id", BigInteger, primary_key=True, autoincrement=True),
+            Column("session_id", String, nullable=False),
+            Column("run_id", String, nullable=False),
+            Column("run", postgresql.JSONB),
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            UniqueConstraint("session_id", "run_id"),
+            extend_existing=True,
+            schema=self.schema,  # type: ignore
+        )
+
+    def runs_table_exists(self) -> bool:
+        """
+        Check if the runs table exists in the database. Always True if runs are not stored separately.
+
+        Returns:
+            bool: True if the runs table exists, False otherwise.
+        """
+        if self.runs_table is None:
+            return True
+        try:
+            return inspect(self.db_engine).has_table(self.runs_table.name, schema=self.schema)
+        except Exception as e:
+            logger.error(f"Error checking if runs table exists: {e}")
+            return False
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -240,6 +297,193 @@ class PostgresStorage(Storage):
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
                 raise
 
+        if self.runs_table is not None:
+            log_debug(f"Creating table: {self.runs_table.name}")
+            self.runs_table.create(self.db_engine, checkfirst=True)
+
+    def _get_read_stmt(self, session_id: str, user_id: Optional[str] = None) -> Any:
+        """Build the select statement that reads a session"""
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        return stmt
+
+    def _filter_sessions(self, stmt: Any, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Any:
+        """Filter a select statement on the sessions table by user_id and/or entity_id"""
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            stmt = stmt.where(self.table.c[self._get_entity_id_field()] == entity_id)
+        return stmt
+
+    def _get_all_sessions_stmt(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Any:
+        """Build the select statement that reads all sessions, newest first"""
+        stmt = self._filter_sessions(select(self.table), user_id=user_id, entity_id=entity_id)
+        # order by created_at desc
+        return stmt.order_by(self.table.c.created_at.desc())
+
+    def _get_list_sessions_stmt(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Build the select statement that reads a page of session summaries, newest first"""
+        columns: List[ColumnElement[Any]] = [self.table.c.session_id, self.table.c.created_at]
+        if fields is None or "user_id" in fields:
+            columns.append(self.table.c.user_id)
+        if fields is None or "session_name" in fields:
+            columns.append(self.table.c.session_data["session_name"].astext.label("session_name"))
+        if fields is None or "title" in fields:
+            # Only the first run is read, the title is taken from its first user message
+            if self.runs_table is not None:
+                first_run = (
+                    select(self.runs_table.c.run)
+                    .where(self.runs_table.c.session_id == self.table.c.session_id)
+                    .order_by(self.runs_table.c.id)
+                    .limit(1)
+                    .scalar_subquery()
+                )
+                # Sessions written before append_runs was enabled still have their runs in the memory column
+                columns.append(func.coalesce(first_run, self.table.c.memory[("runs", 0)]).label("first_run"))
+            else:
+                columns.append(self.table.c.memory[("runs", 0)].label("first_run"))
+        if fields is None or "updated_at" in fields:
+            columns.append(self.table.c.updated_at)
+
+        stmt = self._filter_sessions(select(*columns), user_id=user_id, entity_id=entity_id)
+        if cursor is not None:
+            created_at, session_id = self._decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    self.table.c.created_at < created_at,
+                    and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                )
+            )
+        stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+        # Read one more session than the limit to know if there is a next page
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    def _row_to_session(self, row: Any) -> Optional[Session]:
+        """Convert a table row to a Session"""
+        if row is None:
+            return None
+        if self.mode == "agent":
+            return AgentSession.from_dict(row._mapping)
+        elif self.mode == "team":
+            return TeamSession.from_dict(row._mapping)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(row._mapping)
+        return None
+
+    def _get_upsert_stmt(self, session: Session) -> Any:
+        """Build the insert statement that upserts a session"""
+        # Create an insert statement
+        if self.mode == "agent":
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=self._get_session_memory(session),
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    agent_id=session.agent_id,  # type: ignore
+                    team_session_id=session.team_session_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=self._get_session_memory(session),
+                    agent_data=session.agent_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        elif self.mode == "team":
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=self._get_session_memory(session),
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    team_id=session.team_id,  # type: ignore
+                    user_id=session.user_id,
+                    team_session_id=session.team_session_id,  # type: ignore
+                    memory=self._get_session_memory(session),
+                    team_data=session.team_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        else:
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=self._get_session_memory(session),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=self._get_session_memory(session),
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        # Only return the timestamps set by the database, the rest of the session is already in memory
+        return stmt.returning(self.table.c.created_at, self.table.c.updated_at)
+
+    def _get_runs_upsert_stmt(self, session: Session) -> Optional[Any]:
+        """Build the insert statement that upserts the runs of a session, if runs are stored separately"""
+        if self.runs_table is None or session.memory is None or not session.memory.get("runs"):
+            return None
+        stmt = postgresql.insert(self.runs_table).values(
+            [
+                {"session_id": session.session_id, "run_id": self._get_run_key(run), "run": run}
+                for run in session.memory["runs"]
+            ]
+        )
+        # Runs that are already stored are updated in place, keeping their position in the session
+        return stmt.on_conflict_do_update(index_elements=["session_id", "run_id"], set_=dict(run=stmt.excluded.run))
+
+    def _get_runs_stmt(self, session_ids: List[str]) -> Any:
+        """Build the select statement that reads the runs of the given sessions, in order"""
+        runs_table: Table = self.runs_table  # type: ignore
+        return (
+            select(runs_table.c.session_id, runs_table.c.run)
+            .where(runs_table.c.session_id.in_(session_ids))
+            .order_by(runs_table.c.id)
+        )
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read an Session from the database.
@@ -253,16 +497,18 @@ class PostgresStorage(Storage):
         """
         try:
             with self.Session() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None
+                result = sess.execute(self._get_read_stmt(session_id=session_id, user_id=user_id)).fetchone()
+                session = self._row_to_session(result)
+                if session is not None and self.runs_table is not None:
+                    legacy_sessions = self._attach_runs(
+                        [session], sess.execute(self._get_runs_stmt([session.session_id]))
+                    )
+                    runs_stmt = self._get_runs_upsert_stmt(session) if legacy_sessions else None
+                    if runs_stmt is not None:
+                        # Move the runs stored with the session to the runs table, before they are left out of it
+                        sess.execute(runs_stmt)
+                        sess.commit()
+                return session
         except Exception as e:
             if "does not exist" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -322,30 +568,11 @@ class PostgresStorage(Storage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # get all sessions
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    else:
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
-                rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    else:
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                else:
-                    return []
+                rows = sess.execute(self._get_all_sessions_stmt(user_id=user_id, entity_id=entity_id)).fetchall()
+                sessions: List[Session] = [self._row_to_session(row) for row in rows]  # type: ignore
+                if sessions and self.runs_table is not None:
+                    self._attach_runs(sessions, sess.execute(self._get_runs_stmt([s.session_id for s in sessions])))
+                return sessions
         except Exception as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -353,6 +580,67 @@ class PostgresStorage(Storage):
             self.create()
         return []
 
+    def exists(self, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """
+        Check if a session exists without reading it.
+
+        Args:
+            session_id (str): ID of the session to check.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by. Defaults to None.
+
+        Returns:
+            bool: True if the session exists, False otherwise.
+        """
+        try:
+            with self.Session() as sess:
+                stmt = select(self.table.c.session_id).where(self.table.c.session_id == session_id)
+                stmt = self._filter_sessions(stmt, user_id=user_id, entity_id=entity_id)
+                return sess.execute(stmt.limit(1)).first() is not None
+        except Exception as e:
+            if "does not exist" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return False
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List summaries of the sessions, newest first, only reading the first run of each session.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): The maximum number of sessions in the page. Defaults to all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page. Defaults to the first page.
+            fields (Optional[Sequence[str]]): The summary fields to read besides session_id and created_at.
+
+        Returns:
+            SessionPage: The session summaries and the cursor of the next page.
+        """
+        stmt = self._get_list_sessions_stmt(user_id, entity_id, limit=limit, cursor=cursor, fields=fields)
+        try:
+            with self.Session() as sess:
+                rows = sess.execute(stmt).fetchall()
+                return self._get_page([self._get_summary(dict(row._mapping), fields) for row in rows], limit)
+        except Exception as e:
+            if "does not exist" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionPage()
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema to the latest version.
@@ -408,87 +696,12 @@ class PostgresStorage(Storage):
 
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                if self.mode == "agent":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "team":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                else:
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-
-                sess.execute(stmt)
+                row = sess.execute(self._get_upsert_stmt(session)).fetchone()
+                runs_stmt = self._get_runs_upsert_stmt(session)
+                if runs_stmt is not None:
+                    sess.execute(runs_stmt)
         except Exception as e:
-            if create_and_retry and not self.table_exists():
+            if create_and_retry and not (self.table_exists() and self.runs_table_exists()):
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table and retrying upsert")
                 self.create()
@@ -499,7 +712,9 @@ class PostgresStorage(Storage):
                     "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                 )
                 return None
-        return self.read(session_id=session.session_id)
+        if row is None:
+            return self.read(session_id=session.session_id)
+        return self._with_timestamps(session, row)
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -520,6 +735,178 @@ class PostgresStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                if result.rowcount == 0:
+                    log_debug(f"No session found with session_id: {session_id}")
+                else:
+                    log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    def _get_async_engine(self) -> Optional["AsyncEngine"]:
+        """
+        Get the async engine used by the async methods.
+
+        Returns:
+            Optional[AsyncEngine]: The async engine, or None if no async capable database URL is available.
+        """
+        loop = get_running_event_loop()
+        if self.async_db_engine is not None:
+            # Pooled connections are bound to the event loop they were opened on, so an engine created here
+            # is only reused on that same loop. An engine provided by the user is always reused.
+            if self._async_engine_loop is None or self._async_engine_loop is loop:
+                return self.async_db_engine
+            # Close the connections of the previous loop, unless it is still running and may be using them
+            if not self._async_engine_loop.is_running():
+                close_in_background(self.async_db_engine.dispose)
+
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+        except ImportError:
+            log_debug("`sqlalchemy[asyncio]` not installed, running storage calls in a thread")
+            return None
+
+        async_db_url: Optional[Any] = self.async_db_url
+        if async_db_url is None:
+            url: URL = self.db_engine.url
+            if url.drivername not in ("postgresql+psycopg", "postgresql+asyncpg"):
+                return None
+            async_db_url = url
+
+        self.async_db_engine = create_async_engine(async_db_url)
+        self._async_engine_loop = loop
+        return self.async_db_engine
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """
+        Read a Session from the database asynchronously.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        try:
+            async with engine.connect() as conn:
+                result = await conn.execute(self._get_read_stmt(session_id=session_id, user_id=user_id))
+                session = self._row_to_session(result.fetchone())
+                if session is not None and self.runs_table is not None:
+                    runs = await conn.execute(self._get_runs_stmt([session.session_id]))
+                    runs_stmt = self._get_runs_upsert_stmt(session) if self._attach_runs([session], runs) else None
+                    if runs_stmt is not None:
+                        # Move the runs stored with the session to the runs table, before they are left out of it
+                        await conn.execute(runs_stmt)
+                        await conn.commit()
+                return session
+        except Exception as e:
+            if "does not exist" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                await asyncio.to_thread(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """
+        Get all sessions asynchronously, optionally filtered by user_id and/or entity_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / workflow to filter by.
+
+        Returns:
+            List[Session]: List of Session objects matching the criteria.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().aget_all_sessions(user_id=user_id, entity_id=entity_id)
+
+        try:
+            async with engine.connect() as conn:
+                result = await conn.execute(self._get_all_sessions_stmt(user_id=user_id, entity_id=entity_id))
+                sessions: List[Session] = [self._row_to_session(row) for row in result.fetchall()]  # type: ignore
+                if sessions and self.runs_table is not None:
+                    runs_stmt = self._get_runs_stmt([s.session_id for s in sessions])
+                    self._attach_runs(sessions, await conn.execute(runs_stmt))
+                return sessions
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            log_debug(f"Table does not exist: {self.table.name}")
+            log_debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return []
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """
+        Insert or update a Session in the database asynchronously.
+
+        Args:
+            session (Session): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[Session]: The upserted Session, or None if operation failed.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().aupsert(session)
+
+        # Perform schema upgrade if auto_upgrade_schema is enabled
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await asyncio.to_thread(self.upgrade_schema)
+
+        try:
+            async with engine.begin() as conn:
+                row = (await conn.execute(self._get_upsert_stmt(session))).fetchone()
+                runs_stmt = self._get_runs_upsert_stmt(session)
+                if runs_stmt is not None:
+                    await conn.execute(runs_stmt)
+        except Exception as e:
+            if create_and_retry and not (
+                await asyncio.to_thread(self.table_exists) and await asyncio.to_thread(self.runs_table_exists)
+            ):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await asyncio.to_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        if row is None:
+            return await self.aread(session_id=session.session_id)
+        return self._with_timestamps(session, row)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """
+        Delete a session from the database asynchronously.
+
+        Args:
+            session_id (Optional[str], optional): ID of the session to delete. Defaults to None.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().adelete_session(session_id=session_id)
+
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        try:
+            async with engine.begin() as conn:
+                result = await conn.execute(self.table.delete().where(self.table.c.session_id == session_id))
+                if self.runs_table is not None:
+                    await conn.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -531,6 +918,8 @@ class PostgresStorage(Storage):
         """
         Drop the table from the database if it exists.
         """
+        if self.runs_table is not None:
+            self.runs_table.drop(self.db_engine, checkfirst=True)
         if self.table_exists():
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
@@ -538,6 +927,8 @@ class PostgresStorage(Storage):
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData(schema=self.schema)
             self.table = self.get_table()
+            if self.runs_table is not None:
+                self.runs_table = self.get_runs_table()
 
     def __deepcopy__(self, memo):
         """
@@ -558,10 +949,10 @@ class PostgresStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            # Reuse db_engine, async_db_engine and Session without copying
+            elif k in {"db_engine", "SqlSession", "async_db_engine", "_async_engine_loop"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -570,5 +961,6 @@ class PostgresStorage(Storage):
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table() if copied_obj.append_runs else None
 
         return copied_obj
@@ -1,17 +1,19 @@
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, cast
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.utils.common import close_in_background, get_running_event_loop
 from agno.utils.log import log_debug, log_info, logger
 
 try:
     from redis import ConnectionError, Redis
+    from redis.asyncio import Redis as AsyncRedis
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
@@ -41,7 +43,7 @@ class RedisStorage(Storage):
         """
         super().__init__(mode)
         self.prefix = prefix
-        self.redis_client = Redis(
+        self._connection_kwargs: Dict[str, Any] = dict(
             host=host,
             port=port,
             db=db,
@@ -49,12 +51,59 @@ class RedisStorage(Storage):
             decode_responses=True,  # Automatically decode responses to str
             ssl=ssl,
         )
+        self.redis_client = Redis(**self._connection_kwargs)
+        # Async clients are bound to the event loop they were created on
+        self._async_redis_client: Optional[AsyncRedis] = None
+        self._async_redis_client_loop: Optional[Any] = None
+        # Set once the indexes are known to include sessions stored before they were maintained
+        self._index_built = False
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for a session."""
         return f"{self.prefix}:{session_id}"
 
+    def _get_index_key(self, field: Optional[str] = None, value: Optional[str] = None) -> str:
+        """Generate Redis key for the sorted set indexing session IDs by created_at, for all sessions or a field value."""
+        if field is None:
+            return f"{self.prefix}-index:all"
+        return f"{self.prefix}-index:{field}:{value}"
+
+    def _get_index_built_key(self) -> str:
+        """Generate Redis key marking that the indexes include the sessions stored before they were maintained."""
+        return f"{self.prefix}-index:built"
+
+    def _get_index_keys(self, data: dict) -> List[str]:
+        """Get the keys of the indexes a session belongs to."""
+        index_keys = [self._get_index_key()]
+        if data.get("user_id"):
+            index_keys.append(self._get_index_key("user_id", data["user_id"]))
+        entity_id_field = self._get_entity_id_field()
+        if data.get(entity_id_field):
+            index_keys.append(self._get_index_key(entity_id_field, data[entity_id_field]))
+        return index_keys
+
+    def _get_query_index_key(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> str:
+        """Get the key of the index to read the sessions matching the filters from."""
+        if user_id:
+            return self._get_index_key("user_id", user_id)
+        if entity_id:
+            return self._get_index_key(self._get_entity_id_field(), entity_id)
+        return self._get_index_key()
+
+    def _add_to_index(self, pipeline: Any, data: dict) -> None:
+        """Queue adding a session to its indexes, keeping the score it was first indexed with."""
+        if not data.get("session_id"):
+            return
+        score = data.get("created_at") or data.get("updated_at") or 0
+        for index_key in self._get_index_keys(data):
+            pipeline.zadd(index_key, {data["session_id"]: score}, nx=True)
+
+    def _remove_from_index(self, pipeline: Any, session_id: str, data: Optional[dict]) -> None:
+        """Queue removing a session from its indexes."""
+        for index_key in self._get_index_keys(data) if data else [self._get_index_key()]:
+            pipeline.zrem(index_key, session_id)
+
     def serialize(self, data: dict) -> str:
         """Serialize data to JSON string."""
         return json.dumps(data, ensure_ascii=False)
@@ -63,6 +112,89 @@ class RedisStorage(Storage):
         """Deserialize JSON string to dict."""
         return json.loads(data)
 
+    def _get_async_client(self) -> AsyncRedis:
+        """Return an async Redis client for the running event loop."""
+        loop = get_running_event_loop()
+        if self._async_redis_client is None or self._async_redis_client_loop is not loop:
+            # Connections are bound to the event loop they were opened on. A client on a loop that is still running
+            # may be in use there, so it is left open.
+            stale_loop = self._async_redis_client_loop
+            if self._async_redis_client is not None and stale_loop is not None and not stale_loop.is_running():
+                close_in_background(self._async_redis_client.aclose)
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)
+            self._async_redis_client_loop = loop
+        return self._async_redis_client
+
+    def _to_session(self, data: dict) -> Optional[Session]:
+        """Convert stored session data to a Session for the storage mode."""
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
+    def _matches(self, data: dict, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """Check if stored session data matches the user_id and entity_id filters."""
+        if user_id and data["user_id"] != user_id:
+            return False
+        if entity_id:
+            if self.mode == "agent":
+                return data["agent_id"] == entity_id
+            elif self.mode == "team":
+                return data["team_id"] == entity_id
+            elif self.mode == "workflow":
+                return data["workflow_id"] == entity_id
+        return True
+
+    def _get_upsert_data(self, session: Session) -> dict:
+        """Convert a Session to the data stored in Redis."""
+        data = asdict(session)
+        data["updated_at"] = int(time.time())
+        if "created_at" not in data:
+            data["created_at"] = data["updated_at"]
+        return data
+
+    def _ensure_index(self) -> None:
+        """Build the indexes the first time they are read, if sessions were stored before they were maintained."""
+        if self._index_built:
+            return
+        if not self.redis_client.exists(self._get_index_built_key()):
+            self.rebuild_index()
+        self._index_built = True
+
+    def rebuild_index(self) -> None:
+        """Add all stored sessions to the user_id and entity_id indexes."""
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        pipeline = self.redis_client.pipeline()
+        for data in self._mget(keys):
+            self._add_to_index(pipeline, data)
+        pipeline.set(self._get_index_built_key(), int(time.time()))
+        pipeline.execute()
+        log_debug(f"Indexed {len(keys)} sessions with prefix: {self.prefix}")
+
+    def _mget(self, keys: List[str]) -> List[dict]:
+        """Read sessions in batches with MGET, skipping the sessions that no longer exist."""
+        sessions = []
+        for i in range(0, len(keys), 1000):
+            for value in cast(List[Optional[str]], self.redis_client.mget(keys[i : i + 1000])):
+                if value is not None:
+                    sessions.append(self.deserialize(value))
+        return sessions
+
+    def _get_indexed_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Get the IDs of the sessions matching the filters from the indexes, newest first."""
+        self._ensure_index()
+        session_ids = cast(
+            List[str], self.redis_client.zrange(self._get_query_index_key(user_id, entity_id), 0, -1, desc=True)
+        )
+        if user_id and entity_id:
+            entity_index_key = self._get_index_key(self._get_entity_id_field(), entity_id)
+            entity_session_ids = set(cast(List[str], self.redis_client.zrange(entity_index_key, 0, -1)))
+            session_ids = [session_id for session_id in session_ids if session_id in entity_session_ids]
+        return session_ids
+
     def create(self) -> None:
         """
         Create storage if it doesn't exist.
@@ -87,12 +219,7 @@ class RedisStorage(Storage):
             if user_id and session_data.get("user_id") != user_id:
                 return None
 
-            if self.mode == "agent":
-                return AgentSession.from_dict(session_data)
-            elif self.mode == "team":
-                return TeamSession.from_dict(session_data)
-            elif self.mode == "workflow":
-                return WorkflowSession.from_dict(session_data)
+            return self._to_session(session_data)
 
         except Exception as e:
             logger.error(f"Error reading session: {e}")
@@ -102,34 +229,7 @@ class RedisStorage(Storage):
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
         session_ids = []
         try:
-            # Get all keys matching the prefix pattern
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
-                        session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
-                    session_ids.append(data["session_id"])
-
+            session_ids = self._get_indexed_session_ids(user_id, entity_id)
         except Exception as e:
             logger.error(f"Error getting session IDs: {e}")
 
@@ -139,48 +239,13 @@ class RedisStorage(Storage):
         """Get all sessions, optionally filtered by user_id and/or entity_id."""
         sessions: List[Session] = []
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    _session = None
-                    # No filters applied, add all sessions
-                    if self.mode == "agent":
-                        _session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        _session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        _session = WorkflowSession.from_dict(data)
+            self._ensure_index()
+            session_ids = cast(
+                List[str], self.redis_client.zrange(self._get_query_index_key(user_id, entity_id), 0, -1, desc=True)
+            )
+            for data in self._mget([self._get_key(session_id) for session_id in session_ids]):
+                if self._matches(data, user_id, entity_id):
+                    _session = self._to_session(data)
                     if _session:
                         sessions.append(_session)
 
@@ -192,13 +257,12 @@ class RedisStorage(Storage):
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update a Session in Redis."""
         try:
-            data = asdict(session)
-            data["updated_at"] = int(time.time())
-            if "created_at" not in data:
-                data["created_at"] = data["updated_at"]
-
+            data = self._get_upsert_data(session)
             key = self._get_key(session.session_id)
-            self.redis_client.set(key, self.serialize(data))
+            pipeline = self.redis_client.pipeline()
+            pipeline.set(key, self.serialize(data))
+            self._add_to_index(pipeline, data)
+            pipeline.execute()
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -210,7 +274,106 @@ class RedisStorage(Storage):
             return
         try:
             key = self._get_key(session_id)
-            self.redis_client.delete(key)
+            data = self.redis_client.get(key)
+            pipeline = self.redis_client.pipeline()
+            pipeline.delete(key)
+            self._remove_from_index(pipeline, session_id, self.deserialize(data) if data else None)  # type: ignore
+            pipeline.execute()
+            log_debug(f"Deleted session: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from Redis asynchronously."""
+        try:
+            data = await self._get_async_client().get(self._get_key(session_id))
+            if data is None:
+                return None
+
+            session_data = self.deserialize(data)  # type: ignore
+            if user_id and session_data.get("user_id") != user_id:
+                return None
+
+            return self._to_session(session_data)
+
+        except Exception as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Get all sessions asynchronously, optionally filtered by user_id and/or entity_id."""
+        sessions: List[Session] = []
+        try:
+            client = self._get_async_client()
+            await self._aensure_index(client)
+            session_ids = cast(
+                List[str], await client.zrange(self._get_query_index_key(user_id, entity_id), 0, -1, desc=True)
+            )
+            for data in await self._amget(client, [self._get_key(session_id) for session_id in session_ids]):
+                if self._matches(data, user_id, entity_id):
+                    _session = self._to_session(data)
+                    if _session:
+                        sessions.append(_session)
+
+        except Exception as e:
+            logger.error(f"Error getting all sessions: {e}")
+
+        return sessions
+
+    async def _aensure_index(self, client: AsyncRedis) -> None:
+        """Build the indexes asynchronously the first time they are read, like `_ensure_index`."""
+        if self._index_built:
+            return
+        if not await client.exists(self._get_index_built_key()):
+            await self.arebuild_index()
+        self._index_built = True
+
+    async def arebuild_index(self) -> None:
+        """Add all stored sessions to the user_id and entity_id indexes asynchronously."""
+        client = self._get_async_client()
+        keys = [key async for key in client.scan_iter(match=f"{self.prefix}:*")]
+        pipeline = client.pipeline()
+        for data in await self._amget(client, keys):
+            self._add_to_index(pipeline, data)
+        pipeline.set(self._get_index_built_key(), int(time.time()))
+        await pipeline.execute()
+        log_debug(f"Indexed {len(keys)} sessions with prefix: {self.prefix}")
+
+    async def _amget(self, client: AsyncRedis, keys: List[str]) -> List[dict]:
+        """Read sessions asynchronously in batches with MGET, skipping the sessions that no longer exist."""
+        sessions = []
+        for i in range(0, len(keys), 1000):
+            for value in cast(List[Optional[str]], await client.mget(keys[i : i + 1000])):
+                if value is not None:
+                    sessions.append(self.deserialize(value))
+        return sessions
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in Redis asynchronously."""
+        try:
+            data = self._get_upsert_data(session)
+            key = self._get_key(session.session_id)
+            pipeline = self._get_async_client().pipeline()
+            pipeline.set(key, self.serialize(data))
+            self._add_to_index(pipeline, data)
+            await pipeline.execute()
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Delete a session from Redis asynchronously."""
+        if session_id is None:
+            return
+        try:
+            client = self._get_async_client()
+            key = self._get_key(session_id)
+            data = cast(Optional[str], await client.get(key))
+            pipeline = client.pipeline()
+            pipeline.delete(key)
+            self._remove_from_index(pipeline, session_id, self.deserialize(data) if data else None)
+            await pipeline.execute()
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
@@ -221,6 +384,9 @@ class RedisStorage(Storage):
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 self.redis_client.delete(key)
+            for key in self.redis_client.scan_iter(match=f"{self.prefix}-index:*"):
+                self.redis_client.delete(key)
+            self._index_built = False
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
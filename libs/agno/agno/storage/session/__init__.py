@@ -1,6 +1,7 @@
 from typing import Union
 
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.summary import SessionPage, SessionSummary
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 
@@ -11,4 +12,6 @@ __all__ = [
     "TeamSession",
     "WorkflowSession",
     "Session",
+    "SessionPage",
+    "SessionSummary",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import asdict, dataclass, replace
 from typing import Any, Dict, Mapping, Optional
 
 from agno.utils.log import logger
@@ -35,6 +36,28 @@ class AgentSession:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def snapshot(self) -> AgentSession:
+        """Copy of the session that later runs of the agent do not change, without serializing the memory.
+
+        The session_data and extra_data, which the agent keeps changing, are copied. The memory is rebuilt on every
+        write instead of changed, so only its top level is copied.
+        """
+        return replace(
+            self,
+            memory=dict(self.memory) if self.memory is not None else None,
+            session_data=deepcopy(self.session_data),
+            extra_data=deepcopy(self.extra_data),
+        )
+
+    def with_summary(self, summary: Dict[str, Any], user_id: Optional[str] = None) -> AgentSession:
+        """Copy of the session with the summary of the session for the user set in its memory"""
+        memory = dict(self.memory or {})
+        summaries = dict(memory.get("summaries") or {})
+        user_id = user_id or "default"
+        summaries[user_id] = {**summaries.get(user_id, {}), self.session_id: summary}
+        memory["summaries"] = summaries
+        return replace(self, memory=memory)
+
     def telemetry_data(self) -> Dict[str, Any]:
         return {
             "model": self.agent_data.get("model") if self.agent_data else None,
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class SessionSummary:
+    """Lightweight summary of a stored session, used to list sessions without loading their memory"""
+
+    # Session UUID
+    session_id: str
+    # ID of the user interacting with this session
+    user_id: Optional[str] = None
+    # Name of the session, if it was named
+    session_name: Optional[str] = None
+    # Title taken from the first run: the first user message, or the first line of the response for workflows
+    title: Optional[str] = None
+    # The unix timestamp when this session was created
+    created_at: Optional[int] = None
+    # The unix timestamp when this session was last updated
+    updated_at: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class SessionPage:
+    """A page of session summaries, newest first"""
+
+    sessions: List[SessionSummary] = field(default_factory=list)
+    # Cursor to pass to `list_sessions` to get the next page, None if this is the last page
+    next_cursor: Optional[str] = None
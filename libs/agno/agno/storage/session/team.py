@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import asdict, dataclass, replace
 from typing import Any, Dict, Mapping, Optional
 
 from agno.utils.log import logger
@@ -34,6 +35,28 @@ class TeamSession:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def snapshot(self) -> TeamSession:
+        """Copy of the session that later runs of the team do not change, without serializing the memory.
+
+        The session_data and extra_data, which the team keeps changing, are copied. The memory is rebuilt on every
+        write instead of changed, so only its top level is copied.
+        """
+        return replace(
+            self,
+            memory=dict(self.memory) if self.memory is not None else None,
+            session_data=deepcopy(self.session_data),
+            extra_data=deepcopy(self.extra_data),
+        )
+
+    def with_summary(self, summary: Dict[str, Any], user_id: Optional[str] = None) -> TeamSession:
+        """Copy of the session with the summary of the session for the user set in its memory"""
+        memory = dict(self.memory or {})
+        summaries = dict(memory.get("summaries") or {})
+        user_id = user_id or "default"
+        summaries[user_id] = {**summaries.get(user_id, {}), self.session_id: summary}
+        memory["summaries"] = summaries
+        return replace(self, memory=memory)
+
     def telemetry_data(self) -> Dict[str, Any]:
         return {
             "model": self.team_data.get("model") if self.team_data else None,
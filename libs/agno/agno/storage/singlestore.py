@@ -404,6 +404,12 @@ class SingleStoreStorage(Storage):
                             else None,
                         },
                     )
+                # SingleStore has no RETURNING, so only the timestamps set by the database are read back
+                row = sess.execute(
+                    select(self.table.c.created_at, self.table.c.updated_at).where(
+                        self.table.c.session_id == session.session_id
+                    )
+                ).fetchone()
             except Exception as e:
                 # Create table and try again
                 if not self.table_exists():
@@ -417,7 +423,9 @@ class SingleStoreStorage(Storage):
                         "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                     )
                     return None
-        return self.read(session_id=session.session_id)
+        if row is None:
+            return self.read(session_id=session.session_id)
+        return self._with_timestamps(session, row)
 
     def delete_session(self, session_id: Optional[str] = None):
         if session_id is None:
@@ -1,9 +1,9 @@
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, List, Literal, Optional, Sequence
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, SessionPage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -15,9 +15,9 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
+    from sqlalchemy.schema import Column, MetaData, Table, UniqueConstraint
     from sqlalchemy.sql import text
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.sql.expression import ColumnElement, and_, func, or_, select
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
@@ -33,6 +33,7 @@ class SqliteStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        append_runs: bool = False,
     ):
         """
         This class provides agent storage using a sqlite database.
@@ -48,6 +49,8 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            append_runs: Store the runs of each session in a separate `<table_name>_runs` table, keyed by
+                session_id and run_id, and only write the runs passed to `upsert` instead of rewriting all of them.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -82,6 +85,9 @@ class SqliteStorage(Storage):
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database table for the session runs, if they are stored separately
+        self.append_runs: bool = append_runs
+        self.runs_table: Optional[Table] = self.get_runs_table() if append_runs else None
 
     @property
     def mode(self) -> Optional[Literal["agent", "team", "workflow"]]:
@@ -159,6 +165,42 @@ class SqliteStorage(Storage):
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_runs_table(self) -> Table:
+        """
+        Define the table storing the runs of each session when `append_runs` is enabled.
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs table.
+        """
+        return Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            # Orders the runs of a session in the order they were first stored
+            Column("id", sqlite.INTEGER, primary_key=True, autoincrement=True),
+            Column("session_id", String, nullable=False),
+            Column("run_id", String, nullable=False),
+            Column("run", sqlite.JSON),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            UniqueConstraint("session_id", "run_id"),
+            extend_existing=True,
+            sqlite_autoincrement=True,
+        )
+
+    def runs_table_exists(self) -> bool:
+        """
+        Check if the runs table exists in the database. Always True if runs are not stored separately.
+
+        Returns:
+            bool: True if the runs table exists, False otherwise.
+        """
+        if self.runs_table is None:
+            return True
+        try:
+            return inspect(self.db_engine).has_table(self.runs_table.name)
+        except Exception as e:
+            logger.error(f"Error checking if runs table exists: {e}")
+            return False
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -218,6 +260,32 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
+        if self.runs_table is not None:
+            log_debug(f"Creating table: {self.runs_table.name}")
+            self.runs_table.create(self.db_engine, checkfirst=True)
+
+    def _get_runs_upsert_stmt(self, session: Session) -> Optional[Any]:
+        """Build the insert statement that upserts the runs of a session, if runs are stored separately"""
+        if self.runs_table is None or session.memory is None or not session.memory.get("runs"):
+            return None
+        stmt = sqlite.insert(self.runs_table).values(
+            [
+                {"session_id": session.session_id, "run_id": self._get_run_key(run), "run": run}
+                for run in session.memory["runs"]
+            ]
+        )
+        # Runs that are already stored are updated in place, keeping their position in the session
+        return stmt.on_conflict_do_update(index_elements=["session_id", "run_id"], set_=dict(run=stmt.excluded.run))
+
+    def _get_runs_stmt(self, session_ids: List[str]) -> Any:
+        """Build the select statement that reads the runs of the given sessions, in order"""
+        runs_table: Table = self.runs_table  # type: ignore
+        return (
+            select(runs_table.c.session_id, runs_table.c.run)
+            .where(runs_table.c.session_id.in_(session_ids))
+            .order_by(runs_table.c.id)
+        )
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read a Session from the database.
@@ -235,12 +303,23 @@ class SqliteStorage(Storage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
+                session: Optional[Session] = None
                 if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    session = AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
                 elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    session = TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
                 elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    session = WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                if session is not None and self.runs_table is not None:
+                    legacy_sessions = self._attach_runs(
+                        [session], sess.execute(self._get_runs_stmt([session.session_id]))
+                    )
+                    runs_stmt = self._get_runs_upsert_stmt(session) if legacy_sessions else None
+                    if runs_stmt is not None:
+                        # Move the runs stored with the session to the runs table, before they are left out of it
+                        sess.execute(runs_stmt)
+                        sess.commit()
+                return session
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -315,12 +394,17 @@ class SqliteStorage(Storage):
                 # execute query
                 rows = sess.execute(stmt).fetchall()
                 if rows is not None:
+                    sessions: List[Session] = []
                     if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        sessions = [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
                     elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        sessions = [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
                     elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        sessions = [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                    if sessions and self.runs_table is not None:
+                        runs_stmt = self._get_runs_stmt([s.session_id for s in sessions])
+                        self._attach_runs(sessions, sess.execute(runs_stmt))
+                    return sessions
                 else:
                     return []
         except Exception as e:
@@ -374,6 +458,7 @@ class SqliteStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        row = None
         try:
             with self.SqlSession() as sess, sess.begin():
                 if self.mode == "agent":
@@ -383,7 +468,7 @@ class SqliteStorage(Storage):
                         agent_id=session.agent_id,  # type: ignore
                         team_session_id=session.team_session_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=session.memory,
+                        memory=self._get_session_memory(session),
                         agent_data=session.agent_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -397,7 +482,7 @@ class SqliteStorage(Storage):
                             agent_id=session.agent_id,  # type: ignore
                             team_session_id=session.team_session_id,  # type: ignore
                             user_id=session.user_id,
-                            memory=session.memory,
+                            memory=self._get_session_memory(session),
                             agent_data=session.agent_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -411,7 +496,7 @@ class SqliteStorage(Storage):
                         team_id=session.team_id,  # type: ignore
                         user_id=session.user_id,
                         team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
+                        memory=self._get_session_memory(session),
                         team_data=session.team_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -425,7 +510,7 @@ class SqliteStorage(Storage):
                             team_id=session.team_id,  # type: ignore
                             user_id=session.user_id,
                             team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
+                            memory=self._get_session_memory(session),
                             team_data=session.team_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -438,7 +523,7 @@ class SqliteStorage(Storage):
                         session_id=session.session_id,
                         workflow_id=session.workflow_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=session.memory,
+                        memory=self._get_session_memory(session),
                         workflow_data=session.workflow_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -451,7 +536,7 @@ class SqliteStorage(Storage):
                         set_=dict(
                             workflow_id=session.workflow_id,  # type: ignore
                             user_id=session.user_id,
-                            memory=session.memory,
+                            memory=self._get_session_memory(session),
                             workflow_data=session.workflow_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -459,9 +544,19 @@ class SqliteStorage(Storage):
                         ),  # The updated value for each column
                     )
 
-                sess.execute(stmt)
+                # Only return the timestamps set by the database, the rest of the session is already in memory.
+                # RETURNING needs SQLite 3.35+, older versions read the session back below.
+                if self.db_engine.dialect.insert_returning:
+                    returning_stmt = stmt.returning(self.table.c.created_at, self.table.c.updated_at)
+                    row = sess.execute(returning_stmt).fetchone()
+                else:
+                    sess.execute(stmt)
+
+                runs_stmt = self._get_runs_upsert_stmt(session)
+                if runs_stmt is not None:
+                    sess.execute(runs_stmt)
         except Exception as e:
-            if create_and_retry and not self.table_exists():
+            if create_and_retry and not (self.table_exists() and self.runs_table_exists()):
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table and retrying upsert")
                 self.create()
@@ -472,7 +567,122 @@ class SqliteStorage(Storage):
                     "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                 )
                 return None
-        return self.read(session_id=session.session_id)
+        if row is None:
+            return self.read(session_id=session.session_id)
+        return self._with_timestamps(session, row)
+
+    def _filter_sessions(self, stmt: Any, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Any:
+        """Filter a select statement on the sessions table by user_id and/or entity_id"""
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            stmt = stmt.where(self.table.c[self._get_entity_id_field()] == entity_id)
+        return stmt
+
+    def _get_list_sessions_stmt(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Build the select statement that reads a page of session summaries, newest first"""
+        columns: List[ColumnElement[Any]] = [self.table.c.session_id, self.table.c.created_at]
+        if fields is None or "user_id" in fields:
+            columns.append(self.table.c.user_id)
+        if fields is None or "session_name" in fields:
+            columns.append(self.table.c.session_data["session_name"].as_string().label("session_name"))
+        if fields is None or "title" in fields:
+            # Only the first run is read, the title is taken from its first user message
+            if self.runs_table is not None:
+                first_run = (
+                    select(self.runs_table.c.run)
+                    .where(self.runs_table.c.session_id == self.table.c.session_id)
+                    .order_by(self.runs_table.c.id)
+                    .limit(1)
+                    .scalar_subquery()
+                )
+                # Sessions written before append_runs was enabled still have their runs in the memory column
+                columns.append(func.coalesce(first_run, self.table.c.memory[("runs", 0)]).label("first_run"))
+            else:
+                columns.append(self.table.c.memory[("runs", 0)].label("first_run"))
+        if fields is None or "updated_at" in fields:
+            columns.append(self.table.c.updated_at)
+
+        stmt = self._filter_sessions(select(*columns), user_id=user_id, entity_id=entity_id)
+        if cursor is not None:
+            created_at, session_id = self._decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    self.table.c.created_at < created_at,
+                    and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                )
+            )
+        stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+        # Read one more session than the limit to know if there is a next page
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    def exists(self, session_id: str, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """
+        Check if a session exists without reading it.
+
+        Args:
+            session_id (str): ID of the session to check.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by. Defaults to None.
+
+        Returns:
+            bool: True if the session exists, False otherwise.
+        """
+        try:
+            with self.SqlSession() as sess:
+                stmt = select(self.table.c.session_id).where(self.table.c.session_id == session_id)
+                stmt = self._filter_sessions(stmt, user_id=user_id, entity_id=entity_id)
+                return sess.execute(stmt.limit(1)).first() is not None
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return False
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List summaries of the sessions, newest first, only reading the first run of each session.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): The maximum number of sessions in the page. Defaults to all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page. Defaults to the first page.
+            fields (Optional[Sequence[str]]): The summary fields to read besides session_id and created_at.
+
+        Returns:
+            SessionPage: The session summaries and the cursor of the next page.
+        """
+        stmt = self._get_list_sessions_stmt(user_id, entity_id, limit=limit, cursor=cursor, fields=fields)
+        try:
+            with self.SqlSession() as sess:
+                rows = sess.execute(stmt).fetchall()
+                return self._get_page([self._get_summary(dict(row._mapping), fields) for row in rows], limit)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionPage()
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -493,6 +703,8 @@ class SqliteStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -504,6 +716,8 @@ class SqliteStorage(Storage):
         """
         Drop the table from the database if it exists.
         """
+        if self.runs_table is not None:
+            self.runs_table.drop(self.db_engine, checkfirst=True)
         if self.table_exists():
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
@@ -511,6 +725,8 @@ class SqliteStorage(Storage):
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData()
             self.table = self.get_table()
+            if self.runs_table is not None:
+                self.runs_table = self.get_runs_table()
 
     def __deepcopy__(self, memo):
         """
@@ -531,7 +747,7 @@ class SqliteStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "SqlSession"}:
@@ -543,5 +759,6 @@ class SqliteStorage(Storage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table() if copied_obj.append_runs else None
 
         return copied_obj
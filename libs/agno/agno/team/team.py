@@ -8,6 +8,7 @@ from typing import (
     Any,
     AsyncIterator,
     Callable,
+    Coroutine,
     Dict,
     Iterator,
     List,
@@ -40,7 +41,7 @@ from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.messages import RunMessages
 from agno.run.response import RunEvent, RunResponse, RunResponseExtraData
 from agno.run.team import TeamRunResponse
-from agno.storage.base import Storage
+from agno.storage.base import Storage, get_run_id
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
@@ -67,6 +68,7 @@ from agno.utils.response import (
 from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import is_valid_uuid, parse_response_model_str, url_safe_string
 from agno.utils.timer import Timer
+from agno.utils.tools import copy_tools
 
 
 @dataclass(init=False)
@@ -200,6 +202,9 @@ class Team:
     enable_session_summaries: bool = False
     # If True, the agent adds a reference to the session summaries in the response
     add_session_summary_references: Optional[bool] = None
+    # If True, user memories and session summaries are created by a background worker after the run returns.
+    # Use `agno.memory.v2.worker.memory_worker.flush()` to wait for them.
+    create_memories_in_background: bool = False
 
     # --- Team History ---
     # If True, enable the team history
@@ -277,6 +282,7 @@ class Team:
         add_memory_references: Optional[bool] = None,
         enable_session_summaries: bool = False,
         add_session_summary_references: Optional[bool] = None,
+        create_memories_in_background: bool = False,
         enable_team_history: bool = False,
         num_of_interactions_from_history: Optional[int] = None,
         num_history_runs: int = 3,
@@ -346,6 +352,7 @@ class Team:
         self.add_memory_references = add_memory_references
         self.enable_session_summaries = enable_session_summaries
         self.add_session_summary_references = add_session_summary_references
+        self.create_memories_in_background = create_memories_in_background
 
         self.enable_team_history = enable_team_history
         self.num_of_interactions_from_history = num_of_interactions_from_history
@@ -392,6 +399,8 @@ class Team:
         self._member_response_model: Optional[Type[BaseModel]] = None
 
         self._formatter: Optional[SafeFormatter] = None
+        # Runs already in storage by run_id, as stored, only used if the storage appends runs
+        self._stored_runs: Dict[str, Dict[str, Any]] = {}
 
     def _set_team_id(self) -> str:
         if self.team_id is None:
@@ -1072,7 +1081,7 @@ class Team:
             effective_filters = self._get_team_effective_filters(knowledge_filters)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Initialize memory if not yet set
         if self.memory is None:
@@ -1318,7 +1327,7 @@ class Team:
         )
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Parse team response model
         if self.response_model is not None and not isinstance(run_response.content, self.response_model):
@@ -1414,7 +1423,7 @@ class Team:
         )
 
         # 4. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 5. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1900,9 +1909,55 @@ class Team:
         if session_id is not None:
             self.session_state["current_session_id"] = session_id
 
+    def _queue_memories_and_summaries(
+        self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """Queue creating user memories and the session summary on the background memory worker"""
+        from agno.memory.v2.worker import memory_worker
+
+        self.memory = cast(Memory, self.memory)
+        user_message_str = (
+            run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+        )
+        if self.enable_user_memories and user_message_str is not None and user_message_str:
+            memory_worker.submit_user_memories(
+                memory=self.memory,
+                messages=[Message(role="user", content=user_message_str)],
+                session_id=session_id,
+                user_id=user_id,
+            )
+
+        if self.enable_session_summaries:
+            # The summary is only created in memory, write it to the stored session once it is ready
+            memory_worker.submit_session_summary(
+                memory=self.memory,
+                session_id=session_id,
+                user_id=user_id,
+                on_done=lambda: self._write_summary_to_storage(session_id=session_id, user_id=user_id),
+            )
+
+    def _write_summary_to_storage(self, session_id: str, user_id: Optional[str] = None) -> None:
+        """Write the summary created in the background to the session in storage.
+        Only the summary of the stored session is updated, as the next run of the team may be changing its state.
+        """
+        if self.storage is None or not isinstance(self.memory, Memory):
+            return
+        summary = self.memory.get_session_summary(session_id=session_id, user_id=user_id)
+        stored = cast(Optional[TeamSession], self.storage.read(session_id=session_id, user_id=user_id))
+        if summary is None or stored is None:
+            return
+        session = stored.with_summary(summary.to_dict(), user_id=user_id)
+        if self.storage.append_runs:
+            # The storage keeps the runs, only the session is written again
+            session = replace(session, memory={**session.memory, "runs": []})  # type: ignore
+        self.storage.upsert(session=session)
+
     def _make_memories_and_summaries(
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> None:
+        if self.create_memories_in_background:
+            return self._queue_memories_and_summaries(run_messages, session_id, user_id)
+
         self.memory = cast(Memory, self.memory)
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
@@ -1917,16 +1972,22 @@ class Team:
     async def _amake_memories_and_summaries(
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> None:
+        if self.create_memories_in_background:
+            return self._queue_memories_and_summaries(run_messages, session_id, user_id)
+
         self.memory = cast(Memory, self.memory)
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
         )
+        # Create the user memories and the session summary concurrently
+        tasks: List[Coroutine[Any, Any, Any]] = []
         if self.enable_user_memories and user_message_str is not None and user_message_str:
-            await self.memory.acreate_user_memories(message=user_message_str, user_id=user_id)
+            tasks.append(self.memory.acreate_user_memories(message=user_message_str, user_id=user_id))
 
         # Update the session summary if needed
         if self.enable_session_summaries:
-            await self.memory.acreate_session_summary(session_id=session_id, user_id=user_id)
+            tasks.append(self.memory.acreate_session_summary(session_id=session_id, user_id=user_id))
+        await asyncio.gather(*tasks)
 
     def _get_response_format(self) -> Optional[Union[Dict, Type[BaseModel]]]:
         self.model = cast(Model, self.model)
@@ -4647,8 +4708,6 @@ class Team:
 
         # 2. Add history to run_messages
         if self.enable_team_history:
-            from copy import deepcopy
-
             history = []
             if isinstance(self.memory, TeamMemory):
                 history = self.memory.get_messages_from_last_n_runs(last_n=self.num_history_runs, skip_role="system")
@@ -4658,12 +4717,9 @@ class Team:
                 )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Shallow copy the history messages and tag them as coming from history. The copies share their
+                # content, media and tool calls with the original messages, which are never modified in place.
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
@@ -6052,6 +6108,7 @@ class Team:
         if self.storage is not None and session_id is not None:
             self.team_session = cast(TeamSession, self.storage.read(session_id=session_id))
             if self.team_session is not None:
+                self._set_runs_stored(self.team_session)
                 self.load_team_session(session=self.team_session)
             else:
                 # New session, just reset the state
@@ -6065,9 +6122,37 @@ class Team:
             Optional[TeamSession]: The saved TeamSession or None if not saved.
         """
         if self.storage is not None:
-            self.team_session = cast(
-                TeamSession, self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id))
-            )
+            team_session = self._get_team_session(session_id=session_id, user_id=user_id)
+            stored = self.storage.upsert(session=self._get_session_to_store(team_session))
+            self.team_session = self._set_session_stored(cast(Optional[TeamSession], stored), team_session)
+        return self.team_session
+
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Load the TeamSession from storage asynchronously
+
+        Returns:
+            Optional[TeamSession]: The loaded TeamSession or None if not found.
+        """
+        if self.storage is not None and session_id is not None:
+            self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self._set_runs_stored(self.team_session)
+                self.load_team_session(session=self.team_session)
+            else:
+                # New session, just reset the state
+                self.session_name = None
+        return self.team_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Save the TeamSession to storage asynchronously
+
+        Returns:
+            Optional[TeamSession]: The saved TeamSession or None if not saved.
+        """
+        if self.storage is not None:
+            team_session = self._get_team_session(session_id=session_id, user_id=user_id)
+            stored = await self.storage.aupsert(session=self._get_session_to_store(team_session))
+            self.team_session = self._set_session_stored(cast(Optional[TeamSession], stored), team_session)
         return self.team_session
 
     def rename_session(self, session_name: str, session_id: Optional[str] = None) -> None:
@@ -6360,6 +6445,99 @@ class Team:
         else:
             raise ValueError(f"Memory type {type(self.memory)} not supported")
 
+    def deep_copy(self, *, update: Optional[Dict[str, Any]] = None) -> "Team":
+        """Create and return a deep copy of this Team and its members, optionally updating fields.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Team.
+
+        Returns:
+            Team: A new Team instance.
+        """
+        from dataclasses import fields
+
+        # Do not copy session_name and the session of the parent team to the new team
+        excluded_fields = ["session_name", "team_session_id"]
+        # Extract the fields to set for the new Team
+        fields_for_new_team: Dict[str, Any] = {}
+
+        for f in fields(self):
+            # Fields that are updated are not copied
+            if f.name in excluded_fields or (update and f.name in update):
+                continue
+            field_value = getattr(self, f.name)
+            if field_value is not None:
+                fields_for_new_team[f.name] = self._deep_copy_field(f.name, field_value)
+
+        # Update fields if provided
+        if update:
+            fields_for_new_team.update(update)
+        # role is set after creating the new Team, as it is not an argument of __init__
+        role = fields_for_new_team.pop("role", None)
+        # Create a new Team
+        new_team = self.__class__(**fields_for_new_team)
+        new_team.role = role
+        log_debug(f"Created new {self.__class__.__name__}")
+        return new_team
+
+    def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
+        """Helper method to deep copy a field based on its type."""
+        from copy import copy, deepcopy
+
+        # For members, memory and the agents and teams, use their deep_copy methods
+        if field_name == "members":
+            return [member.deep_copy() for member in field_value]
+        elif field_name == "memory":
+            return field_value.deep_copy()
+
+        # The knowledge base is only read during a run, share it with its vector db client
+        elif field_name == "knowledge":
+            return field_value
+
+        # Share the toolkits, but give each team its own functions
+        elif field_name == "tools":
+            return copy_tools(field_value)
+
+        # For storage, model and reasoning_model, use a deep copy
+        elif field_name in ("storage", "model", "reasoning_model"):
+            try:
+                return deepcopy(field_value)
+            except Exception:
+                try:
+                    return copy(field_value)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # For compound types, attempt a deep copy
+        elif isinstance(field_value, (list, dict, set)):
+            try:
+                return deepcopy(field_value)
+            except Exception:
+                try:
+                    return copy(field_value)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # For pydantic models, attempt a model_copy
+        elif isinstance(field_value, BaseModel):
+            try:
+                return field_value.model_copy(deep=True)
+            except Exception:
+                try:
+                    return field_value.model_copy(deep=False)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # For other types, attempt a shallow copy
+        try:
+            return copy(field_value)
+        except Exception:
+            # If copy fails, return as is
+            return field_value
+
     ###########################################################################
     # Handle images, videos and audio
     ###########################################################################
@@ -6911,10 +7089,10 @@ class Team:
                 self.memory = cast(Memory, self.memory)
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 if self.memory.runs is not None:
-                    memory_dict = self.memory.to_dict()
+                    memory_dict = self.memory.to_dict(include_runs=False)
                     run_responses = self.memory.runs.get(session_id)
                     if run_responses is not None:
-                        memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                        memory_dict["runs"] = [self._serialize_run(rr.run_id, rr) for rr in run_responses]
 
         return TeamSession(
             session_id=session_id,
@@ -6928,6 +7106,59 @@ class Team:
             created_at=int(time()),
         )
 
+    def _serialize_run(self, run_id: Optional[str], run: Union[RunResponse, TeamRunResponse]) -> Dict[str, Any]:
+        """Serialize a run of the session, reusing the stored dict of a run the storage already has.
+
+        Stored runs are not written again, so every write only serializes the new runs and the current run.
+        """
+        if self._is_run_stored(run_id):
+            return self._stored_runs[run_id]  # type: ignore
+        return run.to_dict()
+
+    def _get_session_to_store(self, session: TeamSession) -> TeamSession:
+        """Get a copy of the TeamSession without the runs the storage already has"""
+        if session.memory is None or not session.memory.get("runs") or not self.storage or not self.storage.append_runs:
+            return session
+        runs = [run for run in session.memory["runs"] if not self._is_run_stored(get_run_id(run))]
+        return replace(session, memory={**session.memory, "runs": runs})
+
+    def _set_session_stored(self, stored: Optional[TeamSession], session: TeamSession) -> Optional[TeamSession]:
+        """Get the TeamSession returned by the storage, with all the runs of the session that was written"""
+        if stored is not None and self.storage is not None and self.storage.append_runs:
+            # Storages that append runs return the session they were given, which only has the new runs
+            stored.memory = session.memory
+        self._set_runs_stored(stored)
+        return stored
+
+    def _is_run_stored(self, run_id: Optional[str]) -> bool:
+        """Check if a run can be left out of the TeamSession because the storage already has it.
+
+        Only storages that append runs keep the runs left out of a session. The current run is always included,
+        as it changes until it completes.
+        """
+        if self.storage is None or not self.storage.append_runs:
+            return False
+        return run_id is not None and run_id != self.run_id and run_id in self._stored_runs
+
+    def _set_runs_stored(self, session: Optional[TeamSession]) -> None:
+        """Record the runs of a TeamSession read from or written to storage as stored"""
+        if session is None or session.memory is None or self.storage is None or not self.storage.append_runs:
+            return
+        for run in session.memory.get("runs") or []:
+            run_id = get_run_id(run)
+            if run_id is not None:
+                self._stored_runs[run_id] = run
+
+    def _get_api_session_data(self, team_session: TeamSession) -> Callable[[], Dict[str, Any]]:
+        """Get a function returning the session data of an event, called on the exporter thread.
+
+        Monitoring posts the whole session, so only a snapshot is taken here and it is serialized on the exporter thread.
+        """
+        if self.monitoring:
+            return team_session.snapshot().to_dict
+        telemetry_data = team_session.telemetry_data()
+        return lambda: telemetry_data
+
     def _log_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
         if not self.telemetry and not self.monitoring:
             return
@@ -6940,13 +7171,15 @@ class Team:
                 session_id=session_id, user_id=user_id
             )
 
+            run_id = self.run_id
+            get_team_data = self._get_api_session_data(team_session)
             create_team_run(
-                run=TeamRunCreate(
-                    run_id=self.run_id,  # type: ignore
+                run=lambda: TeamRunCreate(
+                    run_id=run_id,  # type: ignore
                     run_data=run_data,
                     team_session_id=team_session.team_session_id,
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=get_team_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -6965,12 +7198,14 @@ class Team:
                 session_id=session_id, user_id=user_id
             )
 
+            run_id = self.run_id
+            get_team_data = self._get_api_session_data(team_session)
             await acreate_team_run(
-                run=TeamRunCreate(
-                    run_id=self.run_id,
+                run=lambda: TeamRunCreate(
+                    run_id=run_id,  # type: ignore
                     run_data=run_data,
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=get_team_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -6987,11 +7222,9 @@ class Team:
             team_session: TeamSession = self.team_session or self._get_team_session(
                 session_id=session_id, user_id=user_id
             )
+            get_team_data = self._get_api_session_data(team_session)
             upsert_team_session(
-                session=TeamSessionCreate(
-                    session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
-                ),
+                session=lambda: TeamSessionCreate(session_id=team_session.session_id, team_data=get_team_data()),
                 monitor=self.monitoring,
             )
         except Exception as e:
@@ -1,5 +1,11 @@
+import asyncio
 from dataclasses import asdict
-from typing import Any, List, Optional, Type
+from typing import Any, Awaitable, Callable, List, Optional, Set, Type
+
+from agno.utils.log import log_debug
+
+# Keeps a reference to the tasks started by `close_in_background` until they are done
+_close_tasks: Set["asyncio.Task[Any]"] = set()
 
 
 def isinstanceany(obj: Any, class_list: List[Type]) -> bool:
@@ -59,3 +65,31 @@ def nested_model_dump(value):
     elif isinstance(value, list):
         return [nested_model_dump(item) for item in value]
     return value
+
+
+def get_running_event_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Returns the running event loop, or None when called outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _close_quietly(close: Callable[[], Awaitable[Any]]) -> None:
+    try:
+        await close()
+    except Exception as e:
+        log_debug(f"Error closing async client: {e}")
+
+
+def close_in_background(close: Callable[[], Awaitable[Any]]) -> None:
+    """Closes an async client that is no longer used on the running event loop, without waiting for it.
+
+    Connections opened on an event loop that is already closed cannot be shut down cleanly, so errors are only logged.
+    """
+    loop = get_running_event_loop()
+    if loop is None:
+        return
+    task = loop.create_task(_close_quietly(close))
+    _close_tasks.add(task)
+    task.add_done_callback(_close_tasks.discard)
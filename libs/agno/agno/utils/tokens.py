@@ -0,0 +1,48 @@
+from functools import lru_cache
+from typing import Callable, List
+
+from agno.models.message import Message
+from agno.utils.log import log_debug
+
+# A tokenizer returns the number of tokens in a text
+Tokenizer = Callable[[str], int]
+
+
+def count_tokens_heuristic(text: str) -> int:
+    """Estimate the number of tokens in a text as one token per 4 characters"""
+    return (len(text) + 3) // 4
+
+
+@lru_cache(maxsize=None)
+def get_tiktoken_tokenizer(encoding_name: str = "o200k_base") -> Tokenizer:
+    """Return a tokenizer counting tokens with the tiktoken encoding, or the character heuristic without tiktoken"""
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        log_debug(f"Could not load tiktoken encoding {encoding_name}, estimating tokens from characters: {e}")
+        return count_tokens_heuristic
+
+    def count_tokens(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return count_tokens
+
+
+def get_messages_within_token_budget(messages: List[Message], max_tokens: int, tokenizer: Tokenizer) -> List[Message]:
+    """Return the most recent messages whose token counts add up to at most `max_tokens`.
+
+    Messages are counted from the newest and the counts are cached on the messages, so only new messages are
+    tokenized. The selection starts at a user message, so tool results are never separated from their tool calls.
+    """
+    total_tokens = 0
+    start = len(messages)
+    for i in range(len(messages) - 1, -1, -1):
+        total_tokens += messages[i].count_tokens(tokenizer)
+        if total_tokens > max_tokens:
+            break
+        start = i
+    while start < len(messages) and messages[start].role != "user":
+        start += 1
+    return messages[start:]
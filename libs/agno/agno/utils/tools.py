@@ -1,7 +1,10 @@
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from copy import copy
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from agno.models.response import ToolExecution
 from agno.tools.function import Function, FunctionCall
+from agno.tools.toolkit import Toolkit
 from agno.utils.functions import get_function_call
 
 
@@ -100,3 +103,24 @@ def get_function_call_for_tool_execution(
         call_id=_tool_call_id,
         functions=functions,
     )
+
+
+def copy_tools(tools: List[Union[Toolkit, Callable, Function, Dict]]) -> List[Union[Toolkit, Callable, Function, Dict]]:
+    """Copy a list of tools for another agent or team.
+
+    Toolkits and their clients are shared, but each copy gets its own Function objects, which hold the agent or
+    team that runs them.
+    """
+    tools_copy: List[Union[Toolkit, Callable, Function, Dict]] = []
+    for tool in tools:
+        if isinstance(tool, Toolkit):
+            toolkit_copy = copy(tool)
+            toolkit_copy.functions = OrderedDict((name, func.model_copy()) for name, func in tool.functions.items())
+            tools_copy.append(toolkit_copy)
+        elif isinstance(tool, Function):
+            tools_copy.append(tool.model_copy())
+        elif isinstance(tool, dict):
+            tools_copy.append(dict(tool))
+        else:
+            tools_copy.append(tool)
+    return tools_copy
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
@@ -34,6 +35,21 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """Return the subset of `hashes` (see `Document.content_hash`) that are already stored in the vector db"""
+        raise NotImplementedError
+
+    async def async_existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        return await asyncio.to_thread(self.existing_content_hashes, hashes)
+
+    def delete_by_content_hashes(self, hashes: List[str]) -> bool:
+        """Delete the documents whose content hash (see `Document.content_hash`) is in `hashes`"""
+        raise NotImplementedError
+
+    def delete_by_ids(self, ids: List[str]) -> bool:
+        """Delete the documents whose `Document.id` is in `ids`"""
+        raise NotImplementedError
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
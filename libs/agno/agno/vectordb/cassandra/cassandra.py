@@ -93,8 +93,9 @@ class Cassandra(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
         futures = []
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             metadata = {key: str(value) for key, value in doc.meta_data.items()}
             futures.append(
                 self.table.put_async(
@@ -1,6 +1,6 @@
 import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -117,6 +117,31 @@ class ChromaDb(VectorDb):
         """Check if a document exists asynchronously."""
         return await asyncio.to_thread(self.doc_exists, document)
 
+    def existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection.
+        Documents are stored with their content hash as id, so this fetches ids in batches.
+        Args:
+            hashes (List[str]): Content hashes to check.
+        Returns:
+            Set[str]: The subset of hashes found in the collection.
+        """
+        if not self.client:
+            logger.warning("Client not initialized")
+            return set()
+
+        existing: Set[str] = set()
+        unique_hashes = list(set(hashes))
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection_name)
+            for i in range(0, len(unique_hashes), 1000):
+                result: GetResult = collection.get(ids=unique_hashes[i : i + 1000], include=[])
+                existing.update(result.get("ids", []))
+        except Exception as e:
+            # Treating the hashes as new would insert duplicates, so the error is raised
+            logger.error(f"Error checking existing content hashes: {e}")
+            raise
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
         Args:
@@ -153,8 +178,9 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -200,8 +226,9 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -360,3 +387,15 @@ class ChromaDb(VectorDb):
         except Exception as e:
             logger.error(f"Error clearing collection: {e}")
             return False
+
+    def delete_by_content_hashes(self, hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes, which are their ids in the collection."""
+        if not hashes:
+            return True
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection_name)
+            collection.delete(ids=list(set(hashes)))
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
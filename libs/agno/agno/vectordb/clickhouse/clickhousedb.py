@@ -293,8 +293,9 @@ class Clickhouse(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
     ) -> None:
         rows: List[List[Any]] = []
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
@@ -332,8 +333,9 @@ class Clickhouse(VectorDb):
         rows: List[List[Any]] = []
         async_client = await self._ensure_async_client()
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
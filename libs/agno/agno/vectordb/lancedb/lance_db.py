@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -204,6 +204,42 @@ class LanceDb(VectorDb):
             self.table = self.connection.open_table(name=self.table_name)
         return self.doc_exists(document)
 
+    def existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table.
+        Documents are stored with their content hash as id, so this looks up ids in batches.
+
+        Args:
+            hashes (List[str]): Content hashes to check
+
+        Returns:
+            Set[str]: The subset of hashes found in the table
+        """
+        existing: Set[str] = set()
+        if self.table is None:
+            return existing
+
+        unique_hashes = list(set(hashes))
+        try:
+            for i in range(0, len(unique_hashes), 1000):
+                batch = unique_hashes[i : i + 1000]
+                ids = ", ".join(f"'{doc_id}'" for doc_id in batch)
+                result = (
+                    self.table.search().where(f"{self._id} IN ({ids})").select([self._id]).limit(len(batch)).to_arrow()
+                )
+                existing.update(result[self._id].to_pylist())
+        except Exception as e:
+            # Treating the hashes as new would insert duplicates, so the error is raised
+            logger.error(f"Error checking existing content hashes: {e}")
+            raise
+        return existing
+
+    async def async_existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """Asynchronously return the content hashes that already exist in the table"""
+        if self.connection:
+            self.table = self.connection.open_table(name=self.table_name)
+        return self.existing_content_hashes(hashes)
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -219,17 +255,18 @@ class LanceDb(VectorDb):
         log_info(f"Inserting {len(documents)} documents")
         data = []
 
-        for document in documents:
-            if self.doc_exists(document):
-                continue
+        existing_hashes = self.existing_content_hashes([document.content_hash for document in documents])
+        documents = [document for document in documents if document.content_hash not in existing_hashes]
+        # Embed all new documents using batched requests to the embedder
+        Document.embed_batch(documents, embedder=self.embedder)
 
+        for document in documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -278,17 +315,18 @@ class LanceDb(VectorDb):
         data = []
 
         # Prepare documents for insertion
-        for document in documents:
-            if await self.async_doc_exists(document):
-                continue
+        existing_hashes = await self.async_existing_content_hashes([document.content_hash for document in documents])
+        documents = [document for document in documents if document.content_hash not in existing_hashes]
+        # Embed all new documents using batched requests to the embedder
+        await Document.async_embed_batch(documents, embedder=self.embedder)
 
+        for document in documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -580,6 +618,22 @@ class LanceDb(VectorDb):
     def delete(self) -> bool:
         return False
 
+    def delete_by_content_hashes(self, hashes: List[str]) -> bool:
+        """Delete the rows with the given content hashes, which are their ids in the table."""
+        if not hashes:
+            return True
+        if self.table is None:
+            return False
+        try:
+            unique_hashes = list(set(hashes))
+            for i in range(0, len(unique_hashes), 1000):
+                ids = ", ".join(f"'{doc_id}'" for doc_id in unique_hashes[i : i + 1000])
+                self.table.delete(f"{self._id} IN ({ids})")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting rows: {e}")
+            return False
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with the given name exists in the database"""
         if self.table is None:
@@ -381,12 +381,13 @@ class Milvus(VectorDb):
         """Insert documents based on search type."""
         log_info(f"Inserting {len(documents)} documents")
 
+        Document.embed_batch(documents, embedder=self.embedder)
+
         if self.search_type == SearchType.hybrid:
             for document in documents:
                 self._insert_hybrid_document(document)
         else:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -414,12 +415,13 @@ class Milvus(VectorDb):
         """Insert documents asynchronously based on search type."""
         log_info(f"Inserting {len(documents)} documents asynchronously")
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         if self.search_type == SearchType.hybrid:
             await asyncio.gather(*[self._async_insert_hybrid_document(doc) for doc in documents])
         else:
 
             async def process_document(document):
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -464,8 +466,9 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -485,8 +488,9 @@ class Milvus(VectorDb):
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Upserting {len(documents)} documents asynchronously")
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
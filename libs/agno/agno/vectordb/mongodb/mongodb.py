@@ -488,6 +488,8 @@ class MongoDb(VectorDb):
         log_info(f"Inserting {len(documents)} documents")
         collection = self._get_collection()
 
+        Document.embed_batch(documents, embedder=self.embedder)
+
         prepared_docs = []
         for document in documents:
             try:
@@ -512,6 +514,8 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
 
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -894,7 +898,8 @@ class MongoDb(VectorDb):
 
     def prepare_doc(self, document: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -945,6 +950,8 @@ class MongoDb(VectorDb):
         log_info(f"Inserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         prepared_docs = []
         for document in documents:
             try:
@@ -969,6 +976,8 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
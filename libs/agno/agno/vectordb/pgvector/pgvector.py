@@ -1,7 +1,7 @@
 import asyncio
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -9,7 +9,7 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
+    from sqlalchemy.sql.expression import any_, bindparam, desc, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
@@ -239,14 +239,34 @@ class PgVector(VectorDb):
         Returns:
             bool: True if the document exists, False otherwise.
         """
-        cleaned_content = document.content.replace("\x00", "\ufffd")
-        content_hash = md5(cleaned_content.encode()).hexdigest()
-        return self._record_exists(self.table.c.content_hash, content_hash)
+        return self._record_exists(self.table.c.content_hash, document.content_hash)
 
     async def async_doc_exists(self, document: Document) -> bool:
         """Check if document exists asynchronously by running in a thread."""
         return await asyncio.to_thread(self.doc_exists, document)
 
+    def existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query.
+
+        Args:
+            hashes (List[str]): The content hashes to check.
+
+        Returns:
+            Set[str]: The subset of hashes found in the table.
+        """
+        if not hashes:
+            return set()
+        try:
+            with self.Session() as sess, sess.begin():
+                hashes_param = bindparam("hashes", value=list(set(hashes)), type_=postgresql.ARRAY(String))
+                stmt = select(self.table.c.content_hash).where(self.table.c.content_hash == any_(hashes_param))
+                return {row[0] for row in sess.execute(stmt)}
+        except Exception as e:
+            # Treating the hashes as new would insert duplicates, so the error is raised
+            logger.error(f"Error checking existing content hashes: {e}")
+            raise
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -307,11 +327,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in one request to the embedder
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -380,11 +402,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in one request to the embedder
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for upserting
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -1035,6 +1059,54 @@ class PgVector(VectorDb):
             sess.rollback()
             return False
 
+    def delete_by_content_hashes(self, hashes: List[str]) -> bool:
+        """
+        Delete the records with the given content hashes.
+
+        Args:
+            hashes (List[str]): The content hashes to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        from sqlalchemy import delete
+
+        if not hashes:
+            return True
+        try:
+            with self.Session() as sess, sess.begin():
+                hashes_param = bindparam("hashes", value=list(set(hashes)), type_=postgresql.ARRAY(String))
+                sess.execute(delete(self.table).where(self.table.c.content_hash == any_(hashes_param)))
+                log_debug(f"Deleted records with {len(hashes)} content hashes from table '{self.table.fullname}'.")
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting rows from table '{self.table.fullname}': {e}")
+            return False
+
+    def delete_by_ids(self, ids: List[str]) -> bool:
+        """
+        Delete the records with the given IDs.
+
+        Args:
+            ids (List[str]): The IDs to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        from sqlalchemy import delete
+
+        if not ids:
+            return True
+        try:
+            with self.Session() as sess, sess.begin():
+                ids_param = bindparam("ids", value=list(set(ids)), type_=postgresql.ARRAY(String))
+                sess.execute(delete(self.table).where(self.table.c.id == any_(ids_param)))
+                log_debug(f"Deleted {len(ids)} records by id from table '{self.table.fullname}'.")
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting rows from table '{self.table.fullname}': {e}")
+            return False
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the PgVector instance, handling unpickleable attributes.
@@ -252,8 +252,9 @@ class PineconeDb(VectorDb):
         """
 
         vectors = []
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -311,8 +312,9 @@ class PineconeDb(VectorDb):
     def _prepare_vectors(self, documents):
         """Prepare vectors for upsert."""
         vectors = []
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             doc.meta_data["text"] = doc.content
             data_to_upsert = {
                 "id": doc.id,
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -176,6 +176,44 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the collection.
+        Documents are stored with their content hash as point id, so this retrieves points in batches.
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        existing: Set[str] = set()
+        if not self.client:
+            return existing
+
+        unique_hashes = list(set(hashes))
+        for i in range(0, len(unique_hashes), 1000):
+            collection_points = self.client.retrieve(
+                collection_name=self.collection,
+                ids=unique_hashes[i : i + 1000],
+                with_payload=False,
+                with_vectors=False,
+            )
+            # Qdrant returns the md5 ids formatted as UUIDs
+            existing.update(str(point.id).replace("-", "") for point in collection_points)
+        return existing
+
+    async def async_existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection asynchronously."""
+        existing: Set[str] = set()
+        unique_hashes = list(set(hashes))
+        for i in range(0, len(unique_hashes), 1000):
+            collection_points = await self.async_client.retrieve(
+                collection_name=self.collection,
+                ids=unique_hashes[i : i + 1000],
+                with_payload=False,
+                with_vectors=False,
+            )
+            existing.update(str(point.id).replace("-", "") for point in collection_points)
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -229,8 +267,9 @@ class Qdrant(VectorDb):
         """
         log_debug(f"Inserting {len(documents)} documents")
         points = []
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -271,8 +310,9 @@ class Qdrant(VectorDb):
         """
         log_debug(f"Inserting {len(documents)} documents asynchronously")
 
+        await Document.async_embed_batch(documents, embedder=self.embedder)
+
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -509,3 +549,17 @@ class Qdrant(VectorDb):
 
     def delete(self) -> bool:
         return False
+
+    def delete_by_content_hashes(self, hashes: List[str]) -> bool:
+        """Delete the points with the given content hashes, which are their ids in the collection."""
+        if not hashes:
+            return True
+        try:
+            self.client.delete(
+                collection_name=self.collection,
+                points_selector=models.PointIdsList(points=list(set(hashes))),  # type: ignore
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting points: {e}")
+            return False
@@ -172,8 +172,9 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_batch(documents, embedder=self.embedder)
+
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -215,8 +216,9 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_batch(documents, embedder=self.embedder)
+
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -189,6 +189,11 @@ class UpstashVectorDb(VectorDb):
         _namespace = self.namespace if namespace is None else namespace
         vectors = []
 
+        if not self.use_upstash_embeddings and self.embedder is not None:
+            Document.embed_batch(
+                [document for document in documents if document.id is not None], embedder=self.embedder
+            )
+
         for document in documents:
             if document.id is None:
                 logger.error(f"Document ID must not be None. Skipping document: {document.content[:100]}...")
@@ -201,7 +206,6 @@ class UpstashVectorDb(VectorDb):
                     logger.error("Embedder is None but use_upstash_embeddings is False")
                     continue
 
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Failed to generate embedding for document: {document.id}")
                     continue
@@ -248,8 +248,9 @@ class Weaviate(VectorDb):
         log_debug(f"Inserting {len(documents)} documents into Weaviate.")
         collection = self.get_client().collections.get(self.collection)
 
+        Document.embed_batch(documents, embedder=self.embedder)
+
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -293,11 +294,11 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            await Document.async_embed_batch(documents, embedder=self.embedder)
+
             # Process documents first
             for document in documents:
                 try:
-                    # Embed document
-                    document.embed(embedder=self.embedder)
                     if document.embedding is None:
                         logger.error(f"Document embedding is None: {document.name}")
                         continue
@@ -357,8 +358,9 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            await Document.async_embed_batch(documents, embedder=self.embedder)
+
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Document embedding is None: {document.name}")
                     continue
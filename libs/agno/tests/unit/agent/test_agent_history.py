@@ -0,0 +1,45 @@
+from agno.agent import Agent, RunResponse
+from agno.media import Image
+from agno.memory.v2.memory import Memory
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+
+
+def make_agent():
+    memory = Memory()
+    memory.add_run(
+        session_id="session-1",
+        run=RunResponse(
+            run_id="run-1",
+            session_id="session-1",
+            messages=[
+                Message(role="user", content="What is in this image?", images=[Image(url="https://example.com/a.png")]),
+                Message(role="assistant", content="A cat."),
+            ],
+        ),
+    )
+    return Agent(
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        memory=memory,
+        add_history_to_messages=True,
+        session_id="session-1",
+    )
+
+
+def test_history_messages_are_tagged_without_modifying_memory():
+    agent = make_agent()
+    original = agent.memory.runs["session-1"][0].messages  # type: ignore
+
+    run_messages = agent.get_run_messages(message="And now?", session_id="session-1")
+
+    history = run_messages.messages[:2]
+    assert [m.content for m in history] == ["What is in this image?", "A cat."]
+    assert all(m.from_history for m in history)
+    assert not any(m.from_history for m in original)
+    # The copies share their content and media with the messages in memory
+    assert history[0] is not original[0]
+    assert history[0].images is original[0].images
+
+    # Reassigning a field of a copy, like models do when formatting messages, leaves memory untouched
+    history[0].content = "Changed"
+    assert original[0].content == "What is in this image?"
@@ -0,0 +1,113 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agno.api.exporter import TelemetryExporter
+from agno.api.schemas.agent import AgentRunCreate
+from agno.cli.settings import agno_cli_settings
+
+
+class StubApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.entered.set()  # type: ignore
+        self.server.release.wait(timeout=5)  # type: ignore
+        self.server.requests.append((self.path, self.client_address, body))  # type: ignore
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubApiHandler)
+    server.requests = []  # type: ignore
+    server.entered = threading.Event()  # type: ignore
+    server.release = threading.Event()  # type: ignore
+    server.release.set()  # type: ignore
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(agno_cli_settings, "api_url", f"http://127.0.0.1:{server.server_port}")
+    yield server
+    server.release.set()  # type: ignore
+    server.shutdown()
+
+
+def test_export_posts_batch_over_one_connection(stub_api):
+    exporter = TelemetryExporter(flush_interval=0.1)
+    for i in range(5):
+        assert exporter.export("/v1/agent-runs", "run", AgentRunCreate(session_id="session-1", run_id=f"run-{i}"))
+    # Payloads can be built lazily on the exporter thread
+    assert exporter.export("/v1/agent-runs", "run", lambda: AgentRunCreate(session_id="session-1", run_id="run-5"))
+
+    assert exporter.flush(timeout=5)
+    exporter.shutdown()
+
+    assert [body["run"]["run_id"] for _, _, body in stub_api.requests] == [f"run-{i}" for i in range(6)]
+    assert {path for path, _, _ in stub_api.requests} == {"/v1/agent-runs"}
+    # The client keeps its connection open between events
+    assert len({address for _, address, _ in stub_api.requests}) == 1
+
+
+def test_export_drops_events_when_queue_is_full(stub_api):
+    exporter = TelemetryExporter(max_queue_size=2, flush_interval=0.1)
+    stub_api.release.clear()
+
+    # The first event is taken off the queue and blocks on the server
+    assert exporter.export("/v1/agent-runs", "run", AgentRunCreate(session_id="session-1", run_id="run-0"))
+    assert stub_api.entered.wait(timeout=5)
+    assert exporter.export("/v1/agent-runs", "run", AgentRunCreate(session_id="session-1", run_id="run-1"))
+    assert exporter.export("/v1/agent-runs", "run", AgentRunCreate(session_id="session-1", run_id="run-2"))
+    assert not exporter.export("/v1/agent-runs", "run", AgentRunCreate(session_id="session-1", run_id="run-3"))
+    assert exporter.dropped == 1
+
+    stub_api.release.set()
+    exporter.shutdown()
+    assert [body["run"]["run_id"] for _, _, body in stub_api.requests] == ["run-0", "run-1", "run-2"]
+
+
+def test_export_survives_failing_payloads(stub_api):
+    exporter = TelemetryExporter(flush_interval=0.1)
+
+    def failing_payload():
+        raise ValueError("Could not serialize session")
+
+    assert exporter.export("/v1/agent-runs", "run", failing_payload)
+    assert exporter.export("/v1/agent-runs", "run", AgentRunCreate(session_id="session-1", run_id="run-1"))
+    assert exporter.flush(timeout=5)
+    exporter.shutdown()
+
+    assert [body["run"]["run_id"] for _, _, body in stub_api.requests] == ["run-1"]
+    # Events are not accepted once the exporter is shut down
+    assert not exporter.export("/v1/agent-runs", "run", AgentRunCreate(session_id="session-1", run_id="run-2"))
+
+
+def test_agent_run_event_is_a_snapshot_of_the_session(monkeypatch):
+    from agno.agent import Agent
+    from agno.run.response import RunResponse
+    from agno.storage.session.agent import AgentSession
+
+    queued = []
+    monkeypatch.setattr("agno.api.agent.create_agent_run", lambda run, monitor: queued.append(run))
+
+    agent = Agent(monitoring=True)
+    agent.run_id = "run-1"
+    agent.run_response = RunResponse(run_id="run-1", content="Hello")
+    agent.agent_session = AgentSession(session_id="session-1", session_data={"session_state": {"count": 1}})
+    agent._log_agent_run(session_id="session-1")
+
+    # The next run changes the session while the event waits on the queue
+    agent.run_id = "run-2"
+    agent.agent_session.session_data["session_state"]["count"] = 2  # type: ignore
+
+    # The event is built on the exporter thread
+    run = queued[0]()
+    assert run.run_id == "run-1"
+    assert run.agent_data["session_data"]["session_state"] == {"count": 1}
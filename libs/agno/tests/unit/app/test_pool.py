@@ -0,0 +1,95 @@
+import asyncio
+
+from agno.agent import Agent
+from agno.app.pool import AgentPool
+from agno.knowledge.agent import AgentKnowledge
+from agno.memory.v2.memory import Memory
+from agno.models.openai import OpenAIChat
+from agno.team.team import Team
+from agno.tools.calculator import CalculatorTools
+
+
+def make_agent(name: str = "Calculator") -> Agent:
+    return Agent(
+        name=name,
+        agent_id=name.lower(),
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        tools=[CalculatorTools()],
+        knowledge=AgentKnowledge(),
+    )
+
+
+def test_deep_copy_shares_knowledge_and_toolkits():
+    agent = make_agent()
+    agent_copy = agent.deep_copy()
+
+    assert agent_copy.knowledge is agent.knowledge
+    assert agent_copy.model is not agent.model
+    # Toolkits are copied shallowly, sharing their clients, and each copy has its own functions
+    assert agent_copy.tools[0] is not agent.tools[0]  # type: ignore
+    assert agent_copy.tools[0].functions.keys() == agent.tools[0].functions.keys()  # type: ignore
+    assert agent_copy.tools[0].functions["add"] is not agent.tools[0].functions["add"]  # type: ignore
+    assert agent_copy.tools[0].functions["add"].entrypoint == agent.tools[0].functions["add"].entrypoint  # type: ignore
+
+
+def test_agent_pool_hands_out_copies():
+    agent = make_agent()
+    pool = AgentPool(agent, size=2)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    # The pool is empty, so a copy is made for the third request
+    third = pool.acquire()
+    assert len({id(agent), id(first), id(second), id(third)}) == 4
+    assert all(agent_copy.agent_id == agent.agent_id for agent_copy in (first, second, third))
+
+    # The copies share the memory of the agent, which keeps sessions apart
+    assert isinstance(agent.memory, Memory)
+    assert first.memory is agent.memory and third.memory is agent.memory
+
+    # Run state set on one copy is not seen by the others
+    first.monitoring = True
+    first.session_id = "session-1"
+    assert second.monitoring is False and second.session_id is None
+
+    pool.refill()
+    assert pool.acquire() not in (first, second, third)
+
+
+def test_agent_pool_copies_share_the_model_clients():
+    agent = make_agent()
+    pool = AgentPool(agent, size=2)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first.model.client is not None  # type: ignore
+    assert first.model.client is second.model.client is agent.model.client  # type: ignore
+
+    # The original owns the client, so closing a copy leaves it open
+    first.model.close()  # type: ignore
+    assert not agent.model.client.is_closed()  # type: ignore
+
+    async def acquire_async_clients():
+        return [pool.acquire().model.get_async_client() for _ in range(2)]  # type: ignore
+
+    first_client, second_client = asyncio.run(acquire_async_clients())
+    assert first_client is second_client is agent.model.async_client  # type: ignore
+
+
+def test_agent_pool_copies_teams_and_members():
+    team = Team(
+        name="Team",
+        team_id="team",
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        members=[make_agent("Member")],
+    )
+    team.role = "Answers questions"
+    pool = AgentPool(team, size=1)
+
+    team_copy = pool.acquire()
+    assert isinstance(team_copy, Team)
+    assert team_copy.team_id == "team" and team_copy.role == "Answers questions"
+    assert team_copy.memory is team.memory
+    assert team_copy.members[0] is not team.members[0]
+    assert team_copy.members[0].agent_id == "member"
+    assert team_copy.members[0].model.client is team.members[0].model.client  # type: ignore
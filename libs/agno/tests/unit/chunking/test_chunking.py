@@ -0,0 +1,68 @@
+import re
+
+import pytest
+
+from agno.document.base import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.utils.tokens import count_tokens_heuristic
+
+TEXT = "The quick brown fox jumps over the lazy dog.\n\nIt barked.\tTwice. " * 50
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def test_clean_text():
+    chunking = FixedSizeChunking()
+    for text in ["", "   ", "a", " a \n\n b\t\tc\r\n", "x  y ", TEXT]:
+        assert chunking.clean_text(text) == re.sub(r"\s+", " ", text)
+
+
+def test_fixed_size_chunking():
+    document = Document(id="doc", name="text", content=TEXT, meta_data={"source": "test"})
+    chunks = FixedSizeChunking(chunk_size=100).chunk(document)
+
+    assert "".join(chunk.content for chunk in chunks) == re.sub(r"\s+", " ", TEXT)
+    assert all(len(chunk.content) <= 100 for chunk in chunks)
+    # Chunks end before a space, so no word is split in half
+    assert all(chunk.content.rstrip(".").split(" ")[-1].isalpha() for chunk in chunks[:-1])
+    assert [chunk.id for chunk in chunks[:2]] == ["doc_1", "doc_2"]
+    assert chunks[1].meta_data == {"source": "test", "chunk": 2, "chunk_size": len(chunks[1].content)}
+    assert document.meta_data == {"source": "test"}
+
+
+def test_fixed_size_chunking_long_word():
+    chunks = FixedSizeChunking(chunk_size=10).chunk(Document(name="word", content="a" * 25))
+    assert [chunk.content for chunk in chunks] == ["a" * 10, "a" * 10, "a" * 5]
+    assert chunks[0].id == "word_1"
+
+
+@pytest.mark.parametrize("strategy", [FixedSizeChunking, RecursiveChunking])
+def test_chunking_overlap_moves_forward(strategy):
+    content = "a" * 12 + " b" + " c" * 40
+    chunks = strategy(chunk_size=20, overlap=15).chunk(Document(id="doc", content=content))
+
+    assert all(len(chunk.content) <= 20 for chunk in chunks)
+    assert re.sub(r"\s+", " ", content).endswith(chunks[-1].content)
+    assert len(chunks) < len(content)
+
+
+def test_recursive_chunking_splits_at_sentences():
+    chunks = RecursiveChunking(chunk_size=100).chunk(Document(id="doc", content=TEXT))
+
+    assert all(chunk.content.endswith(".") for chunk in chunks[:-1])
+    assert "".join(chunk.content for chunk in chunks) == re.sub(r"\s+", " ", TEXT)
+
+
+@pytest.mark.parametrize("strategy", [FixedSizeChunking, RecursiveChunking])
+@pytest.mark.parametrize("tokenizer", [count_words, count_tokens_heuristic])
+def test_chunking_by_tokens(strategy, tokenizer):
+    chunks = strategy(chunk_size=40, overlap=4, tokenizer=tokenizer).chunk(Document(id="doc", content=TEXT))
+
+    assert len(chunks) > 1
+    assert all(tokenizer(chunk.content) <= 40 for chunk in chunks)
+    # Chunks are filled close to the token budget
+    assert sum(tokenizer(chunk.content) for chunk in chunks[:-1]) / (len(chunks) - 1) > 30
+    assert re.sub(r"\s+", " ", TEXT).endswith(chunks[-1].content)
@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from agno.document.base import Document
+from agno.document.chunking.semantic import SemanticChunking
+from agno.embedder.base import Embedder
+
+TOPICS = ["cat", "rocket", "bread"]
+
+
+@dataclass
+class TopicEmbedder(Embedder):
+    """Embeds a text as the one-hot vector of the first topic it mentions"""
+
+    dimensions: int = len(TOPICS)
+    batches: List[List[str]] = field(default_factory=list)
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batches.append(texts)
+        return [self.get_embedding(text) for text in texts], [None] * len(texts)
+
+    def get_embedding(self, text: str) -> List[float]:
+        topic = next((i for i, topic in enumerate(TOPICS) if topic in text), 0)
+        return [1.0 if i == topic else 0.0 for i in range(len(TOPICS))]
+
+
+def test_semantic_chunking_splits_at_topic_changes():
+    content = (
+        "The cat sleeps. A cat purrs!\n\nThe rocket launched. Did the rocket land? "
+        "Fresh bread is baked. The cat is back."
+    )
+    embedder = TopicEmbedder(batch_size=4)
+    chunks = SemanticChunking(embedder=embedder, chunk_size=100, reuse_embeddings=True).chunk(
+        Document(id="doc", name="text", content=content, meta_data={"source": "test"})
+    )
+
+    assert [chunk.content for chunk in chunks] == [
+        "The cat sleeps. A cat purrs!",
+        "The rocket launched. Did the rocket land?",
+        "Fresh bread is baked.",
+        "The cat is back.",
+    ]
+    assert [chunk.id for chunk in chunks] == ["doc_1", "doc_2", "doc_3", "doc_4"]
+    assert chunks[0].meta_data == {"source": "test", "chunk": 1, "chunk_size": 28}
+    # The sentences are embedded in batches with the configured embedder
+    assert [len(batch) for batch in embedder.batches] == [4, 2]
+    # Single sentence chunks reuse the sentence embedding, the others are embedded by the vector db
+    assert [chunk.embedding for chunk in chunks] == [None, None, [0.0, 0.0, 1.0], [1.0, 0.0, 0.0]]
+
+    Document.embed_batch(chunks, embedder=embedder)
+    assert embedder.batches[-1] == ["The cat sleeps. A cat purrs!", "The rocket launched. Did the rocket land?"]
+
+
+def test_semantic_chunking_respects_chunk_size():
+    content = "The cat sleeps on the mat. " * 20 + "a" * 50
+    chunking = SemanticChunking(embedder=TopicEmbedder(), chunk_size=40, count_characters=True)
+    chunks = chunking.chunk(Document(content=content))
+
+    assert all(len(chunk.content) <= 40 for chunk in chunks)
+    assert all(chunk.embedding is None for chunk in chunks)
+    assert "".join(chunk.content for chunk in chunks).replace(" ", "") == content.replace(" ", "")
+
+
+def test_semantic_chunking_counts_tokens_by_default():
+    from agno.utils.tokens import get_tiktoken_tokenizer
+
+    assert SemanticChunking(embedder=TopicEmbedder()).tokenizer is get_tiktoken_tokenizer()
+    assert SemanticChunking(embedder=TopicEmbedder(), count_characters=True).tokenizer is None
+
+
+def test_semantic_chunking_counts_tokens_with_a_tokenizer():
+    def count_words(text: str) -> int:
+        return len(text.split())
+
+    content = "The cat sleeps on the mat. " * 6 + "The cat " + "purrs " * 12
+    chunking = SemanticChunking(embedder=TopicEmbedder(), chunk_size=12, tokenizer=count_words)
+    chunks = chunking.chunk(Document(content=content))
+
+    # Sentences are grouped up to 12 words, and the sentence longer than a chunk is split
+    assert [count_words(chunk.content) for chunk in chunks[:3]] == [12, 12, 12]
+    assert len(chunks) == 5
+    assert all(count_words(chunk.content) <= 12 for chunk in chunks)
+    assert "".join(chunk.content for chunk in chunks).replace(" ", "") == content.replace(" ", "")
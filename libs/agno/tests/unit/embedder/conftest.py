@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.embedder.base import Embedder, split_usage
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that records every batch it is asked to embed"""
+
+    dimensions: int = 3
+
+    def __post_init__(self):
+        self.batches: List[List[str]] = []
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text))] * self.dimensions
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batches.append(texts)
+        return [self.get_embedding(text) for text in texts], split_usage({"total_tokens": len(texts)}, texts)
+
+
+@pytest.fixture
+def counting_embedder():
+    """Create embedders that record every batch they are asked to embed"""
+    return CountingEmbedder
@@ -0,0 +1,74 @@
+from typing import List
+
+import pytest
+
+from agno.embedder.cached import CachedEmbedder
+
+
+def test_cached_embedder_hits_skip_wrapped_embedder(counting_embedder):
+    wrapped = counting_embedder(batch_size=10)
+    embedder = CachedEmbedder(embedder=wrapped)
+
+    first = embedder.get_embeddings_batch(["a", "bb", "a"])
+    second = embedder.get_embeddings_batch(["bb", "ccc"])
+
+    # Duplicates within a batch and texts seen before are not embedded again
+    assert wrapped.batches == [["a", "bb"], ["ccc"]]
+    assert first == [[1.0] * 3, [2.0] * 3, [1.0] * 3]
+    assert second == [[2.0] * 3, [3.0] * 3]
+    assert embedder.stats["hits"] == 2
+    assert embedder.stats["misses"] == 3
+
+
+def test_cached_embedder_query_embedding_is_cached(counting_embedder):
+    wrapped = counting_embedder()
+    embedder = CachedEmbedder(embedder=wrapped)
+    calls: List[str] = []
+    original = wrapped.get_embedding_and_usage
+
+    def counting_get_embedding_and_usage(text):
+        calls.append(text)
+        return original(text)
+
+    wrapped.get_embedding_and_usage = counting_get_embedding_and_usage  # type: ignore
+
+    assert embedder.get_embedding("query") == [5.0] * 3
+    assert embedder.get_embedding("query") == [5.0] * 3
+    assert calls == ["query"]
+    assert embedder.dimensions == wrapped.dimensions
+
+
+def test_cached_embedder_lru_eviction(counting_embedder):
+    wrapped = counting_embedder()
+    embedder = CachedEmbedder(embedder=wrapped, max_size=2)
+
+    embedder.get_embeddings_batch(["a", "bb", "ccc"])
+
+    assert embedder.stats["size"] == 2
+    embedder.get_embeddings_batch(["a"])
+    assert wrapped.batches[-1] == ["a"]
+
+
+def test_cached_embedder_persists_to_sqlite(counting_embedder, tmp_path):
+    db_file = tmp_path / "embeddings.db"
+    embedder = CachedEmbedder(embedder=counting_embedder(), db_file=db_file)
+    embedder.get_embeddings_batch(["a", "bb"])
+
+    wrapped = counting_embedder()
+    reloaded = CachedEmbedder(embedder=wrapped, db_file=db_file)
+
+    assert reloaded.get_embeddings_batch(["a", "bb"]) == [[1.0] * 3, [2.0] * 3]
+    assert wrapped.batches == []
+    assert reloaded.stats["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_embedder_async_batch(counting_embedder):
+    wrapped = counting_embedder(batch_size=10)
+    embedder = CachedEmbedder(embedder=wrapped)
+
+    await embedder.async_get_embeddings_batch(["a", "bb"])
+    embeddings = await embedder.async_get_embeddings_batch(["bb", "a"])
+
+    assert embeddings == [[2.0] * 3, [1.0] * 3]
+    assert wrapped.batches == [["a", "bb"]]
@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import split_usage
+
+
+def test_get_embeddings_batch_respects_batch_size(counting_embedder):
+    embedder = counting_embedder(batch_size=2)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    embeddings = embedder.get_embeddings_batch(texts)
+
+    assert embedder.batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_async_get_embeddings_batch_preserves_order(counting_embedder):
+    embedder = counting_embedder(batch_size=2, max_concurrency=2)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    embeddings = await embedder.async_get_embeddings_batch(texts)
+
+    assert len(embedder.batches) == 3
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_document_embed_batch(counting_embedder):
+    embedder = counting_embedder(batch_size=10)
+    documents = [Document(content="one"), Document(content="three")]
+
+    Document.embed_batch(documents, embedder=embedder)
+
+    assert len(embedder.batches) == 1
+    assert documents[0].embedding == [3.0, 3.0, 3.0]
+    assert documents[1].embedding == [5.0, 5.0, 5.0]
+
+
+def test_document_embed_batch_skips_only_current_embeddings(counting_embedder):
+    embedder = counting_embedder(batch_size=10)
+    other_embedder = counting_embedder(batch_size=10)
+    embedded, changed, provided = Document(content="one"), Document(content="two"), Document(content="six")
+    Document.embed_batch([embedded, changed], embedder=embedder)
+    changed.content = "three"
+    provided.embedding = [0.0]
+
+    Document.embed_batch([embedded, changed, provided], embedder=embedder)
+
+    # The embedding of a changed document and an embedding from elsewhere are recomputed
+    assert embedder.batches[-1] == ["three", "six"]
+    assert changed.embedding == [5.0, 5.0, 5.0]
+
+    Document.embed_batch([embedded], embedder=other_embedder)
+    assert other_embedder.batches == [["one"]]
+
+
+def test_openai_embedder_batches_requests():
+    from agno.embedder.openai import OpenAIEmbedder
+
+    mock_client = MagicMock()
+    mock_client.embeddings.create.side_effect = lambda **kwargs: MagicMock(
+        data=[
+            MagicMock(index=i, embedding=[float(i)] * 2)
+            # Return the data out of order to check it is sorted by index
+            for i in reversed(range(len(kwargs["input"])))
+        ]
+    )
+    embedder = OpenAIEmbedder(openai_client=mock_client, batch_size=3)
+
+    embeddings = embedder.get_embeddings_batch(["a", "b", "c", "d"])
+
+    assert mock_client.embeddings.create.call_count == 2
+    assert mock_client.embeddings.create.call_args_list[0].kwargs["input"] == ["a", "b", "c"]
+    assert embeddings == [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [0.0, 0.0]]
+
+
+def test_document_embed_batch_sets_usage(counting_embedder):
+    embedder = counting_embedder(batch_size=2)
+    documents = [Document(content="one"), Document(content="two"), Document(content="three")]
+
+    Document.embed_batch(documents, embedder=embedder)
+
+    # Each document gets its share of the usage of the request that embedded it
+    assert [document.usage for document in documents] == [{"total_tokens": 1}, {"total_tokens": 1}, {"total_tokens": 1}]
+
+
+def test_split_usage_adds_up_to_the_request_usage():
+    usages = split_usage({"prompt_tokens": 10, "total_tokens": 10, "model": "m"}, ["a", "bb", "cccc", ""])
+
+    assert [usage["prompt_tokens"] for usage in usages] == [1, 3, 6, 0]
+    assert sum(usage["total_tokens"] for usage in usages) == 10
+    assert all(usage["model"] == "m" for usage in usages)
+    assert split_usage(None, ["a", "b"]) == [None, None]
+
+
+def test_openai_embedder_batch_errors_propagate():
+    from agno.embedder.openai import OpenAIEmbedder
+
+    mock_client = MagicMock()
+    mock_client.embeddings.create.side_effect = RuntimeError("rate limited")
+    embedder = OpenAIEmbedder(openai_client=mock_client)
+    documents = [Document(content="one")]
+
+    with pytest.raises(RuntimeError):
+        Document.embed_batch(documents, embedder=embedder)
+    assert documents[0].embedding is None
@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+from agno.vectordb.base import VectorDb
+
+
+@pytest.fixture
+def documents():
+    return [
+        Document(content="Tom Kha Gai is a Thai coconut soup with chicken"),
+        Document(content="Pad Thai is a stir-fried rice noodle dish"),
+        Document(content="Pad Thai is a stir-fried rice noodle dish"),
+        Document(content="Green curry is a spicy Thai curry with coconut milk"),
+    ]
+
+
+@pytest.fixture
+def vector_db():
+    db = MagicMock(spec=VectorDb)
+    db.upsert_available.return_value = False
+    db.async_insert = AsyncMock()
+    return db
+
+
+def test_content_hash_is_cached_and_follows_content():
+    doc = Document(content="hello\x00world")
+    content_hash = doc.content_hash
+    assert content_hash == doc.content_hash
+    assert content_hash == Document(content="hello�world").content_hash
+
+    doc.content = "changed"
+    assert doc.content_hash != content_hash
+
+
+def test_filter_existing_documents_uses_bulk_lookup(vector_db, documents):
+    vector_db.existing_content_hashes.return_value = {documents[0].content_hash}
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    filtered = knowledge.filter_existing_documents(documents)
+
+    # Existing documents and duplicates within the list are both dropped
+    assert filtered == [documents[1], documents[3]]
+    vector_db.existing_content_hashes.assert_called_once_with([doc.content_hash for doc in documents])
+    vector_db.doc_exists.assert_not_called()
+
+
+def test_filter_existing_documents_falls_back_to_doc_exists(vector_db, documents):
+    vector_db.existing_content_hashes.side_effect = NotImplementedError
+    vector_db.doc_exists.side_effect = lambda doc: doc.content_hash == documents[3].content_hash
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    assert knowledge.filter_existing_documents(documents) == [documents[0], documents[1]]
+
+
+def test_load_documents_skips_existing(vector_db, documents):
+    vector_db.existing_content_hashes.return_value = {documents[1].content_hash}
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    knowledge.load_documents(documents)
+
+    vector_db.insert.assert_called_once_with(documents=[documents[0], documents[3]], filters=None)
+
+
+@pytest.mark.asyncio
+async def test_async_load_documents_skips_existing(vector_db, documents):
+    vector_db.async_existing_content_hashes = AsyncMock(return_value={documents[0].content_hash})
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    await knowledge.async_load_documents(documents)
+
+    vector_db.async_existing_content_hashes.assert_awaited_once()
+    vector_db.async_doc_exists.assert_not_called()
+    vector_db.async_insert.assert_awaited_once_with(documents=[documents[1], documents[3]], filters=None)
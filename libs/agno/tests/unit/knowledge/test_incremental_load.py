@@ -0,0 +1,150 @@
+import os
+from typing import Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.document.reader.text_reader import TextReader
+from agno.knowledge.manifest import KnowledgeManifest
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.base import VectorDb
+
+
+@pytest.fixture
+def vector_db():
+    """A mock vector db keeping the inserted documents by content hash"""
+    store: Dict[str, Document] = {}
+    db = MagicMock(spec=VectorDb)
+    db.store = store
+    db.upsert_available.return_value = False
+    db.exists.return_value = True
+    db.existing_content_hashes.side_effect = lambda hashes: {h for h in hashes if h in store}
+    db.insert.side_effect = lambda documents, filters=None: store.update({d.content_hash: d for d in documents})
+
+    def delete_by_content_hashes(hashes):
+        for content_hash in hashes:
+            store.pop(content_hash, None)
+        return True
+
+    db.delete_by_content_hashes.side_effect = delete_by_content_hashes
+    return db
+
+
+@pytest.fixture
+def text_dir(tmp_path):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    for i in range(3):
+        (docs_dir / f"doc_{i}.txt").write_text(f"Document number {i} talks about Thai food")
+    return docs_dir
+
+
+@pytest.fixture
+def knowledge(text_dir, vector_db, tmp_path):
+    return TextKnowledgeBase(
+        path=text_dir,
+        vector_db=vector_db,
+        reader=TextReader(chunk=False),
+        manifest_path=tmp_path / "manifest.json",
+    )
+
+
+def test_incremental_load_skips_unchanged_files(knowledge, vector_db, tmp_path):
+    knowledge.load(incremental=True)
+    assert len(vector_db.store) == 3
+    ids = {d.content_hash: d.id for d in vector_db.store.values()}
+
+    manifest = KnowledgeManifest.read(tmp_path / "manifest.json")
+    assert len(manifest.files) == 3
+    assert all(len(entry.chunk_ids) == 1 for entry in manifest.files.values())
+
+    vector_db.insert.reset_mock()
+    knowledge.reader.read = MagicMock(wraps=knowledge.reader.read)
+    knowledge.load(incremental=True)
+
+    knowledge.reader.read.assert_not_called()
+    vector_db.insert.assert_not_called()
+    assert {d.content_hash: d.id for d in vector_db.store.values()} == ids
+
+
+def test_incremental_load_gives_stable_ids(knowledge, vector_db, tmp_path):
+    knowledge.load(incremental=True)
+    ids = sorted(d.id for d in vector_db.store.values())
+
+    # Reload from scratch: unchanged content gets the same ids
+    vector_db.store.clear()
+    knowledge.load(recreate=True, incremental=True)
+
+    assert sorted(d.id for d in vector_db.store.values()) == ids
+
+
+def test_incremental_load_reindexes_changed_files(knowledge, vector_db, text_dir):
+    knowledge.load(incremental=True)
+    old_hash = Document(content=(text_dir / "doc_1.txt").read_text()).content_hash
+
+    (text_dir / "doc_1.txt").write_text("Document number 1 now talks about green curry")
+    knowledge.load(incremental=True)
+
+    assert len(vector_db.store) == 3
+    assert old_hash not in vector_db.store
+    assert any("green curry" in d.content for d in vector_db.store.values())
+
+
+def test_incremental_load_ignores_touched_files(knowledge, vector_db, text_dir):
+    knowledge.load(incremental=True)
+
+    stat = (text_dir / "doc_0.txt").stat()
+    os.utime(text_dir / "doc_0.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    knowledge.reader.read = MagicMock(wraps=knowledge.reader.read)
+    knowledge.load(incremental=True)
+
+    knowledge.reader.read.assert_not_called()
+
+
+def test_incremental_load_deletes_removed_files(knowledge, vector_db, text_dir, tmp_path):
+    knowledge.load(incremental=True)
+    removed_hash = Document(content=(text_dir / "doc_2.txt").read_text()).content_hash
+
+    (text_dir / "doc_2.txt").unlink()
+    knowledge.load(incremental=True)
+
+    assert len(vector_db.store) == 2
+    assert removed_hash not in vector_db.store
+    assert len(KnowledgeManifest.read(tmp_path / "manifest.json").files) == 2
+
+
+def test_incremental_load_keeps_documents_shared_with_other_files(knowledge, vector_db, text_dir):
+    (text_dir / "copy_of_doc_0.txt").write_text((text_dir / "doc_0.txt").read_text())
+    knowledge.load(incremental=True)
+    shared_hash = Document(content=(text_dir / "doc_0.txt").read_text()).content_hash
+    assert len(vector_db.store) == 3
+
+    # The copy still contains the content, so its document is kept
+    (text_dir / "doc_0.txt").unlink()
+    knowledge.load(incremental=True)
+    assert shared_hash in vector_db.store
+
+    (text_dir / "copy_of_doc_0.txt").write_text("The copy now talks about pad thai")
+    knowledge.load(incremental=True)
+    assert shared_hash not in vector_db.store
+    assert len(vector_db.store) == 3
+
+
+def test_incremental_load_keeps_documents_moved_between_files(knowledge, vector_db, text_dir):
+    knowledge.load(incremental=True)
+    moved_hash = Document(content=(text_dir / "doc_1.txt").read_text()).content_hash
+
+    # doc_2 takes the content of doc_1, which changes
+    (text_dir / "doc_2.txt").write_text((text_dir / "doc_1.txt").read_text())
+    (text_dir / "doc_1.txt").write_text("Document number 1 now talks about green curry")
+    knowledge.load(incremental=True)
+
+    assert moved_hash in vector_db.store
+    assert len(vector_db.store) == 3
+
+
+def test_incremental_load_requires_manifest_path(knowledge):
+    knowledge.manifest_path = None
+    with pytest.raises(ValueError):
+        knowledge.load(incremental=True)
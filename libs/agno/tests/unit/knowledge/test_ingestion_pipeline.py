@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.reader.text_reader import TextReader
+from agno.embedder.base import Embedder
+from agno.knowledge.pipeline import IngestionPipeline
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.base import VectorDb
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that records every text it is asked to embed"""
+
+    dimensions: int = 3
+
+    def __post_init__(self):
+        self.texts: List[str] = []
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text))] * self.dimensions
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.texts.extend(texts)
+        return [self.get_embedding(text) for text in texts], [{"total_tokens": len(texts)}] * len(texts)
+
+
+@pytest.fixture
+def text_dir(tmp_path):
+    for i in range(5):
+        (tmp_path / f"doc_{i}.txt").write_text(f"Document number {i} talks about Thai food and coconut soup")
+    return tmp_path
+
+
+@pytest.fixture
+def vector_db():
+    db = MagicMock(spec=VectorDb)
+    db.embedder = CountingEmbedder()
+    db.upsert_available.return_value = False
+    db.exists.return_value = True
+    db.async_exists = AsyncMock(return_value=True)
+    db.existing_content_hashes.return_value = set()
+    db.async_existing_content_hashes = AsyncMock(return_value=set())
+    return db
+
+
+def make_knowledge(text_dir, vector_db, **pipeline_kwargs) -> TextKnowledgeBase:
+    return TextKnowledgeBase(
+        path=text_dir,
+        vector_db=vector_db,
+        reader=TextReader(chunking_strategy=FixedSizeChunking(chunk_size=20)),
+        pipeline=IngestionPipeline(**pipeline_kwargs),
+    )
+
+
+def inserted_documents(vector_db) -> List:
+    return [doc for call in vector_db.insert.call_args_list for doc in call.kwargs["documents"]]
+
+
+def test_load_streams_documents_through_pipeline(text_dir, vector_db):
+    knowledge = make_knowledge(text_dir, vector_db, queue_size=1, num_embedders=2, num_writers=2)
+
+    knowledge.load()
+
+    documents = inserted_documents(vector_db)
+    # Every source is inserted separately, chunked and embedded before reaching the vector db
+    assert vector_db.insert.call_count == 5
+    assert all(len(doc.content) <= 20 for doc in documents)
+    assert all(doc.embedding is not None for doc in documents)
+    assert sorted(vector_db.embedder.texts) == sorted(doc.content for doc in documents)
+    # Chunking is handed back to the reader once the pipeline is done
+    assert knowledge.reader.chunk is True
+
+    stats = knowledge.pipeline.stats
+    assert stats["read"].count == 5
+    assert stats["chunk"].count == stats["embed"].count == stats["write"].count == len(documents)
+    assert stats["chunk"].rate > 0
+
+
+def test_load_chunks_in_process_pool(text_dir, vector_db):
+    knowledge = make_knowledge(text_dir, vector_db, num_chunkers=2, chunk_in_processes=True)
+
+    knowledge.load()
+
+    documents = inserted_documents(vector_db)
+    assert len(documents) == knowledge.pipeline.stats["chunk"].count
+    assert all(len(doc.content) <= 20 for doc in documents)
+
+
+def test_load_skips_existing_documents(text_dir, vector_db):
+    vector_db.existing_content_hashes.side_effect = lambda hashes: {h for h in hashes if h == hashes[0]}
+    knowledge = make_knowledge(text_dir, vector_db)
+
+    knowledge.load()
+
+    assert knowledge.pipeline.stats["embed"].count == knowledge.pipeline.stats["chunk"].count - 5
+    assert len(inserted_documents(vector_db)) == knowledge.pipeline.stats["embed"].count
+
+
+def test_load_raises_stage_errors(text_dir, vector_db):
+    vector_db.insert.side_effect = RuntimeError("database unavailable")
+    knowledge = make_knowledge(text_dir, vector_db, queue_size=1)
+
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        knowledge.load()
+    # The reader chunks its documents again after a failed run
+    assert knowledge.reader.chunk is True
+
+
+@pytest.mark.asyncio
+async def test_aload_streams_documents_through_pipeline(text_dir, vector_db):
+    knowledge = make_knowledge(text_dir, vector_db, queue_size=1, num_embedders=3)
+
+    await knowledge.aload()
+
+    documents = [doc for call in vector_db.async_insert.call_args_list for doc in call.kwargs["documents"]]
+    assert vector_db.async_insert.await_count == 5
+    assert all(doc.embedding is not None for doc in documents)
+    assert knowledge.pipeline.stats["write"].count == len(documents)
+    assert knowledge.reader.chunk is True
+
+
+@pytest.mark.asyncio
+async def test_aload_raises_stage_errors(text_dir, vector_db):
+    vector_db.async_insert.side_effect = RuntimeError("database unavailable")
+    knowledge = make_knowledge(text_dir, vector_db, queue_size=1)
+
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        await knowledge.aload()
+    assert knowledge.reader.chunk is True
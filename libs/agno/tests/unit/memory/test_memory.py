@@ -1,8 +1,10 @@
 from datetime import datetime
+from typing import List
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from agno.embedder.base import Embedder
 from agno.memory.v2 import MemoryManager, SessionSummarizer
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.memory import Memory
@@ -709,6 +711,170 @@ def test_create_user_memories(memory_with_managers, mock_db):
     assert any(m.memory == "New memory 2" for m in memories)
 
 
+def test_user_memories_are_cached_until_db_changes(tmp_path):
+    from agno.memory.v2.db.sqlite import SqliteMemoryDb
+
+    db = SqliteMemoryDb(table_name="memories", db_file=str(tmp_path / "memory.db"))
+    db.create()
+    memory = Memory(db=db)
+    other_memory = Memory(db=db)
+    memory.add_user_memory(UserMemory(memory="The user likes tea"), user_id="test_user")
+
+    with patch.object(
+        SqliteMemoryDb, "read_memories", autospec=True, side_effect=SqliteMemoryDb.read_memories
+    ) as read_memories:
+        # Reads are served from the cache, and writes go through it
+        assert [m.memory for m in memory.get_user_memories(user_id="test_user")] == ["The user likes tea"]
+        memory_id = memory.add_user_memory(UserMemory(memory="The user lives in Paris"), user_id="test_user")
+        assert len(memory.search_user_memories(user_id="test_user")) == 2
+        memory.delete_user_memory(memory_id=memory_id, user_id="test_user")
+        assert len(memory.get_user_memories(user_id="test_user")) == 1
+        assert read_memories.call_count == 0
+
+        # A memory added by another instance changes the version in the db, so the memories are read again
+        other_memory.add_user_memory(UserMemory(memory="The user has a cat"), user_id="test_user")
+        read_memories.reset_mock()
+        assert len(memory.get_user_memories(user_id="test_user")) == 2
+        assert read_memories.call_count == 1
+
+
+def test_user_memories_cache_sees_replaced_memory_within_a_second(tmp_path):
+    from agno.memory.v2.db.sqlite import SqliteMemoryDb
+
+    db = SqliteMemoryDb(table_name="memories", db_file=str(tmp_path / "memory.db"))
+    db.create()
+    memory = Memory(db=db)
+    other_memory = Memory(db=db)
+    memory_id = memory.add_user_memory(UserMemory(memory="The user likes tea"), user_id="test_user")
+    assert [m.memory for m in memory.get_user_memories(user_id="test_user")] == ["The user likes tea"]
+
+    # Replacing the memory keeps the number of memories, only the update time changes the version
+    other_memory.replace_user_memory(memory_id, UserMemory(memory="The user likes coffee"), user_id="test_user")
+    assert [m.memory for m in memory.get_user_memories(user_id="test_user")] == ["The user likes coffee"]
+
+
+def test_user_memories_cache_ttl(mock_db):
+    mock_db.get_memories_version.return_value = (0, None)
+    memory = Memory(db=mock_db, cache_ttl=60)
+
+    memory.get_user_memories(user_id="test_user")
+    memory.get_user_memories(user_id="test_user")
+    memory.get_user_memory(memory_id="missing", user_id="test_user")
+
+    # Within the TTL the cached memories are used without checking the db
+    assert mock_db.read_memories.call_count == 1
+    assert mock_db.get_memories_version.call_count == 1
+
+
+class KeywordEmbedder(Embedder):
+    """Embeds a text as the counts of a few keywords, so similarity is predictable"""
+
+    keywords = ["tea", "coffee", "paris", "cat", "dog"]
+
+    def get_embedding(self, text: str) -> List[float]:
+        words = text.lower().replace(".", "").split()
+        return [float(words.count(keyword)) for keyword in self.keywords]
+
+
+def test_search_user_memories_semantic():
+    embedder = KeywordEmbedder(dimensions=5)
+    memory = Memory(embedder=embedder)
+    for text in ["The user likes tea", "The user lives in Paris", "The user has a cat", "The user drinks coffee"]:
+        memory.add_user_memory(UserMemory(memory=text), user_id="test_user")
+
+    with patch.object(
+        KeywordEmbedder, "get_embedding", autospec=True, side_effect=KeywordEmbedder.get_embedding
+    ) as get_embedding:
+        results = memory.search_user_memories(
+            query="Does the user own a cat or a dog?", retrieval_method="semantic", limit=1, user_id="test_user"
+        )
+        assert [m.memory for m in results] == ["The user has a cat"]
+        # Memories are embedded when they are written, so only the query is embedded when searching
+        assert get_embedding.call_count == 1
+
+    # Deleted memories are not returned
+    memory.delete_user_memory(memory_id=results[0].memory_id, user_id="test_user")
+    results = memory.search_user_memories(query="cat", retrieval_method="semantic", user_id="test_user")
+    assert "The user has a cat" not in [m.memory for m in results]
+    assert len(results) == 3
+
+    with pytest.raises(ValueError):
+        memory.search_user_memories(retrieval_method="semantic", user_id="test_user")
+
+
+def test_memory_index_keys_vector_db_documents_by_memory_id():
+    from agno.memory.v2.index import MemoryIndex
+    from agno.vectordb.base import VectorDb
+
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.upsert_available.return_value = True
+    stored_ids = set()
+    vector_db.upsert.side_effect = lambda documents, filters: stored_ids.update(d.id for d in documents)
+    vector_db.existing_content_hashes.side_effect = lambda hashes: set(hashes) if stored_ids else set()
+    vector_db.id_exists.side_effect = lambda id: id in stored_ids
+    index = MemoryIndex(vector_db=vector_db)
+
+    # Identical memories of different users are both stored
+    index.sync(user_id="user-a", memories={"memory-a": UserMemory(memory="The user likes tea")})
+    index.sync(user_id="user-b", memories={"memory-b": UserMemory(memory="The user likes tea")})
+    stored = [call.kwargs["documents"][0] for call in vector_db.upsert.call_args_list]
+    assert [(d.id, d.meta_data["user_id"]) for d in stored] == [("memory-a", "user-a"), ("memory-b", "user-b")]
+
+    # Deleted memories are removed from the vector db
+    index.sync(user_id="user-a", memories={})
+    vector_db.delete_by_ids.assert_called_once_with(["memory-a"])
+
+
+def test_memory_index_skips_memories_stored_by_an_earlier_process():
+    from agno.document import Document
+    from agno.memory.v2.index import MemoryIndex
+    from agno.vectordb.base import VectorDb
+
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.upsert_available.return_value = True
+    vector_db.existing_content_hashes.return_value = {Document(content="The user likes tea").content_hash}
+    vector_db.id_exists.side_effect = lambda id: id in {"memory-a", "memory-b"}
+    index = MemoryIndex(vector_db=vector_db)
+
+    index.sync(
+        user_id="user-a",
+        memories={
+            "memory-a": UserMemory(memory="The user likes tea"),
+            # Stored with an older text
+            "memory-b": UserMemory(memory="The user likes coffee"),
+            "memory-c": UserMemory(memory="The user likes tea"),
+        },
+    )
+    assert [d.id for d in vector_db.upsert.call_args.kwargs["documents"]] == ["memory-b", "memory-c"]
+
+    # Stored memories are searched without embedding them again
+    vector_db.search.return_value = [
+        Document(content="The user likes tea", meta_data={"user_id": "user-a", "memory_id": "memory-a"})
+    ]
+    assert index.search(user_id="user-a", query="tea") == ["memory-a"]
+
+
+def test_search_user_memories_agentic_with_candidates(mock_model):
+    memory = Memory(model=mock_model, embedder=KeywordEmbedder(dimensions=5), agentic_search_candidates=2)
+    memory_ids = [
+        memory.add_user_memory(UserMemory(memory=text), user_id="test_user")
+        for text in ["The user likes tea", "The user drinks coffee", "The user lives in Paris", "The user has a dog"]
+    ]
+    mock_model.response.return_value = MagicMock(content=f'{{"memory_ids": ["{memory_ids[1]}"]}}', parsed=None)
+
+    results = memory.search_user_memories(
+        query="What does the user drink, tea or coffee?", retrieval_method="agentic", user_id="test_user"
+    )
+
+    assert [m.memory for m in results] == ["The user drinks coffee"]
+    # Only the memories most similar to the query are put in the prompt
+    system_message = mock_model.response.call_args.kwargs["messages"][0].content
+    assert "The user likes tea" in system_message
+    assert "The user drinks coffee" in system_message
+    assert "Paris" not in system_message
+    assert "dog" not in system_message
+
+
 def test_to_dict_and_from_dict(memory_with_model, sample_user_memory, sample_session_summary):
     # Setup memory with user memories and summaries
     user_id = "test_user"
@@ -17,11 +17,13 @@ def mock_redis_client():
 
         # Create an in-memory store to simulate Redis
         mock_data: Dict[str, str] = {}
+        mock_sorted_sets: Dict[str, Dict[str, float]] = {}
 
         # Mock Redis client methods
         client.get.side_effect = lambda key: mock_data.get(key)
         client.set.side_effect = lambda key, value: mock_data.update({key: value})
-        client.exists.side_effect = lambda key: key in mock_data
+        client.mget.side_effect = lambda keys: [mock_data.get(key) for key in keys]
+        client.exists.side_effect = lambda key: key in mock_data or key in mock_sorted_sets
 
         # Make delete actually work correctly
         def mock_delete(*keys):
@@ -30,10 +32,34 @@ def mock_redis_client():
                 if key in mock_data:
                     del mock_data[key]
                     deleted += 1
+                elif key in mock_sorted_sets:
+                    del mock_sorted_sets[key]
+                    deleted += 1
             return deleted
 
         client.delete.side_effect = mock_delete
         client.ping.return_value = True
+        client.incr.side_effect = lambda key: mock_data.update({key: str(int(mock_data.get(key, 0)) + 1)})
+
+        # Mock sorted sets used as indexes
+        def mock_zadd(key, mapping):
+            mock_sorted_sets.setdefault(key, {}).update(mapping)
+
+        def mock_zrem(key, *members):
+            for member in members:
+                mock_sorted_sets.get(key, {}).pop(member, None)
+
+        def mock_zrange(key, start, end, desc=False):
+            members = sorted(mock_sorted_sets.get(key, {}).items(), key=lambda item: (item[1], item[0]), reverse=desc)
+            return [member for member, _ in members[start : None if end == -1 else end + 1]]
+
+        client.zadd.side_effect = mock_zadd
+        client.zrem.side_effect = mock_zrem
+        client.zrange.side_effect = mock_zrange
+
+        # Pipelined commands are applied to the in-memory store directly
+        client.pipeline.return_value = client
+        client.execute.return_value = []
 
         # Mock scan_iter to return keys
         client.scan_iter.side_effect = lambda match, count=None: [
@@ -141,6 +167,25 @@ def test_read_memories(memory_db, mock_redis_client):
     assert sorted_asc[0].id == "1"  # Oldest first
 
 
+def test_read_memories_uses_indexes(memory_db, mock_redis_client):
+    """Test memories are read from the indexes without scanning the keyspace."""
+    with patch("time.time", side_effect=[1000, 2000, 3000]):
+        for i, user_id in enumerate(["user1", "user1", "user2"]):
+            memory_db.upsert_memory(MemoryRow(id=str(i), user_id=user_id, memory={"text": f"Memory {i}"}))
+    memory_db.read_memories()
+
+    mock_redis_client.scan_iter.reset_mock()
+    mock_redis_client.get.reset_mock()
+    assert [m.id for m in memory_db.read_memories(user_id="user1")] == ["1", "0"]
+    assert [m.id for m in memory_db.read_memories(limit=2, sort="asc")] == ["0", "1"]
+    mock_redis_client.scan_iter.assert_not_called()
+    mock_redis_client.get.assert_not_called()
+
+    memory_db.delete_memory("1")
+    assert [m.id for m in memory_db.read_memories(user_id="user1")] == ["0"]
+    assert [m.id for m in memory_db.read_memories()] == ["2", "0"]
+
+
 def test_delete_memory(memory_db, mock_redis_client):
     """Test deleting a memory."""
     # Set up test data
@@ -161,6 +206,34 @@ def test_delete_memory(memory_db, mock_redis_client):
     memory_db.delete_memory("does-not-exist")
 
 
+def test_memories_version_changes_on_every_write(memory_db, mock_redis_client):
+    """Test the revision of the user is incremented by writes within the same second."""
+
+    def get_memories_version():
+        # Pipelined commands are applied directly, so return the results of the queued reads from execute
+        revision = mock_redis_client.get(memory_db._get_revision_key("user-1"))
+        mock_redis_client.execute.return_value = [
+            revision,
+            len(mock_redis_client.zrange("test_memory-index:user_id:user-1", 0, -1)),
+        ]
+        return memory_db.get_memories_version(user_id="user-1")
+
+    with patch("agno.memory.v2.db.redis.time.time", return_value=1000):
+        memory_db.upsert_memory(MemoryRow(id="memory-1", user_id="user-1", memory={"memory": "The user likes tea"}))
+        first = get_memories_version()
+        memory_db.upsert_memory(MemoryRow(id="memory-1", user_id="user-1", memory={"memory": "The user likes coffee"}))
+        second = get_memories_version()
+        memory_db.delete_memory("memory-1")
+        third = get_memories_version()
+
+    assert first == (1, 1)
+    assert second == (2, 1)
+    assert third == (3, 0)
+    # Clearing the memories keeps the revisions, so they are never repeated
+    memory_db.clear()
+    assert mock_redis_client.get(memory_db._get_revision_key("user-1")) == "3"
+
+
 def test_drop_table(memory_db, mock_redis_client):
     """Test dropping the table."""
     # Set up test data
@@ -0,0 +1,112 @@
+import threading
+from unittest.mock import Mock
+
+from agno.memory.v2.worker import MemoryWorker
+from agno.models.message import Message
+
+
+def test_worker_coalesces_jobs_per_session():
+    worker = MemoryWorker(max_workers=2)
+    memory = Mock()
+    started = threading.Event()
+    release = threading.Event()
+    created = []
+
+    def create_user_memories(messages, user_id):
+        created.append([m.content for m in messages])
+        started.set()
+        release.wait(timeout=5)
+
+    memory.create_user_memories.side_effect = create_user_memories
+
+    worker.submit_user_memories(memory, [Message(role="user", content="one")], session_id="s1", user_id="u1")
+    assert started.wait(timeout=5)
+    # While the first job runs, the next messages of the session are merged into one waiting job
+    worker.submit_user_memories(memory, [Message(role="user", content="two")], session_id="s1", user_id="u1")
+    worker.submit_user_memories(memory, [Message(role="user", content="three")], session_id="s1", user_id="u1")
+    # Summaries run next to memories, and only the latest waiting request is kept
+    worker.submit_session_summary(memory, session_id="s1", user_id="u1")
+
+    release.set()
+    assert worker.flush(timeout=5)
+    worker.shutdown()
+
+    assert created == [["one"], ["two", "three"]]
+    memory.create_session_summary.assert_called_once_with(session_id="s1", user_id="u1")
+
+
+def test_worker_flush_times_out_and_survives_errors():
+    worker = MemoryWorker(max_workers=1)
+    memory = Mock()
+    release = threading.Event()
+    memory.create_session_summary.side_effect = lambda session_id, user_id: release.wait(timeout=5)
+    memory.create_user_memories.side_effect = ValueError("Model error")
+
+    worker.submit_session_summary(memory, session_id="s1")
+    assert not worker.flush(timeout=0.1)
+    release.set()
+
+    worker.submit_user_memories(memory, [Message(role="user", content="one")], session_id="s2")
+    assert worker.flush(timeout=5)
+    worker.shutdown()
+    memory.create_user_memories.assert_called_once()
+
+
+def test_worker_calls_on_done_after_the_summary_is_created():
+    worker = MemoryWorker(max_workers=1)
+    memory = Mock()
+    calls = []
+    memory.create_session_summary.side_effect = lambda session_id, user_id: calls.append("summary")
+
+    worker.submit_session_summary(memory, session_id="s1", on_done=lambda: calls.append("write"))
+    assert worker.flush(timeout=5)
+    # A failed summary is not written
+    memory.create_session_summary.side_effect = ValueError("Model error")
+    worker.submit_session_summary(memory, session_id="s1", on_done=lambda: calls.append("write"))
+    assert worker.flush(timeout=5)
+    worker.shutdown()
+
+    assert calls == ["summary", "write"]
+
+
+def test_worker_drops_jobs_when_queue_is_full():
+    worker = MemoryWorker(max_workers=1, max_queue_size=2)
+    memory = Mock()
+    release = threading.Event()
+    memory.create_session_summary.side_effect = lambda session_id, user_id: release.wait(timeout=5)
+
+    assert worker.submit_session_summary(memory, session_id="s1")
+    assert worker.submit_session_summary(memory, session_id="s2")
+    assert not worker.submit_session_summary(memory, session_id="s3")
+    # Jobs of sessions already queued are still accepted
+    assert worker.submit_session_summary(memory, session_id="s2")
+    assert worker.dropped == 1
+
+    release.set()
+    assert worker.flush(timeout=5)
+    worker.shutdown()
+    assert [c.kwargs["session_id"] for c in memory.create_session_summary.call_args_list] == ["s1", "s2"]
+
+
+def test_summary_is_written_without_the_agent_state(tmp_path):
+    from datetime import datetime
+
+    from agno.agent import Agent
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.schema import SessionSummary
+    from agno.storage.sqlite import SqliteStorage
+
+    storage = SqliteStorage(table_name="sessions", db_file=str(tmp_path / "sessions.db"))
+    agent = Agent(storage=storage, memory=Memory(), session_state={"count": 1})
+    agent.write_to_storage(session_id="s1", user_id="u1")
+
+    # The next run changes the state while the summary is written
+    agent.session_state["count"] = 2  # type: ignore
+    agent.memory._set_session_summary(  # type: ignore
+        user_id="u1", session_id="s1", summary=SessionSummary(summary="Talked about tea", last_updated=datetime.now())
+    )
+    agent._write_summary_to_storage(session_id="s1", user_id="u1")
+
+    stored = storage.read(session_id="s1")
+    assert stored.memory["summaries"]["u1"]["s1"]["summary"] == "Talked about tea"  # type: ignore
+    assert stored.session_data["session_state"]["count"] == 1  # type: ignore
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from agno.models.openai import OpenAIChat
+from agno.models.openai.like import OpenAILike
+
+
+def test_get_client_is_reused():
+    model = OpenAIChat(api_key="test-key")
+
+    client = model.get_client()
+
+    assert model.get_client() is client
+
+
+def test_get_client_is_recreated_after_close():
+    model = OpenAIChat(api_key="test-key")
+    client = model.get_client()
+
+    model.close()
+
+    assert model.client is None
+    assert model.get_client() is not client
+
+
+def test_openai_like_subclass_reuses_client():
+    model = OpenAILike(id="test-model", base_url="http://localhost:1234/v1")
+
+    assert model.get_client() is model.get_client()
+
+
+@pytest.mark.asyncio
+async def test_get_async_client_is_reused_on_same_loop():
+    model = OpenAIChat(api_key="test-key")
+
+    client = model.get_async_client()
+
+    assert model.get_async_client() is client
+    await model.aclose()
+    assert model.async_client is None
+
+
+def test_get_async_client_is_recreated_on_new_loop():
+    model = OpenAIChat(api_key="test-key")
+
+    async def get_client():
+        client = model.get_async_client()
+        # Let the client of the previous loop close in the background
+        await asyncio.sleep(0)
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+    # The client of the closed loop is closed when it is replaced
+    assert first.is_closed()
+    assert not second.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_user_provided_async_client_is_kept():
+    from openai import AsyncOpenAI
+
+    async_client = AsyncOpenAI(api_key="test-key")
+    model = OpenAIChat(api_key="test-key", async_client=async_client)
+
+    assert model.get_async_client() is async_client
+
+
+def test_deep_copy_creates_own_clients():
+    from copy import deepcopy
+
+    model = OpenAIChat(api_key="test-key")
+    client = model.get_client()
+
+    model_copy = deepcopy(model)
+
+    assert model_copy.client is None
+    assert model_copy.get_client() is not client
+    model_copy.close()
+    assert not client.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_close_leaves_user_provided_clients_open():
+    import httpx
+    from openai import AsyncOpenAI, OpenAI
+
+    http_client = httpx.Client()
+    model = OpenAIChat(api_key="test-key", http_client=http_client)
+    model.get_client()
+    model.close()
+    assert not http_client.is_closed
+
+    client = OpenAI(api_key="test-key")
+    async_client = AsyncOpenAI(api_key="test-key")
+    model = OpenAIChat(api_key="test-key", client=client, async_client=async_client)
+    model.close()
+    await model.aclose()
+    assert not client.is_closed()
+    assert not async_client.is_closed()
+    assert model.get_client() is client
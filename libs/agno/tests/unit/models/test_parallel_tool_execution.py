@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import List
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+def _slow_lookup(query: str) -> str:
+    """Look up a query slowly."""
+    time.sleep(0.2)
+    return f"result for {query} from {threading.current_thread().name}"
+
+
+def _make_function_calls(n: int) -> List[FunctionCall]:
+    function = Function.from_callable(_slow_lookup)
+    return [FunctionCall(function=function, arguments={"query": f"q{i}"}, call_id=f"call_{i}") for i in range(n)]
+
+
+def test_parallel_tool_execution_runs_concurrently_and_keeps_order():
+    model = OpenAIChat(api_key="test-key", parallel_tool_execution=True)
+    function_call_results: List[Message] = []
+
+    start = time.perf_counter()
+    events = list(model.run_function_calls(_make_function_calls(4), function_call_results=function_call_results))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    assert [m.tool_call_id for m in function_call_results] == ["call_0", "call_1", "call_2", "call_3"]
+    assert [m.content.split(" from ")[0] for m in function_call_results] == [
+        "result for q0",
+        "result for q1",
+        "result for q2",
+        "result for q3",
+    ]
+
+    started = [e for e in events if e.event == ModelResponseEvent.tool_call_started.value]
+    completed = [e for e in events if e.event == ModelResponseEvent.tool_call_completed.value]
+    assert len(started) == 4
+    assert [e.tool_executions[0].tool_call_id for e in completed] == ["call_0", "call_1", "call_2", "call_3"]
+
+
+def test_parallel_tool_execution_respects_tool_call_limit():
+    model = OpenAIChat(api_key="test-key", parallel_tool_execution=True)
+    function_call_results: List[Message] = []
+
+    list(
+        model.run_function_calls(
+            _make_function_calls(4), function_call_results=function_call_results, tool_call_limit=2
+        )
+    )
+
+    assert [m.tool_call_id for m in function_call_results] == ["call_0", "call_1"]
+    assert model._tool_choice == "none"
+
+
+def test_parallel_tool_execution_pauses_for_confirmation():
+    model = OpenAIChat(api_key="test-key", parallel_tool_execution=True)
+    function_calls = _make_function_calls(3)
+    confirm_function = Function.from_callable(_slow_lookup)
+    confirm_function.requires_confirmation = True
+    function_calls[1].function = confirm_function
+    function_call_results: List[Message] = []
+
+    events = list(model.run_function_calls(function_calls, function_call_results=function_call_results))
+
+    paused = [e for e in events if e.event == ModelResponseEvent.tool_call_paused.value]
+    assert [e.tool_executions[0].tool_call_id for e in paused] == ["call_1"]
+    assert [m.tool_call_id for m in function_call_results] == ["call_0", "call_2"]
+
+
+def test_sequential_tool_execution_is_default():
+    model = OpenAIChat(api_key="test-key")
+    function_call_results: List[Message] = []
+
+    list(model.run_function_calls(_make_function_calls(2), function_call_results=function_call_results))
+
+    assert all("MainThread" in m.content for m in function_call_results)
@@ -1,3 +1,4 @@
+import gzip
 import io
 import tempfile
 from pathlib import Path
@@ -5,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from agno.document.base import Document
-from agno.document.reader.csv_reader import CSVReader, CSVUrlReader
+from agno.document.reader.csv_reader import CSVReader, CSVStreamReader, CSVUrlReader
 
 # Sample CSV data
 SAMPLE_CSV = """name,age,city
@@ -224,3 +225,36 @@ async def test_async_read_url(csv_url_reader):
 
     assert expected_first_row in documents[0].content
     assert expected_second_row in documents[0].content
+
+
+def test_stream_reader_groups_rows(temp_dir):
+    file_path = temp_dir / "orders.csv.gz"
+    rows = ["region,order,amount"] + [f"{'east' if i < 30 else 'west'},{i},{i * 10}" for i in range(50)]
+    with gzip.open(file_path, "wt", encoding="utf-8") as f:
+        f.write("\n".join(rows))
+
+    reader = CSVStreamReader(metadata_fields=["region"], chunk_size=200)
+    documents = reader.read(file_path)
+
+    assert all(doc.name == "orders" for doc in documents)
+    assert all(doc.content.startswith("region, order, amount\n") for doc in documents)
+    assert all(len(doc.content) <= 200 for doc in documents)
+    # Every row is read once, and a document never mixes regions
+    assert sum(doc.meta_data["rows"] for doc in documents) == 50
+    assert [doc.meta_data["region"] for doc in documents] == sorted(doc.meta_data["region"] for doc in documents)
+    west = [doc for doc in documents if doc.meta_data["region"] == "west"]
+    assert west[0].meta_data["start_row"] == 31
+    assert "west, 30, 300" in west[0].content
+
+
+def test_stream_reader_document_lists():
+    file_obj = io.BytesIO("\n".join(["id,name"] + [f"{i},row {i}" for i in range(10)]).encode())
+    file_obj.name = "rows.csv"
+
+    reader = CSVStreamReader(max_records_per_document=3, batch_size=2)
+    document_lists = list(reader.iter_document_lists(file_obj))
+
+    assert [len(documents) for documents in document_lists] == [2, 2]
+    assert [doc.meta_data["rows"] for documents in document_lists for doc in documents] == [3, 3, 3, 1]
+    # The file of the caller is left open
+    assert not file_obj.closed
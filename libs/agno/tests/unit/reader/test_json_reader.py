@@ -1,11 +1,12 @@
+import gzip
 import json
-from io import BytesIO
+from io import BytesIO, StringIO
 from pathlib import Path
 
 import pytest
 
 from agno.document.base import Document
-from agno.document.reader.json_reader import JSONReader
+from agno.document.reader.json_reader import JSONReader, JSONStreamReader, iter_json_values
 
 
 @pytest.fixture
@@ -265,3 +266,47 @@ async def test_async_large_json():
 
     assert len(documents) == 1000
     assert all(doc.name == "large" for doc in documents)
+
+
+def test_iter_json_values():
+    records = [{"id": i, "text": "x" * i, "score": i / 3} for i in range(100)]
+
+    # Small read sizes split values, including numbers, across reads
+    assert list(iter_json_values(StringIO(json.dumps(records)), read_size=7)) == records
+    ndjson = "\n".join(json.dumps(record) for record in records) + "\n"
+    assert list(iter_json_values(StringIO(ndjson), read_size=7)) == records
+    assert list(iter_json_values(StringIO("12345"), read_size=2)) == [12345]
+    with pytest.raises(ValueError):
+        list(iter_json_values(StringIO('{"id": 1'), read_size=4))
+
+
+def test_stream_reader_ndjson_gzip(tmp_path):
+    json_path = tmp_path / "events.jsonl.gz"
+    records = [{"type": "click" if i % 2 else "view", "id": i} for i in range(20)]
+    with gzip.open(json_path, "wt", encoding="utf-8") as f:
+        f.write("\n".join(json.dumps(record) for record in sorted(records, key=lambda r: r["type"])))
+
+    reader = JSONStreamReader(metadata_fields=["type"], max_records_per_document=4)
+    documents = reader.read(json_path)
+
+    assert len(documents) == 6
+    assert all(doc.name == "events" for doc in documents)
+    for doc in documents:
+        values = [json.loads(line) for line in doc.content.split("\n")]
+        assert {value["type"] for value in values} == {doc.meta_data["type"]}
+
+
+def test_json_knowledge_base_reads_gzipped_files_with_a_stream_reader(tmp_path):
+    from agno.knowledge.json import JSONKnowledgeBase
+
+    (tmp_path / "plain.json").write_text(json.dumps([{"id": 1}]))
+    with gzip.open(tmp_path / "events.json.gz", "wt", encoding="utf-8") as f:
+        f.write(json.dumps([{"id": 2}]))
+
+    knowledge_base = JSONKnowledgeBase(path=tmp_path, reader=JSONStreamReader())
+    names = sorted(doc.name for documents in knowledge_base.document_lists for doc in documents)
+    assert names == ["events", "plain"]
+
+    # The JSONReader cannot read gzipped files, so they are skipped
+    knowledge_base = JSONKnowledgeBase(path=tmp_path)
+    assert [doc.name for documents in knowledge_base.document_lists for doc in documents] == ["plain"]
@@ -13,6 +13,34 @@ from agno.document.reader.pdf_reader import (
 )
 
 
+def make_pdf(num_pages: int) -> bytes:
+    """A PDF with the text "Page <number> text" on each page"""
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for page_number in range(1, num_pages + 1):
+        page = writer.add_blank_page(612, 792)
+        contents = DecodedStreamObject()
+        contents.set_data(f"BT /F1 12 Tf 72 720 Td (Page {page_number} text) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(contents)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
 @pytest.fixture(scope="session")
 def sample_pdf_path(tmp_path_factory) -> Path:
     # Use tmp_path_factory for session-scoped temporary directory
@@ -156,3 +184,66 @@ def test_pdf_reader_empty_pdf():
     documents = reader.read(empty_pdf)
 
     assert len(documents) == 0
+
+
+@pytest.fixture(scope="module")
+def generated_pdf_path(tmp_path_factory) -> Path:
+    pdf_path = tmp_path_factory.mktemp("pdf_tests") / "generated.pdf"
+    pdf_path.write_bytes(make_pdf(7))
+    return pdf_path
+
+
+def test_pdf_reader_process_pool(generated_pdf_path):
+    expected = [f"Page {page_number} text" for page_number in range(1, 8)]
+
+    # Page ranges are extracted by worker processes and returned in page order, from a path or file content
+    reader = PDFReader(chunk=False, max_workers=2, pages_per_task=2)
+    pdf_file = BytesIO(generated_pdf_path.read_bytes())
+    pdf_file.name = "generated.pdf"
+    for pdf in (generated_pdf_path, pdf_file):
+        documents = reader.read(pdf)
+        assert [doc.content for doc in documents] == expected
+        assert [doc.meta_data["page"] for doc in documents] == list(range(1, 8))
+        assert all(doc.name == "generated" for doc in documents)
+
+    # Without workers, pages are extracted in this process
+    assert [doc.content for doc in PDFReader(chunk=False).read(generated_pdf_path)] == expected
+
+
+def test_pdf_reader_process_pool_reads_file_content_from_one_temporary_file(generated_pdf_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from agno.document.reader import pdf_reader
+
+    sources = []
+    original_extract_pages = pdf_reader.extract_pages
+
+    def extract_pages(pdf, start, end, ocr=False):
+        sources.append(pdf)
+        return original_extract_pages(pdf, start, end, ocr)
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(pdf_reader, "get_process_pool", lambda max_workers: executor)
+    monkeypatch.setattr(pdf_reader, "extract_pages", extract_pages)
+
+    pdf_file = BytesIO(generated_pdf_path.read_bytes())
+    pdf_file.name = "generated.pdf"
+    documents = PDFReader(chunk=False, max_workers=2, pages_per_task=2).read(pdf_file)
+    executor.shutdown()
+
+    assert len(documents) == 7
+    # Every page range opens the same file, which is removed after reading
+    assert len(sources) == 4 and len(set(sources)) == 1
+    assert isinstance(sources[0], str) and not Path(sources[0]).exists()
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_async_process_pool(generated_pdf_path):
+    expected = [f"Page {page_number} text" for page_number in range(1, 8)]
+
+    documents = await PDFReader(chunk=False, max_workers=2, pages_per_task=3).async_read(generated_pdf_path)
+    assert [doc.content for doc in documents] == expected
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 8))
+
+    documents = await PDFReader(chunk=False).async_read(generated_pdf_path)
+    assert [doc.content for doc in documents] == expected
@@ -1,9 +1,21 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from agno.document.base import Document
-from agno.document.reader.website_reader import WebsiteReader
+from agno.document.reader.website_reader import HostRateLimiter, WebsiteReader
+
+SITE_PAGES = {
+    "/": '<main>Home</main><a href="/page1">1</a><a href="/page2">2</a><a href="/private">Private</a>',
+    "/page1": '<main>Page 1</main><a href="/page3">3</a><a href="/">Home</a>',
+    "/page2": '<main>Page 2</main><a href="/page3">3</a><a href="/file.pdf">PDF</a>',
+    "/page3": "<main>Page 3</main>",
+    "/private": "<main>Private</main>",
+    "/robots.txt": "User-agent: *\nDisallow: /private\n",
+}
 
 
 @pytest.fixture
@@ -271,3 +283,112 @@ async def test_async_crawl_max_depth(mock_html_content, mock_html_content_with_a
         assert len(result) == 2
         assert "https://example.com" in result
         assert "https://example.com/page1" in result
+
+
+@pytest.fixture
+def website():
+    """A local website, with the paths requested by the crawler"""
+    requested = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            body = SITE_PAGES.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            content_type = "text/plain" if self.path == "/robots.txt" else "text/html"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requested
+    server.shutdown()
+    server.server_close()
+
+
+def test_crawl_local_website(website):
+    base_url, requested = website
+    reader = WebsiteReader(max_depth=3, max_links=10, max_concurrency=3, requests_per_second=None)
+
+    result = reader.crawl(base_url + "/")
+
+    assert sorted(result.values()) == ["Home", "Page 1", "Page 2", "Page 3"]
+    # robots.txt is read once, disallowed pages and files are skipped, and each page is fetched once
+    assert sorted(requested) == ["/", "/page1", "/page2", "/page3", "/robots.txt"]
+
+
+def test_crawl_max_links_and_depth(website):
+    base_url, _ = website
+
+    assert len(WebsiteReader(max_depth=3, max_links=2, requests_per_second=None).crawl(base_url + "/")) == 2
+    result = WebsiteReader(max_depth=1, max_links=10, requests_per_second=None).crawl(base_url + "/")
+    assert list(result.values()) == ["Home"]
+
+
+def test_crawl_without_robots_txt(website):
+    base_url, requested = website
+    reader = WebsiteReader(max_depth=2, respect_robots_txt=False, requests_per_second=None)
+
+    result = reader.crawl(base_url + "/")
+
+    assert "Private" in result.values()
+    assert "/robots.txt" not in requested
+
+
+def test_parse_robots_txt_without_robots_txt():
+    reader = WebsiteReader()
+    url = "https://example.com/"
+
+    denied = reader._parse_robots_txt(url, httpx.Response(403))
+    missing = reader._parse_robots_txt(url, httpx.Response(404))
+    unreachable = reader._parse_robots_txt(url, None)
+
+    assert not denied.can_fetch("agno", "https://example.com/page1")
+    assert missing.can_fetch("agno", "https://example.com/page1")
+    assert unreachable.can_fetch("agno", "https://example.com/page1")
+
+
+def test_crawl_unreachable_starting_url(website):
+    base_url, _ = website
+
+    with pytest.raises(httpx.HTTPStatusError):
+        WebsiteReader(requests_per_second=None).crawl(base_url + "/missing")
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_local_website(website):
+    base_url, requested = website
+    reader = WebsiteReader(max_depth=3, max_links=10, max_concurrency=3, requests_per_second=None)
+
+    result = await reader.async_crawl(base_url + "/")
+
+    assert sorted(result.values()) == ["Home", "Page 1", "Page 2", "Page 3"]
+    assert sorted(requested) == ["/", "/page1", "/page2", "/page3", "/robots.txt"]
+
+
+def test_host_rate_limiter():
+    with patch("time.monotonic", return_value=100.0):
+        rate_limiter = HostRateLimiter(rate=2.0, capacity=2)
+        # The bucket starts full, then each request waits for one more token
+        assert [rate_limiter.reserve("a.com") for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+        # Hosts have their own bucket
+        assert rate_limiter.reserve("b.com") == 0.0
+
+        # A crawl delay from robots.txt replaces the rate for its host
+        rate_limiter.set_limit("c.com", rate=0.5)
+        assert [rate_limiter.reserve("c.com") for _ in range(2)] == [0.0, 2.0]
+
+    # Tokens are refilled over time
+    with patch("time.monotonic", return_value=101.5):
+        assert rate_limiter.reserve("a.com") == 0.0
+    assert HostRateLimiter(rate=None).reserve("a.com") == 0.0
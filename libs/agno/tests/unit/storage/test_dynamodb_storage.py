@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -291,6 +292,69 @@ def test_get_all_session_ids(agent_storage):
     )
 
 
+def test_list_sessions(agent_storage):
+    """Test listing a page of session summaries from the agent_id index."""
+    storage, mock_table = agent_storage
+
+    mock_table.query.return_value = {
+        "Items": [
+            {
+                "session_id": "session-2",
+                "created_at": Decimal("1700000002"),
+                "session_data": {"session_name": "Named session"},
+                "memory": {"runs": [{"messages": [{"role": "user", "content": "Second question"}]}]},
+            },
+            {
+                "session_id": "session-1",
+                "created_at": Decimal("1700000001"),
+                "memory": {"runs": [{"messages": [{"role": "user", "content": "First question"}]}]},
+            },
+        ],
+        "LastEvaluatedKey": {"session_id": "session-1", "agent_id": "test-agent", "created_at": Decimal("1700000001")},
+    }
+
+    page = storage.list_sessions(entity_id="test-agent", limit=2, fields=["session_name", "title"])
+    assert [(s.session_id, s.session_name, s.title, s.created_at) for s in page.sessions] == [
+        ("session-2", "Named session", "Second question", 1700000002),
+        ("session-1", None, "First question", 1700000001),
+    ]
+    mock_table.query.assert_called_once_with(
+        IndexName="agent_id-index",
+        KeyConditionExpression=Key("agent_id").eq("test-agent"),
+        ProjectionExpression="session_id, created_at, session_data.session_name, memory.runs[0]",
+        ScanIndexForward=False,
+        Limit=2,
+    )
+
+    # The next page continues from the last evaluated key
+    mock_table.query.reset_mock()
+    mock_table.query.return_value = {"Items": []}
+    page = storage.list_sessions(entity_id="test-agent", limit=2, cursor=page.next_cursor, fields=["title"])
+    assert page.sessions == [] and page.next_cursor is None
+    assert mock_table.query.call_args.kwargs["ExclusiveStartKey"] == {
+        "session_id": "session-1",
+        "agent_id": "test-agent",
+        "created_at": 1700000001,
+    }
+
+
+def test_exists(agent_storage):
+    """Test checking if a session exists without reading it."""
+    storage, mock_table = agent_storage
+
+    mock_table.get_item.return_value = {
+        "Item": {"session_id": "session-1", "user_id": "test-user", "agent_id": "agent-1"}
+    }
+    assert storage.exists("session-1", user_id="test-user", entity_id="agent-1")
+    assert not storage.exists("session-1", entity_id="agent-2")
+    mock_table.get_item.assert_called_with(
+        Key={"session_id": "session-1"}, ProjectionExpression="session_id, user_id, agent_id"
+    )
+
+    mock_table.get_item.return_value = {}
+    assert not storage.exists("session-2")
+
+
 def test_drop_table(agent_storage):
     """Test dropping a table."""
     storage, mock_table = agent_storage
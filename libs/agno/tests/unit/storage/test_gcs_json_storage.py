@@ -1,8 +1,10 @@
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.api_core.exceptions import PreconditionFailed
 
 from agno.storage.gcs_json import GCSJsonStorage
 from agno.storage.session.agent import AgentSession
@@ -19,6 +21,8 @@ def mock_gcs_client():
         bucket = MagicMock()
         # For testing, simulate that the bucket already exists.
         bucket.exists.return_value = True
+        # Simulate that the session index has not been created yet.
+        bucket.get_blob.return_value = None
         client_instance.bucket.return_value = bucket
 
         yield client_instance, bucket
@@ -58,10 +62,14 @@ def test_upsert_and_read_agent(gcs_storage):
     blob = MagicMock()
     gcs_storage.bucket.blob.return_value = blob
 
-    # Test upsert: it should call blob.upload_from_string with the session's JSON
+    # Test upsert: it should call blob.upload_from_string with the session's JSON, then with the index
     result = gcs_storage.upsert(session)
     assert result == session
-    blob.upload_from_string.assert_called_once()
+    assert blob.upload_from_string.call_count == 2
+    assert json.loads(blob.upload_from_string.call_args_list[0].args[0])["session_id"] == "test-session"
+    index_upload = blob.upload_from_string.call_args_list[1]
+    assert json.loads(index_upload.args[0])["test-session"]["agent_id"] == "agent-1"
+    assert index_upload.kwargs["if_generation_match"] == 0
 
     # Prepare a JSON string to simulate a successful read.
     session_dict = session.to_dict()
@@ -105,3 +113,82 @@ def test_delete_session(gcs_storage):
 
     gcs_storage.delete_session("test-session")
     blob.delete.assert_called_once()
+
+
+def test_get_all_sessions_downloads_indexed_sessions_concurrently(gcs_storage):
+    gcs_storage.download_workers = 4
+    index = {
+        f"session-{i}": {"user_id": "user-1" if i % 2 == 0 else "user-2", "agent_id": "agent-1", "title": None}
+        for i in range(4)
+    }
+    index_blob = MagicMock()
+    index_blob.name = "agent/.index.json"
+    index_blob.generation = 7
+    index_blob.download_as_bytes.return_value = json.dumps(index).encode("utf-8")
+    gcs_storage.bucket.get_blob.return_value = index_blob
+
+    listed_blobs = []
+    for name in ["agent/.index.json"] + [f"agent/session-{i}.json" for i in range(4)]:
+        listed_blob = MagicMock()
+        listed_blob.name = name
+        listed_blobs.append(listed_blob)
+    gcs_storage.client.list_blobs.return_value = listed_blobs
+
+    def get_blob(path):
+        session_id = path[len("agent/") : -len(".json")]
+        blob = MagicMock()
+        blob.download_as_bytes.return_value = json.dumps(
+            {"session_id": session_id, "agent_id": "agent-1", **index.get(session_id, {})}
+        ).encode("utf-8")
+        return blob
+
+    gcs_storage.bucket.blob.side_effect = get_blob
+
+    with patch("agno.storage.gcs_json.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+        sessions = gcs_storage.get_all_sessions(user_id="user-1")
+    assert [s.session_id for s in sessions] == ["session-0", "session-2"]
+    executor.assert_called_once_with(max_workers=4)
+    # Only the sessions of the user are downloaded, and the index is not uploaded again
+    assert [c.args[0] for c in gcs_storage.bucket.blob.call_args_list] == [
+        "agent/session-0.json",
+        "agent/session-2.json",
+    ]
+    # The bucket is not listed when the index exists
+    gcs_storage.client.list_blobs.assert_not_called()
+
+
+def test_list_sessions_only_downloads_the_index(gcs_storage):
+    index = {
+        f"session-{i}": {"user_id": "user-1", "agent_id": "agent-1", "title": f"Question {i}", "created_at": i}
+        for i in range(3)
+    }
+    index_blob = MagicMock()
+    index_blob.name = "agent/.index.json"
+    index_blob.generation = 1
+    index_blob.download_as_bytes.return_value = json.dumps(index).encode("utf-8")
+    gcs_storage.bucket.get_blob.return_value = index_blob
+
+    page = gcs_storage.list_sessions(user_id="user-1", limit=2)
+
+    assert [s.session_id for s in page.sessions] == ["session-2", "session-1"]
+    assert page.sessions[0].title == "Question 2"
+    assert page.next_cursor is not None
+    gcs_storage.bucket.blob.assert_not_called()
+    gcs_storage.client.list_blobs.assert_not_called()
+
+
+def test_index_update_retries_on_concurrent_change(gcs_storage):
+    index_blob = MagicMock()
+    index_blob.name = "agent/.index.json"
+    index_blob.generation = 1
+    index_blob.download_as_bytes.return_value = b"{}"
+    gcs_storage.bucket.get_blob.return_value = index_blob
+
+    blob = MagicMock()
+    gcs_storage.bucket.blob.return_value = blob
+    # The session upload succeeds, the first index upload finds the index was changed concurrently
+    blob.upload_from_string.side_effect = [None, PreconditionFailed("changed"), None]
+
+    assert gcs_storage.upsert(AgentSession(session_id="test-session", agent_id="agent-1")) is not None
+    assert blob.upload_from_string.call_count == 3
+    assert gcs_storage.bucket.get_blob.call_count == 2
@@ -1,3 +1,4 @@
+import json
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -174,3 +175,87 @@ def test_workflow_storage_filtering(workflow_storage: JsonStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_filtering_reads_index(agent_storage: JsonStorage, temp_dir: Path, monkeypatch):
+    for i in range(4):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1" if i < 2 else "agent-2",
+                user_id="user-1" if i % 2 == 0 else "user-2",
+                session_data={"session_name": f"Session {i}"},
+            )
+        )
+    # A session stored without the storage is added when the index is rebuilt
+    (temp_dir / "old-session.json").write_text(
+        agent_storage.serialize(AgentSession(session_id="old-session", agent_id="agent-1", user_id="user-1").to_dict())
+    )
+
+    index = json.loads((temp_dir / ".index.json").read_text())
+    assert index["session-1"]["agent_id"] == "agent-1"
+    assert index["session-1"]["session_name"] == "Session 1"
+
+    read_session_ids = []
+    original_read_data = agent_storage._read_data
+
+    def read_data(session_id):
+        read_session_ids.append(session_id)
+        return original_read_data(session_id)
+
+    monkeypatch.setattr(agent_storage, "_read_data", read_data)
+    assert sorted(agent_storage.get_all_session_ids(entity_id="agent-1")) == ["session-0", "session-1"]
+    assert read_session_ids == []
+    agent_storage.rebuild_index()
+    assert sorted(agent_storage.get_all_session_ids(entity_id="agent-1")) == ["old-session", "session-0", "session-1"]
+
+    read_session_ids.clear()
+    sessions = agent_storage.get_all_sessions(user_id="user-1", entity_id="agent-1")
+    assert sorted(s.session_id for s in sessions) == ["old-session", "session-0"]
+    assert sorted(read_session_ids) == ["old-session", "session-0"]
+
+    # Deleted sessions are removed from the index, files removed without the storage once they are missed
+    agent_storage.delete_session("session-0")
+    (temp_dir / "old-session.json").unlink()
+    assert sorted(agent_storage.get_all_session_ids(user_id="user-1")) == ["old-session", "session-2"]
+    assert [s.session_id for s in agent_storage.get_all_sessions(user_id="user-1")] == ["session-2"]
+    assert agent_storage.get_all_session_ids(user_id="user-1") == ["session-2"]
+    assert sorted(json.loads((temp_dir / ".index.json").read_text())) == ["session-1", "session-2", "session-3"]
+    assert sorted(agent_storage.get_all_session_ids()) == ["session-1", "session-2", "session-3"]
+
+
+def test_list_sessions_reads_only_the_index(agent_storage: JsonStorage, temp_dir: Path, monkeypatch):
+    for i in range(5):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1",
+                user_id="user-1",
+                memory={"runs": [{"run_id": f"run-{i}", "messages": [{"role": "user", "content": f"Question {i}"}]}]},
+                session_data={"session_name": f"Session {i}"},
+                created_at=1700000000 + i,
+            )
+        )
+
+    def read_data(session_id):
+        raise AssertionError(f"Session {session_id} was read")
+
+    monkeypatch.setattr(agent_storage, "_read_data", read_data)
+    first_page = agent_storage.list_sessions(entity_id="agent-1", limit=3)
+    assert [s.session_id for s in first_page.sessions] == ["session-4", "session-3", "session-2"]
+    assert first_page.sessions[0].title == "Question 4"
+    assert first_page.sessions[0].session_name == "Session 4"
+    assert first_page.next_cursor is not None
+
+    second_page = agent_storage.list_sessions(entity_id="agent-1", limit=3, cursor=first_page.next_cursor)
+    assert [s.session_id for s in second_page.sessions] == ["session-1", "session-0"]
+    assert second_page.next_cursor is None
+    assert agent_storage.list_sessions(user_id="other-user").sessions == []
+
+    # An index written without titles is rebuilt from the sessions
+    monkeypatch.undo()
+    index = json.loads((temp_dir / ".index.json").read_text())
+    for entry in index.values():
+        del entry["title"]
+    (temp_dir / ".index.json").write_text(json.dumps(index))
+    assert agent_storage.list_sessions(limit=1).sessions[0].title == "Question 4"
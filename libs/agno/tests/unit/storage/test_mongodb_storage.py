@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -269,6 +269,55 @@ def test_get_all_session_ids(agent_storage):
     mock_collection.find.assert_called_once_with({"agent_id": "test-agent"}, {"session_id": 1})
 
 
+def test_list_sessions(agent_storage):
+    """Test listing a page of session summaries with a projection."""
+    storage, mock_collection = agent_storage
+
+    mock_cursor = MagicMock()
+    mock_collection.find.return_value.sort.return_value.limit.return_value = mock_cursor
+    mock_cursor.__iter__.return_value = [
+        {
+            "session_id": "session-3",
+            "created_at": 1700000003,
+            "memory": {"runs": [{"message": {"role": "user", "content": "Third question"}, "response": {}}]},
+        },
+        {"session_id": "session-2", "created_at": 1700000002, "session_data": {"session_name": "Named session"}},
+        {"session_id": "session-1", "created_at": 1700000001},
+    ]
+
+    cursor = storage._encode_cursor([1700000004, "session-4"])
+    page = storage.list_sessions(user_id="test-user", limit=2, cursor=cursor)
+    assert [(s.session_id, s.session_name, s.title) for s in page.sessions] == [
+        ("session-3", None, "Third question"),
+        ("session-2", "Named session", None),
+    ]
+    assert storage._decode_cursor(page.next_cursor) == (1700000002, "session-2")
+
+    query, projection = mock_collection.find.call_args.args
+    assert query == {
+        "user_id": "test-user",
+        "$or": [
+            {"created_at": {"$lt": 1700000004}},
+            {"created_at": 1700000004, "session_id": {"$lt": "session-4"}},
+        ],
+    }
+    assert projection["memory.runs"] == {"$slice": 1}
+    assert "memory" not in projection and "agent_data" not in projection
+    mock_collection.find.return_value.sort.return_value.limit.assert_called_once_with(3)
+
+
+def test_exists(agent_storage):
+    """Test checking if a session exists without reading it."""
+    storage, mock_collection = agent_storage
+
+    mock_collection.find_one.return_value = {"_id": "id"}
+    assert storage.exists("session-1", entity_id="agent-1")
+    mock_collection.find_one.assert_called_once_with({"agent_id": "agent-1", "session_id": "session-1"}, {"_id": 1})
+
+    mock_collection.find_one.return_value = None
+    assert not storage.exists("session-2")
+
+
 def test_drop_collection(agent_storage):
     """Test dropping a collection."""
     storage, mock_collection = agent_storage
@@ -316,3 +365,41 @@ def test_deepcopy(agent_storage):
     assert copied_storage._client is storage._client
     assert copied_storage.db is storage.db
     assert copied_storage.collection is storage.collection
+
+
+@pytest.mark.asyncio
+async def test_async_methods_use_async_client(mock_mongo_client):
+    """Test the async methods use the provided async client."""
+    async_collection = MagicMock()
+    async_client = MagicMock()
+    async_client.__getitem__.return_value.__getitem__.return_value = async_collection
+    storage = MongoDbStorage(collection_name="agent_sessions", db_name="test_db", async_client=async_client)
+
+    session = AgentSession(session_id="test-session", agent_id="test-agent", user_id="test-user", memory={})
+    async_collection.find_one = AsyncMock(side_effect=[None, {**session.to_dict(), "_id": "mongo-id"}])
+    async_collection.update_one = AsyncMock(return_value=MagicMock(acknowledged=True))
+
+    result = await storage.aupsert(session)
+
+    assert result is not None
+    assert result.session_id == "test-session"
+    update = async_collection.update_one.call_args[0][1]["$set"]
+    assert update["created_at"] == update["updated_at"]
+    async_client.__getitem__.assert_called_with("test_db")
+    _, mock_collection = mock_mongo_client
+    mock_collection.update_one.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_methods_fall_back_to_thread_with_sync_client():
+    """Test the async methods run the sync methods when only a sync client is provided."""
+    client = MagicMock()
+    collection = client.__getitem__.return_value.__getitem__.return_value
+    collection.find_one.return_value = {"session_id": "test-session", "agent_id": "test-agent", "_id": "mongo-id"}
+    storage = MongoDbStorage(collection_name="agent_sessions", client=client)
+
+    result = await storage.aread("test-session")
+
+    assert result is not None
+    assert result.agent_id == "test-agent"
+    collection.find_one.assert_called_once_with({"session_id": "test-session"})
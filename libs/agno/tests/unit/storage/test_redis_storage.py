@@ -1,5 +1,6 @@
+import asyncio
 from typing import Dict
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 import redis
@@ -19,21 +20,50 @@ def mock_redis_client():
 
         # Create an in-memory store to simulate Redis
         mock_data: Dict[str, str] = {}
+        mock_sorted_sets: Dict[str, Dict[str, float]] = {}
 
         # Mock Redis client methods
         client.get.side_effect = lambda key: mock_data.get(key)
         client.set.side_effect = lambda key, value: mock_data.update({key: value})
+        client.mget.side_effect = lambda keys: [mock_data.get(key) for key in keys]
+        client.exists.side_effect = lambda key: int(key in mock_data or key in mock_sorted_sets)
 
         # Make delete actually work correctly
         def mock_delete(key):
             if key in mock_data:
                 del mock_data[key]
                 return 1
+            if key in mock_sorted_sets:
+                del mock_sorted_sets[key]
+                return 1
             return 0
 
         client.delete.side_effect = mock_delete
         client.ping.return_value = True
 
+        # Mock sorted sets used as indexes
+        def mock_zadd(key, mapping, nx=False):
+            sorted_set = mock_sorted_sets.setdefault(key, {})
+            for member, score in mapping.items():
+                if not nx or member not in sorted_set:
+                    sorted_set[member] = score
+
+        def mock_zrem(key, *members):
+            for member in members:
+                mock_sorted_sets.get(key, {}).pop(member, None)
+
+        def mock_zrange(key, start, end, desc=False):
+            members = sorted(mock_sorted_sets.get(key, {}).items(), key=lambda item: (item[1], item[0]), reverse=desc)
+            return [member for member, _ in members[start : None if end == -1 else end + 1]]
+
+        client.zadd.side_effect = mock_zadd
+        client.zrem.side_effect = mock_zrem
+        client.zrange.side_effect = mock_zrange
+
+        # Pipelined commands are applied to the in-memory store directly
+        client.pipeline.return_value = client
+        client.execute.return_value = []
+
         # Mock scan_iter to return keys
         client.scan_iter.side_effect = lambda match: [
             k for k in mock_data.keys() if k.startswith(match.replace("*", ""))
@@ -345,3 +375,101 @@ def test_get_all_session_ids(agent_storage, mock_redis_client):
     # Test combined filtering
     filtered_session_ids = agent_storage.get_all_session_ids(user_id="user-1", entity_id="agent-1")
     assert len(filtered_session_ids) == 1
+
+
+def test_indexes_are_maintained_on_upsert_and_delete(agent_storage, mock_redis_client):
+    """Test sessions are listed from the indexes without scanning the keyspace."""
+    # A session stored before indexes were maintained is indexed on the first read
+    old_session = AgentSession(session_id="old-session", agent_id="agent-1", user_id="user-1", created_at=100)
+    mock_redis_client.set("test_agent:old-session", agent_storage.serialize(old_session.__dict__))
+    assert agent_storage.get_all_session_ids(user_id="user-1") == ["old-session"]
+
+    for i, created_at in enumerate([300, 200]):
+        agent_storage.upsert(
+            AgentSession(session_id=f"session-{i}", agent_id="agent-1", user_id="user-1", created_at=created_at)
+        )
+    agent_storage.upsert(AgentSession(session_id="other-session", agent_id="agent-2", user_id="user-2"))
+
+    mock_redis_client.scan_iter.reset_mock()
+    mock_redis_client.get.reset_mock()
+    assert agent_storage.get_all_session_ids(entity_id="agent-1") == ["session-0", "session-1", "old-session"]
+    sessions = agent_storage.get_all_sessions(user_id="user-1", entity_id="agent-1")
+    assert [s.session_id for s in sessions] == ["session-0", "session-1", "old-session"]
+    mock_redis_client.scan_iter.assert_not_called()
+    mock_redis_client.get.assert_not_called()
+
+    agent_storage.delete_session("session-0")
+    assert agent_storage.get_all_session_ids(user_id="user-1") == ["session-1", "old-session"]
+    assert agent_storage.get_all_session_ids(entity_id="agent-1") == ["session-1", "old-session"]
+    assert "session-0" not in agent_storage.get_all_session_ids()
+
+
+@pytest.fixture
+def mock_async_redis_client(mock_redis_client):
+    """Mock async Redis client sharing the in-memory store of the sync mock."""
+    with patch("agno.storage.redis.AsyncRedis") as mock_async_redis:
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=mock_redis_client.get.side_effect)
+        client.set = AsyncMock(side_effect=mock_redis_client.set.side_effect)
+        client.delete = AsyncMock(side_effect=mock_redis_client.delete.side_effect)
+        client.mget = AsyncMock(side_effect=mock_redis_client.mget.side_effect)
+        client.exists = AsyncMock(side_effect=mock_redis_client.exists.side_effect)
+        client.zrange = AsyncMock(side_effect=mock_redis_client.zrange.side_effect)
+
+        # Commands are queued on async pipelines without awaiting, only execute is awaited
+        pipeline = MagicMock()
+        pipeline.set.side_effect = mock_redis_client.set.side_effect
+        pipeline.delete.side_effect = mock_redis_client.delete.side_effect
+        pipeline.zadd.side_effect = mock_redis_client.zadd.side_effect
+        pipeline.zrem.side_effect = mock_redis_client.zrem.side_effect
+        pipeline.execute = AsyncMock(return_value=[])
+        client.pipeline.return_value = pipeline
+
+        async def scan_iter(match):
+            for key in mock_redis_client.scan_iter(match=match):
+                yield key
+
+        client.scan_iter.side_effect = scan_iter
+        mock_async_redis.return_value = client
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_async_agent_session_crud(agent_storage, mock_async_redis_client):
+    """Test the async methods use the async Redis client."""
+    session = AgentSession(session_id="test-session", agent_id="test-agent", user_id="test-user", memory={})
+
+    assert await agent_storage.aupsert(session) == session
+    mock_async_redis_client.pipeline.return_value.set.assert_called_once_with("test_agent:test-session", ANY)
+    mock_async_redis_client.pipeline.return_value.execute.assert_awaited_once()
+
+    read_session = await agent_storage.aread("test-session")
+    assert read_session is not None
+    assert read_session.agent_id == "test-agent"
+    assert await agent_storage.aread("test-session", user_id="other-user") is None
+
+    sessions = await agent_storage.aget_all_sessions(user_id="test-user", entity_id="test-agent")
+    assert [s.session_id for s in sessions] == ["test-session"]
+
+    await agent_storage.adelete_session("test-session")
+    assert await agent_storage.aread("test-session") is None
+    # The sync client is not used by the async methods
+    agent_storage.redis_client.set.assert_not_called()
+
+
+def test_async_client_of_a_closed_loop_is_closed(agent_storage):
+    """A new event loop gets its own async client, and the client of the closed loop is closed."""
+    with patch("agno.storage.redis.AsyncRedis", side_effect=lambda **kwargs: MagicMock(aclose=AsyncMock())):
+
+        async def get_client():
+            client = agent_storage._get_async_client()
+            # Let the stale client close in the background
+            await asyncio.sleep(0)
+            return client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+    assert first is not second
+    first.aclose.assert_awaited_once()
+    second.aclose.assert_not_awaited()
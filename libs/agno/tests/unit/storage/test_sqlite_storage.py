@@ -2,6 +2,7 @@ import os
 import tempfile
 from pathlib import Path
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
 
@@ -193,3 +194,186 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_upsert_returns_session_without_reading_it_back(agent_storage: SqliteStorage, monkeypatch):
+    session = AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [{"content": "hi"}]})
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("upsert should not read the session back")
+
+    monkeypatch.setattr(agent_storage, "read", fail_read)
+    created = agent_storage.upsert(session)
+    assert created is session
+    assert created.created_at is not None
+
+    updated = agent_storage.upsert(
+        AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [{"content": "hi"}] * 2})
+    )
+    assert updated is not None
+    # The timestamps come from the database, so created_at is kept on update
+    assert updated.created_at == created.created_at
+    assert updated.updated_at is not None
+
+    monkeypatch.undo()
+    stored = agent_storage.read("test-session")
+    assert stored is not None
+    assert len(stored.memory["runs"]) == 2
+
+
+def test_append_runs_stores_runs_separately(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", append_runs=True)
+    storage.create()
+
+    storage.upsert(
+        AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [{"run_id": "run-1"}]})
+    )
+    # Only the new run is passed on the next upsert, and an existing run is updated in place
+    storage.upsert(
+        AgentSession(
+            session_id="test-session",
+            agent_id="test-agent",
+            memory={"runs": [{"run_id": "run-2"}, {"run_id": "run-1", "content": "updated"}]},
+        )
+    )
+
+    read_session = storage.read("test-session")
+    assert read_session is not None
+    assert read_session.memory["runs"] == [{"run_id": "run-1", "content": "updated"}, {"run_id": "run-2"}]
+    assert [s.memory["runs"] for s in storage.get_all_sessions()] == [read_session.memory["runs"]]
+
+    storage.delete_session("test-session")
+    assert storage.read("test-session") is None
+    with storage.SqlSession() as sess:
+        assert sess.execute(storage._get_runs_stmt(["test-session"])).fetchall() == []
+
+
+def test_agent_only_writes_new_runs_with_append_runs(temp_db_path: Path):
+    from agno.agent import Agent
+    from agno.memory.v2.memory import Memory
+    from agno.run.response import RunResponse
+
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", append_runs=True)
+    storage.create()
+    agent = Agent(storage=storage, memory=Memory(), session_id="test-session")
+
+    written_runs = []
+    original_upsert = storage.upsert
+
+    def upsert(session, **kwargs):
+        written_runs.append([run["run_id"] for run in session.memory["runs"]])
+        return original_upsert(session, **kwargs)
+
+    storage.upsert = upsert  # type: ignore
+    serialized_runs = []
+    original_to_dict = RunResponse.to_dict
+
+    def to_dict(run_response):
+        serialized_runs.append(run_response.run_id)
+        return original_to_dict(run_response)
+
+    with patch.object(RunResponse, "to_dict", to_dict):
+        for i in range(3):
+            agent.memory.add_run("test-session", RunResponse(run_id=f"run-{i}", session_id="test-session"))
+            agent.write_to_storage(session_id="test-session")
+
+    assert written_runs == [["run-0"], ["run-1"], ["run-2"]]
+    # Stored runs are not serialized again
+    assert serialized_runs == ["run-0", "run-1", "run-2"]
+    # The session returned by the storage still has every run
+    assert [run["run_id"] for run in agent.agent_session.memory["runs"]] == ["run-0", "run-1", "run-2"]
+
+    # A new agent reading the session gets every run back
+    new_agent = Agent(storage=storage, memory=Memory(), session_id="test-session")
+    new_agent.read_from_storage(session_id="test-session")
+    assert [run.run_id for run in new_agent.memory.runs["test-session"]] == ["run-0", "run-1", "run-2"]
+
+
+def test_append_runs_moves_runs_stored_with_the_session(temp_db_path: Path):
+    from agno.agent import Agent
+    from agno.memory.v2.memory import Memory
+    from agno.models.message import Message
+    from agno.run.response import RunResponse
+
+    legacy_run = RunResponse(
+        run_id="run-0", session_id="test-session", messages=[Message(role="user", content="Hello")]
+    ).to_dict()
+    legacy_storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent")
+    legacy_storage.create()
+    legacy_storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [legacy_run]}))
+
+    # Runs written before append_runs was enabled are still read
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", append_runs=True)
+    storage.create()
+    assert [s.memory["runs"] for s in storage.get_all_sessions()] == [[legacy_run]]
+    assert storage.list_sessions().sessions[0].title == "Hello"
+
+    agent = Agent(storage=storage, memory=Memory(), session_id="test-session")
+    agent.read_from_storage(session_id="test-session")
+    agent.memory.add_run("test-session", RunResponse(run_id="run-1", session_id="test-session"))
+    agent.write_to_storage(session_id="test-session")
+
+    read_session = storage.read("test-session")
+    assert read_session is not None
+    assert [run["run_id"] for run in read_session.memory["runs"]] == ["run-0", "run-1"]
+
+
+@pytest.mark.parametrize("append_runs", [False, True])
+def test_list_sessions_pages_summaries(temp_db_path: Path, append_runs: bool):
+    storage = SqliteStorage(
+        table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", append_runs=append_runs
+    )
+    storage.create()
+    for i in range(5):
+        storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent" if i < 4 else "other-agent",
+                user_id="test-user",
+                session_data={"session_name": "Named session"} if i == 1 else None,
+                memory={
+                    "runs": [
+                        {
+                            "run_id": f"run-{i}",
+                            "messages": [
+                                {"role": "system", "content": "You are helpful"},
+                                {"role": "user", "content": f"Question {i}"},
+                            ],
+                        },
+                        {"run_id": f"run-{i}-2", "messages": [{"role": "user", "content": "Follow up"}]},
+                    ]
+                },
+            )
+        )
+
+    first_page = storage.list_sessions(entity_id="test-agent", limit=3)
+    assert [s.session_id for s in first_page.sessions] == ["session-3", "session-2", "session-1"]
+    assert [s.title for s in first_page.sessions] == ["Question 3", "Question 2", "Question 1"]
+    assert first_page.sessions[2].session_name == "Named session"
+    assert first_page.next_cursor is not None
+
+    second_page = storage.list_sessions(entity_id="test-agent", limit=3, cursor=first_page.next_cursor)
+    assert [s.session_id for s in second_page.sessions] == ["session-0"]
+    assert second_page.next_cursor is None
+
+    # Only the requested fields are read
+    summary = storage.list_sessions(user_id="test-user", fields=["session_name"]).sessions[0]
+    assert summary.session_id == "session-4"
+    assert summary.title is None and summary.user_id is None
+
+    with pytest.raises(ValueError):
+        storage.list_sessions(cursor="not-a-cursor")
+    # Valid JSON that is not a (created_at, session_id) pair
+    for value in [5, [1, 2, 3], ["1", "session-1"], [1, None]]:
+        with pytest.raises(ValueError):
+            storage.list_sessions(cursor=storage._encode_cursor(value))
+
+
+def test_exists(agent_storage: SqliteStorage):
+    agent_storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", user_id="test-user"))
+
+    assert agent_storage.exists("test-session")
+    assert agent_storage.exists("test-session", user_id="test-user", entity_id="test-agent")
+    assert not agent_storage.exists("test-session", entity_id="other-agent")
+    assert not agent_storage.exists("test-session", user_id="other-user")
+    assert not agent_storage.exists("missing-session")
@@ -1,3 +1,4 @@
+import json
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -174,3 +175,32 @@ def test_workflow_storage_filtering(workflow_storage: YamlStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_filtering_reads_index(agent_storage: YamlStorage, temp_dir: Path):
+    for i in range(4):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1" if i < 2 else "agent-2",
+                user_id="user-1" if i % 2 == 0 else "user-2",
+            )
+        )
+
+    index = json.loads((temp_dir / ".index.json").read_text())
+    assert index["session-2"] == {
+        "user_id": "user-1",
+        "agent_id": "agent-2",
+        "session_name": None,
+        "title": None,
+        "created_at": None,
+        "updated_at": index["session-2"]["updated_at"],
+    }
+
+    # Filtering only reads the files of the matching sessions
+    (temp_dir / "session-3.yaml").write_text("not: [valid")
+    sessions = agent_storage.get_all_sessions(user_id="user-1", entity_id="agent-2")
+    assert [s.session_id for s in sessions] == ["session-2"]
+
+    agent_storage.drop()
+    assert not (temp_dir / ".index.json").exists()
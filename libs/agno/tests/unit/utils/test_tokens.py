@@ -0,0 +1,46 @@
+from unittest.mock import Mock
+
+from agno.models.message import Message
+from agno.utils.tokens import count_tokens_heuristic, get_messages_within_token_budget
+
+
+def make_history():
+    return [
+        Message(role="user", content="a" * 40),
+        Message(role="assistant", content="b" * 40),
+        Message(role="user", content="c" * 40),
+        Message(role="assistant", tool_calls=[{"id": "call_1", "function": {"name": "search", "arguments": "{}"}}]),
+        Message(role="tool", tool_call_id="call_1", content="d" * 40),
+        Message(role="assistant", content="e" * 40),
+    ]
+
+
+def test_get_messages_within_token_budget():
+    history = make_history()
+
+    # Every message costs 4 tokens plus one token per 4 characters
+    assert [m.content for m in get_messages_within_token_budget(history, 1000, count_tokens_heuristic)] == [
+        m.content for m in history
+    ]
+    # The newest messages that fit, starting at a user message so the tool result keeps its tool call
+    selected = get_messages_within_token_budget(history, 70, count_tokens_heuristic)
+    assert [m.role for m in selected] == ["user", "assistant", "tool", "assistant"]
+    assert get_messages_within_token_budget(history, 40, count_tokens_heuristic) == []
+
+
+def test_token_counts_are_cached_on_messages():
+    history = make_history()
+    tokenizer = Mock(side_effect=count_tokens_heuristic)
+
+    get_messages_within_token_budget(history, 1000, tokenizer)
+    calls = tokenizer.call_count
+    assert calls == len(history) + 1  # The tool call is counted separately
+
+    # The next turn only tokenizes the new message
+    history.append(Message(role="user", content="f" * 40))
+    get_messages_within_token_budget(history, 1000, tokenizer)
+    assert tokenizer.call_count == calls + 1
+
+    # Another tokenizer counts the messages again
+    other_tokenizer = Mock(return_value=1)
+    assert get_messages_within_token_budget(history, 6 * len(history), other_tokenizer) == history
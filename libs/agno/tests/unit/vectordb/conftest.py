@@ -1,5 +1,5 @@
 from typing import Any, Dict, List
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -22,4 +22,13 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # Mock the batched embedding methods
+    mock.get_embeddings_batch_and_usage.side_effect = lambda texts: (
+        [mock_embedding for _ in texts],
+        [mock_usage for _ in texts],
+    )
+    mock.async_get_embeddings_batch_and_usage = AsyncMock(
+        side_effect=lambda texts: ([mock_embedding for _ in texts], [mock_usage for _ in texts])
+    )
+
     return mock
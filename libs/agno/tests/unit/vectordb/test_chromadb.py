@@ -130,6 +130,21 @@ def test_doc_exists(chroma_db, sample_documents):
     assert chroma_db.doc_exists(sample_documents[0]) is True
 
 
+def test_existing_content_hashes(chroma_db, sample_documents):
+    """Test bulk content hash existence check"""
+    chroma_db.insert(sample_documents[:2])
+    hashes = [doc.content_hash for doc in sample_documents]
+    assert chroma_db.existing_content_hashes(hashes) == {doc.content_hash for doc in sample_documents[:2]}
+
+
+def test_delete_by_content_hashes(chroma_db, sample_documents):
+    """Test deleting documents by content hash"""
+    chroma_db.insert(sample_documents)
+    assert chroma_db.delete_by_content_hashes([sample_documents[0].content_hash]) is True
+    assert chroma_db.get_count() == 2
+    assert chroma_db.doc_exists(sample_documents[0]) is False
+
+
 def test_get_count(chroma_db, sample_documents):
     """Test document count"""
     assert chroma_db.get_count() == 0
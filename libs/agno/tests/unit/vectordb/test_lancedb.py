@@ -1,6 +1,7 @@
 import os
 import shutil
 from typing import List
+from unittest.mock import patch
 
 import pytest
 
@@ -125,6 +126,29 @@ def test_doc_exists(lance_db, sample_documents):
     assert lance_db.doc_exists(sample_documents[0]) is True
 
 
+def test_existing_content_hashes(lance_db, sample_documents):
+    """Test bulk content hash existence check"""
+    lance_db.insert(sample_documents[:2])
+    hashes = [doc.content_hash for doc in sample_documents]
+    assert lance_db.existing_content_hashes(hashes) == {doc.content_hash for doc in sample_documents[:2]}
+
+
+def test_existing_content_hashes_raises_lookup_errors(lance_db, sample_documents):
+    """A failed lookup is raised instead of treating every document as new"""
+    lance_db.insert(sample_documents[:1])
+    with patch.object(lance_db.table, "search", side_effect=RuntimeError("lookup failed")):
+        with pytest.raises(RuntimeError):
+            lance_db.existing_content_hashes([doc.content_hash for doc in sample_documents])
+
+
+def test_delete_by_content_hashes(lance_db, sample_documents):
+    """Test deleting documents by content hash"""
+    lance_db.insert(sample_documents)
+    assert lance_db.delete_by_content_hashes([sample_documents[0].content_hash]) is True
+    assert lance_db.get_count() == 2
+    assert lance_db.doc_exists(sample_documents[0]) is False
+
+
 def test_name_exists(lance_db, sample_documents):
     """Test name existence check"""
     lance_db.insert([sample_documents[0]])
@@ -18,6 +18,13 @@ def mock_embedder() -> MagicMock:
     embedder = MagicMock()
     embedder.dimensions = 384
     embedder.get_embedding.return_value = [0.1] * 384
+    embedder.get_embeddings_batch_and_usage.side_effect = lambda texts: (
+        [[0.1] * 384 for _ in texts],
+        [None for _ in texts],
+    )
+    embedder.async_get_embeddings_batch_and_usage = AsyncMock(
+        side_effect=lambda texts: ([[0.1] * 384 for _ in texts], [None for _ in texts])
+    )
     embedder.embedding_dim = 384
     return embedder
 
@@ -157,6 +157,31 @@ def test_doc_exists(mock_pgvector):
         assert mock_pgvector.doc_exists(doc) is False
 
 
+def test_existing_content_hashes(mock_pgvector):
+    """Test existing_content_hashes runs a single query for all hashes."""
+    docs = create_test_documents(3)
+    session = mock_pgvector.Session.return_value.__enter__.return_value
+    session.execute.return_value = [(docs[0].content_hash,)]
+
+    with patch("agno.vectordb.pgvector.pgvector.select"), patch("agno.vectordb.pgvector.pgvector.any_"):
+        result = mock_pgvector.existing_content_hashes([doc.content_hash for doc in docs])
+
+    assert result == {docs[0].content_hash}
+    session.execute.assert_called_once()
+    assert mock_pgvector.existing_content_hashes([]) == set()
+
+
+def test_existing_content_hashes_raises_database_errors(mock_pgvector):
+    """Test existing_content_hashes does not report the hashes as new when the query fails."""
+    docs = create_test_documents(2)
+    session = mock_pgvector.Session.return_value.__enter__.return_value
+    session.execute.side_effect = Exception("connection lost")
+
+    with patch("agno.vectordb.pgvector.pgvector.select"), patch("agno.vectordb.pgvector.pgvector.any_"):
+        with pytest.raises(Exception, match="connection lost"):
+            mock_pgvector.existing_content_hashes([doc.content_hash for doc in docs])
+
+
 def test_name_exists(mock_pgvector):
     """Test name_exists method."""
     with patch.object(mock_pgvector, "_record_exists") as mock_record_exists:
@@ -1,3 +1,4 @@
+import uuid
 from typing import List
 from unittest.mock import Mock, patch
 
@@ -153,6 +154,18 @@ def test_doc_exists(qdrant_db, sample_documents, mock_qdrant_client):
     assert qdrant_db.doc_exists(sample_documents[0]) is False
 
 
+def test_existing_content_hashes(qdrant_db, sample_documents, mock_qdrant_client):
+    """Test bulk content hash existence check"""
+    content_hash = sample_documents[0].content_hash
+    # Qdrant returns md5 ids formatted as UUIDs
+    mock_qdrant_client.retrieve.return_value = [Mock(id=str(uuid.UUID(content_hash)))]
+
+    hashes = [doc.content_hash for doc in sample_documents]
+    assert qdrant_db.existing_content_hashes(hashes) == {content_hash}
+    mock_qdrant_client.retrieve.assert_called_once()
+    assert sorted(mock_qdrant_client.retrieve.call_args.kwargs["ids"]) == sorted(hashes)
+
+
 def test_name_exists(qdrant_db, mock_qdrant_client):
     """Test name existence check"""
     # Test when name exists